@@ -0,0 +1,55 @@
+"""Arrow IPC stream format for framelike data
+
+The hetida designer runtime can be configured to request framelike data in the
+Arrow IPC streaming format via the Accept header and to send framelike data in
+that format if the adapter lists the media type in the acceptedRequestContentTypes
+of its /info endpoint. The columns are the same as the keys of the json records.
+"""
+
+import pandas as pd
+import pyarrow as pa
+
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+
+
+def is_arrow_stream_content_type(content_type: str | None) -> bool:
+    if content_type is None:
+        return False
+    return content_type.split(";", 1)[0].strip().lower() == ARROW_STREAM_MEDIA_TYPE
+
+
+def accepts_arrow_stream(accept: str | None) -> bool:
+    """Whether the Accept header explicitly accepts the Arrow IPC stream format"""
+    if accept is None:
+        return False
+    for media_range in accept.split(","):
+        media_type, *params = (part.strip() for part in media_range.split(";"))
+        if media_type.lower() != ARROW_STREAM_MEDIA_TYPE:
+            continue
+        for param in params:
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    return float(value) > 0
+                except ValueError:
+                    return False
+        return True
+    return False
+
+
+def df_to_arrow_stream_bytes(df: pd.DataFrame) -> bytes:
+    """Write dataframe as Arrow IPC stream
+
+    Raises pa.ArrowInvalid or pa.ArrowTypeError if the dataframe cannot be converted,
+    e.g. because of object columns with mixed value types.
+    """
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def arrow_stream_bytes_to_df(arrow_stream_bytes: bytes) -> pd.DataFrame:
+    with pa.ipc.open_stream(arrow_stream_bytes) as reader:
+        return reader.read_pandas()
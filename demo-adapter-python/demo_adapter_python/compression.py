@@ -0,0 +1,91 @@
+"""Decompression of gzip encoded request bodies
+
+The hetida designer runtime may send gzip compressed request bodies to generic rest
+adapters which list gzip in the acceptedRequestEncodings of their /info endpoint.
+"""
+
+import zlib
+
+from starlette.responses import PlainTextResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+ACCEPTED_REQUEST_ENCODINGS = ["gzip"]
+
+
+class RequestDecompressionMiddleware:
+    """ASGI middleware decompressing gzip encoded request bodies
+
+    The body is decompressed chunk by chunk as it is received, so large requests
+    are never held in memory in compressed and decompressed form completely.
+    Requests with other content encodings are rejected with status 415.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        content_encoding = next(
+            (
+                value.decode("latin-1").strip().lower()
+                for key, value in scope["headers"]
+                if key == b"content-encoding"
+            ),
+            "identity",
+        )
+        if content_encoding == "identity":
+            await self.app(scope, receive, send)
+            return
+
+        if content_encoding not in ACCEPTED_REQUEST_ENCODINGS:
+            response = PlainTextResponse(
+                f"Unsupported content encoding {content_encoding}. Accepted encodings"
+                f" are: {', '.join(ACCEPTED_REQUEST_ENCODINGS)}",
+                status_code=415,
+            )
+            await response(scope, receive, send)
+            return
+
+        # the decompressed body has a different length
+        scope = {
+            **scope,
+            "headers": [
+                (key, value)
+                for key, value in scope["headers"]
+                if key not in (b"content-encoding", b"content-length")
+            ],
+        }
+        # wbits 31 expects gzip header and trailer
+        decompressor = zlib.decompressobj(wbits=31)
+
+        async def receive_decompressed() -> Message:
+            message = await receive()
+            if message["type"] != "http.request":
+                return message
+            body = decompressor.decompress(message.get("body", b""))
+            if not message.get("more_body", False):
+                body += decompressor.flush()
+            return {**message, "body": body}
+
+        response_started = False
+
+        async def send_tracking_start(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, receive_decompressed, send_tracking_start)
+        except zlib.error as e:
+            if response_started:
+                # e.g. streaming endpoints, no other response can be sent anymore
+                raise
+            response = PlainTextResponse(
+                f"Failed to decompress gzip encoded request body: {str(e)}",
+                status_code=400,
+            )
+            await response(scope, receive, send)
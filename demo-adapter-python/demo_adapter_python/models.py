@@ -11,6 +11,8 @@ class InfoResponse(BaseModel):
     id: str  # noqa: A003
     name: str
     version: str
+    acceptedRequestEncodings: list[str] = []
+    acceptedRequestContentTypes: list[str] = []
 
 
 class StructureThingNode(BaseModel):
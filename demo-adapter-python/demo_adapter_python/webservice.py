@@ -2,23 +2,37 @@ import base64
 import datetime
 import json
 import logging
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 from io import StringIO
 from typing import Any
 from urllib.parse import unquote
 
 import numpy as np
 import pandas as pd
-from fastapi import APIRouter, Body, FastAPI, Header, HTTPException, Query, status
+import pyarrow as pa
+from fastapi import APIRouter, FastAPI, Header, HTTPException, Query, status
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware import Middleware
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import StreamingResponse
 from fastapi.routing import APIRoute
+from pydantic import BaseModel, ValidationError, parse_obj_as
 from starlette.requests import Request
 from starlette.responses import Response
 
 from demo_adapter_python import VERSION
+from demo_adapter_python.arrow_format import (
+    ARROW_STREAM_MEDIA_TYPE,
+    accepts_arrow_stream,
+    arrow_stream_bytes_to_df,
+    df_to_arrow_stream_bytes,
+    is_arrow_stream_content_type,
+)
+from demo_adapter_python.compression import (
+    ACCEPTED_REQUEST_ENCODINGS,
+    RequestDecompressionMiddleware,
+)
 from demo_adapter_python.config import demo_adapter_config
 from demo_adapter_python.demo_data.sinks import get_sinks
 from demo_adapter_python.demo_data.sources import get_sources
@@ -54,7 +68,10 @@ middleware = [
         allow_methods=["GET", "POST"],
         allow_headers=["*"],
         expose_headers=["Data-Attributes"],  # is this necessary?
-    )
+    ),
+    # responses are only compressed if the client accepts gzip encoding
+    Middleware(GZipMiddleware, minimum_size=1000),
+    Middleware(RequestDecompressionMiddleware),
 ]
 
 app = FastAPI(
@@ -76,18 +93,22 @@ class AdditionalLoggingRoute(APIRoute):
         original_route_handler = super().get_route_handler()
 
         async def custom_route_handler(request: Request) -> Response:
-            try:
-                json_data = await request.json()
-            except json.decoder.JSONDecodeError:
+            if is_arrow_stream_content_type(request.headers.get("content-type")):
                 body = await request.body()
-                logger.info(
-                    "RECEIVED BODY (could not parse as json):\n%s", body.decode()
-                )
+                logger.info("RECEIVED ARROW STREAM BODY of %d bytes", len(body))
             else:
-                logger.info(
-                    "RECEIVED JSON BODY: \n%s",
-                    json.dumps(json_data, indent=2, sort_keys=True),
-                )
+                try:
+                    json_data = await request.json()
+                except json.decoder.JSONDecodeError:
+                    body = await request.body()
+                    logger.info(
+                        "RECEIVED BODY (could not parse as json):\n%s", body.decode()
+                    )
+                else:
+                    logger.info(
+                        "RECEIVED JSON BODY: \n%s",
+                        json.dumps(json_data, indent=2, sort_keys=True),
+                    )
             try:
                 return await original_route_handler(request)  # type: ignore
             except RequestValidationError as exc:
@@ -113,6 +134,8 @@ async def info() -> InfoResponse:
         id="python-demo-adapter",
         name="Python Demo Adapter",
         version=VERSION,
+        acceptedRequestEncodings=ACCEPTED_REQUEST_ENCODINGS,
+        acceptedRequestContentTypes=["application/json", ARROW_STREAM_MEDIA_TYPE],
     )
 
 
@@ -162,6 +185,20 @@ async def sources(
     )
 
 
+async def metadata_batch(
+    get_metadatum: Callable[[str], Awaitable[Metadatum]], keys: list[str]
+) -> list[Metadatum]:
+    """Metadata with the requested keys, omitting those which are not available"""
+    metadata = []
+    for key in keys:
+        try:
+            metadata.append(await get_metadatum(key))
+        except HTTPException as e:
+            if e.status_code != status.HTTP_404_NOT_FOUND:
+                raise
+    return metadata
+
+
 @demo_adapter_main_router.get(
     "/sources/{sourceId}/metadata/", response_model=list[Metadatum]
 )
@@ -238,6 +275,17 @@ async def get_metadata_source_by_key(  # noqa: PLR0911, PLR0912
     )
 
 
+@demo_adapter_main_router.get(
+    "/sources/{sourceId}/metadataBatch", response_model=list[Metadatum]
+)
+async def get_metadata_batch_source(
+    sourceId: str, key: list[str] = Query([])
+) -> list[Metadatum]:
+    return await metadata_batch(
+        lambda single_key: get_metadata_source_by_key(sourceId, single_key), key
+    )
+
+
 @demo_adapter_main_router.post(
     "/sources/{sourceId}/metadata/{key}", status_code=200, response_model=None
 )
@@ -343,6 +391,17 @@ async def get_metadata_sink_by_key(sinkId: str, key: str) -> Metadatum:
     )
 
 
+@demo_adapter_main_router.get(
+    "/sinks/{sinkId}/metadataBatch", response_model=list[Metadatum]
+)
+async def get_metadata_batch_sink(
+    sinkId: str, key: list[str] = Query([])
+) -> list[Metadatum]:
+    return await metadata_batch(
+        lambda single_key: get_metadata_sink_by_key(sinkId, single_key), key
+    )
+
+
 @demo_adapter_main_router.post(
     "/sinks/{sinkId}/metadata/{key}", status_code=200, response_model=None
 )
@@ -487,6 +546,22 @@ async def get_metadata_thingNode_by_key(  # noqa: PLR0911, PLR0912
     )
 
 
+@demo_adapter_main_router.get(
+    "/thingNodes/{thingNodeId}/metadataBatch", response_model=list[Metadatum]
+)
+async def get_metadata_batch_thingNode(
+    thingNodeId: str,
+    key: list[str] = Query([]),
+    latex_mode: str = Query("", examples=["yes"]),
+) -> list[Metadatum]:
+    return await metadata_batch(
+        lambda single_key: get_metadata_thingNode_by_key(
+            thingNodeId, single_key, latex_mode=latex_mode
+        ),
+        key,
+    )
+
+
 @demo_adapter_main_router.post(
     "/thingNodes/{thingNodeId}/metadata/{key}", status_code=200, response_model=None
 )
@@ -543,6 +618,80 @@ def encode_attributes(data_attrs: Any) -> str:
     return base64_str
 
 
+def framelike_response(
+    df: pd.DataFrame, headers: dict[str, str], accept: str | None
+) -> Response:
+    """Respond with Arrow IPC stream if accepted, otherwise with json lines"""
+    if accepts_arrow_stream(accept):
+        try:
+            arrow_stream_bytes = df_to_arrow_stream_bytes(df)
+        except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+            logger.info("Cannot convert data to Arrow, responding with json: %s", e)
+        else:
+            return Response(
+                arrow_stream_bytes, media_type=ARROW_STREAM_MEDIA_TYPE, headers=headers
+            )
+
+    io_stream = StringIO()
+    df.to_json(io_stream, lines=True, orient="records", date_format="iso")
+    io_stream.seek(0)
+
+    return StreamingResponse(io_stream, media_type="application/json", headers=headers)
+
+
+async def framelike_request_body_to_df(
+    request: Request, record_model: type[BaseModel] | None = None
+) -> pd.DataFrame:
+    """Read Arrow IPC stream or json list of records from request body
+
+    If record_model is provided, json records are validated with it.
+    """
+    body = await request.body()
+    if is_arrow_stream_content_type(request.headers.get("content-type")):
+        try:
+            return arrow_stream_bytes_to_df(body)
+        except pa.ArrowInvalid as error:
+            raise HTTPException(
+                status.HTTP_422_UNPROCESSABLE_ENTITY,
+                f"Cannot read request body as Arrow IPC stream: {error}",
+            ) from error
+
+    try:
+        records = json.loads(body)
+    except json.decoder.JSONDecodeError as error:
+        raise HTTPException(
+            status.HTTP_422_UNPROCESSABLE_ENTITY,
+            f"Cannot parse request body as json: {error}",
+        ) from error
+    if record_model is not None:
+        try:
+            records = [
+                record.dict() for record in parse_obj_as(list[record_model], records)  # type: ignore
+            ]
+        except ValidationError as error:
+            raise RequestValidationError(error.errors()) from error
+    return pd.DataFrame.from_dict(records, orient="columns")
+
+
+def framelike_request_body_openapi(
+    items_schema: dict[str, Any], example: list[dict[str, Any]]
+) -> dict[str, Any]:
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": {"type": "array", "items": items_schema},
+                    "example": example,
+                },
+                ARROW_STREAM_MEDIA_TYPE: {
+                    "schema": {"type": "string", "format": "binary"}
+                },
+            },
+        }
+    }
+
+
 def return_stored_anomaly_score(
     ts_id: str, from_timestamp: datetime.datetime, to_timestamp: datetime.datetime
 ) -> pd.DataFrame:
@@ -591,9 +740,10 @@ async def timeseries(
         ..., alias="to", examples=[datetime.datetime.now(datetime.timezone.utc)]
     ),
     frequency: str = Query("", examples=["5min"]),
-) -> StreamingResponse:
+    accept: str | None = Header(None),
+) -> Response:
     collected_attrs = {}
-    io_stream = StringIO()
+    ts_dfs = []
 
     dt_range = pd.date_range(
         start=from_timestamp, end=to_timestamp, freq="1h", tz=datetime.timezone.utc
@@ -631,8 +781,7 @@ async def timeseries(
                     f"Provided value '{frequency}' for the filter 'frequency' is invalid! "
                     "Check the reference for pandas.DataFrame.resample for more information.",
                 ) from error
-        # throws warning during pytest:
-        ts_df.to_json(io_stream, lines=True, orient="records", date_format="iso")
+        ts_dfs.append(ts_df)
 
         if len(ts_df.attrs) != 0:
             logger.debug("which has attributes %s", str(ts_df.attrs))
@@ -646,11 +795,12 @@ async def timeseries(
                 }
             )
 
-    io_stream.seek(0)
     headers = {}
     if len(collected_attrs) != 0:
         headers["Data-Attributes"] = encode_attributes(collected_attrs)
-    return StreamingResponse(io_stream, media_type="application/json", headers=headers)
+    return framelike_response(
+        pd.concat(ts_dfs, ignore_index=True), headers=headers, accept=accept
+    )
 
 
 def decode_attributes(data_attributes: str) -> Any:
@@ -663,16 +813,26 @@ def decode_attributes(data_attributes: str) -> Any:
     return df_attrs
 
 
-@demo_adapter_main_router.post("/timeseries", status_code=200)
+@demo_adapter_main_router.post(
+    "/timeseries",
+    status_code=200,
+    openapi_extra=framelike_request_body_openapi(
+        TimeseriesRecord.schema(),
+        [
+            {"timestamp": "2020-03-11T13:45:18.194000000Z", "value": 42.3},
+            {"timestamp": "2020-03-11T14:45:18.194000000Z", "value": 41.7},
+        ],
+    ),
+)
 async def post_timeseries(
-    ts_body: list[TimeseriesRecord],
+    request: Request,
     ts_id: str = Query(..., alias="timeseriesId"),
     frequency: str = Query("", examples=["5min"]),
     data_attributes: str | None = Header(None),
 ) -> dict:
-    logger.info("Received ts_body for id %s:\n%s", ts_id, str(ts_body))
+    df = await framelike_request_body_to_df(request, record_model=TimeseriesRecord)
+    logger.info("Received timeseries for id %s:\n%s", ts_id, str(df))
     if ts_id.endswith("anomaly_score"):
-        df = pd.DataFrame.from_dict((x.dict() for x in ts_body), orient="columns")
         if "timestamp" not in df.columns:
             raise HTTPException(
                 status.HTTP_422_UNPROCESSABLE_ENTITY,
@@ -728,7 +888,8 @@ def parse_string_to_list(input_string: str) -> tuple[list, str]:
 async def dataframe(
     df_id: str = Query(..., alias="id"),
     column_names: str = Query("", examples=["""[\\\"column1\\\", \\\"column2\\\"]"""]),
-) -> StreamingResponse | HTTPException:
+    accept: str | None = Header(None),
+) -> Response:
     if df_id.endswith("plantA.maintenance_events"):
         df = pd.DataFrame(
             {  # has timestamp column
@@ -834,30 +995,28 @@ async def dataframe(
     if df_attrs is not None and len(df_attrs) != 0:
         headers["Data-Attributes"] = encode_attributes(df_attrs)
 
-    io_stream = StringIO()
-    df.to_json(io_stream, lines=True, orient="records", date_format="iso")
-    io_stream.seek(0)
-
-    return StreamingResponse(io_stream, media_type="application/json", headers=headers)
+    return framelike_response(df, headers=headers, accept=accept)
 
 
-@demo_adapter_main_router.post("/dataframe", status_code=200)
-async def post_dataframe(
-    df_body: list[dict] = Body(
-        ...,
-        examples=[
-            [
-                {"column_A": 42.0, "column_B": "example"},
-                {"column_A": 11.97, "column_B": "example"},
-            ]
+@demo_adapter_main_router.post(
+    "/dataframe",
+    status_code=200,
+    openapi_extra=framelike_request_body_openapi(
+        {"type": "object"},
+        [
+            {"column_A": 42.0, "column_B": "example"},
+            {"column_A": 11.97, "column_B": "example"},
         ],
     ),
+)
+async def post_dataframe(
+    request: Request,
     df_id: str = Query(..., alias="id"),
     column_names: str = Query("", examples=["""[\\\"column1\\\", \\\"column2\\\"]"""]),
     data_attributes: str | None = Header(None),
 ) -> dict:
     if df_id.endswith("alerts"):
-        df = pd.DataFrame.from_dict(df_body, orient="columns")
+        df = await framelike_request_body_to_df(request)
         if column_names != "":
             column_name_list, error_msg = parse_string_to_list(column_names)
             if error_msg != "":
@@ -877,7 +1036,7 @@ async def post_dataframe(
             df_from_store: pd.DataFrame = get_value_from_store(df_id)
             df.attrs = df_from_store.attrs
             df.attrs.update(decode_attributes(data_attributes))
-        logger.debug("storing %s", json.dumps(df_body))
+        logger.debug("storing %s", str(df))
         logger.debug("which has attributes %s", str(df.attrs))
         set_value_in_store(df_id, df)
         return {"message": "success"}
@@ -888,7 +1047,7 @@ async def post_dataframe(
 
 
 @demo_adapter_main_router.get("/multitsframe", response_model=None)
-async def multitsframe(
+async def multitsframe(  # noqa: PLR0913
     mtsf_id: str = Query(..., alias="id"),
     from_timestamp: datetime.datetime = Query(
         ..., alias="from", examples=[datetime.datetime.now(datetime.timezone.utc)]
@@ -898,7 +1057,8 @@ async def multitsframe(
     ),
     lower_threshold: str = Query("", examples=["93.4"]),
     upper_threshold: str = Query("", examples=["107.9"]),
-) -> StreamingResponse | HTTPException:
+    accept: str | None = Header(None),
+) -> Response:
     dt_range = pd.date_range(
         start=from_timestamp, end=to_timestamp, freq="H", tz=datetime.timezone.utc
     )
@@ -975,48 +1135,46 @@ async def multitsframe(
     if df_attrs is not None and len(df_attrs) != 0:
         headers["Data-Attributes"] = encode_attributes(df_attrs)
 
-    io_stream = StringIO()
-    mtsf.to_json(io_stream, lines=True, orient="records", date_format="iso")
-    io_stream.seek(0)
-
-    return StreamingResponse(io_stream, media_type="application/json", headers=headers)
+    return framelike_response(mtsf, headers=headers, accept=accept)
 
 
-@demo_adapter_main_router.post("/multitsframe", status_code=200)
-async def post_multitsframe(
-    mtsf_body: list[dict] = Body(
-        ...,
-        examples=[
-            [
-                {
-                    "metric": "Milling Influx Temperature",
-                    "timestamp": "2020-03-11T13:45:18.194000000Z",
-                    "value": 42.3,
-                },
-                {
-                    "metric": "Milling Outfeed Temperature",
-                    "timestamp": "2020-03-11T14:45:18.237000000Z",
-                    "value": 41.7,
-                },
-                {
-                    "metric": "Pickling Influx Temperature",
-                    "timestamp": "2020-03-11T15:45:18.081000000Z",
-                    "value": 18.4,
-                },
-                {
-                    "metric": "Pickling Outfeed Temperature",
-                    "timestamp": "2020-03-11T15:45:18.153000000Z",
-                    "value": 18.3,
-                },
-            ]
+@demo_adapter_main_router.post(
+    "/multitsframe",
+    status_code=200,
+    openapi_extra=framelike_request_body_openapi(
+        {"type": "object"},
+        [
+            {
+                "metric": "Milling Influx Temperature",
+                "timestamp": "2020-03-11T13:45:18.194000000Z",
+                "value": 42.3,
+            },
+            {
+                "metric": "Milling Outfeed Temperature",
+                "timestamp": "2020-03-11T14:45:18.237000000Z",
+                "value": 41.7,
+            },
+            {
+                "metric": "Pickling Influx Temperature",
+                "timestamp": "2020-03-11T15:45:18.081000000Z",
+                "value": 18.4,
+            },
+            {
+                "metric": "Pickling Outfeed Temperature",
+                "timestamp": "2020-03-11T15:45:18.153000000Z",
+                "value": 18.3,
+            },
         ],
     ),
+)
+async def post_multitsframe(
+    request: Request,
     mtsf_id: str = Query(..., alias="id"),
     metric_names: str = Query("", examples=["""[\\\"metric1\\\", \\\"metric2\\\"]"""]),
     data_attributes: str | None = Header(None),
 ) -> dict:
     if mtsf_id in ("root.plantA.anomalies", "root.plantB.anomalies"):
-        mtsf = pd.DataFrame.from_dict(mtsf_body, orient="columns")
+        mtsf = await framelike_request_body_to_df(request)
         if metric_names != "":
             metric_name_list, error_msg = parse_string_to_list(metric_names)
             if error_msg != "":
@@ -1043,7 +1201,7 @@ async def post_multitsframe(
             df_from_store: pd.DataFrame = get_value_from_store(mtsf_id)
             mtsf.attrs = df_from_store.attrs
             mtsf.attrs.update(decode_attributes(data_attributes))
-        logger.debug("storing %s", json.dumps(mtsf_body))
+        logger.debug("storing %s", str(mtsf))
         logger.debug("which has attributes %s", str(mtsf.attrs))
         set_value_in_store(mtsf_id, mtsf)
         return {"message": "success"}
@@ -1,5 +1,7 @@
+import gzip
 import io
 import json
+import zlib
 from copy import deepcopy
 from urllib.parse import quote
 
@@ -7,7 +9,15 @@ import pandas as pd
 import pytest
 from httpx import AsyncClient
 from starlette.testclient import TestClient
+from starlette.types import Message, Receive, Scope, Send
 
+from demo_adapter_python.arrow_format import (
+    ARROW_STREAM_MEDIA_TYPE,
+    accepts_arrow_stream,
+    arrow_stream_bytes_to_df,
+    df_to_arrow_stream_bytes,
+)
+from demo_adapter_python.compression import RequestDecompressionMiddleware
 from demo_adapter_python.external_types import ExternalType
 from demo_adapter_python.in_memory_store import get_value_from_store
 from demo_adapter_python.models import (
@@ -352,6 +362,41 @@ async def test_post_metadata_to_sink_get_metadata_from_source(
         assert get_response.json()["value"] == value
 
 
+@pytest.mark.asyncio
+async def test_get_metadata_batch(async_test_client: AsyncClient) -> None:
+    async with async_test_client as client:
+        response = await client.get(
+            "/thingNodes/root.plantA/metadataBatch",
+            params=[
+                ("key", "Temperature Unit"),
+                ("key", "Pressure Unit"),
+                ("key", "Unknown Key"),
+                ("latex_mode", "yes"),
+            ],
+        )
+        assert response.status_code == 200
+        assert response.json() == [
+            {
+                "key": "Temperature Unit",
+                "value": "$^\\circ$F",
+                "dataType": "string",
+                "isSink": False,
+            },
+            {
+                "key": "Pressure Unit",
+                "value": "psi",
+                "dataType": "string",
+                "isSink": False,
+            },
+        ]
+
+        response = await client.get(
+            "/sources/unknown_source/metadataBatch", params={"key": "Max Value"}
+        )
+        assert response.status_code == 200
+        assert response.json() == []
+
+
 @pytest.mark.asyncio
 async def test_sending_attrs_via_get_dataframe(async_test_client: AsyncClient) -> None:
     async with async_test_client as client:
@@ -882,3 +927,145 @@ async def test_output_wiring_free_text_filters(
         )
         assert ts_response_no_frequency_string.status_code == 422
         assert "'frequency' is invalid" in ts_response_no_frequency_string.text
+
+
+@pytest.mark.asyncio
+async def test_gzip_encoded_requests_and_responses(
+    async_test_client: AsyncClient,
+) -> None:
+    async with async_test_client as client:
+        info_response = await client.get("/info")
+        assert info_response.json()["acceptedRequestEncodings"] == ["gzip"]
+
+        ts_id = "root.plantA.picklingUnit.influx.anomaly_score"
+        records = [
+            {"timestamp": f"2020-01-01T00:{minute:02d}:00.000000000Z", "value": 1.5}
+            for minute in range(60)
+        ]
+        response = await client.post(
+            f"/timeseries?timeseriesId={ts_id}",
+            content=gzip.compress(json.dumps(records).encode("utf8")),
+            headers={"Content-Type": "application/json", "Content-Encoding": "gzip"},
+        )
+        assert response.status_code == 200
+        assert len(get_value_from_store(ts_id)) == 60
+
+        response = await client.get(
+            "/timeseries",
+            params={
+                "id": "root.plantA.picklingUnit.influx.temp",
+                "from": "2020-01-01T00:00:00Z",
+                "to": "2020-01-03T00:00:00Z",
+            },
+            headers={"Accept-Encoding": "gzip"},
+        )
+        assert response.status_code == 200
+        assert response.headers["Content-Encoding"] == "gzip"
+        # httpx decodes the response transparently
+        assert len(response.text.splitlines()) > 1
+
+        response = await client.post(
+            f"/timeseries?timeseriesId={ts_id}",
+            content=b"not compressed",
+            headers={"Content-Type": "application/json", "Content-Encoding": "br"},
+        )
+        assert response.status_code == 415
+
+
+@pytest.mark.asyncio
+async def test_arrow_stream_format_for_framelike_data(
+    async_test_client: AsyncClient,
+) -> None:
+    async with async_test_client as client:
+        info_response = await client.get("/info")
+        assert (
+            ARROW_STREAM_MEDIA_TYPE
+            in info_response.json()["acceptedRequestContentTypes"]
+        )
+        openapi_response = await client.get("/openapi.json")
+        assert (
+            ARROW_STREAM_MEDIA_TYPE
+            in openapi_response.json()["paths"]["/timeseries"]["post"]["requestBody"][
+                "content"
+            ]
+        )
+
+        ts_id = "root.plantA.picklingUnit.influx.anomaly_score"
+        ts_df = pd.DataFrame(
+            {
+                "timestamp": pd.date_range(
+                    "2020-01-01T00:00:00Z", periods=5, freq="1h"
+                ),
+                "value": [1.0, 2.0, 3.0, 4.0, 5.0],
+            }
+        )
+        response = await client.post(
+            f"/timeseries?timeseriesId={ts_id}",
+            content=df_to_arrow_stream_bytes(ts_df),
+            headers={"Content-Type": ARROW_STREAM_MEDIA_TYPE},
+        )
+        assert response.status_code == 200
+
+        response = await client.get(
+            "/timeseries",
+            params={
+                "id": ts_id,
+                "from": "2020-01-01T00:00:00Z",
+                "to": "2020-01-02T00:00:00Z",
+            },
+            headers={"Accept": f"{ARROW_STREAM_MEDIA_TYPE}, */*;q=0.5"},
+        )
+        assert response.status_code == 200
+        assert response.headers["Content-Type"] == ARROW_STREAM_MEDIA_TYPE
+        received_df = arrow_stream_bytes_to_df(response.content)
+        assert received_df["value"].to_list() == [1.0, 2.0, 3.0, 4.0, 5.0]
+        assert (received_df["timeseriesId"] == ts_id).all()
+        assert isinstance(received_df["timestamp"].dtype, pd.DatetimeTZDtype)
+
+        # mixed value types cannot be converted, json lines are sent instead
+        response = await client.get(
+            "/dataframe",
+            params={"id": "root.plantA.masterdata"},
+            headers={"Accept": ARROW_STREAM_MEDIA_TYPE},
+        )
+        assert response.status_code == 200
+        assert response.headers["Content-Type"] == "application/json"
+        assert len(response.text.splitlines()) == 3
+
+        # without Accept header json lines are sent
+        response = await client.get(
+            "/dataframe", params={"id": "root.plantA.maintenance_events"}
+        )
+        assert response.headers["Content-Type"] == "application/json"
+
+
+def test_accepts_arrow_stream() -> None:
+    assert accepts_arrow_stream(ARROW_STREAM_MEDIA_TYPE)
+    assert accepts_arrow_stream(f"application/json, {ARROW_STREAM_MEDIA_TYPE};q=0.9")
+    assert not accepts_arrow_stream(f"{ARROW_STREAM_MEDIA_TYPE};q=0")
+    assert not accepts_arrow_stream("*/*")
+    assert not accepts_arrow_stream(None)
+
+
+@pytest.mark.asyncio
+async def test_invalid_gzip_request_body_after_response_start() -> None:
+    sent_messages: list[Message] = []
+
+    async def streaming_app(
+        scope: Scope, receive: Receive, send: Send  # noqa: ARG001
+    ) -> None:
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await receive()
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b"not compressed", "more_body": False}
+
+    async def send(message: Message) -> None:
+        sent_messages.append(message)
+
+    with pytest.raises(zlib.error):
+        await RequestDecompressionMiddleware(streaming_app)(
+            {"type": "http", "headers": [(b"content-encoding", b"gzip")]}, receive, send
+        )
+    # no second response is started
+    assert [message["type"] for message in sent_messages] == ["http.response.start"]
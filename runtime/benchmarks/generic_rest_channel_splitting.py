@@ -0,0 +1,89 @@
+"""Benchmark splitting multi-timeseries responses of generic rest adapters
+
+Compares the single-pass splitting of loaded timeseries records into one
+Series per timeseriesId to the former approach of masking the complete
+records once per id, for an increasing number of channels with a fixed
+number of records per channel.
+
+Run from the runtime directory via
+
+    python -m benchmarks.generic_rest_channel_splitting --records-per-channel 2000
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from hetdesrun.adapters.generic_rest.load_ts_data import (
+    split_channels_from_loaded_data,
+)
+
+
+def mask_per_id(df: pd.DataFrame, ts_ids: list[str]) -> dict[str, pd.Series]:
+    extracted_series_by_ts_id = {}
+    for ts_id in ts_ids:
+        extracted_df = df[df["timeseriesId"] == ts_id].copy()
+        extracted_df.index = extracted_df["timestamp"]
+        extracted_series_by_ts_id[ts_id] = extracted_df["value"].sort_index()
+    return extracted_series_by_ts_id
+
+
+def records_of_channels(n_channels: int, records_per_channel: int) -> pd.DataFrame:
+    rng = np.random.default_rng(42)
+    n_records = n_channels * records_per_channel
+    return pd.DataFrame(
+        {
+            "timeseriesId": pd.Series(
+                np.repeat(
+                    [f"channel_{i}" for i in range(n_channels)], records_per_channel
+                ),
+                dtype="string",
+            ),
+            "timestamp": pd.Timestamp("2020-01-01T00:00:00Z")
+            + pd.to_timedelta(
+                np.tile(np.arange(records_per_channel), n_channels), unit="s"
+            ),
+            "value": rng.normal(size=n_records),
+        }
+    ).sample(
+        frac=1, random_state=42
+    )  # adapters may interleave channels
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument("--records-per-channel", type=int, default=2000)
+    parser.add_argument(
+        "--channels", type=int, nargs="+", default=[10, 50, 100, 250, 500]
+    )
+    args = parser.parse_args()
+
+    print(  # noqa: T201
+        f"{'channels':>8} {'records':>10} {'mask per id':>12} {'single pass':>12}"
+    )
+    for n_channels in args.channels:
+        df = records_of_channels(n_channels, args.records_per_channel)
+        ts_ids = [f"channel_{i}" for i in range(n_channels)]
+
+        start = time.perf_counter()
+        masked = mask_per_id(df, ts_ids)
+        mask_duration = time.perf_counter() - start
+
+        start = time.perf_counter()
+        split = split_channels_from_loaded_data(df, {ts_id: ts_id for ts_id in ts_ids})
+        split_duration = time.perf_counter() - start
+
+        for ts_id in ts_ids:
+            pd.testing.assert_series_equal(
+                split[ts_id], masked[ts_id], check_names=False
+            )
+
+        print(  # noqa: T201
+            f"{n_channels:>8} {len(df):>10} {mask_duration:>11.3f}s {split_duration:>11.3f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
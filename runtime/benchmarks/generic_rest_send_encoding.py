@@ -0,0 +1,78 @@
+"""Benchmark encoding of timeseries for generic rest adapter sinks
+
+Compares the vectorized json encoding of timeseries used by the generic rest
+adapter sinks to the former per-row encoding (strftime via apply followed by
+to_dict and json.dumps) and checks that both result in identical bytes.
+
+Run from the runtime directory via
+
+    python -m benchmarks.generic_rest_send_encoding --n-points 1000000
+"""
+
+import argparse
+import json
+import time
+
+import numpy as np
+import pandas as pd
+
+from hetdesrun.adapters.generic_rest.external_types import ExternalType
+from hetdesrun.adapters.generic_rest.send_framelike import JsonRecordsStream
+from hetdesrun.adapters.generic_rest.send_ts_data import ts_to_json_rows_encoder
+
+
+def per_row_encoding(series: pd.Series) -> bytes:
+    records = (
+        pd.DataFrame(
+            {
+                "value": series.to_numpy(),
+                "timestamp": pd.Series(series.index, index=series.index).apply(
+                    lambda x: x.strftime("%Y-%m-%dT%H:%M:%S.%f")
+                    + f"{x.nanosecond:03d}"
+                    + "Z"
+                ),
+            }
+        )
+        .replace({np.nan: None})
+        .to_dict(orient="records")
+    )
+    return json.dumps(records).encode("utf-8")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument("--n-points", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    series = pd.Series(
+        rng.normal(size=args.n_points),
+        index=pd.date_range(
+            "2020-01-01T00:00:00Z", periods=args.n_points, freq="1337ns"
+        ),
+    )
+    series.iloc[::100] = np.nan
+
+    start = time.perf_counter()
+    vectorized = b"".join(
+        JsonRecordsStream(
+            ts_to_json_rows_encoder(series, ExternalType.TIMESERIES_FLOAT),
+            0,
+            len(series),
+        ).chunks()
+    )
+    vectorized_duration = time.perf_counter() - start
+
+    start = time.perf_counter()
+    per_row = per_row_encoding(series)
+    per_row_duration = time.perf_counter() - start
+
+    print(f"points:     {args.n_points}")  # noqa: T201
+    print(f"per row:    {per_row_duration:.3f} s")  # noqa: T201
+    print(f"vectorized: {vectorized_duration:.3f} s")  # noqa: T201
+    print(f"speedup:    {per_row_duration / vectorized_duration:.1f}x")  # noqa: T201
+    print(f"identical:  {vectorized == per_row}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
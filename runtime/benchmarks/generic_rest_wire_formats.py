@@ -0,0 +1,94 @@
+"""Benchmark decoding generic rest adapter responses in different wire formats
+
+Compares parsing timeseries records received as NDJSON to reading them from an
+Arrow IPC stream, for an increasing number of records. Additionally the sizes of
+the encoded responses are printed, uncompressed and gzip compressed.
+
+Run from the runtime directory via
+
+    python -m benchmarks.generic_rest_wire_formats --records 100000 1000000
+"""
+
+import argparse
+import gzip
+import io
+import time
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from hetdesrun.adapters.generic_rest.arrow_format import parse_arrow_stream_bytes
+from hetdesrun.adapters.generic_rest.load_framelike import parse_ndjson_bytes
+
+
+def timeseries_records(n_records: int, n_channels: int = 10) -> pd.DataFrame:
+    rng = np.random.default_rng(42)
+    return pd.DataFrame(
+        {
+            "timeseriesId": np.repeat(
+                [f"channel_{i}" for i in range(n_channels)],
+                n_records // n_channels,
+            ),
+            "timestamp": pd.Timestamp("2020-01-01T00:00:00Z")
+            + pd.to_timedelta(
+                np.tile(np.arange(n_records // n_channels), n_channels), unit="s"
+            ),
+            "value": rng.normal(size=n_channels * (n_records // n_channels)),
+        }
+    )
+
+
+def to_ndjson_bytes(df: pd.DataFrame) -> bytes:
+    io_stream = io.StringIO()
+    df.to_json(
+        io_stream, lines=True, orient="records", date_format="iso", date_unit="ns"
+    )
+    return io_stream.getvalue().encode("utf8")
+
+
+def to_arrow_stream_bytes(df: pd.DataFrame) -> bytes:
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument(
+        "--records", type=int, nargs="+", default=[10_000, 100_000, 1_000_000]
+    )
+    args = parser.parse_args()
+
+    print(  # noqa: T201
+        f"{'records':>10} {'ndjson parse':>13} {'arrow read':>11}"
+        f" {'ndjson MB':>10} {'gzip MB':>8} {'arrow MB':>9} {'gzip MB':>8}"
+    )
+    for n_records in args.records:
+        df = timeseries_records(n_records)
+        ndjson_bytes = to_ndjson_bytes(df)
+        arrow_stream_bytes = to_arrow_stream_bytes(df)
+
+        start = time.perf_counter()
+        ndjson_df = parse_ndjson_bytes(ndjson_bytes)
+        ndjson_duration = time.perf_counter() - start
+
+        start = time.perf_counter()
+        arrow_df = parse_arrow_stream_bytes(arrow_stream_bytes)
+        arrow_duration = time.perf_counter() - start
+
+        pd.testing.assert_frame_equal(ndjson_df, arrow_df, check_dtype=False)
+
+        print(  # noqa: T201
+            f"{len(df):>10} {ndjson_duration:>12.3f}s {arrow_duration:>10.3f}s"
+            f" {len(ndjson_bytes) / 1e6:>10.1f}"
+            f" {len(gzip.compress(ndjson_bytes)) / 1e6:>8.1f}"
+            f" {len(arrow_stream_bytes) / 1e6:>9.1f}"
+            f" {len(gzip.compress(arrow_stream_bytes)) / 1e6:>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
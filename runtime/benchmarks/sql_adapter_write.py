@@ -0,0 +1,94 @@
+"""Benchmark writing timeseries rows via the sql adapter on SQLite
+
+Compares the insert strategies available to DataFrame.to_sql for appending to a
+timeseries table in a temporary SQLite database file:
+
+* multi row INSERT statements, chunked to stay below the bound parameter limit
+* executemany of one prepared INSERT statement in one transaction, which is what
+  the sql adapter uses for SQLite
+
+Run from the runtime directory via
+
+    python -m benchmarks.sql_adapter_write --rows 10000 100000 300000
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from hetdesrun.adapters.sql_adapter.config import SQLAdapterDBConfig
+from hetdesrun.adapters.sql_adapter.write_table import write_dataframe
+
+
+def timeseries_rows(n_rows: int, n_metrics: int = 10) -> pd.DataFrame:
+    rng = np.random.default_rng(42)
+    return pd.DataFrame(
+        {
+            "timestamp": pd.Timestamp("2023-01-01T00:00:00Z")
+            + pd.to_timedelta(np.arange(n_rows) // n_metrics, unit="s"),
+            "metric": np.tile([f"metric_{i}" for i in range(n_metrics)], n_rows)[
+                :n_rows
+            ],
+            "value": rng.normal(size=n_rows),
+        }
+    )
+
+
+def write_multi_row_inserts(db_config: SQLAdapterDBConfig, df: pd.DataFrame) -> None:
+    with db_config.engine.begin() as connection:
+        df.to_sql(
+            "ts_table",
+            connection,
+            if_exists="append",
+            index=False,
+            method="multi",
+            # SQLite allows 32766 bound parameters per statement
+            chunksize=32766 // len(df.columns),
+        )
+
+
+def write_bulk(db_config: SQLAdapterDBConfig, df: pd.DataFrame) -> None:
+    write_dataframe(db_config.engine, df, "ts_table", if_exists="append")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument(
+        "--rows", type=int, nargs="+", default=[10_000, 100_000, 300_000]
+    )
+    args = parser.parse_args()
+
+    print(f"{'rows':>10} {'multi insert':>13} {'bulk write':>11}")  # noqa: T201
+    for n_rows in args.rows:
+        df = timeseries_rows(n_rows)
+        durations = []
+        for write in (write_multi_row_inserts, write_bulk):
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                db_config = SQLAdapterDBConfig(
+                    connection_url="sqlite+pysqlite:///"
+                    + os.path.join(tmp_dir, "benchmark.db"),
+                    name="benchmark sqlite db",
+                    key="benchmark_sqlite_db",
+                )
+                start = time.perf_counter()
+                write(db_config, df)
+                durations.append(time.perf_counter() - start)
+                assert (  # noqa: S101
+                    pd.read_sql_query(
+                        "SELECT COUNT(*) AS n FROM ts_table", db_config.engine
+                    )["n"][0]
+                    == n_rows
+                )
+                db_config.engine.dispose()
+
+        print(  # noqa: T201
+            f"{n_rows:>10} {durations[0]:>12.3f}s {durations[1]:>10.3f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -31,6 +31,7 @@ from hetdesrun.adapters.exceptions import (  # noqa: F401
     AdapterOutputDataError,
     AdapterUnknownError,
 )
+from hetdesrun.adapters.execution import run_blocking_adapter_func
 from hetdesrun.adapters.generic_rest import load_data as generic_rest_adapter_load_func
 from hetdesrun.adapters.generic_rest import send_data as generic_rest_adapter_send_func
 from hetdesrun.adapters.local_file import load_data as local_file_load_data
@@ -226,8 +227,12 @@ async def load_data_from_adapter(
                 adapter_key=str(adapter_key),
             )
             return loaded_data
-        loaded_data = adapter_func(
-            wf_input_name_to_filtered_source_mapping_dict, adapter_key=str(adapter_key)
+        # synchronous adapter functions must not block the event loop
+        loaded_data = await run_blocking_adapter_func(
+            str(adapter_key),
+            adapter_func,
+            wf_input_name_to_filtered_source_mapping_dict,
+            adapter_key=str(adapter_key),
         )
         return loaded_data
     except adapter["connection_error_classes"] as e:
@@ -273,7 +278,10 @@ async def send_data_with_adapter(
                 adapter_key=str(adapter_key),
             )
         else:
-            data_not_sent = adapter_func(
+            # synchronous adapter functions must not block the event loop
+            data_not_sent = await run_blocking_adapter_func(
+                str(adapter_key),
+                adapter_func,
                 wf_output_name_to_filtered_sink_mapping_dict,
                 result_data,
                 adapter_key=str(adapter_key),
@@ -9,6 +9,7 @@ try:
 except FileNotFoundError:
     VERSION = "dev snapshot"
 
+ADAPTER_KEY: Final = "blob-storage-adapter"
 BUCKET_NAME_DIR_SEPARATOR: Final = "-"
 OBJECT_KEY_DIR_SEPARATOR: Final = "/"
 IDENTIFIER_SEPARATOR: Final = "_"
@@ -1,4 +1,5 @@
 import os
+from datetime import timedelta
 from typing import Literal
 
 from pydantic import BaseSettings, Field, validator
@@ -88,6 +89,58 @@ class BlobStorageAdapterConfig(BaseSettings):
         env="BLOB_STORAGE_CHECKSUM_ALGORITHM",
     )
 
+    multipart_part_size: int = Field(
+        8 * 1024 * 1024,
+        description=(
+            "Size in bytes of the parts in which objects are uploaded. Objects larger than"
+            " this are written with a multipart upload, so that at most one part is held"
+            " in memory additionally to the object. Also the size up to which hdf5"
+            " objects are buffered in memory when loading, larger ones are buffered in a"
+            " temporary file. Must be at least 5 MiB, as required by S3."
+        ),
+        env="BLOB_STORAGE_ADAPTER_MULTIPART_PART_SIZE",
+        ge=5 * 1024 * 1024,
+    )
+    listing_cache_ttl: timedelta | None = Field(
+        timedelta(seconds=60),
+        description=(
+            "How long the object keys of each bucket are cached for answering structure"
+            " and source requests. Objects written by the adapter are visible"
+            " immediately, objects written otherwise after this time at the latest."
+            " Set to null to list the bucket on every request. Can be provided in seconds."
+        ),
+        env="BLOB_STORAGE_ADAPTER_LISTING_CACHE_TTL",
+    )
+    object_cache_dir: str | None = Field(
+        None,
+        description=(
+            "Directory in which loaded objects are cached. Later loads of an unchanged"
+            " object, as determined by its ETag, read the cached file instead of"
+            " downloading the object again. If not set, no objects are cached on disk."
+        ),
+        env="BLOB_STORAGE_ADAPTER_OBJECT_CACHE_DIR",
+    )
+    object_cache_max_size: int = Field(
+        1024**3,
+        description=(
+            "Maximum total size in bytes of the object cache directory."
+            " Least recently used cached objects are removed if exceeded."
+        ),
+        env="BLOB_STORAGE_ADAPTER_OBJECT_CACHE_MAX_SIZE",
+        gt=0,
+    )
+    object_cache_max_objects: int = Field(
+        0,
+        description=(
+            "Number of deserialized objects kept in memory, so that loading an"
+            " unchanged object again does not require deserializing it again."
+            " These objects are shared between executions and must not be modified"
+            " by workflows. Set to 0 to not keep any objects in memory."
+        ),
+        env="BLOB_STORAGE_ADAPTER_OBJECT_CACHE_MAX_OBJECTS",
+        ge=0,
+    )
+
     @validator("allow_bucket_creation")
     def no_anonymous_bucket_creation(
         cls, allow_bucket_creation: bool, values: dict
@@ -0,0 +1,70 @@
+"""Cache for the object listings of the buckets
+
+Each source lookup, also during execution, requires the object keys of the
+respective bucket. Listing all objects of a bucket with thousands of objects
+requires many paginated requests to the storage. Therefore the object key strings
+of each bucket are cached for the configured listing_cache_ttl, together with an
+index of the object key strings by object key name, i.e. by the thing node they
+are attached to.
+
+Writing an object via the adapter invalidates the cached listing of the respective
+bucket.
+"""
+
+import logging
+from collections.abc import Iterable
+
+from hetdesrun.adapters.blob_storage import IDENTIFIER_SEPARATOR
+from hetdesrun.adapters.blob_storage.models import BucketName, IdString
+from hetdesrun.adapters.ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+
+class BucketListing:
+    """Object key strings of a bucket indexed by object key name"""
+
+    def __init__(self, object_key_strings: Iterable[IdString]) -> None:
+        self.object_key_strings: list[IdString] = list(object_key_strings)
+        self._object_key_string_set = set(self.object_key_strings)
+        self._object_key_strings_by_name: dict[str, list[IdString]] = {}
+        for object_key_string in self.object_key_strings:
+            name = object_key_string.split(IDENTIFIER_SEPARATOR, maxsplit=1)[0]
+            self._object_key_strings_by_name.setdefault(name, []).append(
+                object_key_string
+            )
+
+    def __contains__(self, object_key_string: object) -> bool:
+        return object_key_string in self._object_key_string_set
+
+    def with_name(self, name: str) -> list[IdString]:
+        """Object key strings starting with the given object key name"""
+        return self._object_key_strings_by_name.get(name, [])
+
+
+class ListingCache(TTLCache[BucketName, BucketListing]):
+    def invalidate(self, bucket_name: BucketName | None = None) -> None:
+        """Remove the cached listing of one bucket or of all buckets"""
+        if bucket_name is None:
+            self.clear()
+        else:
+            self.remove_where(
+                lambda cached_bucket_name: cached_bucket_name == bucket_name
+            )
+        logger.debug("Invalidated cached object listing of bucket %s", bucket_name)
+
+
+listing_cache = ListingCache()
+
+
+def get_listing_cache() -> ListingCache:
+    return listing_cache
+
+
+def invalidate_listing_cache(bucket_name: BucketName | None = None) -> None:
+    """Invalidate the cached listing of the bucket with bucket_name or of all buckets
+
+    Call this after writing or deleting objects outside of the adapter, if the changes
+    should be visible before the listing_cache_ttl has passed.
+    """
+    get_listing_cache().invalidate(bucket_name)
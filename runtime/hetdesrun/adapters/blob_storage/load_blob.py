@@ -1,12 +1,18 @@
+import asyncio
 import logging
 import pickle
-from io import BytesIO
-from typing import Any
+import shutil
+import tempfile
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import IO, Any, cast
 
 import h5py
+from botocore.exceptions import ClientError
 from mypy_boto3_s3 import S3Client
 from mypy_boto3_s3.type_defs import GetObjectOutputTypeDef
 
+from hetdesrun.adapters.blob_storage import ADAPTER_KEY
 from hetdesrun.adapters.blob_storage.config import get_blob_adapter_config
 from hetdesrun.adapters.blob_storage.exceptions import StructureObjectNotFound
 from hetdesrun.adapters.blob_storage.models import (
@@ -15,6 +21,11 @@ from hetdesrun.adapters.blob_storage.models import (
     ObjectKey,
     get_structure_bucket_and_object_key_prefix_from_id,
 )
+from hetdesrun.adapters.blob_storage.object_cache import (
+    CACHE_FILE_SUFFIX,
+    get_object_cache,
+    object_cache_key,
+)
 from hetdesrun.adapters.blob_storage.service import ensure_bucket_exists, get_s3_client
 from hetdesrun.adapters.blob_storage.structure import (
     get_source_by_thing_node_id_and_metadata_key,
@@ -24,23 +35,255 @@ from hetdesrun.adapters.exceptions import (
     AdapterConnectionError,
     AdapterHandlingException,
 )
+from hetdesrun.adapters.execution import run_blocking_adapter_func
+from hetdesrun.adapters.file_cache import (
+    cache_file_path,
+    enforce_size_limit,
+    open_cache_file,
+)
+from hetdesrun.atomic_files import write_atomically
 from hetdesrun.models.data_selection import FilteredSource
 
 logger = logging.getLogger(__name__)
 
 
 def get_object(
-    s3_client: S3Client, bucket_name: str, object_key_string: str
+    s3_client: S3Client,
+    bucket_name: str,
+    object_key_string: str,
+    etag: str | None = None,
 ) -> GetObjectOutputTypeDef:
+    """Get an object, if etag is provided only if it still has this ETag"""
+    kwargs: dict[str, Any] = {} if etag is None else {"IfMatch": etag}
     if get_blob_adapter_config().checksum_algorithm == "":  # noqa: PLC1901
-        return s3_client.get_object(Bucket=bucket_name, Key=object_key_string)
+        return s3_client.get_object(Bucket=bucket_name, Key=object_key_string, **kwargs)
 
     return s3_client.get_object(
-        Bucket=bucket_name, Key=object_key_string, ChecksumMode="ENABLED"
+        Bucket=bucket_name, Key=object_key_string, ChecksumMode="ENABLED", **kwargs
     )
 
 
-async def load_blob_from_storage(thing_node_id: str, metadata_key: str) -> Any:
+def get_object_etag(
+    s3_client: S3Client, bucket_name: str, object_key_string: str
+) -> str | None:
+    """ETag of an object or None if there is no object with the key"""
+    try:
+        # head_object is as get_object but without the body
+        response = s3_client.head_object(Bucket=bucket_name, Key=object_key_string)
+    except ClientError as error:
+        if error.response["Error"]["Code"] in ("404", "NoSuchKey"):
+            return None
+        raise
+    return response["ETag"]
+
+
+def object_cache_enabled() -> bool:
+    blob_adapter_config = get_blob_adapter_config()
+    return (
+        blob_adapter_config.object_cache_dir is not None
+        or blob_adapter_config.object_cache_max_objects > 0
+    )
+
+
+def download_to(body: Any, file_path: str) -> None:
+    with open(file_path, "wb") as file_object:
+        shutil.copyfileobj(body, file_object)
+
+
+@contextmanager
+def opened_object(
+    s3_client: S3Client,
+    bucket_name: str,
+    object_key_string: str,
+    etag: str | None = None,
+) -> Iterator[IO[bytes]]:
+    """Open an object for reading
+
+    If the etag is provided and an object cache directory is configured, the object
+    is read from its cached file, which is downloaded first if not yet cached.
+    Otherwise the object is streamed from storage.
+
+    Raises NoSuchKey if there is no object with the key and AdapterConnectionError
+    if the object does not have the etag anymore.
+    """
+    blob_adapter_config = get_blob_adapter_config()
+    cache_dir = blob_adapter_config.object_cache_dir
+    if etag is None or cache_dir is None:
+        body = get_object(
+            s3_client=s3_client,
+            bucket_name=bucket_name,
+            object_key_string=object_key_string,
+        )["Body"]
+        try:
+            yield cast(IO[bytes], body)
+            # read the rest of the body, so that its checksum is validated
+            body.read()
+        finally:
+            body.close()
+        return
+
+    file_path = cache_file_path(
+        cache_dir,
+        object_cache_key(bucket_name, object_key_string, etag),
+        CACHE_FILE_SUFFIX,
+    )
+    file_object = open_cache_file(file_path)
+    downloaded = file_object is None
+    if file_object is None:
+        try:
+            body = get_object(
+                s3_client=s3_client,
+                bucket_name=bucket_name,
+                object_key_string=object_key_string,
+                etag=etag,
+            )["Body"]
+        except ClientError as error:
+            if error.response["Error"]["Code"] in ("412", "PreconditionFailed"):
+                raise AdapterConnectionError(
+                    f"The object with the key '{object_key_string}' in the bucket"
+                    f" '{bucket_name}' was changed while loading it!"
+                ) from error
+            raise
+        try:
+            write_atomically(file_path, lambda tmp_path: download_to(body, tmp_path))
+        finally:
+            body.close()
+        file_object = open(file_path, "rb")  # noqa: SIM115
+    else:
+        logger.debug("Reading object %s from object cache", object_key_string)
+
+    with file_object:
+        yield file_object
+    if downloaded:
+        enforce_size_limit(
+            cache_dir, CACHE_FILE_SUFFIX, blob_adapter_config.object_cache_max_size
+        )
+
+
+def load_custom_objects(
+    s3_client: S3Client, bucket_name: str, object_key: ObjectKey
+) -> dict[str, Any] | None:
+    custom_objects_object_key = object_key.to_custom_objects_object_key()
+    etag = None
+    if get_blob_adapter_config().object_cache_dir is not None:
+        etag = get_object_etag(
+            s3_client=s3_client,
+            bucket_name=bucket_name,
+            object_key_string=custom_objects_object_key.string,
+        )
+        if etag is None:
+            return None
+    try:
+        with opened_object(
+            s3_client=s3_client,
+            bucket_name=bucket_name,
+            object_key_string=custom_objects_object_key.string,
+            etag=etag,
+        ) as file_object:
+            custom_objects: dict[str, Any] = pickle.load(file_object)  # noqa: S301
+    except s3_client.exceptions.NoSuchKey:
+        return None
+    return custom_objects
+
+
+def load_keras_model(
+    s3_client: S3Client,
+    bucket_name: str,
+    object_key: ObjectKey,
+    file_object: IO[bytes],
+) -> Any:
+    try:
+        import tensorflow as tf
+    except ModuleNotFoundError as error:
+        msg = (
+            "To load a model from a BLOB in the hdf5 format, "
+            f"add tensorflow to the runtime dependencies:\n{error}"
+        )
+        logger.error(msg)
+        raise AdapterHandlingException(msg) from error
+
+    logger.info("Successfully imported tensorflow version %s", tf.__version__)
+    custom_objects = load_custom_objects(
+        s3_client=s3_client, bucket_name=bucket_name, object_key=object_key
+    )
+    if file_object.seekable():
+        # cached files are read directly
+        with h5py.File(file_object, "r") as f:
+            return tf.keras.saving.load_model(f, custom_objects=custom_objects)
+
+    # hdf5 files require random access, hence large ones are not held in memory
+    part_size = get_blob_adapter_config().multipart_part_size
+    with tempfile.SpooledTemporaryFile(max_size=part_size) as spooled_file_object:
+        shutil.copyfileobj(file_object, spooled_file_object, part_size)
+        spooled_file_object.seek(0)
+        with h5py.File(spooled_file_object, "r") as f:
+            return tf.keras.saving.load_model(f, custom_objects=custom_objects)
+
+
+def load_object_from_storage(
+    s3_client: S3Client, bucket_name: str, object_key: ObjectKey
+) -> Any:
+    """Load and unpickle an object from storage
+
+    If the object cache is enabled, the ETag of the object is requested first, so
+    that an unchanged object can be taken from the cache.
+
+    Blocking, hence run in the adapter thread pool by load_blob_from_storage.
+    """
+    ensure_bucket_exists(s3_client=s3_client, bucket_name=bucket_name)
+
+    no_such_key_msg = (
+        f"The bucket '{bucket_name}' contains no object "
+        f"with the key '{object_key.string}'!"
+    )
+    etag = None
+    if object_cache_enabled():
+        etag = get_object_etag(
+            s3_client=s3_client,
+            bucket_name=bucket_name,
+            object_key_string=object_key.string,
+        )
+        if etag is None:
+            raise AdapterConnectionError(no_such_key_msg)
+        in_memory, data = get_object_cache().get_object(
+            object_cache_key(bucket_name, object_key.string, etag)
+        )
+        if in_memory:
+            logger.debug("Took object %s from object cache", object_key.string)
+            return data
+
+    try:
+        with opened_object(
+            s3_client=s3_client,
+            bucket_name=bucket_name,
+            object_key_string=object_key.string,
+            etag=etag,
+        ) as file_object:
+            if object_key.file_extension == FileExtension.H5:
+                data = load_keras_model(
+                    s3_client=s3_client,
+                    bucket_name=bucket_name,
+                    object_key=object_key,
+                    file_object=file_object,
+                )
+            else:
+                # unpickled while streaming instead of reading the whole body first
+                data = pickle.load(file_object)  # noqa: S301
+    except s3_client.exceptions.NoSuchKey as error:
+        raise AdapterConnectionError(no_such_key_msg) from error
+
+    if etag is not None:
+        get_object_cache().store_object(
+            object_cache_key(bucket_name, object_key.string, etag),
+            data,
+            get_blob_adapter_config().object_cache_max_objects,
+        )
+    return data
+
+
+async def load_blob_from_storage(
+    thing_node_id: str, metadata_key: str, adapter_key: str = ADAPTER_KEY
+) -> Any:
     """Load BLOB from storage.
 
     Note, that StructureObjectNotFound, MissingHierarchyError, StorageAuthenticationError, and
@@ -75,70 +318,26 @@ async def load_blob_from_storage(thing_node_id: str, metadata_key: str) -> Any:
     )
     s3_client = await get_s3_client()
 
-    ensure_bucket_exists(s3_client=s3_client, bucket_name=bucket.name)
-
-    try:
-        response = get_object(
-            s3_client=s3_client,
-            bucket_name=bucket.name,
-            object_key_string=object_key.string,
-        )
-    except s3_client.exceptions.NoSuchKey as error:
-        raise AdapterConnectionError(
-            f"The bucket '{bucket.name}' contains no object "
-            f"with the key '{object_key.string}'!"
-        ) from error
-
-    if object_key.file_extension == FileExtension.H5:
-        try:
-            import tensorflow as tf
-        except ModuleNotFoundError as error:
-            msg = (
-                "To load a model from a BLOB in the hdf5 format, "
-                f"add tensorflow to the runtime dependencies:\n{error}"
-            )
-            logger.error(msg)
-            raise AdapterHandlingException(msg) from error
-        else:
-            logger.info("Successfully imported tensorflow version %s", tf.__version__)
-            file_object = BytesIO(response["Body"].read())
-            custom_objects: dict[str, Any] | None = None
-            custom_objects_object_key = object_key.to_custom_objects_object_key()
-            try:
-                custom_objects_response = get_object(
-                    s3_client=s3_client,
-                    bucket_name=bucket.name,
-                    object_key_string=custom_objects_object_key.string,
-                )
-            except s3_client.exceptions.NoSuchKey:
-                pass
-            else:
-                custom_objects = pickle.load(  # noqa: S301
-                    custom_objects_response["Body"]
-                )
-            with h5py.File(file_object, "r") as f:
-                data = tf.keras.saving.load_model(f, custom_objects=custom_objects)
-    else:
-        data = pickle.load(response["Body"])  # noqa: S301
-
-    return data
+    # requests to the storage and unpickling are blocking
+    return await run_blocking_adapter_func(
+        adapter_key,
+        load_object_from_storage,
+        s3_client=s3_client,
+        bucket_name=bucket.name,
+        object_key=object_key,
+    )
 
 
 async def load_data(
     wf_input_name_to_filtered_source_mapping_dict: dict[str, FilteredSource],
-    adapter_key: str,  # noqa: ARG001
+    adapter_key: str,
 ) -> dict[str, Any]:
     """Load data for filtered sources from BLOB storage.
 
     A AdapterHandlingException or AdapterConnectionError raised in
     load_blob_from_storage may occur.
     """
-    wf_input_name_to_data_dict: dict[str, Any] = {}
-
-    for (
-        wf_input_name,
-        filtered_source,
-    ) in wf_input_name_to_filtered_source_mapping_dict.items():
+    for filtered_source in wf_input_name_to_filtered_source_mapping_dict.values():
         if filtered_source.ref_id is None or filtered_source.ref_key is None:
             msg = (
                 "To use the BLOB storage adapter each filtered "
@@ -148,8 +347,22 @@ async def load_data(
             logger.error(msg)
             raise AdapterClientWiringInvalidError(msg)
 
-        wf_input_name_to_data_dict[wf_input_name] = await load_blob_from_storage(
-            filtered_source.ref_id, filtered_source.ref_key
+    # the sources are loaded concurrently, limited by the adapter's thread limit
+    loaded_data = await asyncio.gather(
+        *(
+            load_blob_from_storage(
+                filtered_source.ref_id,  # type: ignore[arg-type]
+                filtered_source.ref_key,  # type: ignore[arg-type]
+                adapter_key=adapter_key,
+            )
+            for filtered_source in wf_input_name_to_filtered_source_mapping_dict.values()
         )
+    )
 
-    return wf_input_name_to_data_dict
+    return dict(
+        zip(
+            wf_input_name_to_filtered_source_mapping_dict.keys(),
+            loaded_data,
+            strict=True,
+        )
+    )
@@ -0,0 +1,73 @@
+"""Local cache for objects loaded from the blob storage
+
+Workflows often load the same large object, e.g. a trained model, on every
+execution. If an object cache directory is configured, loaded objects are
+additionally stored in that directory and later loads read them from there instead
+of downloading them again.
+
+Cached files are keyed by bucket name, object key and ETag of the object. The ETag
+is determined with a head_object request before each load and the object is
+downloaded only if its ETag still matches, so changed objects are never served from
+stale cache files. The total size of the cache directory is limited: The least
+recently used files are removed when the limit is exceeded.
+
+Optionally the deserialized objects themselves can be kept in memory for a
+configurable number of objects, so that repeated loads only cost the head_object
+request. Note that such objects are shared between executions and hence must not
+be modified by workflows.
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any
+
+CACHE_FILE_SUFFIX = ".blob"
+
+
+def object_cache_key(bucket_name: str, object_key_string: str, etag: str) -> str:
+    return hashlib.sha256(
+        json.dumps(
+            {"bucket": bucket_name, "key": object_key_string, "etag": etag},
+            sort_keys=True,
+        ).encode("utf8")
+    ).hexdigest()
+
+
+class ObjectCache:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        # deserialized objects in the order of their last usage
+        self._objects: OrderedDict[str, Any] = OrderedDict()
+
+    def get_object(self, cache_key: str) -> tuple[bool, Any]:
+        """Whether the object is kept in memory and the object itself"""
+        with self._lock:
+            try:
+                obj = self._objects[cache_key]
+            except KeyError:
+                return False, None
+            self._objects.move_to_end(cache_key)
+            return True, obj
+
+    def store_object(self, cache_key: str, obj: Any, max_objects: int) -> None:
+        if max_objects <= 0:
+            return
+        with self._lock:
+            self._objects[cache_key] = obj
+            self._objects.move_to_end(cache_key)
+            while len(self._objects) > max_objects:
+                self._objects.popitem(last=False)
+
+    def clear_objects(self) -> None:
+        """Remove all deserialized objects kept in memory"""
+        with self._lock:
+            self._objects.clear()
+
+
+object_cache = ObjectCache()
+
+
+def get_object_cache() -> ObjectCache:
+    return object_cache
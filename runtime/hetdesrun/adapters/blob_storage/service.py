@@ -6,11 +6,13 @@ from botocore.client import Config
 from botocore.exceptions import ClientError
 from mypy_boto3_s3 import S3Client
 
+from hetdesrun.adapters.blob_storage import ADAPTER_KEY
 from hetdesrun.adapters.blob_storage.authentication import get_credentials
 from hetdesrun.adapters.blob_storage.config import get_blob_adapter_config
 from hetdesrun.adapters.blob_storage.exceptions import StorageAuthenticationError
 from hetdesrun.adapters.blob_storage.models import BucketName, IdString
 from hetdesrun.adapters.exceptions import AdapterConnectionError
+from hetdesrun.adapters.execution import run_blocking_adapter_func
 
 logger = getLogger(__name__)
 
@@ -87,6 +89,24 @@ def ensure_bucket_exists(s3_client: S3Client, bucket_name: BucketName) -> None:
             raise AdapterConnectionError(msg) from client_error
 
 
+def list_object_key_strings(
+    s3_client: S3Client, bucket_name: BucketName
+) -> list[IdString]:
+    """List the object key strings of all objects in the bucket.
+
+    Blocking, hence run in the adapter thread pool by get_object_key_strings_in_bucket.
+    Each response contains at most 1000 object keys, hence the listing is paginated.
+    """
+    ensure_bucket_exists(s3_client, bucket_name)
+
+    paginator = s3_client.get_paginator("list_objects_v2")
+    return [
+        IdString(obj_summary["Key"])
+        for page in paginator.paginate(Bucket=bucket_name)
+        for obj_summary in page.get("Contents", [])
+    ]
+
+
 async def get_object_key_strings_in_bucket(bucket_name: BucketName) -> list[IdString]:
     """Get the object key strings of all objects in the given bucket.
 
@@ -94,14 +114,6 @@ async def get_object_key_strings_in_bucket(bucket_name: BucketName) -> list[IdSt
     """
     s3_client = await get_s3_client()
 
-    ensure_bucket_exists(s3_client, bucket_name)
-
-    s3_response = s3_client.list_objects_v2(Bucket=bucket_name)
-
-    if s3_response["KeyCount"] == 0:
-        return []
-
-    object_key_strings = [
-        IdString(obj_summary["Key"]) for obj_summary in s3_response["Contents"]
-    ]
-    return object_key_strings
+    return await run_blocking_adapter_func(
+        ADAPTER_KEY, list_object_key_strings, s3_client, bucket_name
+    )
@@ -3,12 +3,18 @@ from logging import getLogger
 from hetdesrun.adapters.blob_storage import (
     IDENTIFIER_SEPARATOR,
 )
+from hetdesrun.adapters.blob_storage.config import get_blob_adapter_config
 from hetdesrun.adapters.blob_storage.exceptions import (
     StructureObjectNotFound,
 )
+from hetdesrun.adapters.blob_storage.listing_cache import (
+    BucketListing,
+    get_listing_cache,
+)
 from hetdesrun.adapters.blob_storage.models import (
     BlobStorageStructureSink,
     BlobStorageStructureSource,
+    BucketName,
     IdString,
     ObjectKey,
     StructureBucket,
@@ -35,14 +41,47 @@ def get_thing_nodes_by_parent_id(
     return tn_list
 
 
+async def get_bucket_listing(bucket_name: BucketName) -> BucketListing:
+    """Get the object key strings of the given bucket, cached for listing_cache_ttl.
+
+    An AdapterConnectionError or StorageAuthenticationError raised from
+    get_object_key_strings_in_bucket may occur.
+    """
+    bucket_listing = get_listing_cache().get(bucket_name)
+    if bucket_listing is not None:
+        return bucket_listing
+
+    bucket_listing = BucketListing(await get_object_key_strings_in_bucket(bucket_name))
+    logger.debug(
+        "Listed %i objects in bucket %s",
+        len(bucket_listing.object_key_strings),
+        bucket_name,
+    )
+    ttl = get_blob_adapter_config().listing_cache_ttl
+    if ttl is not None:
+        get_listing_cache().store(bucket_name, bucket_listing, ttl.total_seconds())
+    return bucket_listing
+
+
 async def get_sources_from_bucket(
     bucket: StructureBucket, thing_node_id: IdString | None = None
 ) -> list[BlobStorageStructureSource]:
-    thing_node_ids = list(get_adapter_structure().thing_node_by_id.keys())
+    thing_node_ids = get_adapter_structure().thing_node_by_id
     src_list: list[BlobStorageStructureSource] = []
 
-    object_key_strings = await get_object_key_strings_in_bucket(bucket.name)
-    logger.info(
+    bucket_listing = await get_bucket_listing(bucket.name)
+    if thing_node_id is None:
+        object_key_strings = bucket_listing.object_key_strings
+    else:
+        # only the objects attached to the thing node via the index
+        try:
+            _, object_key_name = get_structure_bucket_and_object_key_prefix_from_id(
+                thing_node_id
+            )
+        except ValueError:
+            return []
+        object_key_strings = bucket_listing.with_name(object_key_name)
+    logger.debug(
         "There are the following object keys in bucket %s:\n%s",
         bucket.name,
         ", ".join(oks for oks in object_key_strings),
@@ -177,8 +216,7 @@ async def get_source_by_id(source_id: IdString) -> BlobStorageStructureSource:
     raised from get_object_key_strings_in_bucket may occur.
     """
     thing_node_id = source_id.rsplit(sep=IDENTIFIER_SEPARATOR, maxsplit=2)[0]
-    thing_node_ids = list(get_adapter_structure().thing_node_by_id.keys())
-    if thing_node_id not in thing_node_ids:
+    if thing_node_id not in get_adapter_structure().thing_node_by_id:
         msg = f"No thing node matching the source id '{source_id}' occurs in the adapter structure!"
         logger.error(msg)
         raise StructureObjectNotFound(msg)
@@ -196,8 +234,7 @@ async def get_source_by_id(source_id: IdString) -> BlobStorageStructureSource:
         logger.error(msg)
         raise StructureObjectNotFound(msg) from error
 
-    object_key_strings = await get_object_key_strings_in_bucket(bucket.name)
-    if object_key_string not in object_key_strings:
+    if object_key_string not in await get_bucket_listing(bucket.name):
         msg = (
             f"There is no object with key '{object_key_string}' in bucket '{bucket.name}', "
             f"hence no source with id '{source_id}' can be found!"
@@ -232,8 +269,7 @@ async def get_source_by_thing_node_id_and_metadata_key(
     A MissingHierarchyError, StorageAuthenticationError, or AdapterConnectionError
     raised by get_all_sources_from_buckets_and_object_keys may occur.
     """
-    thing_node_ids = list(get_adapter_structure().thing_node_by_id.keys())
-    if thing_node_id not in thing_node_ids:
+    if thing_node_id not in get_adapter_structure().thing_node_by_id:
         msg = (
             f"No thing node with id '{thing_node_id}' occurs in the adapter structure!"
         )
@@ -253,8 +289,7 @@ async def get_source_by_thing_node_id_and_metadata_key(
         logger.error(msg)
         raise StructureObjectNotFound(msg) from error
 
-    object_key_strings = await get_object_key_strings_in_bucket(bucket.name)
-    if object_key.string not in object_key_strings:
+    if object_key.string not in await get_bucket_listing(bucket.name):
         msg = (
             f"There is no object with key '{object_key.string}' in bucket '{bucket.name}', "
             f"hence no source with thing node id '{thing_node_id}' and "
@@ -1,5 +1,10 @@
+import base64
+import hashlib
 import logging
 import pickle
+import shutil
+import tempfile
+import zlib
 from io import BytesIO
 from typing import Any, cast
 from uuid import UUID
@@ -7,15 +12,17 @@ from uuid import UUID
 import h5py
 from botocore.exceptions import ClientError
 from mypy_boto3_s3 import S3Client
-from mypy_boto3_s3.type_defs import PutObjectOutputTypeDef
+from mypy_boto3_s3.type_defs import CompletedPartTypeDef, PutObjectOutputTypeDef
 
 from hdutils import WrappedModelWithCustomObjects
 from hetdesrun.adapters.blob_storage import (
+    ADAPTER_KEY,
     HIERARCHY_END_NODE_NAME_SEPARATOR,
     OBJECT_KEY_DIR_SEPARATOR,
 )
 from hetdesrun.adapters.blob_storage.config import get_blob_adapter_config
 from hetdesrun.adapters.blob_storage.exceptions import StructureObjectNotFound
+from hetdesrun.adapters.blob_storage.listing_cache import invalidate_listing_cache
 from hetdesrun.adapters.blob_storage.models import (
     BlobStorageStructureSink,
     FileExtension,
@@ -33,6 +40,7 @@ from hetdesrun.adapters.exceptions import (
     AdapterClientWiringInvalidError,
     AdapterConnectionError,
 )
+from hetdesrun.adapters.execution import run_blocking_adapter_func
 from hetdesrun.models.data_selection import FilteredSink
 from hetdesrun.runtime.logging import _get_job_id_context
 
@@ -106,11 +114,159 @@ def put_object(
     )
 
 
+def part_checksum_kwargs(checksum_algorithm: str, body: bytes) -> dict[str, str]:
+    """Checksum arguments for an upload_part call
+
+    The checksum is computed beforehand and sent as header, instead of letting botocore
+    send it as trailer of a chunked request, which is not supported by all S3
+    compatible storages.
+    """
+    if checksum_algorithm == "SHA1":
+        digest = hashlib.sha1(body).digest()  # noqa: S324
+    elif checksum_algorithm == "SHA256":
+        digest = hashlib.sha256(body).digest()
+    elif checksum_algorithm == "CRC32":
+        digest = zlib.crc32(body).to_bytes(4, byteorder="big")
+    else:
+        # let botocore compute it, e.g. for CRC32C
+        return {"ChecksumAlgorithm": checksum_algorithm}
+    return {"Checksum" + checksum_algorithm: base64.b64encode(digest).decode("ascii")}
+
+
+class MultipartObjectWriter:
+    """Writable file object which uploads to storage in parts of bounded size
+
+    Objects not larger than the part size are written with a single put_object call
+    on complete. Larger objects are written with a multipart upload, so that at most
+    one part is buffered in memory.
+    """
+
+    def __init__(
+        self,
+        s3_client: S3Client,
+        bucket_name: str,
+        object_key_string: str,
+        part_size: int,
+    ) -> None:
+        self.s3_client = s3_client
+        self.bucket_name = bucket_name
+        self.object_key_string = object_key_string
+        self.part_size = part_size
+        self.checksum_algorithm = get_blob_adapter_config().checksum_algorithm
+        self.upload_id: str | None = None
+        self.size = 0
+        self._buffer = bytearray()
+        self._parts: list[CompletedPartTypeDef] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: bytes | bytearray | memoryview) -> int:
+        view = memoryview(data).cast("B")
+        written = len(view)
+        self.size += written
+        if len(self._buffer) > 0:
+            missing = self.part_size - len(self._buffer)
+            self._buffer += view[:missing]
+            view = view[missing:]
+            if len(self._buffer) < self.part_size:
+                return written
+            self._upload_part(bytes(self._buffer))
+            self._buffer.clear()
+        # large writes are uploaded in parts without copying them into the buffer
+        while len(view) > self.part_size:
+            self._upload_part(bytes(view[: self.part_size]))
+            view = view[self.part_size :]
+        self._buffer += view
+        return written
+
+    def _upload_part(self, body: bytes) -> None:
+        if self.upload_id is None:
+            self.upload_id = self.s3_client.create_multipart_upload(
+                Bucket=self.bucket_name,
+                Key=self.object_key_string,
+                ContentType="application/octet-stream",
+                **(
+                    {"ChecksumAlgorithm": self.checksum_algorithm}  # type: ignore[dict-item]
+                    if self.checksum_algorithm != ""
+                    else {}
+                ),
+            )["UploadId"]
+        part_number = len(self._parts) + 1
+        checksum_kwargs = (
+            part_checksum_kwargs(self.checksum_algorithm, body)
+            if self.checksum_algorithm != ""
+            else {}
+        )
+        response = self.s3_client.upload_part(
+            Bucket=self.bucket_name,
+            Key=self.object_key_string,
+            UploadId=self.upload_id,
+            PartNumber=part_number,
+            Body=body,
+            **checksum_kwargs,  # type: ignore[arg-type]
+        )
+        completed_part: dict[str, Any] = {
+            "ETag": response["ETag"],
+            "PartNumber": part_number,
+        }
+        if self.checksum_algorithm != "":
+            checksum_key = "Checksum" + self.checksum_algorithm
+            completed_part[checksum_key] = checksum_kwargs.get(
+                checksum_key, response.get(checksum_key)  # type: ignore[misc]
+            )
+        self._parts.append(cast(CompletedPartTypeDef, completed_part))
+        logger.debug(
+            "Uploaded part %i of object %s", part_number, self.object_key_string
+        )
+
+    def complete(self) -> None:
+        if self.upload_id is None:
+            with BytesIO(self._buffer) as file_object:
+                put_object(
+                    s3_client=self.s3_client,
+                    bucket_name=self.bucket_name,
+                    object_key_string=self.object_key_string,
+                    file_object=file_object,
+                )
+            return
+
+        if len(self._buffer) > 0:
+            # the last part may be smaller than the minimum part size
+            self._upload_part(bytes(self._buffer))
+            self._buffer.clear()
+        self.s3_client.complete_multipart_upload(
+            Bucket=self.bucket_name,
+            Key=self.object_key_string,
+            UploadId=self.upload_id,
+            MultipartUpload={"Parts": self._parts},
+        )
+
+    def abort(self) -> None:
+        """Abort a started multipart upload, so that its parts are not kept"""
+        self._buffer.clear()
+        if self.upload_id is None:
+            return
+        try:
+            self.s3_client.abort_multipart_upload(
+                Bucket=self.bucket_name,
+                Key=self.object_key_string,
+                UploadId=self.upload_id,
+            )
+        except ClientError as error:
+            logger.warning(
+                "Could not abort multipart upload of object %s:\n%s",
+                self.object_key_string,
+                error.response["Error"]["Code"],
+            )
+
+
 async def write_custom_objects_to_storage(
     s3_client: S3Client,
     custom_objects: dict[str, Any],
     structure_bucket: StructureBucket,
     object_key: ObjectKey,
+    adapter_key: str = ADAPTER_KEY,
 ) -> None:
     with BytesIO() as file_object:
         pickle.dump(
@@ -126,7 +282,9 @@ async def write_custom_objects_to_storage(
         )
 
         try:
-            put_object(
+            await run_blocking_adapter_func(
+                adapter_key,
+                put_object,
                 s3_client=s3_client,
                 bucket_name=structure_bucket.name,
                 object_key_string=custom_objects_object_key.string,
@@ -140,6 +298,7 @@ async def write_custom_objects_to_storage(
             )
             logger.error(msg)
             raise AdapterConnectionError(msg) from client_error
+        invalidate_listing_cache(structure_bucket.name)
 
 
 def apply_filters_to_metadata_key(
@@ -174,8 +333,88 @@ def apply_filters_to_metadata_key(
     return metadata_key
 
 
+def write_object_to_storage(
+    s3_client: S3Client,
+    data: Any,
+    bucket_name: str,
+    object_key: ObjectKey,
+    as_keras_model: bool,
+) -> None:
+    """Serialize and write an object to storage if the object key is not yet used
+
+    Blocking, hence run in the adapter thread pool by write_blob_to_storage.
+    """
+    ensure_bucket_exists(s3_client=s3_client, bucket_name=bucket_name)
+
+    try:
+        # head_object is as get_object but without the body
+        s3_client.head_object(Bucket=bucket_name, Key=object_key.string)
+    except ClientError as client_error:
+        error_code = client_error.response["Error"]["Code"]
+        if error_code != "404":
+            msg = (
+                "Unexpected ClientError occured for head_object call with bucket "
+                f"{bucket_name} and object key {object_key.string}:\n{error_code}"
+            )
+            logger.error(msg)
+            raise AdapterConnectionError(msg) from client_error
+    else:
+        msg = (
+            f"The bucket '{bucket_name}' already contains an object "
+            f"with the key '{object_key.string}', write request will not be executed!"
+        )
+        logger.error(msg)
+        raise AdapterConnectionError(msg)
+
+    # only write if the object does not yet exist
+    part_size = get_blob_adapter_config().multipart_part_size
+    object_writer = MultipartObjectWriter(
+        s3_client=s3_client,
+        bucket_name=bucket_name,
+        object_key_string=object_key.string,
+        part_size=part_size,
+    )
+    try:
+        if as_keras_model:
+            import tensorflow as tf
+
+            # hdf5 files require random access, hence they are not written directly
+            with tempfile.SpooledTemporaryFile(max_size=part_size) as h5_buffer:
+                with h5py.File(h5_buffer, "w") as h5_file_object:
+                    tf.keras.saving.save_model(data, h5_file_object)
+                h5_buffer.seek(0)
+                shutil.copyfileobj(h5_buffer, object_writer, part_size)  # type: ignore[misc]
+        else:
+            # pickled directly into the upload instead of into one buffer
+            pickle.dump(data, object_writer, protocol=pickle.HIGHEST_PROTOCOL)
+
+        object_writer.complete()
+    except ClientError as error:
+        object_writer.abort()
+        error_code = error.response["Error"]["Code"]
+        msg = (
+            "Unexpected ClientError occured for "
+            + ("put_object" if object_writer.upload_id is None else "multipart upload")
+            + f" call with bucket {bucket_name} and object key {object_key.string}:"
+            + f"\n{error_code}"
+        )
+        logger.error(msg)
+        raise AdapterConnectionError(msg) from error
+    except BaseException:
+        object_writer.abort()
+        raise
+
+    logger.info("Dumped data of size %i into BLOB", object_writer.size)
+    # the new object must be found by source lookups right away
+    invalidate_listing_cache(bucket_name)
+
+
 async def write_blob_to_storage(
-    data: Any, thing_node_id: str, metadata_key: str, filters: dict[str, str]
+    data: Any,
+    thing_node_id: str,
+    metadata_key: str,
+    filters: dict[str, str],
+    adapter_key: str = ADAPTER_KEY,
 ) -> None:
     """Write BLOB to storage.
 
@@ -229,72 +468,30 @@ async def write_blob_to_storage(
     )
     s3_client = await get_s3_client()
 
-    ensure_bucket_exists(s3_client=s3_client, bucket_name=structure_bucket.name)
-
-    try:
-        # head_object is as get_object but without the body
-        s3_client.head_object(Bucket=structure_bucket.name, Key=object_key.string)
-    except ClientError as client_error:
-        error_code = client_error.response["Error"]["Code"]
-        if error_code != "404":
-            msg = (
-                "Unexpected ClientError occured for head_object call with bucket "
-                f"{structure_bucket.name} and object key {object_key.string}:\n{error_code}"
-            )
-            logger.error(msg)
-            raise AdapterConnectionError(msg) from client_error
-
-        # only write if the object does not yet exist
-        with BytesIO() as file_object:
-            if is_keras_model or is_keras_model_with_custom_objects:
-                with h5py.File(file_object, "w") as h5_file_object:
-                    tf.keras.saving.save_model(
-                        data if is_keras_model else data.model, h5_file_object
-                    )
-                file_object.seek(0)
-            else:
-                pickle.dump(data, file_object, protocol=pickle.HIGHEST_PROTOCOL)
-                file_object.seek(0)
-
-            logger.info(
-                "Dumped data of size %i into BLOB", file_object.getbuffer().nbytes
-            )
-
-            try:
-                put_object(
-                    s3_client=s3_client,
-                    bucket_name=structure_bucket.name,
-                    object_key_string=object_key.string,
-                    file_object=file_object,
-                )
-            except ClientError as error:
-                error_code = error.response["Error"]["Code"]
-                msg = (
-                    "Unexpected ClientError occured for put_object call with bucket "
-                    f"{structure_bucket.name} and object key {object_key.string}:\n{error_code}"
-                )
-                logger.error(msg)
-                raise AdapterConnectionError(msg) from error
-        if is_keras_model_with_custom_objects:
-            await write_custom_objects_to_storage(
-                s3_client=s3_client,
-                custom_objects=data.custom_objects,
-                structure_bucket=structure_bucket,
-                object_key=object_key.to_custom_objects_object_key(),
-            )
-    else:
-        msg = (
-            f"The bucket '{structure_bucket.name}' already contains an object "
-            f"with the key '{object_key.string}', write request will not be executed!"
+    # requests to the storage and pickling are blocking
+    await run_blocking_adapter_func(
+        adapter_key,
+        write_object_to_storage,
+        s3_client=s3_client,
+        data=data.model if is_keras_model_with_custom_objects else data,
+        bucket_name=structure_bucket.name,
+        object_key=object_key,
+        as_keras_model=is_keras_model or is_keras_model_with_custom_objects,
+    )
+    if is_keras_model_with_custom_objects:
+        await write_custom_objects_to_storage(
+            s3_client=s3_client,
+            custom_objects=data.custom_objects,
+            structure_bucket=structure_bucket,
+            object_key=object_key.to_custom_objects_object_key(),
+            adapter_key=adapter_key,
         )
-        logger.error(msg)
-        raise AdapterConnectionError(msg)
 
 
 async def send_data(
     wf_output_name_to_filtered_sink_mapping_dict: dict[str, FilteredSink],
     wf_output_name_to_value_mapping_dict: dict[str, Any],
-    adapter_key: str,  # noqa: ARG001
+    adapter_key: str,
 ) -> dict[str, Any]:
     """Send data for filtered sinks from BLOB storage.
 
@@ -316,6 +513,10 @@ async def send_data(
 
         blob = wf_output_name_to_value_mapping_dict[wf_output_name]
         await write_blob_to_storage(
-            blob, filtered_sink.ref_id, filtered_sink.ref_key, filtered_sink.filters
+            blob,
+            filtered_sink.ref_id,
+            filtered_sink.ref_key,
+            filtered_sink.filters,
+            adapter_key=adapter_key,
         )
     return {}
@@ -19,3 +19,23 @@ class AdapterClientWiringInvalidError(AdapterHandlingException):
 
     For example the expected filters may depend on the ref_id for an input wiring.
     """
+
+
+class MultipleAdaptersHandlingError(AdapterHandlingException):
+    """Raised if handling data failed for more than one adapter
+
+    Adapters are loaded from and sent to concurrently. This collects the
+    exceptions of all failing adapters, attributed by adapter key.
+    """
+
+    def __init__(
+        self, exceptions_by_adapter_key: dict[str, AdapterHandlingException]
+    ) -> None:
+        self.exceptions_by_adapter_key = exceptions_by_adapter_key
+        super().__init__(
+            f"Handling data failed for {len(exceptions_by_adapter_key)} adapters:\n"
+            + "\n".join(
+                f"Adapter {adapter_key}: {type(exc).__name__}: {str(exc)}"
+                for adapter_key, exc in exceptions_by_adapter_key.items()
+            )
+        )
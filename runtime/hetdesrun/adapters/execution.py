@@ -0,0 +1,111 @@
+"""Running blocking adapter functions outside of the event loop
+
+Synchronous adapter load / send functions and blocking IO inside the built-in
+adapters (reading files, database and blob storage access) would block every other
+request and execution handled by the worker process while they run. They are
+therefore run in a dedicated thread pool of the worker process, which is bounded
+by hd_adapters_thread_pool_max_workers.
+
+Additionally the number of threads used concurrently by each adapter can be limited
+via hd_adapters_thread_limits, so that one slow adapter cannot occupy all threads
+of the pool. Waiting for a free thread happens in the event loop and does not
+occupy a thread. The limits are enforced per event loop.
+"""
+
+import asyncio
+import contextvars
+import functools
+import logging
+import threading
+import weakref
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+adapter_semaphores_lock = threading.Lock()
+adapter_semaphores: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[tuple[str, int], asyncio.Semaphore]
+] = weakref.WeakKeyDictionary()
+
+
+class AdapterThreadPool:
+    """Lazily created thread pool, which is recreated after shutdown"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+
+    def get_executor(self) -> ThreadPoolExecutor:
+        # imported here since the webservice config indirectly imports the adapters
+        from hetdesrun.webservice.config import get_config
+
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=get_config().hd_adapters_thread_pool_max_workers,
+                    thread_name_prefix="hd-adapter",
+                )
+            return self._executor
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._lock:
+            executor = self._executor
+            self._executor = None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+
+adapter_thread_pool = AdapterThreadPool()
+
+
+def get_adapter_thread_pool() -> AdapterThreadPool:
+    return adapter_thread_pool
+
+
+def get_adapter_semaphore(adapter_key: str) -> asyncio.Semaphore | None:
+    """Semaphore limiting the threads used by the adapter in the running event loop
+
+    Returns None if no thread limit is configured for the adapter.
+    """
+    from hetdesrun.webservice.config import get_config
+
+    thread_limit = get_config().hd_adapters_thread_limits.get(adapter_key, None)
+    if thread_limit is None:
+        return None
+
+    loop = asyncio.get_running_loop()
+    with adapter_semaphores_lock:
+        semaphores = adapter_semaphores.setdefault(loop, {})
+        try:
+            return semaphores[(adapter_key, thread_limit)]
+        except KeyError:
+            semaphore = asyncio.Semaphore(thread_limit)
+            semaphores[(adapter_key, thread_limit)] = semaphore
+            return semaphore
+
+
+async def run_blocking_adapter_func(
+    adapter_key: str, func: Callable[..., T], /, *args: Any, **kwargs: Any
+) -> T:
+    """Run a blocking function of an adapter in the adapter thread pool
+
+    Context variables (e.g. the id of the currently executed job) are propagated
+    to the thread, as with asyncio.to_thread.
+    """
+    loop = asyncio.get_running_loop()
+    func_call = functools.partial(contextvars.copy_context().run, func, *args, **kwargs)
+
+    semaphore = get_adapter_semaphore(adapter_key)
+    if semaphore is None:
+        return await loop.run_in_executor(
+            get_adapter_thread_pool().get_executor(), func_call
+        )
+
+    async with semaphore:
+        return await loop.run_in_executor(
+            get_adapter_thread_pool().get_executor(), func_call
+        )
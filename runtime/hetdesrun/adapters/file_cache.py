@@ -0,0 +1,73 @@
+"""Directories of cached files with a limited total size
+
+Adapters which cache loaded data as files in a configured directory name the files
+by a cache key and a suffix per kind of cached file. The modification time of a
+cached file is updated on each use, so that the least recently used files can be
+removed when the total size of the cache directory exceeds its limit.
+"""
+
+import contextlib
+import logging
+import os
+import threading
+from typing import IO
+
+logger = logging.getLogger(__name__)
+
+size_limit_lock = threading.Lock()
+
+
+def cache_file_path(cache_dir: str, cache_key: str, suffix: str) -> str:
+    return os.path.join(cache_dir, cache_key + suffix)
+
+
+def use_cache_file(file_path: str) -> bool:
+    """Mark the cached file as recently used and return whether it exists"""
+    try:
+        os.utime(file_path)
+    except FileNotFoundError:
+        return False
+    return True
+
+
+def open_cache_file(file_path: str) -> IO[bytes] | None:
+    """Open a cached file for reading and mark it as recently used
+
+    Returns None if the file does not exist, e.g. since it was removed to keep the
+    size limit. An opened file stays readable even if it is removed afterwards.
+    """
+    try:
+        file_object = open(file_path, "rb")  # noqa: SIM115
+    except FileNotFoundError:
+        return None
+    use_cache_file(file_path)
+    return file_object
+
+
+def enforce_size_limit(cache_dir: str, suffix: str, max_size: int) -> None:
+    """Remove least recently used files with suffix until max_size is kept"""
+    with size_limit_lock:
+        cached_files = []
+        try:
+            with os.scandir(cache_dir) as dir_entries:
+                for dir_entry in dir_entries:
+                    if dir_entry.name.endswith(suffix):
+                        stat_result = dir_entry.stat()
+                        cached_files.append(
+                            (
+                                stat_result.st_mtime_ns,
+                                stat_result.st_size,
+                                dir_entry.path,
+                            )
+                        )
+        except FileNotFoundError:
+            return
+
+        total_size = sum(size for _, size, _ in cached_files)
+        for _, size, file_path in sorted(cached_files):
+            if total_size <= max_size:
+                break
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(file_path)
+            total_size -= size
+            logger.debug("Removed least recently used cached file %s", file_path)
@@ -0,0 +1,45 @@
+"""Arrow IPC stream format for framelike data
+
+Generic rest adapters may exchange framelike data in the Arrow IPC streaming format
+instead of (ND)JSON. The columns are the same as the keys of the json records. The
+format is selected via content negotiation, see the generic rest adapter web service
+interface documentation.
+"""
+
+import logging
+from collections.abc import Callable
+
+import pandas as pd
+import pyarrow as pa
+
+logger = logging.getLogger(__name__)
+
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+
+# Returns the data as frame with the columns of the respective json records.
+WireFrameGetter = Callable[[], pd.DataFrame]
+
+
+def is_arrow_stream_content_type(content_type: str | None) -> bool:
+    if content_type is None:
+        return False
+    return content_type.split(";", 1)[0].strip().lower() == ARROW_STREAM_MEDIA_TYPE
+
+
+def parse_arrow_stream_bytes(arrow_stream_bytes: bytes) -> pd.DataFrame:
+    with pa.ipc.open_stream(arrow_stream_bytes) as reader:
+        return reader.read_pandas()
+
+
+def frame_to_arrow_table(df: pd.DataFrame) -> pa.Table | None:
+    """Convert frame to Arrow table, returns None if not possible
+
+    Conversion fails for example for object columns with mixed value types.
+    """
+    try:
+        return pa.Table.from_pandas(df, preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError) as e:
+        logger.info(
+            "Could not convert data to Arrow format, falling back to json: %s", str(e)
+        )
+        return None
@@ -16,6 +16,7 @@ from hetdesrun.backend.models.adapter import AdapterFrontendDto
 from hetdesrun.backend.service.adapter_router import get_all_adapters
 from hetdesrun.webservice.auth_outgoing import ServiceAuthenticationError
 from hetdesrun.webservice.config import get_config
+from hetdesrun.webservice.http_clients import get_shared_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -81,19 +82,17 @@ async def load_generic_adapter_base_urls() -> list[BackendRegisteredGenericRestA
             raise AdapterHandlingException(msg) from e
     else:
         # call backend service "adapters" endpoint
-        async with httpx.AsyncClient(
-            verify=get_config().hd_backend_verify_certs,
-            timeout=get_config().external_request_timeout,
-        ) as client:
-            try:
-                resp = await client.get(url, headers=headers)
-            except httpx.HTTPError as e:
-                msg = (
-                    f"Failure connecting to hd backend adapters endpoint ({url}): "
-                    + str(e)
-                )
-                logger.info(msg)
-                raise AdapterConnectionError(msg) from e
+        client = get_shared_http_client(
+            url, verify=get_config().hd_backend_verify_certs
+        )
+        try:
+            resp = await client.get(url, headers=headers)
+        except httpx.HTTPError as e:
+            msg = f"Failure connecting to hd backend adapters endpoint ({url}): " + str(
+                e
+            )
+            logger.info(msg)
+            raise AdapterConnectionError(msg) from e
 
         if resp.status_code != 200:
             msg = (
@@ -0,0 +1,98 @@
+import datetime
+import os
+
+from pydantic import BaseModel, BaseSettings, Field
+
+
+class GenericRestAdapterOptions(BaseModel):
+    """Runtime client options for a single generic rest adapter"""
+
+    cache_timeseries: bool = Field(
+        False,
+        description=(
+            "Whether timeseries loaded from this adapter are cached. Subsequent"
+            " requests for the same timeseries then only load the parts of the"
+            " requested time interval which are not cached already."
+            " Only activate this for adapters whose timeseries data does not change"
+            " for time intervals which have already been loaded."
+        ),
+    )
+
+    timeseries_window_size: datetime.timedelta | None = Field(
+        None,
+        description=(
+            "If set, requests for timeseries spanning a longer time interval are split"
+            " into windows of this size, which are loaded concurrently."
+            " Accepts seconds or ISO 8601 durations like P1D."
+        ),
+    )
+
+    timeseries_window_concurrency: int = Field(
+        4,
+        description="Maximum number of timeseries windows loaded concurrently",
+        gt=0,
+    )
+
+    metadata_cache_ttl: datetime.timedelta | None = Field(
+        None,
+        description=(
+            "If set, metadata loaded from this adapter are cached for this duration."
+            " Sending a metadatum to the adapter removes it from the cache."
+            " Accepts seconds or ISO 8601 durations like PT30S."
+        ),
+    )
+
+    compress_requests: bool = Field(
+        False,
+        description=(
+            "Whether data sent to this adapter is gzip compressed. Only takes effect"
+            " if the /info endpoint of the adapter lists gzip in its"
+            " acceptedRequestEncodings."
+        ),
+    )
+
+    arrow_format: bool = Field(
+        False,
+        description=(
+            "Whether framelike data is exchanged with this adapter in the Arrow IPC"
+            " stream format instead of json. Data is requested with an Accept header"
+            " preferring the Arrow format, falling back to json if the adapter answers"
+            " with json. Data is only sent in the Arrow format if the /info endpoint of"
+            " the adapter lists application/vnd.apache.arrow.stream in its"
+            " acceptedRequestContentTypes."
+        ),
+    )
+
+
+class GenericRestAdapterConfig(BaseSettings):
+    """Configuration for the runtime client of generic rest adapters"""
+
+    adapter_options: dict[str, GenericRestAdapterOptions] = Field(
+        {},
+        description="Mapping of generic rest adapter keys to their runtime client options",
+        env="GENERIC_REST_ADAPTER_OPTIONS",
+    )
+
+    timeseries_cache_max_bytes: int = Field(
+        256 * 1024 * 1024,
+        description=(
+            "Memory budget of the timeseries cache in bytes. The least recently"
+            " used timeseries are evicted if it is exceeded."
+        ),
+        env="GENERIC_REST_ADAPTER_TIMESERIES_CACHE_MAX_BYTES",
+        ge=0,
+    )
+
+    def options(self, adapter_key: str) -> GenericRestAdapterOptions:
+        return self.adapter_options.get(adapter_key, GenericRestAdapterOptions())
+
+
+environment_file = os.environ.get("HD_GENERIC_REST_ADAPTER_ENVIRONMENT_FILE", None)
+
+generic_rest_adapter_config = GenericRestAdapterConfig(
+    _env_file=environment_file if environment_file else None  # type: ignore[call-arg]
+)
+
+
+def get_generic_rest_adapter_config() -> GenericRestAdapterConfig:
+    return generic_rest_adapter_config
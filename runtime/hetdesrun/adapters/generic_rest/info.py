@@ -0,0 +1,77 @@
+"""Loading and caching of generic rest adapter info responses
+
+The /info endpoint of a generic rest adapter may announce optional protocol
+features, like accepting compressed request bodies or request bodies in the
+Arrow IPC stream format.
+"""
+
+import logging
+import threading
+from posixpath import join as posix_urljoin
+
+import httpx
+from httpx import AsyncClient
+from pydantic import BaseModel, ValidationError
+
+from hetdesrun.adapters.generic_rest.baseurl import get_generic_rest_adapter_base_url
+
+logger = logging.getLogger(__name__)
+
+generic_rest_adapter_infos_lock = threading.Lock()
+
+# initialize cache for adapter infos as global singleton
+try:
+    with generic_rest_adapter_infos_lock:
+        generic_rest_adapter_infos  # type: ignore # noqa: B018
+except NameError:
+    with generic_rest_adapter_infos_lock:
+        generic_rest_adapter_infos: dict[str, "GenericRestAdapterInfo"] = {}
+
+
+class GenericRestAdapterInfo(BaseModel):
+    id: str  # noqa: A003
+    name: str
+    version: str
+    acceptedRequestEncodings: list[str] = []
+    acceptedRequestContentTypes: list[str] = []
+
+
+async def get_generic_rest_adapter_info(
+    adapter_key: str, client: AsyncClient, headers: dict[str, str]
+) -> GenericRestAdapterInfo | None:
+    """Load info of a generic rest adapter from cache or from its /info endpoint
+
+    Returns None if the info can not be obtained. Failures are not cached, since
+    the info is only used to enable optional features.
+    """
+    try:
+        return generic_rest_adapter_infos[adapter_key]
+    except KeyError:
+        pass
+
+    url = posix_urljoin(await get_generic_rest_adapter_base_url(adapter_key), "info")
+    try:
+        resp = await client.get(url, headers=headers)
+    except httpx.HTTPError as e:
+        logger.info("Failed to get info of generic rest adapter from %s: %s", url, e)
+        return None
+
+    if resp.status_code != 200:
+        logger.info(
+            "Failed to get info of generic rest adapter from %s. Status code: %s",
+            url,
+            str(resp.status_code),
+        )
+        return None
+
+    try:
+        adapter_info = GenericRestAdapterInfo.parse_obj(resp.json())
+    except (ValueError, ValidationError) as e:
+        logger.info(
+            "Failed to parse info of generic rest adapter from %s: %s", url, str(e)
+        )
+        return None
+
+    with generic_rest_adapter_infos_lock:
+        generic_rest_adapter_infos[adapter_key] = adapter_info
+    return adapter_info
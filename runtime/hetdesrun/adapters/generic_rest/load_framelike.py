@@ -3,26 +3,36 @@
 Common utilities for loading data that is frame-like (tabular), i.e. dataframes as well as
 timeseries (where the later can be understood as special dataframe/table)
 """
+import asyncio
 import base64
 import datetime
+import io
 import json
 import logging
+from collections.abc import AsyncIterator
 from posixpath import join as posix_urljoin
 from typing import Any, Literal
 
+import httpx
 import pandas as pd
-import requests
 
 from hetdesrun.adapters.exceptions import (
     AdapterConnectionError,
     AdapterHandlingException,
 )
+from hetdesrun.adapters.generic_rest.arrow_format import (
+    ARROW_STREAM_MEDIA_TYPE,
+    is_arrow_stream_content_type,
+    parse_arrow_stream_bytes,
+)
 from hetdesrun.adapters.generic_rest.auth import get_generic_rest_adapter_auth_headers
 from hetdesrun.adapters.generic_rest.baseurl import get_generic_rest_adapter_base_url
+from hetdesrun.adapters.generic_rest.config import get_generic_rest_adapter_config
 from hetdesrun.adapters.generic_rest.external_types import ExternalType, df_empty
 from hetdesrun.models.data_selection import FilteredSource
 from hetdesrun.webservice.auth_outgoing import ServiceAuthenticationError
 from hetdesrun.webservice.config import get_config
+from hetdesrun.webservice.http_clients import get_shared_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -55,6 +65,55 @@ def decode_attributes(data_attributes: str) -> Any:
     return df_attrs
 
 
+# Size in bytes of the batches of complete NDJSON lines which are parsed in worker
+# threads while receiving framelike data.
+NDJSON_PARSE_BATCH_SIZE = 8 * 1024 * 1024
+
+
+def parse_ndjson_bytes(ndjson_bytes: bytes) -> pd.DataFrame:
+    return pd.read_json(io.BytesIO(ndjson_bytes), lines=True)
+
+
+async def read_ndjson_stream(
+    byte_chunks: AsyncIterator[bytes], batch_size: int = NDJSON_PARSE_BATCH_SIZE
+) -> pd.DataFrame:
+    """Parse NDJSON from an async stream of bytes
+
+    The stream is split into batches of complete lines which are parsed in worker
+    threads while receiving continues. Hence neither receiving nor parsing blocks
+    the event loop. The parsed batches are concatenated in order.
+    """
+    parse_tasks: list[asyncio.Task] = []
+    buffer = bytearray()
+
+    def schedule_parsing(batch: bytes) -> None:
+        if len(batch.strip()) != 0:
+            parse_tasks.append(
+                asyncio.create_task(asyncio.to_thread(parse_ndjson_bytes, batch))
+            )
+
+    try:
+        async for chunk in byte_chunks:
+            buffer.extend(chunk)
+            if len(buffer) >= batch_size:
+                last_line_end = buffer.rfind(b"\n")
+                if last_line_end != -1:
+                    schedule_parsing(bytes(buffer[: last_line_end + 1]))
+                    del buffer[: last_line_end + 1]
+        schedule_parsing(bytes(buffer))
+        parsed_batches = await asyncio.gather(*parse_tasks)
+    except BaseException:
+        for parse_task in parse_tasks:
+            parse_task.cancel()
+        raise
+
+    if len(parsed_batches) == 0:
+        return pd.DataFrame()
+    if len(parsed_batches) == 1:
+        return parsed_batches[0]
+    return pd.concat(parsed_batches, ignore_index=True)
+
+
 def are_valid_sources(filtered_sources: list[FilteredSource]) -> tuple[bool, str]:
     if len({fs.type for fs in filtered_sources}) > 1:
         return False, "Got more than one datatype in same grouped data"
@@ -69,7 +128,7 @@ def are_valid_sources(filtered_sources: list[FilteredSource]) -> tuple[bool, str
     return True, ""
 
 
-async def load_framelike_data(  # noqa: PLR0915
+async def load_framelike_data(  # noqa: PLR0912,PLR0915
     filtered_sources: list[FilteredSource],
     additional_params: list[
         tuple[str, str]
@@ -109,26 +168,29 @@ async def load_framelike_data(  # noqa: PLR0915
         logger.info(msg)
         raise AdapterHandlingException(msg) from e
 
-    with requests.Session() as session:
-        try:
-            start_time = datetime.datetime.now(datetime.timezone.utc)
-            logger.info(
-                "Start receiving generic rest adapter %s framelike data at %s",
-                adapter_key,
-                start_time.isoformat(),
-            )
-            resp = session.get(
-                url,
-                params=[
-                    ("id", (str(filtered_source.ref_id)))
-                    for filtered_source in filtered_sources
-                ]
-                + additional_params,
-                stream=True,
-                headers=headers,
-                verify=get_config().hd_adapters_verify_certs,
-                timeout=get_config().external_request_timeout,
-            )
+    if get_generic_rest_adapter_config().options(adapter_key).arrow_format:
+        headers["Accept"] = f"{ARROW_STREAM_MEDIA_TYPE}, */*;q=0.5"
+
+    client = get_shared_http_client(url, verify=get_config().hd_adapters_verify_certs)
+    try:
+        start_time = datetime.datetime.now(datetime.timezone.utc)
+        logger.info(
+            "Start receiving generic rest adapter %s framelike data at %s",
+            adapter_key,
+            start_time.isoformat(),
+        )
+        async with client.stream(
+            "GET",
+            url,
+            params=[
+                ("id", (str(filtered_source.ref_id)))
+                for filtered_source in filtered_sources
+            ]
+            + additional_params,
+            headers=headers,
+        ) as resp:
+            if resp.status_code != 200:
+                await resp.aread()
             if (
                 resp.status_code == 404
                 and "errorCode" in resp.text
@@ -149,51 +211,57 @@ async def load_framelike_data(  # noqa: PLR0915
 
             if resp.status_code != 200:
                 msg = (
-                    f"Requesting framelike data from generic rest adapter endpoint {url} failed."
-                    f" Status code: {resp.status_code}. Text: {resp.text}"
+                    f"Requesting framelike data from generic rest adapter endpoint {url}"
+                    f" failed. Status code: {resp.status_code}. Text: {resp.text}"
                 )
                 logger.info(msg)
                 raise AdapterConnectionError(msg)
             logger.info("Start reading in and parsing framelike data")
 
-            df: pd.DataFrame = pd.read_json(resp.raw, lines=True)
-            end_time = datetime.datetime.now(datetime.timezone.utc)
-            logger.info(
-                (
-                    "Finished receiving generic rest framelike data (including dataframe parsing)"
-                    " at %s. DataFrame shape is %s with columns %s"
-                ),
-                end_time.isoformat(),
-                str(df.shape),
-                str(df.columns),
-            )
-            logger.info(
-                (
-                    "Receiving generic rest adapter framelike data took"
-                    " (including dataframe parsing)"
-                    " %s"
-                ),
-                str(end_time - start_time),
-            )
+            df: pd.DataFrame
+            if is_arrow_stream_content_type(resp.headers.get("Content-Type")):
+                df = await asyncio.to_thread(
+                    parse_arrow_stream_bytes, await resp.aread()
+                )
+            else:
+                df = await read_ndjson_stream(resp.aiter_bytes())
+        end_time = datetime.datetime.now(datetime.timezone.utc)
+        logger.info(
+            (
+                "Finished receiving generic rest framelike data (including dataframe parsing)"
+                " at %s. DataFrame shape is %s with columns %s"
+            ),
+            end_time.isoformat(),
+            str(df.shape),
+            str(df.columns),
+        )
+        logger.info(
+            (
+                "Receiving generic rest adapter framelike data took"
+                " (including dataframe parsing)"
+                " %s"
+            ),
+            str(end_time - start_time),
+        )
 
-            if "Data-Attributes" in resp.headers:
-                logger.debug("Got Data-Attributes via GET response header")
-                data_attributes = resp.headers["Data-Attributes"]
-                df.attrs = decode_attributes(data_attributes)
+        if "Data-Attributes" in resp.headers:
+            logger.debug("Got Data-Attributes via GET response header")
+            data_attributes = resp.headers["Data-Attributes"]
+            df.attrs = decode_attributes(data_attributes)
 
-            logger.debug(
-                "Received dataframe of form %s:\n%s",
-                str(df.shape) if len(df) > 0 else "EMPTY RESULT",
-                str(df) if len(df) > 0 else "EMPTY RESULT",
-            )
-        except requests.HTTPError as e:
-            msg = (
-                f"Requesting framelike data from generic rest adapter endpoint {url}"
-                f" failed with Exception {str(e)}"
-            )
+        logger.debug(
+            "Received dataframe of form %s:\n%s",
+            str(df.shape) if len(df) > 0 else "EMPTY RESULT",
+            str(df) if len(df) > 0 else "EMPTY RESULT",
+        )
+    except httpx.HTTPError as e:
+        msg = (
+            f"Requesting framelike data from generic rest adapter endpoint {url}"
+            f" failed with Exception {str(e)}"
+        )
 
-            logger.info(msg)
-            raise AdapterConnectionError(msg) from e
+        logger.info(msg)
+        raise AdapterConnectionError(msg) from e
     logger.info("Complete generic rest adapter %s framelike request", adapter_key)
     if len(df) == 0:
         if endpoint == "timeseries":
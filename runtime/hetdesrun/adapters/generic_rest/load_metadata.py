@@ -1,11 +1,13 @@
 import asyncio
 import logging
+import threading
 import urllib
+from collections import defaultdict
 from posixpath import join as posix_urljoin
 from typing import Any
 
 import httpx
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel, ValidationError, parse_obj_as
 
 from hetdesrun.adapters.exceptions import (
     AdapterConnectionError,
@@ -13,14 +15,26 @@ from hetdesrun.adapters.exceptions import (
 )
 from hetdesrun.adapters.generic_rest.auth import get_generic_rest_adapter_auth_headers
 from hetdesrun.adapters.generic_rest.baseurl import get_generic_rest_adapter_base_url
+from hetdesrun.adapters.generic_rest.config import get_generic_rest_adapter_config
 from hetdesrun.adapters.generic_rest.external_types import ExternalType, ValueDataType
+from hetdesrun.adapters.generic_rest.metadata_cache import (
+    MetadataCacheKey,
+    get_metadata_cache,
+)
 from hetdesrun.models.adapter_data import RefIdType
 from hetdesrun.models.data_selection import FilteredSource
 from hetdesrun.webservice.auth_outgoing import ServiceAuthenticationError
 from hetdesrun.webservice.config import get_config
+from hetdesrun.webservice.http_clients import get_shared_http_client
 
 logger = logging.getLogger(__name__)
 
+# status codes of adapters which do not provide the metadata batch endpoints
+METADATA_BATCH_UNSUPPORTED_STATUS_CODES = (405, 501)
+
+generic_rest_adapters_without_metadata_batch_lock = threading.Lock()
+generic_rest_adapters_without_metadata_batch: set[str] = set()
+
 
 class Metadatum(BaseModel):
     key: str
@@ -28,27 +42,73 @@ class Metadatum(BaseModel):
     dataType: ValueDataType | None = None
 
 
-async def load_single_metadatum_from_adapter(
+def metadata_endpoint(ref_id_type: RefIdType | None) -> str:
+    if ref_id_type == RefIdType.SOURCE:
+        return "sources"
+    if ref_id_type == RefIdType.SINK:
+        return "sinks"
+    return "thingNodes"
+
+
+def metadata_cache_key(
+    filtered_source: FilteredSource, adapter_key: str
+) -> MetadataCacheKey:
+    return (
+        adapter_key,
+        filtered_source.ref_id_type,  # type: ignore
+        str(filtered_source.ref_id),
+        str(filtered_source.ref_key),
+        frozenset(filtered_source.filters.items()),
+    )
+
+
+def parse_metadatum_value(
+    metadatum: Metadatum, filtered_source: FilteredSource, url: str
+) -> Any:
+    value_datatype = ExternalType(filtered_source.type).value_datatype
+    assert value_datatype is not None  # for mypy   # noqa: S101
+
+    if metadatum.dataType is not None and metadatum.dataType != value_datatype:
+        msg = (
+            f"received metadata has wrong value dataType "
+            f"(not the requested one inside {str(filtered_source.type)})"
+            f". Received metdatum is {str(metadatum)}"
+        )
+        logger.info(msg)
+        raise AdapterConnectionError(msg)
+
+    try:
+        parsed_value = value_datatype.parse_object(metadatum.value)
+    except ValidationError as e:
+        msg = (
+            f"Validation failure trying to parse received metadata from adapter"
+            f"url {url}: {str(metadatum)}\nError is: " + str(e)
+        )
+
+        logger.info(msg)
+        raise AdapterHandlingException(msg) from e
+    return parsed_value
+
+
+async def request_single_metadatum_from_adapter(
     filtered_source: FilteredSource,
     adapter_key: str,
-    client: httpx.AsyncClient,
-) -> Any:
-    if filtered_source.ref_id_type == RefIdType.SOURCE:
-        endpoint = "sources"
-    elif filtered_source.ref_id_type == RefIdType.SINK:
-        endpoint = "sinks"
-    else:
-        endpoint = "thingNodes"
+    headers: dict[str, str],
+) -> tuple[Metadatum, str]:
+    """Request one metadatum from the adapter
 
+    Returns the metadatum and the url it has been requested from.
+    """
     url = posix_urljoin(
         await get_generic_rest_adapter_base_url(adapter_key),
-        endpoint,
+        metadata_endpoint(filtered_source.ref_id_type),
         urllib.parse.quote(str(filtered_source.ref_id)),
         "metadata",
         urllib.parse.quote(str(filtered_source.ref_key)),
     )
+    client = get_shared_http_client(url, verify=get_config().hd_adapters_verify_certs)
     try:
-        resp = await client.get(url, params=filtered_source.filters)
+        resp = await client.get(url, params=filtered_source.filters, headers=headers)
     except httpx.HTTPError as e:
         msg = (
             f"Requesting metadata data from generic rest adapter endpoint {url}"
@@ -88,57 +148,207 @@ async def load_single_metadatum_from_adapter(
         logger.info(msg)
         raise AdapterConnectionError(msg)
 
-    value_datatype = ExternalType(filtered_source.type).value_datatype
-    assert value_datatype is not None  # for mypy   # noqa: S101
+    return metadatum, url
 
-    if metadatum.dataType is not None and metadatum.dataType != value_datatype:
+
+async def load_single_metadatum_from_adapter(
+    filtered_source: FilteredSource,
+    adapter_key: str,
+    headers: dict[str, str],
+) -> Any:
+    metadatum, url = await request_single_metadatum_from_adapter(
+        filtered_source, adapter_key, headers
+    )
+    return parse_metadatum_value(metadatum, filtered_source, url)
+
+
+async def request_metadata_batch_from_adapter(
+    filtered_sources: list[FilteredSource],
+    adapter_key: str,
+    headers: dict[str, str],
+) -> tuple[dict[str, Metadatum], str] | None:
+    """Request several metadata of the same source, sink or thingNode at once
+
+    All filtered sources must have the same ref id type, ref id and filters.
+    Metadata which are not available are omitted from the result.
+
+    Returns None if the adapter does not provide the metadata batch endpoint. This
+    is remembered, so that subsequent requests to this adapter are not tried.
+    Returns None as well if the batch endpoint responds with status code 404, which
+    adapters providing it may do for unknown ref ids, but this is not remembered.
+    """
+    if adapter_key in generic_rest_adapters_without_metadata_batch:
+        return None
+
+    first_filtered_source = filtered_sources[0]
+    url = posix_urljoin(
+        await get_generic_rest_adapter_base_url(adapter_key),
+        metadata_endpoint(first_filtered_source.ref_id_type),
+        urllib.parse.quote(str(first_filtered_source.ref_id)),
+        "metadataBatch",
+    )
+    client = get_shared_http_client(url, verify=get_config().hd_adapters_verify_certs)
+    try:
+        resp = await client.get(
+            url,
+            params=[
+                ("key", str(filtered_source.ref_key))
+                for filtered_source in filtered_sources
+            ]
+            + list(first_filtered_source.filters.items()),
+            headers=headers,
+        )
+    except httpx.HTTPError as e:
         msg = (
-            f"received metadata has wrong value dataType "
-            f"(not the requested one inside {str(filtered_source.type)})"
-            f". Received metdatum is {str(metadatum)}"
+            f"Requesting metadata batch from generic rest adapter endpoint {url}"
+            f" failed with Exception: {str(e)}"
+        )
+        logger.info(msg)
+        raise AdapterConnectionError(msg) from e
+
+    if resp.status_code in METADATA_BATCH_UNSUPPORTED_STATUS_CODES:
+        logger.info(
+            "Generic rest adapter %s does not provide metadata batch endpoints"
+            " (status code %s from %s). Requesting metadata individually.",
+            adapter_key,
+            str(resp.status_code),
+            url,
+        )
+        with generic_rest_adapters_without_metadata_batch_lock:
+            generic_rest_adapters_without_metadata_batch.add(adapter_key)
+        return None
+
+    if resp.status_code == 404:
+        logger.info(
+            "Metadata batch endpoint %s of generic rest adapter %s was not found."
+            " Requesting metadata individually.",
+            url,
+            adapter_key,
+        )
+        return None
+
+    if resp.status_code != 200:
+        msg = (
+            f"Requesting metadata batch from generic rest adapter endpoint {url}"
+            f" failed. Status code: {resp.status_code}. Text: {resp.text}"
         )
         logger.info(msg)
         raise AdapterConnectionError(msg)
 
     try:
-        parsed_value = value_datatype.parse_object(metadatum.value)
-    except ValidationError as e:
+        metadata = parse_obj_as(list[Metadatum], resp.json())
+    except (ValueError, ValidationError) as e:
         msg = (
-            f"Validation failure trying to parse received metadata from adapter"
-            f"url {url}: {str(metadatum)}\nError is: " + str(e)
+            f"Validation failure trying to parse received metadata batch from adapter"
+            f" url {url}: {resp.text}\nError is: " + str(e)
         )
-
         logger.info(msg)
         raise AdapterHandlingException(msg) from e
-    return parsed_value  # type: ignore
+
+    logger.debug("Received metadata batch json from url %s:\n%s", url, resp.text)
+
+    return {metadatum.key: metadatum for metadatum in metadata}, url
+
+
+async def load_metadata_group_from_adapter(
+    data_to_load: dict[str, FilteredSource],
+    adapter_key: str,
+    headers: dict[str, str],
+) -> dict[str, tuple[Metadatum, str]]:
+    """Load metadata with identical ref id type, ref id and filters
+
+    Uses the metadata batch endpoint if more than one metadatum is requested and
+    requests metadata missing in the batch response individually.
+    """
+    loaded_metadata: dict[str, tuple[Metadatum, str]] = {}
+    filters = next(iter(data_to_load.values())).filters
+    if len(data_to_load) > 1 and "key" not in filters:
+        metadata_batch = await request_metadata_batch_from_adapter(
+            list(data_to_load.values()), adapter_key, headers
+        )
+        if metadata_batch is not None:
+            metadata_by_key, url = metadata_batch
+            for name, filtered_source in data_to_load.items():
+                if str(filtered_source.ref_key) in metadata_by_key:
+                    loaded_metadata[name] = (
+                        metadata_by_key[str(filtered_source.ref_key)],
+                        url,
+                    )
+
+    names_to_request = [name for name in data_to_load if name not in loaded_metadata]
+    requested_metadata = await asyncio.gather(
+        *(
+            request_single_metadatum_from_adapter(
+                data_to_load[name], adapter_key, headers
+            )
+            for name in names_to_request
+        )
+    )
+    loaded_metadata.update(zip(names_to_request, requested_metadata, strict=True))
+    return loaded_metadata
 
 
 async def load_multiple_metadata(
     data_to_load: dict[str, FilteredSource], adapter_key: str
 ) -> dict[str, Any]:
-    try:
-        headers = await get_generic_rest_adapter_auth_headers(external=True)
-    except ServiceAuthenticationError as e:
-        msg = (
-            "Failed to get auth headers for loading multiple metadata from adapter"
-            f"with key {adapter_key}. Error was:\n{str(e)}"
-        )
-        logger.info(msg)
-        raise AdapterHandlingException(msg) from e
+    metadata_cache_ttl = (
+        get_generic_rest_adapter_config().options(adapter_key).metadata_cache_ttl
+    )
+    metadata_cache = get_metadata_cache()
+
+    loaded_metadata: dict[str, tuple[Metadatum, str]] = {}
+    if metadata_cache_ttl is not None:
+        for name, filtered_source in data_to_load.items():
+            cached_metadatum = metadata_cache.get(
+                metadata_cache_key(filtered_source, adapter_key)
+            )
+            if cached_metadatum is not None:
+                loaded_metadata[name] = (cached_metadatum, "cache")
+
+    group_by_ref_and_filters: dict[
+        tuple[RefIdType | None, str, frozenset[tuple[str, Any]]],
+        dict[str, FilteredSource],
+    ] = defaultdict(dict)
+    for name, filtered_source in data_to_load.items():
+        if name in loaded_metadata:
+            continue
+        group_by_ref_and_filters[
+            (
+                filtered_source.ref_id_type,
+                str(filtered_source.ref_id),
+                frozenset(filtered_source.filters.items()),
+            )
+        ][name] = filtered_source
 
-    async with httpx.AsyncClient(
-        headers=headers,
-        verify=get_config().hd_adapters_verify_certs,
-        timeout=get_config().external_request_timeout,
-    ) as client:
-        loaded_metadata = await asyncio.gather(
+    if len(group_by_ref_and_filters) > 0:
+        try:
+            headers = await get_generic_rest_adapter_auth_headers(external=True)
+        except ServiceAuthenticationError as e:
+            msg = (
+                "Failed to get auth headers for loading multiple metadata from adapter"
+                f"with key {adapter_key}. Error was:\n{str(e)}"
+            )
+            logger.info(msg)
+            raise AdapterHandlingException(msg) from e
+
+        for group_metadata in await asyncio.gather(
             *(
-                load_single_metadatum_from_adapter(
-                    filtered_source,
-                    adapter_key,
-                    client,
-                )
-                for filtered_source in data_to_load.values()
+                load_metadata_group_from_adapter(grouped_data, adapter_key, headers)
+                for grouped_data in group_by_ref_and_filters.values()
             )
+        ):
+            for name, (metadatum, url) in group_metadata.items():
+                if metadata_cache_ttl is not None:
+                    metadata_cache.store(
+                        metadata_cache_key(data_to_load[name], adapter_key),
+                        metadatum,
+                        metadata_cache_ttl.total_seconds(),
+                    )
+                loaded_metadata[name] = (metadatum, url)
+
+    return {
+        name: parse_metadatum_value(
+            loaded_metadata[name][0], filtered_source, loaded_metadata[name][1]
         )
-    return dict(zip(data_to_load.keys(), loaded_metadata, strict=True))
+        for name, filtered_source in data_to_load.items()
+    }
@@ -1,3 +1,5 @@
+import asyncio
+import datetime
 import logging
 from collections import defaultdict
 from collections.abc import Iterable
@@ -10,13 +12,79 @@ from hetdesrun.adapters.exceptions import (
     AdapterClientWiringInvalidError,
     AdapterHandlingException,
 )
+from hetdesrun.adapters.generic_rest.config import get_generic_rest_adapter_config
 from hetdesrun.adapters.generic_rest.external_types import ExternalType
 from hetdesrun.adapters.generic_rest.load_framelike import load_framelike_data
+from hetdesrun.adapters.generic_rest.ts_cache import get_timeseries_cache
 from hetdesrun.models.data_selection import FilteredSource
 
 logger = logging.getLogger(__name__)
 
 
+def parse_utc_timestamp(timestamp_str: str) -> pd.Timestamp:
+    timestamp = pd.Timestamp(timestamp_str)
+    if timestamp.tzinfo is None:
+        return timestamp.tz_localize("UTC")
+    return timestamp.tz_convert("UTC")
+
+
+def format_utc_timestamp(timestamp: pd.Timestamp) -> str:
+    """Format timestamp like the frontend, e.g. 2020-03-11T13:45:18.194000000Z"""
+    return (
+        np.datetime_as_string(
+            timestamp.tz_convert(None).as_unit("ns").to_datetime64(), unit="ns"
+        )
+        + "Z"
+    )
+
+
+def split_into_time_windows(
+    filter_params: list[tuple[str, Any]], window_size: datetime.timedelta
+) -> list[list[tuple[str, Any]]] | None:
+    """Split filter params into params for consecutive time windows
+
+    The windows are disjoint closed intervals, i.e. each window ends one
+    nanosecond before the next one starts.
+
+    Returns None if the from / to filters do not span more than one window or
+    can not be parsed.
+    """
+    filter_dict = dict(filter_params)
+    try:
+        start = parse_utc_timestamp(filter_dict["from"])
+        end = parse_utc_timestamp(filter_dict["to"])
+    except (KeyError, ValueError):
+        return None
+    window_delta = pd.Timedelta(window_size)
+    if window_delta <= pd.Timedelta(0) or end - start <= window_delta:
+        return None
+
+    other_params = [
+        (filter_key, filter_value)
+        for filter_key, filter_value in filter_params
+        if filter_key not in ("from", "to")
+    ]
+    window_starts = list(pd.date_range(start, end, freq=window_delta, inclusive="left"))
+    return [
+        [
+            *other_params,
+            (
+                "from",
+                filter_dict["from"] if i == 0 else format_utc_timestamp(window_start),
+            ),
+            (
+                "to",
+                filter_dict["to"]
+                if i == len(window_starts) - 1
+                else format_utc_timestamp(
+                    window_starts[i + 1] - pd.Timedelta(1, unit="ns")
+                ),
+            ),
+        ]
+        for i, window_start in enumerate(window_starts)
+    ]
+
+
 async def load_ts_data_from_adapter(
     filtered_sources: list[FilteredSource],
     filter_params: Iterable[tuple[str, Any]],
@@ -31,49 +99,255 @@ async def load_ts_data_from_adapter(
     a "value" column with automatically inferred dtype
     and a timeseriesId column with dtype str.
 
-    This uses request with stream=True in combination with the raw response as file-like together
-    with Pandas read_json class method to get some minor performance out of the streaming.
-
-    It therefore currently isn't async.
+    If a timeseries window size is configured for the adapter, the requested time
+    interval is split into windows, which are loaded concurrently and then
+    concatenated in order.
     """
+    filter_params = list(filter_params)
+    options = get_generic_rest_adapter_config().options(adapter_key)
 
-    df = await load_framelike_data(
-        filtered_sources=filtered_sources,
-        additional_params=list(filter_params),
-        adapter_key=adapter_key,
-        endpoint="timeseries",
+    windows_filter_params = (
+        None
+        if options.timeseries_window_size is None
+        else split_into_time_windows(filter_params, options.timeseries_window_size)
     )
 
+    if windows_filter_params is None:
+        df = await load_framelike_data(
+            filtered_sources=filtered_sources,
+            additional_params=filter_params,
+            adapter_key=adapter_key,
+            endpoint="timeseries",
+        )
+    else:
+        logger.info(
+            "Loading timeseries from adapter %s in %d time windows",
+            adapter_key,
+            len(windows_filter_params),
+        )
+        semaphore = asyncio.Semaphore(options.timeseries_window_concurrency)
+
+        async def load_window(
+            window_filter_params: list[tuple[str, Any]]
+        ) -> pd.DataFrame:
+            async with semaphore:
+                return await load_framelike_data(
+                    filtered_sources=filtered_sources,
+                    additional_params=window_filter_params,
+                    adapter_key=adapter_key,
+                    endpoint="timeseries",
+                )
+
+        window_dfs = await asyncio.gather(
+            *(
+                load_window(window_filter_params)
+                for window_filter_params in windows_filter_params
+            )
+        )
+        df = pd.concat(window_dfs, ignore_index=True)
+        df.attrs = {
+            ts_id: ts_attrs
+            for window_df in window_dfs
+            for ts_id, ts_attrs in window_df.attrs.items()
+        }
+
     if "timeseriesId" in df.columns:
         df["timeseriesId"] = df["timeseriesId"].astype("string")
 
     return df
 
 
-def extract_one_channel_series_from_loaded_data(
-    df: pd.DataFrame, ts_id: str
-) -> pd.Series:
+def split_channels_from_loaded_data(
+    df: pd.DataFrame, ts_id_by_key: dict[str, str]
+) -> dict[str, pd.Series]:
+    """Split loaded timeseries records into one Series per timeseries id
+
+    The records are grouped in one pass via a stable argsort of the factorized
+    timeseriesId column instead of masking the complete data once per id.
+    The Series are slices, i.e. views, of the grouped data. They are only
+    sorted by timestamp (and hence copied) if they are not sorted already.
+
+    Returns a dictionary with the keys of ts_id_by_key as keys. Ids without
+    records obtain empty Series.
+    """
     try:
-        extracted_df = df[df["timeseriesId"] == ts_id].copy()
-        extracted_df.index = extracted_df["timestamp"]
-        extracted_series = extracted_df["value"].sort_index()
+        codes, unique_ids = pd.factorize(df["timeseriesId"])
+        order = np.argsort(codes, kind="stable")
+        grouped_series = df.iloc[order].set_index("timestamp")["value"]
+    except KeyError as e:
+        msg = (
+            f"Missing keys in received timeseries records. Got columns {str(df.columns)}"
+            f" with dataframe of shape {str(df.shape)}:\n{str(df)}"
+        )
+        logger.info(msg)
+        raise AdapterHandlingException(msg) from e
+
+    # records with missing timeseriesId have code -1 and are sorted first
+    group_bounds = np.searchsorted(
+        codes[order], np.arange(len(unique_ids) + 1), side="left"
+    )
+    code_by_ts_id = {ts_id: code for code, ts_id in enumerate(unique_ids)}
+
+    extracted_series_by_key: dict[str, pd.Series] = {}
+    extracted_ts_ids: set[str] = set()
+    for key, ts_id in ts_id_by_key.items():
+        code = code_by_ts_id.get(ts_id, None)
+        extracted_series = (
+            grouped_series.iloc[0:0]
+            if code is None
+            else grouped_series.iloc[group_bounds[code] : group_bounds[code + 1]]
+        )
+        if not extracted_series.index.is_monotonic_increasing:
+            extracted_series = extracted_series.sort_index(kind="stable")
+        elif ts_id in extracted_ts_ids:
+            # do not share data between Series of an id requested more than once
+            extracted_series = extracted_series.copy()
+        extracted_ts_ids.add(ts_id)
+
         extracted_series.attrs = df.attrs.get(ts_id, {})
         logger.debug(
             "extracted attributes %s for series with id %s",
             extracted_series.attrs,
             ts_id,
         )
+        extracted_series.name = ts_id
+        extracted_series_by_key[key] = extracted_series
+
+    return extracted_series_by_key
+
+
+def warn_about_unqueried_ids(
+    df: pd.DataFrame, queried_ids: list[str], adapter_key: str
+) -> None:
+    try:
+        received_ids = df["timeseriesId"].unique()
     except KeyError as e:
         msg = (
-            f"Missing keys in received timeseries records. Got columns {str(df.columns)}"
-            f" with dataframe of shape {str(df.shape)}:\n{str(df)}"
+            f"Missing keys in received timeseries records."
+            f" Got columns {str(df.columns)}"
+            f" with dataframe of shape {str(df.shape)}:\n"
+            f"{str(df)}"
         )
         logger.info(msg)
         raise AdapterHandlingException(msg) from e
 
-    extracted_series.name = ts_id
+    if not np.isin(received_ids, np.array(queried_ids)).all():
+        msg = (
+            f"Found timeseries ids in received data that were not queried."
+            f" Received timeseriesId unique values were:\n{str(received_ids.tolist())}"
+            f" \nQueried ids were:\n{str(queried_ids)}."
+            "\nThis unassignable data will be discarded. This indicates an error in the adapter"
+            f" implementation of the adapter {str(adapter_key)}!"
+        )
+        logger.warning(msg)
+
+
+async def load_timeseries_group_via_cache(
+    grouped_source_dict: dict[str, FilteredSource],
+    filters: frozenset[tuple[str, Any]],
+    external_type: ExternalType,
+    adapter_key: str,
+) -> dict[str, pd.Series] | None:
+    """Load a group of timeseries with identical filters using the timeseries cache
+
+    Only the sub-intervals of the requested interval which are not cached yet
+    are loaded from the adapter. Timeseries with identical missing intervals are
+    loaded together.
+
+    Returns None if the requested interval can not be handled by the cache, e.g.
+    since the from / to filters are not valid timestamps.
+    """
+    filter_dict = dict(filters)
+    try:
+        start = parse_utc_timestamp(filter_dict["from"])
+        end = parse_utc_timestamp(filter_dict["to"])
+    except ValueError:
+        logger.debug(
+            "Not using timeseries cache for from / to filters %s / %s",
+            filter_dict["from"],
+            filter_dict["to"],
+        )
+        return None
+    if start > end:
+        return None
+
+    # keep the original strings for the requested interval boundaries
+    timestamp_strings = {start: filter_dict["from"], end: filter_dict["to"]}
+    other_filters = frozenset(
+        (filter_key, filter_value)
+        for filter_key, filter_value in filters
+        if filter_key not in ("from", "to")
+    )
+
+    cache = get_timeseries_cache()
+    filtered_source_by_ts_id: dict[str, FilteredSource] = {
+        filtered_source.ref_id: filtered_source  # type: ignore[misc]
+        for filtered_source in grouped_source_dict.values()
+    }
+    cached_timeseries_by_ts_id = {
+        ts_id: cache.get((adapter_key, ts_id, external_type, other_filters))
+        for ts_id in filtered_source_by_ts_id
+    }
+
+    ts_ids_by_missing_interval: dict[
+        tuple[pd.Timestamp, pd.Timestamp], list[str]
+    ] = defaultdict(list)
+    for ts_id, cached_timeseries in cached_timeseries_by_ts_id.items():
+        for missing_interval in cached_timeseries.missing_intervals(start, end):
+            ts_ids_by_missing_interval[missing_interval].append(ts_id)
+
+    for (
+        interval_start,
+        interval_end,
+    ), ts_ids in ts_ids_by_missing_interval.items():
+        logger.debug(
+            "Loading timeseries %s from %s to %s not found in cache",
+            str(ts_ids),
+            interval_start.isoformat(),
+            interval_end.isoformat(),
+        )
+        loaded_ts_data_from_adapter = await load_ts_data_from_adapter(
+            [filtered_source_by_ts_id[ts_id] for ts_id in ts_ids],
+            [
+                *other_filters,
+                (
+                    "from",
+                    timestamp_strings.get(
+                        interval_start, format_utc_timestamp(interval_start)
+                    ),
+                ),
+                (
+                    "to",
+                    timestamp_strings.get(
+                        interval_end, format_utc_timestamp(interval_end)
+                    ),
+                ),
+            ],
+            adapter_key=adapter_key,
+        )
+        extracted_series_by_ts_id = split_channels_from_loaded_data(
+            loaded_ts_data_from_adapter, {ts_id: ts_id for ts_id in ts_ids}
+        )
+        for ts_id in ts_ids:
+            cached_timeseries_by_ts_id[ts_id].merge(
+                extracted_series_by_ts_id[ts_id], interval_start, interval_end
+            )
+        warn_about_unqueried_ids(loaded_ts_data_from_adapter, ts_ids, adapter_key)
 
-    return extracted_series
+    loaded_data = {}
+    for key, filtered_source in grouped_source_dict.items():
+        extracted_series = cached_timeseries_by_ts_id[
+            filtered_source.ref_id  # type: ignore[index]
+        ].extract(start, end)
+        extracted_series.name = filtered_source.ref_id
+        loaded_data[key] = extracted_series
+
+    for ts_id, cached_timeseries in cached_timeseries_by_ts_id.items():
+        cache.store(
+            (adapter_key, ts_id, external_type, other_filters), cached_timeseries
+        )
+
+    return loaded_data
 
 
 async def load_grouped_timeseries_data_together(
@@ -115,8 +389,20 @@ async def load_grouped_timeseries_data_together(
             )
         ][key] = filtered_source
 
+    cache_timeseries = (
+        get_generic_rest_adapter_config().options(adapter_key).cache_timeseries
+    )
+
     # load each group together:
     for group_tuple, grouped_source_dict in group_by_filters_and_external_type.items():
+        if cache_timeseries:
+            cached_loaded_data = await load_timeseries_group_via_cache(
+                grouped_source_dict, group_tuple[0], group_tuple[1], adapter_key
+            )
+            if cached_loaded_data is not None:
+                loaded_data.update(cached_loaded_data)
+                continue
+
         loaded_ts_data_from_adapter = await load_ts_data_from_adapter(
             list(grouped_source_dict.values()),
             group_tuple[0],
@@ -124,37 +410,19 @@ async def load_grouped_timeseries_data_together(
         )
 
         loaded_data.update(
-            {
-                key: extract_one_channel_series_from_loaded_data(
-                    loaded_ts_data_from_adapter,
-                    filtered_source.ref_id,  # type: ignore
-                )
-                for key, filtered_source in grouped_source_dict.items()
-            }
-        )
-
-        try:
-            received_ids = loaded_ts_data_from_adapter["timeseriesId"].unique()
-        except KeyError as e:
-            msg = (
-                f"Missing keys in received timeseries records."
-                f" Got columns {str(loaded_ts_data_from_adapter.columns)}"
-                f" with dataframe of shape {str(loaded_ts_data_from_adapter.shape)}:\n"
-                f"{str(loaded_ts_data_from_adapter)}"
-            )
-            logger.info(msg)
-            raise AdapterHandlingException(msg) from e
-
-        queried_ids = [fs.ref_id for fs in grouped_source_dict.values()]
-
-        if not np.isin(received_ids, np.array(queried_ids)).all():
-            msg = (
-                f"Found timeseries ids in received data that were not queried."
-                f" Received timeseriesId unique values were:\n{str(received_ids.tolist())}"
-                f" \nQueried ids were:\n{str(queried_ids)}."
-                "\nThis unassignable data will be discarded. This indicates an error in the adapter"
-                f" implementation of the adapter {str(adapter_key)}!"
+            split_channels_from_loaded_data(
+                loaded_ts_data_from_adapter,
+                {
+                    key: filtered_source.ref_id  # type: ignore
+                    for key, filtered_source in grouped_source_dict.items()
+                },
             )
-            logger.warning(msg)
+        )
+
+        warn_about_unqueried_ids(
+            loaded_ts_data_from_adapter,
+            [fs.ref_id for fs in grouped_source_dict.values()],  # type: ignore[misc]
+            adapter_key,
+        )
 
     return loaded_data
@@ -0,0 +1,40 @@
+"""Short-lived cache for metadata loaded from generic rest adapters
+
+Metadata are cached for the metadata_cache_ttl configured for the respective
+adapter. Sending a metadatum to an adapter removes it from the cache, so that
+subsequent executions in the same worker process load the new value.
+"""
+
+import logging
+from typing import Any
+
+from hetdesrun.adapters.ttl_cache import TTLCache
+from hetdesrun.models.adapter_data import RefIdType
+
+logger = logging.getLogger(__name__)
+
+# adapter key, ref id type, ref id, metadatum key and filters
+MetadataCacheKey = tuple[str, RefIdType, str, str, frozenset[tuple[str, Any]]]
+
+MAX_CACHED_METADATA = 10_000
+
+
+class MetadataCache(TTLCache[MetadataCacheKey, Any]):
+    def __init__(self, max_entries: int = MAX_CACHED_METADATA) -> None:
+        super().__init__(max_entries=max_entries)
+
+    def invalidate(
+        self, adapter_key: str, ref_id_type: RefIdType, ref_id: str, ref_key: str
+    ) -> None:
+        """Remove a metadatum from the cache, regardless of the filters"""
+        self.remove_where(
+            lambda cached_key: cached_key[:4]
+            == (adapter_key, ref_id_type, ref_id, ref_key)
+        )
+
+
+metadata_cache = MetadataCache()
+
+
+def get_metadata_cache() -> MetadataCache:
+    return metadata_cache
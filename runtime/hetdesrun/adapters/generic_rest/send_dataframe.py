@@ -1,13 +1,15 @@
 import asyncio
+import json
 
 import numpy as np
 import pandas as pd
-from httpx import AsyncClient
 
 from hetdesrun.adapters.exceptions import AdapterOutputDataError
-from hetdesrun.adapters.generic_rest.send_framelike import post_framelike_records
+from hetdesrun.adapters.generic_rest.send_framelike import (
+    JsonRowsEncoder,
+    post_framelike_records,
+)
 from hetdesrun.models.data_selection import FilteredSink
-from hetdesrun.webservice.config import get_config
 
 
 def dataframe_to_list_of_dicts(df: pd.DataFrame) -> list[dict]:
@@ -33,23 +35,38 @@ def dataframe_to_list_of_dicts(df: pd.DataFrame) -> list[dict]:
     return new_df.to_dict(orient="records")  # type: ignore
 
 
+def dataframe_to_json_rows_encoder(df: pd.DataFrame) -> JsonRowsEncoder:
+    """Validate dataframe and obtain an encoder for batches of its rows"""
+    if not isinstance(df, pd.DataFrame):
+        raise AdapterOutputDataError(
+            "Did not receive Pandas DataFrame as expected from workflow output."
+            f" Got {str(type(df))} instead."
+        )
+
+    def encode_rows(start: int, stop: int) -> str:
+        # strip the brackets of the json list
+        return json.dumps(dataframe_to_list_of_dicts(df.iloc[start:stop]))[1:-1]
+
+    return encode_rows
+
+
 async def post_dataframe(
     df: pd.DataFrame,
     ref_id: str,
     additional_params: list[tuple[str, str]],
     adapter_key: str,
-    client: AsyncClient,
 ) -> None:
-    records = dataframe_to_list_of_dicts(df)
+    encode_rows = dataframe_to_json_rows_encoder(df)
 
     await post_framelike_records(
-        records,
+        encode_rows,
+        len(df),
         attributes=df.attrs,
         ref_id=ref_id,
         additional_params=additional_params,
         adapter_key=adapter_key,
         endpoint="dataframe",
-        client=client,
+        get_wire_frame=lambda: df,
     )
 
 
@@ -59,22 +76,17 @@ async def post_dataframes(
     sink_filters: list[dict[str, str]],
     adapter_key: str,
 ) -> None:
-    async with AsyncClient(
-        verify=get_config().hd_adapters_verify_certs,
-        timeout=get_config().external_request_timeout,
-    ) as client:
-        await asyncio.gather(
-            *(
-                post_dataframe(
-                    df,
-                    ref_id,
-                    additional_params=list(filters.items()),
-                    adapter_key=adapter_key,
-                    client=client,
-                )
-                for df, ref_id, filters in zip(dfs, ref_ids, sink_filters, strict=True)
+    await asyncio.gather(
+        *(
+            post_dataframe(
+                df,
+                ref_id,
+                additional_params=list(filters.items()),
+                adapter_key=adapter_key,
             )
+            for df, ref_id, filters in zip(dfs, ref_ids, sink_filters, strict=True)
         )
+    )
 
 
 async def send_dataframes_to_adapter(
@@ -3,23 +3,46 @@
 Common utilities for sending data that is frame-like (tabular), i.e. dataframes as well as
 timeseries (where the later can be understood as special dataframe/table)
 """
+import asyncio
 import base64
 import datetime
+import io
 import json
 import logging
+import zlib
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Callable, Iterator
 from posixpath import join as posix_urljoin
 from typing import Any, Literal
 
 import httpx
-from httpx import AsyncClient
+import numpy as np
+import pandas as pd
+import pyarrow as pa
 
 from hetdesrun.adapters.exceptions import AdapterConnectionError
+from hetdesrun.adapters.generic_rest.arrow_format import (
+    ARROW_STREAM_MEDIA_TYPE,
+    WireFrameGetter,
+    frame_to_arrow_table,
+)
 from hetdesrun.adapters.generic_rest.auth import get_generic_rest_adapter_auth_headers
 from hetdesrun.adapters.generic_rest.baseurl import get_generic_rest_adapter_base_url
+from hetdesrun.adapters.generic_rest.config import get_generic_rest_adapter_config
+from hetdesrun.adapters.generic_rest.info import get_generic_rest_adapter_info
 from hetdesrun.webservice.auth_outgoing import ServiceAuthenticationError
+from hetdesrun.webservice.config import get_config
+from hetdesrun.webservice.http_clients import get_shared_http_client
 
 logger = logging.getLogger(__name__)
 
+JSON_RECORDS_BATCH_SIZE = 50_000
+ARROW_RECORD_BATCH_SIZE = 100_000
+
+# Encodes the rows from start (inclusive) to stop (exclusive) as json objects
+# joined by ", ", i.e. as the inner part of a json list of records.
+JsonRowsEncoder = Callable[[int, int], str]
+
 
 def encode_attributes(df_attrs: Any) -> str:
     df_attrs_json_str = json.dumps(df_attrs)
@@ -31,16 +54,194 @@ def encode_attributes(df_attrs: Any) -> str:
     return base64_str
 
 
-async def post_framelike_records(
-    list_of_records: list[dict],
+def encode_json_values(values: pd.Series) -> list[str]:
+    """Json encode each value of a Series
+
+    Numeric and boolean dtypes are encoded vectorized. The results are identical
+    to json.dumps on the respective (native Python) values, where null values
+    like nan are encoded as null.
+    """
+    arr = values.to_numpy()
+    if arr.dtype.kind == "f":
+        encoded = list(map(float.__repr__, arr.tolist()))
+        for pos in np.flatnonzero(~np.isfinite(arr)):
+            encoded[pos] = (
+                "null"
+                if np.isnan(arr[pos])
+                else ("Infinity" if arr[pos] > 0 else "-Infinity")
+            )
+        return encoded
+    if arr.dtype.kind in ("i", "u"):
+        return list(map(int.__repr__, arr.tolist()))
+    if arr.dtype.kind == "b":
+        return np.where(arr, "true", "false").tolist()  # type: ignore
+
+    encoder = json.JSONEncoder()
+    return [
+        # numpy scalars in object columns are encoded as native Python values
+        encoder.encode(value.item() if isinstance(value, np.generic) else value)
+        for value in values.astype(object).where(values.notna(), None).tolist()
+    ]
+
+
+def encode_utc_timestamps(timestamps: pd.DatetimeIndex | pd.Series) -> list[str]:
+    """Json encode UTC timestamps in generic rest datetime format
+
+    The format is yyyy-MM-ddTHH:mm:ss.SSSSSSSSSZ, i.e. always with nanoseconds.
+    """
+    index = pd.DatetimeIndex(timestamps).tz_convert(None).as_unit("ns")
+    return [
+        '"' + timestamp_str + 'Z"'
+        for timestamp_str in np.datetime_as_string(index.to_numpy(), unit="ns").tolist()
+    ]
+
+
+def encode_json_rows(encoded_columns: dict[str, list[str]]) -> str:
+    """Assemble json records from json encoded column values
+
+    The records are joined like json.dumps does for a list of dicts but without
+    the enclosing brackets and without building the dicts.
+    """
+    row_template = (
+        "{"
+        + ", ".join(
+            json.dumps(column_name).replace("%", "%%") + ": %s"
+            for column_name in encoded_columns
+        )
+        + "}"
+    )
+    return ", ".join(
+        map(row_template.__mod__, zip(*encoded_columns.values(), strict=True))
+    )
+
+
+class RecordsStream(ABC):
+    """Request body which is encoded incrementally in row batches
+
+    Can be passed as content to httpx async clients, which then stream it as
+    chunked request body. Batches are encoded in a worker thread in order not
+    to block the event loop.
+
+    If gzip is set, the chunks are gzip compressed, again batch by batch.
+    """
+
+    def __init__(self, start: int, stop: int, batch_size: int, gzip: bool) -> None:
+        self.start = start
+        self.stop = stop
+        self.batch_size = batch_size
+        self.gzip = gzip
+
+    @abstractmethod
+    def body_chunks(self) -> Iterator[bytes]:
+        """Uncompressed chunks of the request body"""
+
+    def chunks(self) -> Iterator[bytes]:
+        if not self.gzip:
+            yield from self.body_chunks()
+            return
+
+        # wbits 31 writes a gzip header and trailer
+        compressor = zlib.compressobj(wbits=31)
+        for body_chunk in self.body_chunks():
+            if len(compressed_chunk := compressor.compress(body_chunk)) != 0:
+                yield compressed_chunk
+        yield compressor.flush()
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        chunks = self.chunks()
+        while (chunk := await asyncio.to_thread(next, chunks, None)) is not None:
+            yield chunk
+
+
+class JsonRecordsStream(RecordsStream):
+    """Json list of records which is encoded incrementally in row batches
+
+    Only one batch of rows is encoded at a time, so that neither all records
+    nor the complete json string are held in memory. The concatenated chunks
+    are identical to json.dumps on the complete list of records.
+    """
+
+    def __init__(
+        self,
+        encode_rows: JsonRowsEncoder,
+        start: int,
+        stop: int,
+        batch_size: int = JSON_RECORDS_BATCH_SIZE,
+        gzip: bool = False,
+    ) -> None:
+        super().__init__(start, stop, batch_size, gzip)
+        self.encode_rows = encode_rows
+
+    def body_chunks(self) -> Iterator[bytes]:
+        yield b"["
+        for batch_start in range(self.start, self.stop, self.batch_size):
+            encoded_rows = self.encode_rows(
+                batch_start, min(batch_start + self.batch_size, self.stop)
+            )
+            yield (("" if batch_start == self.start else ", ") + encoded_rows).encode(
+                "utf-8"
+            )
+        yield b"]"
+
+
+class ArrowRecordsStream(RecordsStream):
+    """Arrow IPC stream of the table rows, written in record batches"""
+
+    def __init__(
+        self,
+        table: pa.Table,
+        start: int,
+        stop: int,
+        batch_size: int = ARROW_RECORD_BATCH_SIZE,
+        gzip: bool = False,
+    ) -> None:
+        super().__init__(start, stop, batch_size, gzip)
+        self.table = table
+
+    def body_chunks(self) -> Iterator[bytes]:
+        sink = io.BytesIO()
+
+        def take_written_bytes() -> bytes:
+            written_bytes = sink.getvalue()
+            sink.seek(0)
+            sink.truncate()
+            return written_bytes
+
+        with pa.ipc.new_stream(sink, self.table.schema) as writer:
+            yield take_written_bytes()
+            for batch in self.table.slice(
+                self.start, self.stop - self.start
+            ).to_batches(max_chunksize=self.batch_size):
+                writer.write_batch(batch)
+                yield take_written_bytes()
+        # end of stream marker
+        yield take_written_bytes()
+
+
+async def post_framelike_records(  # noqa: PLR0913
+    encode_rows: JsonRowsEncoder,
+    n_rows: int,
     attributes: Any | None,
     ref_id: str,
     additional_params: list[tuple[str, str]],
     adapter_key: str,
     endpoint: Literal["timeseries", "dataframe", "multitsframe"],
-    client: AsyncClient,
+    get_wire_frame: WireFrameGetter | None = None,
 ) -> None:
-    """Post a list of dicts (records) to the appropriate endpoint"""
+    """Post framelike data as list of records to the appropriate endpoint
+
+    The request bodies are streamed, encoding the rows in batches via encode_rows.
+    If hd_generic_rest_sink_max_rows_per_request is configured, the rows are
+    posted in several subsequent requests with at most that number of rows.
+
+    If compression of requests is activated for the adapter and its /info endpoint
+    announces that gzip encoded request bodies are accepted, the request bodies
+    are gzip compressed.
+
+    Analogously, if the Arrow format is activated for the adapter and accepted
+    according to its /info endpoint, the frame obtained from get_wire_frame is
+    posted as Arrow IPC stream instead of json.
+    """
     try:
         headers = await get_generic_rest_adapter_auth_headers(external=True)
     except ServiceAuthenticationError as e:
@@ -51,12 +252,42 @@ async def post_framelike_records(
         logger.info(msg)
         raise AdapterConnectionError(msg) from e
 
+    url = posix_urljoin(await get_generic_rest_adapter_base_url(adapter_key), endpoint)
+    client = get_shared_http_client(url, verify=get_config().hd_adapters_verify_certs)
+
+    options = get_generic_rest_adapter_config().options(adapter_key)
+    adapter_info = None
+    if options.compress_requests or (
+        options.arrow_format and get_wire_frame is not None
+    ):
+        adapter_info = await get_generic_rest_adapter_info(
+            adapter_key, client, dict(headers)
+        )
+
+    gzip_requests = (
+        options.compress_requests
+        and adapter_info is not None
+        and "gzip" in adapter_info.acceptedRequestEncodings
+    )
+    if gzip_requests:
+        headers["Content-Encoding"] = "gzip"
+
+    arrow_table = None
+    if (
+        options.arrow_format
+        and get_wire_frame is not None
+        and adapter_info is not None
+        and ARROW_STREAM_MEDIA_TYPE in adapter_info.acceptedRequestContentTypes
+    ):
+        arrow_table = await asyncio.to_thread(frame_to_arrow_table, get_wire_frame())
+    headers["Content-Type"] = (
+        ARROW_STREAM_MEDIA_TYPE if arrow_table is not None else "application/json"
+    )
+
     if attributes is not None and len(attributes) != 0:
         logger.debug("Sending Data-Attributes via POST request header")
         headers["Data-Attributes"] = encode_attributes(attributes)
 
-    url = posix_urljoin(await get_generic_rest_adapter_base_url(adapter_key), endpoint)
-
     start_time = datetime.datetime.now(datetime.timezone.utc)
     logger.info(
         "Start sending framelike data at %s to %s for id %s",
@@ -65,28 +296,61 @@ async def post_framelike_records(
         ref_id,
     )
 
-    try:
-        response = await client.post(
+    max_rows_per_request = get_config().hd_generic_rest_sink_max_rows_per_request
+    if max_rows_per_request is None:
+        max_rows_per_request = max(n_rows, 1)
+
+    # an empty list of records is posted as well
+    for request_start in range(0, max(n_rows, 1), max_rows_per_request):
+        request_stop = min(request_start + max_rows_per_request, n_rows)
+        logger.debug(
+            "Posting rows %d to %d of %d to %s for id %s",
+            request_start,
+            request_stop,
+            n_rows,
             url,
-            params=[
-                ("timeseriesId" if endpoint == "timeseries" else "id", ref_id),
-                *additional_params,
-            ],
-            json=list_of_records,
-            headers=headers,
-            timeout=60,
+            ref_id,
         )
-    except httpx.HTTPError as e:
-        msg = f"Http error while posting framelike data to {url} for id {ref_id}: {str(e)}"
-        logger.info(msg)
-        raise AdapterConnectionError(msg) from e
+        try:
+            response = await client.post(
+                url,
+                params=[
+                    ("timeseriesId" if endpoint == "timeseries" else "id", ref_id),
+                    *additional_params,
+                ],
+                content=JsonRecordsStream(
+                    encode_rows,
+                    request_start,
+                    request_stop,
+                    batch_size=JSON_RECORDS_BATCH_SIZE,
+                    gzip=gzip_requests,
+                )
+                if arrow_table is None
+                else ArrowRecordsStream(
+                    arrow_table,
+                    request_start,
+                    request_stop,
+                    batch_size=ARROW_RECORD_BATCH_SIZE,
+                    gzip=gzip_requests,
+                ),
+                headers=headers,
+                timeout=60,
+            )
+        except httpx.HTTPError as e:
+            msg = (
+                f"Http error while posting framelike data to {url} for id {ref_id}:"
+                f" {str(e)}"
+            )
+            logger.info(msg)
+            raise AdapterConnectionError(msg) from e
 
-    if response.status_code not in (200, 201):
-        msg = (
-            f"Failed posting framelike data to {url} for id {ref_id}."
-            f" Status code: {str(response.status_code)}. Response text: {response.text}"
-        )
-        raise AdapterConnectionError(msg)
+        if response.status_code not in (200, 201):
+            msg = (
+                f"Failed posting framelike data to {url} for id {ref_id}."
+                f" Status code: {str(response.status_code)}."
+                f" Response text: {response.text}"
+            )
+            raise AdapterConnectionError(msg)
     logger.info(
         "Successfully finished posting framelike data to %s for id %s at %s",
         url,
@@ -10,21 +10,28 @@ from hetdesrun.adapters.exceptions import AdapterConnectionError, AdapterOutputD
 from hetdesrun.adapters.generic_rest.auth import get_generic_rest_adapter_auth_headers
 from hetdesrun.adapters.generic_rest.baseurl import get_generic_rest_adapter_base_url
 from hetdesrun.adapters.generic_rest.external_types import ExternalType
+from hetdesrun.adapters.generic_rest.metadata_cache import get_metadata_cache
 from hetdesrun.models.adapter_data import RefIdType
 from hetdesrun.models.data_selection import FilteredSink
 from hetdesrun.webservice.auth_outgoing import ServiceAuthenticationError
 from hetdesrun.webservice.config import get_config
+from hetdesrun.webservice.http_clients import get_shared_http_client
 
 logger = logging.getLogger(__name__)
 
 
 async def post_json_with_open_client(
-    open_client: httpx.AsyncClient, url: str, params: dict[str, str], json_payload: dict
+    open_client: httpx.AsyncClient,
+    url: str,
+    params: dict[str, str],
+    json_payload: dict,
+    headers: dict[str, str] | None = None,
 ) -> httpx.Response:
     return await open_client.post(
         url,
         params=params,
         json=json_payload,
+        headers=headers,
     )
 
 
@@ -32,7 +39,7 @@ async def send_single_metadatum_to_adapter(
     filtered_sink: FilteredSink,
     metadatum_value: Any,
     adapter_key: str,
-    client: httpx.AsyncClient,
+    headers: dict[str, str],
 ) -> None:
     if filtered_sink.ref_id_type == RefIdType.SOURCE:
         endpoint = "sources"
@@ -60,6 +67,15 @@ async def send_single_metadatum_to_adapter(
             f"as the declared data type {value_datatype.name}."
         ) from error
 
+    # also if posting fails, since the adapter may have stored the value anyway
+    get_metadata_cache().invalidate(
+        adapter_key,
+        filtered_sink.ref_id_type,  # type: ignore
+        str(filtered_sink.ref_id),
+        str(filtered_sink.ref_key),
+    )
+
+    client = get_shared_http_client(url, verify=get_config().hd_adapters_verify_certs)
     try:
         resp = await post_json_with_open_client(
             open_client=client,
@@ -72,6 +88,7 @@ async def send_single_metadatum_to_adapter(
                     "dataType": value_datatype.value,
                 }
             ),
+            headers=headers,
         )
     except httpx.HTTPError as e:
         msg = (
@@ -108,20 +125,15 @@ async def send_multiple_metadata_to_adapter(
         logger.info(msg)
         raise AdapterConnectionError(msg) from e
 
-    async with httpx.AsyncClient(
-        headers=headers,
-        verify=get_config().hd_adapters_verify_certs,
-        timeout=get_config().external_request_timeout,
-    ) as client:
-        wf_output_names = filtered_sinks.keys()
-        await asyncio.gather(
-            *(
-                send_single_metadatum_to_adapter(
-                    filtered_sinks[wf_output_name],
-                    data_to_send[wf_output_name],
-                    adapter_key=adapter_key,
-                    client=client,
-                )
-                for wf_output_name in wf_output_names
+    wf_output_names = filtered_sinks.keys()
+    await asyncio.gather(
+        *(
+            send_single_metadatum_to_adapter(
+                filtered_sinks[wf_output_name],
+                data_to_send[wf_output_name],
+                adapter_key=adapter_key,
+                headers=headers,
             )
+            for wf_output_name in wf_output_names
         )
+    )
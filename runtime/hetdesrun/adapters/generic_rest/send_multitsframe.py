@@ -1,27 +1,41 @@
 import asyncio
 import datetime
 
-import numpy as np
 import pandas as pd
 import pytz
-from httpx import AsyncClient
 
 from hetdesrun.adapters.exceptions import AdapterOutputDataError
-from hetdesrun.adapters.generic_rest.send_framelike import post_framelike_records
+from hetdesrun.adapters.generic_rest.send_framelike import (
+    JsonRowsEncoder,
+    encode_json_rows,
+    encode_json_values,
+    encode_utc_timestamps,
+    post_framelike_records,
+)
 from hetdesrun.datatypes import MULTITSFRAME_COLUMN_NAMES
 from hetdesrun.models.data_selection import FilteredSink
-from hetdesrun.webservice.config import get_config
 
 
-def multitsframe_to_list_of_dicts(df: pd.DataFrame) -> list[dict]:
+def multitsframe_to_json_rows_encoder(df: pd.DataFrame) -> JsonRowsEncoder:
+    """Validate multitsframe and obtain an encoder for batches of its rows"""
     if not isinstance(df, pd.DataFrame):
         raise AdapterOutputDataError(
             "Did not receive Pandas DataFrame as expected from workflow output."
             f" Got {str(type(df))} instead."
         )
 
+    def encode_rows(start: int, stop: int) -> str:
+        return encode_json_rows(
+            {
+                column_name: encode_utc_timestamps(df[column_name].iloc[start:stop])
+                if column_name == "timestamp"
+                else encode_json_values(df[column_name].iloc[start:stop])
+                for column_name in df.columns
+            }
+        )
+
     if len(df) == 0:
-        return []
+        return encode_rows
 
     if set(df.columns) != set(MULTITSFRAME_COLUMN_NAMES):
         column_names_string = ", ".join(df.columns)
@@ -55,15 +69,7 @@ def multitsframe_to_list_of_dicts(df: pd.DataFrame) -> list[dict]:
             f'Got {str(df["timestamp"].dt.tz)} timezone instead.'
         )
 
-    new_df = df.replace({np.nan: None})
-    new_df["timestamp"] = new_df["timestamp"].apply(
-        lambda x: x.strftime(
-            "%Y-%m-%dT%H:%M:%S.%f"
-        )  # Generic Rest datetime format is yyyy-MM-ddTHH:mm:ss.SSSSSSSSSX
-        + "{:03d}".format(x.nanosecond)  # noqa: UP032
-        + "Z"  # we guaranteed UTC time zone some lines above!
-    )
-    return new_df.to_dict(orient="records")  # type: ignore
+    return encode_rows
 
 
 async def post_multitsframe(
@@ -71,18 +77,18 @@ async def post_multitsframe(
     ref_id: str,
     additional_params: list[tuple[str, str]],
     adapter_key: str,
-    client: AsyncClient,
 ) -> None:
-    records = multitsframe_to_list_of_dicts(df)
+    encode_rows = multitsframe_to_json_rows_encoder(df)
 
     await post_framelike_records(
-        records,
+        encode_rows,
+        len(df),
         attributes=df.attrs,
         ref_id=ref_id,
         additional_params=additional_params,
         adapter_key=adapter_key,
         endpoint="multitsframe",
-        client=client,
+        get_wire_frame=lambda: df,
     )
 
 
@@ -92,22 +98,17 @@ async def post_multitsframes(
     sink_filters: list[dict[str, str]],
     adapter_key: str,
 ) -> None:
-    async with AsyncClient(
-        verify=get_config().hd_adapters_verify_certs,
-        timeout=get_config().external_request_timeout,
-    ) as client:
-        await asyncio.gather(
-            *(
-                post_multitsframe(
-                    df,
-                    ref_id,
-                    additional_params=list(filters.items()),
-                    adapter_key=adapter_key,
-                    client=client,
-                )
-                for df, ref_id, filters in zip(dfs, ref_ids, sink_filters, strict=True)
+    await asyncio.gather(
+        *(
+            post_multitsframe(
+                df,
+                ref_id,
+                additional_params=list(filters.items()),
+                adapter_key=adapter_key,
             )
+            for df, ref_id, filters in zip(dfs, ref_ids, sink_filters, strict=True)
         )
+    )
 
 
 async def send_multitsframes_to_adapter(
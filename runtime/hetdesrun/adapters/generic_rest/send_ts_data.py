@@ -1,16 +1,19 @@
 import asyncio
 import datetime
 
-import numpy as np
 import pandas as pd
 import pytz
-from httpx import AsyncClient
 
 from hetdesrun.adapters.exceptions import AdapterOutputDataError
 from hetdesrun.adapters.generic_rest.external_types import ExternalType
-from hetdesrun.adapters.generic_rest.send_framelike import post_framelike_records
+from hetdesrun.adapters.generic_rest.send_framelike import (
+    JsonRowsEncoder,
+    encode_json_rows,
+    encode_json_values,
+    encode_utc_timestamps,
+    post_framelike_records,
+)
 from hetdesrun.models.data_selection import FilteredSink
-from hetdesrun.webservice.config import get_config
 
 
 def validate_series_dtype(series: pd.Series, sink_type: ExternalType) -> None:
@@ -37,15 +40,26 @@ def validate_series_dtype(series: pd.Series, sink_type: ExternalType) -> None:
         )
 
 
-def ts_to_list_of_dicts(series: pd.Series, sink_type: ExternalType) -> list[dict]:
+def ts_to_json_rows_encoder(
+    series: pd.Series, sink_type: ExternalType
+) -> JsonRowsEncoder:
+    """Validate timeseries and obtain an encoder for batches of its rows"""
     if not isinstance(series, pd.Series):
         raise AdapterOutputDataError(
             "Did not receive Pandas Series as expected from workflow output."
             f" Got {str(type(series))} instead."
         )
 
+    def encode_rows(start: int, stop: int) -> str:
+        return encode_json_rows(
+            {
+                "value": encode_json_values(series.iloc[start:stop]),
+                "timestamp": encode_utc_timestamps(series.index[start:stop]),
+            }
+        )
+
     if len(series) == 0:
-        return []
+        return encode_rows
 
     if not pd.api.types.is_datetime64_any_dtype(series.index):
         raise AdapterOutputDataError(
@@ -62,22 +76,7 @@ def ts_to_list_of_dicts(series: pd.Series, sink_type: ExternalType) -> list[dict
         )
     validate_series_dtype(series, sink_type)
 
-    return (  # type: ignore
-        pd.DataFrame(
-            {
-                "value": series.to_numpy(),
-                "timestamp": pd.Series(series.index, index=series.index).apply(
-                    lambda x: x.strftime(
-                        "%Y-%m-%dT%H:%M:%S.%f"
-                    )  # Generic Rest datetime format is yyyy-MM-ddTHH:mm:ss.SSSSSSSSSX
-                    + "{:03d}".format(x.nanosecond)  # noqa: UP032
-                    + "Z"  # we guaranteed UTC time zone some lines above!
-                ),
-            }
-        )
-        .replace({np.nan: None})
-        .to_dict(orient="records")
-    )
+    return encode_rows
 
 
 async def post_single_timeseries(
@@ -86,18 +85,20 @@ async def post_single_timeseries(
     additional_params: list[tuple[str, str]],
     sink_type: ExternalType,
     adapter_key: str,
-    client: AsyncClient,
 ) -> None:
-    records = ts_to_list_of_dicts(series, sink_type)
+    encode_rows = ts_to_json_rows_encoder(series, sink_type)
 
     await post_framelike_records(
-        records,
+        encode_rows,
+        len(series),
         attributes=series.attrs,
         ref_id=ref_id,
         additional_params=additional_params,
         adapter_key=adapter_key,
         endpoint="timeseries",
-        client=client,
+        get_wire_frame=lambda: pd.DataFrame(
+            {"timestamp": series.index, "value": series.array}
+        ),
     )
 
 
@@ -108,25 +109,20 @@ async def post_multiple_timeseries(
     sink_types: list[ExternalType],
     adapter_key: str,
 ) -> None:
-    async with AsyncClient(
-        verify=get_config().hd_adapters_verify_certs,
-        timeout=get_config().external_request_timeout,
-    ) as client:
-        await asyncio.gather(
-            *(
-                post_single_timeseries(
-                    series,
-                    ref_id,
-                    additional_params=list(filters.items()),
-                    sink_type=sink_type,
-                    adapter_key=adapter_key,
-                    client=client,
-                )
-                for series, ref_id, filters, sink_type in zip(
-                    timeseries_list, ref_ids, sink_filters, sink_types, strict=True
-                )
+    await asyncio.gather(
+        *(
+            post_single_timeseries(
+                series,
+                ref_id,
+                additional_params=list(filters.items()),
+                sink_type=sink_type,
+                adapter_key=adapter_key,
+            )
+            for series, ref_id, filters, sink_type in zip(
+                timeseries_list, ref_ids, sink_filters, sink_types, strict=True
             )
         )
+    )
 
 
 async def send_multiple_timeseries_to_adapter(
@@ -0,0 +1,160 @@
+"""Range-aware cache for timeseries loaded from generic rest adapters
+
+For every timeseries the cache stores the loaded data together with the time
+intervals which have been loaded. Requests only need to load the sub-intervals
+of the requested interval which are not covered yet. Intervals are closed, in
+accordance with the from and to filters of the generic rest adapter timeseries
+endpoint.
+
+The cache has a memory budget. If it is exceeded, the least recently used
+timeseries are evicted.
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any
+
+import pandas as pd
+
+from hetdesrun.adapters.generic_rest.config import get_generic_rest_adapter_config
+from hetdesrun.adapters.generic_rest.external_types import ExternalType
+
+logger = logging.getLogger(__name__)
+
+# adapter key, timeseries id, value type and the filters apart from from / to
+TimeseriesCacheKey = tuple[str, str, ExternalType, frozenset[tuple[str, Any]]]
+
+
+class CachedTimeseries:
+    """Loaded data of one timeseries with the intervals it has been loaded for"""
+
+    def __init__(self) -> None:
+        self.series: pd.Series | None = None
+        self.intervals: list[tuple[pd.Timestamp, pd.Timestamp]] = []
+        self.attrs: dict[str, Any] = {}
+
+    @property
+    def nbytes(self) -> int:
+        if self.series is None:
+            return 0
+        return int(self.series.memory_usage(deep=True))
+
+    def missing_intervals(
+        self, start: pd.Timestamp, end: pd.Timestamp
+    ) -> list[tuple[pd.Timestamp, pd.Timestamp]]:
+        """Sub-intervals of [start, end] which are not covered by loaded intervals
+
+        Boundaries are included in the missing intervals, i.e. boundary points of
+        loaded intervals are loaded again.
+        """
+        missing: list[tuple[pd.Timestamp, pd.Timestamp]] = []
+        cursor = start
+        cursor_covered = False
+        for interval_start, interval_end in self.intervals:
+            if interval_end < cursor:
+                continue
+            if interval_start > end:
+                break
+            if interval_start > cursor:
+                missing.append((cursor, interval_start))
+            cursor = max(cursor, interval_end)
+            cursor_covered = True
+            if cursor >= end:
+                return missing
+        if cursor < end or not cursor_covered:
+            missing.append((cursor, end))
+        return missing
+
+    def merge(self, series: pd.Series, start: pd.Timestamp, end: pd.Timestamp) -> None:
+        """Merge data loaded for the interval [start, end]
+
+        The loaded data replaces all cached data in that interval.
+        """
+        if len(series.attrs) != 0:
+            self.attrs = series.attrs
+
+        # copy, since series may be a view on a much larger frame
+        if self.series is None:
+            merged_series = series.copy()
+        else:
+            kept = self.series[(self.series.index < start) | (self.series.index > end)]
+            merged_series = pd.concat([kept, series]).sort_index(kind="stable")
+        merged_series.attrs = {}
+        self.series = merged_series
+
+        merged_intervals: list[tuple[pd.Timestamp, pd.Timestamp]] = []
+        for interval_start, interval_end in sorted([*self.intervals, (start, end)]):
+            if len(merged_intervals) != 0 and interval_start <= merged_intervals[-1][1]:
+                merged_intervals[-1] = (
+                    merged_intervals[-1][0],
+                    max(merged_intervals[-1][1], interval_end),
+                )
+            else:
+                merged_intervals.append((interval_start, interval_end))
+        self.intervals = merged_intervals
+
+    def extract(self, start: pd.Timestamp, end: pd.Timestamp) -> pd.Series:
+        """Copy of the cached data in [start, end]"""
+        if self.series is None:
+            raise ValueError("No data has been merged into this cached timeseries.")
+        extracted_series = self.series.loc[start:end].copy()  # type: ignore[misc]
+        extracted_series.attrs = self.attrs
+        return extracted_series
+
+
+class TimeseriesCache:
+    """LRU cache of CachedTimeseries objects with a memory budget"""
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[TimeseriesCacheKey, CachedTimeseries] = OrderedDict()
+        self._nbytes: dict[TimeseriesCacheKey, int] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def nbytes(self) -> int:
+        return sum(self._nbytes.values())
+
+    def get(self, key: TimeseriesCacheKey) -> CachedTimeseries:
+        """Get cached timeseries, which is empty if key is not cached"""
+        with self._lock:
+            try:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+            except KeyError:
+                return CachedTimeseries()
+
+    def store(self, key: TimeseriesCacheKey, entry: CachedTimeseries) -> None:
+        """Store (updated) entry and evict least recently used entries if necessary"""
+        entry_nbytes = entry.nbytes
+        with self._lock:
+            self._entries.pop(key, None)
+            self._nbytes.pop(key, None)
+            if entry_nbytes > self.max_bytes:
+                logger.info(
+                    "Not caching timeseries %s since its size %d exceeds the cache budget",
+                    str(key),
+                    entry_nbytes,
+                )
+                return
+            self._entries[key] = entry
+            self._nbytes[key] = entry_nbytes
+            while sum(self._nbytes.values()) > self.max_bytes:
+                evicted_key, _ = self._entries.popitem(last=False)
+                del self._nbytes[evicted_key]
+                logger.debug("Evicted timeseries %s from cache", str(evicted_key))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._nbytes.clear()
+
+
+timeseries_cache = TimeseriesCache(
+    get_generic_rest_adapter_config().timeseries_cache_max_bytes
+)
+
+
+def get_timeseries_cache() -> TimeseriesCache:
+    return timeseries_cache
@@ -1,5 +1,6 @@
 from typing import Any
 
+from hetdesrun.adapters.execution import run_blocking_adapter_func
 from hetdesrun.adapters.local_file.load_file import load_file_from_id
 from hetdesrun.adapters.local_file.write_file import write_to_file
 from hetdesrun.models.data_selection import FilteredSink, FilteredSource
@@ -13,15 +14,19 @@ except FileNotFoundError:
 
 async def load_data(
     wf_input_name_to_filtered_source_mapping_dict: dict[str, FilteredSource],
-    adapter_key: str,  # noqa: ARG001
+    adapter_key: str,
 ) -> dict[str, Any]:
+    # file reads are blocking and must not block the event loop
     return {
-        wf_input_name: load_file_from_id(
+        wf_input_name: await run_blocking_adapter_func(
+            adapter_key,
+            load_file_from_id,
             str(
                 filtered_source.ref_key
                 if filtered_source.ref_key is not None
                 else filtered_source.ref_id
-            )
+            ),
+            filtered_source.filters,
         )
         for wf_input_name, filtered_source in wf_input_name_to_filtered_source_mapping_dict.items()
     }
@@ -30,7 +35,7 @@ async def load_data(
 async def send_data(
     wf_output_name_to_filtered_sink_mapping_dict: dict[str, FilteredSink],
     wf_output_name_to_value_mapping_dict: dict[str, Any],
-    adapter_key: str,  # noqa: ARG001
+    adapter_key: str,
 ) -> dict[str, Any]:
     for (
         wf_output_name,
@@ -48,5 +53,7 @@ async def send_data(
             else filtered_sink.ref_id
         )
 
-        write_to_file(data, str(id_to_use), filtered_sink.filters)
+        await run_blocking_adapter_func(
+            adapter_key, write_to_file, data, str(id_to_use), filtered_sink.filters
+        )
     return {}
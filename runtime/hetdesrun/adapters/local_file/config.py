@@ -34,6 +34,35 @@ class LocalFileAdapterConfig(BaseSettings):
         description="Whether a generic sink of type DATAFRAME is offered in each directory",
         env="RUNTIME_LOCAL_FILE_ADAPTER_GENERIC_DATAFRAME_SINKS",
     )
+    index_refresh_interval: float | None = Field(
+        None,
+        description=(
+            "Interval in seconds in which the index of the local files is refreshed"
+            " in the background. If not set, the index is refreshed incrementally"
+            " on each request, which only lists directories that changed."
+        ),
+        env="RUNTIME_LOCAL_FILE_ADAPTER_INDEX_REFRESH_INTERVAL",
+        gt=0,
+    )
+    sidecar_cache_dir: str | None = Field(
+        None,
+        description=(
+            "Directory in which DataFrames loaded from files of formats which are"
+            " slow to parse (e.g. csv and excel) are cached as Feather files."
+            " Later loads of unchanged files read these sidecar files instead."
+            " If not set, no sidecar files are written."
+        ),
+        env="RUNTIME_LOCAL_FILE_ADAPTER_SIDECAR_CACHE_DIR",
+    )
+    sidecar_cache_max_size: int = Field(
+        1024**3,
+        description=(
+            "Maximum total size in bytes of the sidecar cache directory."
+            " Least recently used sidecar files are removed if exceeded."
+        ),
+        env="RUNTIME_LOCAL_FILE_ADAPTER_SIDECAR_CACHE_MAX_SIZE",
+        gt=0,
+    )
 
 
 environment_file = os.environ.get("HD_RUNTIME_ENVIRONMENT_FILE", None)
@@ -7,6 +7,7 @@ from pydantic import BaseModel, Field, ValidationError
 from hetdesrun.adapters.local_file.extensions import (
     FileSupportHandler,
     get_file_support_handler,
+    is_data_directory,
 )
 
 logger = logging.getLogger(__name__)
@@ -75,6 +76,11 @@ def parse_settings_file(
     return parsed_settings
 
 
+def is_directory_handled(path: str) -> bool:
+    file_support_handler = get_file_support_handler(path)
+    return file_support_handler is not None and file_support_handler.is_directory
+
+
 def local_file_from_path(
     file_path: str,
     top_dir: str,
@@ -90,7 +96,11 @@ def local_file_from_path(
                 (not os.path.exists(data_file_path))
                 or provide_from_settings_file_if_data_file_present
             )
-            and (data_file_path.endswith((".csv", ".csv.zip")))
+            and (
+                data_file_path.endswith((".csv", ".csv.zip"))
+                # e.g. datasets which are created on first write
+                or is_directory_handled(data_file_path)
+            )
         ) or provide_from_settings_file_if_data_file_present:
             parsed_settings_file = parse_settings_file(data_file_path=data_file_path)
 
@@ -158,8 +168,16 @@ def get_local_files_and_dirs(
             if local_file is not None:
                 local_files.append(local_file)
 
-        for sub_dir in dirs:
-            sub_directories.append(os.path.join(root, sub_dir))
+        for sub_dir in list(dirs):
+            sub_dir_path = os.path.join(root, sub_dir)
+            if is_data_directory(sub_dir_path):
+                # data directories are local files and are not walked into
+                dirs.remove(sub_dir)
+                local_file = local_file_from_path(sub_dir_path, top_dir)
+                if local_file is not None:
+                    local_files.append(local_file)
+                continue
+            sub_directories.append(sub_dir_path)
 
         if not walk_sub_dirs:
             break
@@ -1,3 +1,4 @@
+import os
 from collections.abc import Callable
 from typing import Any
 
@@ -14,6 +15,32 @@ class FileSupportHandler(BaseModel):
         ExternalType.DATAFRAME,
         description="As which type the adapter should offer files.",
     )
+    filterable_columns_func: Callable | None = Field(
+        None,
+        description=(
+            "Function returning the columns of a file which can be filtered while reading."
+            " If provided, read_handler_func must accept a read_filter keyword argument"
+            " and the adapter offers filters for the sources of such files."
+        ),
+    )
+
+    sidecar_cacheable: bool = Field(
+        False,
+        description=(
+            "Whether DataFrames loaded by read_handler_func may be cached as"
+            " sidecar files, if a sidecar cache directory is configured."
+            " Only recommended for formats which are slow to parse."
+        ),
+    )
+
+    is_directory: bool = Field(
+        False,
+        description=(
+            "Whether the associated paths are directories, e.g. datasets consisting"
+            " of multiple files. Such directories are offered as sources / sinks"
+            " instead of as thing nodes."
+        ),
+    )
 
     @validator("write_handler_func", always=True)
     def at_least_one_handler_func(
@@ -44,6 +71,16 @@ def get_file_support_handler(path: str) -> FileSupportHandler | None:
     return None
 
 
+def is_data_directory(path: str) -> bool:
+    """Whether the path is a directory handled by a directory based handler"""
+    file_support_handler = get_file_support_handler(path)
+    return (
+        file_support_handler is not None
+        and file_support_handler.is_directory
+        and os.path.isdir(path)
+    )
+
+
 def register_file_support(
     file_support_handler: FileSupportHandler, allow_overwrite: bool = False
 ) -> None:
@@ -0,0 +1,137 @@
+"""Filters for loading only parts of local files
+
+File formats supporting it (Parquet, HDF5 tables) apply these filters while reading,
+so that only the required columns and row groups / rows are read from disk.
+
+Timestamp filters are applied to the "timestamp" column and the metrics filter to the
+"metric" column, following the conventions of hetida designer's multitsframes.
+"""
+
+import datetime
+import logging
+from typing import Any
+
+import pandas as pd
+from pydantic import BaseModel, ValidationError
+
+from hetdesrun.adapters.exceptions import AdapterHandlingException
+from hetdesrun.adapters.local_file.models import FilterType, StructureFilter
+
+logger = logging.getLogger(__name__)
+
+TIMESTAMP_COLUMN = "timestamp"
+METRIC_COLUMN = "metric"
+
+READ_FILTERS = {
+    "columns": StructureFilter(
+        name="Columns (json array or comma separated, all if empty)",
+        type=FilterType.free_text,
+        required=False,
+    ),
+    "timestampFrom": StructureFilter(
+        name="Minimum timestamp (inclusive) of column timestamp",
+        type=FilterType.free_text,
+        required=False,
+    ),
+    "timestampTo": StructureFilter(
+        name="Maximum timestamp (inclusive) of column timestamp",
+        type=FilterType.free_text,
+        required=False,
+    ),
+    "metrics": StructureFilter(
+        name="Metrics of column metric (json array or comma separated, all if empty)",
+        type=FilterType.free_text,
+        required=False,
+    ),
+}
+
+
+class StringList(BaseModel):
+    __root__: list[str]
+
+
+def split_string_list(list_string: str) -> list[str]:
+    try:
+        return StringList.parse_raw(list_string).__root__
+    except ValidationError:
+        # handle as comma separated string
+        return [x.strip() for x in list_string.split(",") if x.strip() != ""]
+
+
+class ReadFilter(BaseModel):
+    columns: list[str] | None = None
+    timestamp_from: datetime.datetime | None = None
+    timestamp_to: datetime.datetime | None = None
+    metrics: list[str] | None = None
+
+    @classmethod
+    def from_filters(cls, filters: dict[str, Any]) -> "ReadFilter":
+        """Parse the filters of a filtered source
+
+        Filters which are not provided or empty are not applied.
+        """
+        non_empty_filters = {
+            key: str(value).strip()
+            for key, value in filters.items()
+            if key in READ_FILTERS and value is not None and str(value).strip() != ""
+        }
+        try:
+            return cls(
+                columns=split_string_list(non_empty_filters["columns"])
+                if "columns" in non_empty_filters
+                else None,
+                timestamp_from=pd.to_datetime(
+                    non_empty_filters["timestampFrom"], utc=True
+                ).to_pydatetime()
+                if "timestampFrom" in non_empty_filters
+                else None,
+                timestamp_to=pd.to_datetime(
+                    non_empty_filters["timestampTo"], utc=True
+                ).to_pydatetime()
+                if "timestampTo" in non_empty_filters
+                else None,
+                metrics=split_string_list(non_empty_filters["metrics"])
+                if "metrics" in non_empty_filters
+                else None,
+            )
+        except ValueError as e:
+            msg = (
+                f"Could not parse local file filters {str(non_empty_filters)}: {str(e)}"
+            )
+            logger.info(msg)
+            raise AdapterHandlingException(msg) from e
+
+    def is_empty(self) -> bool:
+        return (
+            self.columns is None
+            and self.timestamp_from is None
+            and self.timestamp_to is None
+            and self.metrics is None
+        )
+
+    def filtered_columns(self) -> list[str]:
+        """Columns the rows are filtered by"""
+        return ([TIMESTAMP_COLUMN] if self.filters_timestamps() else []) + (
+            [METRIC_COLUMN] if self.metrics is not None else []
+        )
+
+    def filters_timestamps(self) -> bool:
+        return self.timestamp_from is not None or self.timestamp_to is not None
+
+
+def apply_read_filter(df: pd.DataFrame, read_filter: ReadFilter) -> pd.DataFrame:
+    """Apply a read filter to an already loaded DataFrame"""
+    mask = pd.Series(True, index=df.index)
+    if read_filter.filters_timestamps():
+        timestamps = pd.to_datetime(df[TIMESTAMP_COLUMN], utc=True)
+        if read_filter.timestamp_from is not None:
+            mask &= timestamps >= read_filter.timestamp_from
+        if read_filter.timestamp_to is not None:
+            mask &= timestamps <= read_filter.timestamp_to
+    if read_filter.metrics is not None:
+        mask &= df[METRIC_COLUMN].isin(read_filter.metrics)
+
+    filtered_df = df[mask]
+    if read_filter.columns is not None:
+        filtered_df = filtered_df[read_filter.columns]
+    return filtered_df
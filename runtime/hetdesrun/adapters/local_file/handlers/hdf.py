@@ -2,9 +2,109 @@ from typing import Any
 
 import pandas as pd
 
+from hetdesrun.adapters.local_file.filters import (
+    METRIC_COLUMN,
+    TIMESTAMP_COLUMN,
+    ReadFilter,
+    apply_read_filter,
+)
 
-def load_hdf(path: str, **kwargs: Any) -> pd.DataFrame:
-    return pd.read_hdf(path, **kwargs)
+
+def hdf_data_columns(path: str, key: str | None = None) -> list[str] | None:
+    """Data columns of the stored table which can be used in where queries
+
+    Returns None if the object is stored in fixed format, which cannot be queried.
+    """
+    with pd.HDFStore(path, mode="r") as store:
+        if key is None:
+            # as in pd.read_hdf, the key may be omitted if the file contains one object
+            keys = store.keys()
+            if len(keys) != 1:
+                raise ValueError(
+                    "key must be provided when HDF5 file contains multiple datasets."
+                )
+            key = keys[0]
+        storer = store.get_storer(key)
+        if not storer.is_table:
+            return None
+        return list(storer.data_columns)
+
+
+def hdf_where_conditions(
+    read_filter: ReadFilter, data_columns: list[str]
+) -> tuple[list[str], ReadFilter]:
+    """Translate a read filter into where conditions for HDF5 tables
+
+    Returns the conditions and the part of the read filter which could not be
+    translated since the filtered columns are no data columns of the table.
+    """
+    conditions: list[str] = []
+    remaining_filter = ReadFilter(columns=read_filter.columns)
+
+    if read_filter.filters_timestamps():
+        if TIMESTAMP_COLUMN in data_columns:
+            if read_filter.timestamp_from is not None:
+                conditions.append(
+                    f"{TIMESTAMP_COLUMN} >= {read_filter.timestamp_from.isoformat()!r}"
+                )
+            if read_filter.timestamp_to is not None:
+                conditions.append(
+                    f"{TIMESTAMP_COLUMN} <= {read_filter.timestamp_to.isoformat()!r}"
+                )
+        else:
+            remaining_filter.timestamp_from = read_filter.timestamp_from
+            remaining_filter.timestamp_to = read_filter.timestamp_to
+
+    if read_filter.metrics is not None:
+        if METRIC_COLUMN in data_columns:
+            conditions.append(f"{METRIC_COLUMN} in {read_filter.metrics!r}")
+        else:
+            remaining_filter.metrics = read_filter.metrics
+
+    return conditions, remaining_filter
+
+
+def load_hdf(
+    path: str, read_filter: ReadFilter | None = None, **kwargs: Any
+) -> pd.DataFrame:
+    """Load an HDF5 file
+
+    For objects stored in table format, row filters on data columns and the column
+    selection of the read filter are applied while reading. Objects stored in fixed
+    format are read completely and filtered afterwards.
+    """
+    if read_filter is None or read_filter.is_empty():
+        return pd.read_hdf(path, **kwargs)
+
+    data_columns = hdf_data_columns(path, kwargs.get("key", None))
+    if data_columns is None:
+        return apply_read_filter(pd.read_hdf(path, **kwargs), read_filter)
+
+    conditions, remaining_filter = hdf_where_conditions(read_filter, data_columns)
+    if len(conditions) > 0:
+        configured_where = kwargs.get("where", None)
+        if configured_where is None:
+            configured_where = []
+        elif isinstance(configured_where, str):
+            configured_where = [configured_where]
+        kwargs["where"] = list(configured_where) + conditions
+
+    if read_filter.columns is not None:
+        kwargs["columns"] = read_filter.columns + [
+            column
+            for column in remaining_filter.filtered_columns()
+            if column not in read_filter.columns
+        ]
+
+    df = pd.read_hdf(path, **kwargs)
+    if remaining_filter.is_empty():
+        return df
+    return apply_read_filter(df, remaining_filter)
+
+
+def hdf_filterable_columns(path: str, **kwargs: Any) -> list[str]:
+    data_columns = hdf_data_columns(path, kwargs.get("key", None))
+    return [] if data_columns is None else data_columns
 
 
 def write_hdf(df: pd.DataFrame, path: str, **kwargs: Any) -> None:
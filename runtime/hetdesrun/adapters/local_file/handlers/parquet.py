@@ -1,10 +1,118 @@
+import datetime
 from typing import Any
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 
+from hetdesrun.adapters.local_file.filters import (
+    METRIC_COLUMN,
+    TIMESTAMP_COLUMN,
+    ReadFilter,
+    apply_read_filter,
+)
 
-def load_parquet(path: str, **kwargs: Any) -> pd.DataFrame:
-    return pd.read_parquet(path, **kwargs)
+
+def timestamp_scalar(
+    timestamp: datetime.datetime, arrow_type: pa.DataType
+) -> pa.Scalar:
+    if arrow_type.tz is None:  # type: ignore[attr-defined]
+        # timezone naive timestamps are interpreted as UTC
+        timestamp = timestamp.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+    return pa.scalar(timestamp, type=arrow_type)
+
+
+def parquet_filter_expression(
+    read_filter: ReadFilter, schema: pa.Schema
+) -> tuple[pc.Expression | None, ReadFilter]:
+    """Translate a read filter into a pyarrow dataset filter expression
+
+    Returns the expression and the part of the read filter which could not be
+    translated and must be applied after reading, e.g. timestamp filters on columns
+    which are not stored as timestamps.
+    """
+    expressions: list[pc.Expression] = []
+    remaining_filter = ReadFilter(columns=read_filter.columns)
+
+    if read_filter.filters_timestamps():
+        if TIMESTAMP_COLUMN in schema.names and pa.types.is_timestamp(
+            schema.field(TIMESTAMP_COLUMN).type
+        ):
+            arrow_type = schema.field(TIMESTAMP_COLUMN).type
+            if read_filter.timestamp_from is not None:
+                expressions.append(
+                    pc.field(TIMESTAMP_COLUMN)
+                    >= timestamp_scalar(read_filter.timestamp_from, arrow_type)
+                )
+            if read_filter.timestamp_to is not None:
+                expressions.append(
+                    pc.field(TIMESTAMP_COLUMN)
+                    <= timestamp_scalar(read_filter.timestamp_to, arrow_type)
+                )
+        else:
+            remaining_filter.timestamp_from = read_filter.timestamp_from
+            remaining_filter.timestamp_to = read_filter.timestamp_to
+
+    if read_filter.metrics is not None:
+        if METRIC_COLUMN in schema.names:
+            expressions.append(pc.field(METRIC_COLUMN).isin(read_filter.metrics))
+        else:
+            remaining_filter.metrics = read_filter.metrics
+
+    if len(expressions) == 0:
+        return None, remaining_filter
+
+    expression = expressions[0]
+    for further_expression in expressions[1:]:
+        expression = expression & further_expression
+    return expression, remaining_filter
+
+
+def load_parquet(
+    path: str, read_filter: ReadFilter | None = None, **kwargs: Any
+) -> pd.DataFrame:
+    """Load a parquet file
+
+    Column selection and row filters of the read filter are pushed down to pyarrow,
+    so that only the required columns and row groups are read.
+    """
+    if read_filter is None or read_filter.is_empty():
+        return pd.read_parquet(path, **kwargs)
+
+    expression, remaining_filter = parquet_filter_expression(
+        read_filter, pq.read_schema(path)
+    )
+
+    if expression is not None:
+        if kwargs.get("filters") is not None:
+            # filters from the settings file in list of tuples notation
+            configured_filters = kwargs["filters"]
+            if not isinstance(configured_filters, pc.Expression):
+                configured_filters = pq.filters_to_expression(configured_filters)
+            expression = configured_filters & expression
+        kwargs["filters"] = expression
+
+    if read_filter.columns is not None:
+        # columns required for filtering after reading are read additionally
+        kwargs["columns"] = read_filter.columns + [
+            column
+            for column in remaining_filter.filtered_columns()
+            if column not in read_filter.columns
+        ]
+
+    df = pd.read_parquet(path, **kwargs)
+    if remaining_filter.is_empty():
+        return df
+    return apply_read_filter(df, remaining_filter)
+
+
+def parquet_filterable_columns(path: str, **kwargs: Any) -> list[str]:  # noqa: ARG001
+    return [
+        name
+        for name in pq.read_schema(path).names
+        if not name.startswith("__index_level_")
+    ]
 
 
 def write_parquet(df: pd.DataFrame, path: str, **kwargs: Any) -> None:
@@ -0,0 +1,429 @@
+"""Appendable, partitioned Parquet datasets
+
+A Parquet dataset is a directory (named with the extension ".parquet_dataset") to
+which each write appends new Parquet files ("fragments") instead of rewriting
+existing data. Fragments are written to a temporary file first and then renamed, so
+readers never see partially written fragments.
+
+Fragments can be partitioned into hive style sub directories by the date (UTC) of
+the "timestamp" column ("date=2023-01-02") or by the value of the "metric" column
+("metric=a"). Loading with timestamp or metric filters then only reads the fragments
+of the matching partitions. The partitioning is fixed on first write and stored in
+the dataset directory.
+
+Since frequent appends create many small fragments, the fragments of a partition can
+be compacted into one file when a configurable number of fragments is reached. The
+compacted file records which fragments it replaces, so that readers ignore these
+fragments until they are removed.
+"""
+
+import contextlib
+import datetime
+import json
+import logging
+import os
+import time
+import urllib.parse
+import uuid
+from typing import Any, Literal
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from hetdesrun.adapters.local_file.filters import (
+    METRIC_COLUMN,
+    TIMESTAMP_COLUMN,
+    ReadFilter,
+    apply_read_filter,
+)
+from hetdesrun.adapters.local_file.handlers.parquet import parquet_filter_expression
+from hetdesrun.atomic_files import write_atomically
+
+logger = logging.getLogger(__name__)
+
+DATASET_INFO_FILE_NAME = "_hd_dataset.json"
+FRAGMENT_SUFFIX = ".parquet"
+FRAGMENT_PREFIX = "part-"
+COMPACTED_PREFIX = "compacted-"
+REPLACED_FRAGMENTS_METADATA_KEY = b"hd_replaced_fragments"
+COMPACTION_LOCK_FILE_NAME = "_compaction.lock"
+# compaction locks of crashed writers are ignored after this time
+COMPACTION_LOCK_TIMEOUT = 600.0
+READ_ATTEMPTS = 3
+
+PartitionBy = Literal["date", "metric"]
+
+
+def new_file_name(prefix: str) -> str:
+    return (
+        prefix
+        + datetime.datetime.now(datetime.timezone.utc).strftime("%Y%m%dT%H%M%S%f")
+        + "-"
+        + uuid.uuid4().hex[:8]
+        + FRAGMENT_SUFFIX
+    )
+
+
+def write_json(path: str, obj: Any) -> None:
+    with open(path, "w", encoding="utf8") as f:
+        json.dump(obj, f)
+
+
+def read_partition_by(path: str) -> PartitionBy | None:
+    try:
+        with open(os.path.join(path, DATASET_INFO_FILE_NAME), encoding="utf8") as f:
+            partition_by: PartitionBy | None = json.load(f)["partition_by"]
+    except FileNotFoundError:
+        return None
+    return partition_by
+
+
+def ensure_partition_by(path: str, partition_by: PartitionBy | None) -> None:
+    """Store the partitioning on first write and check it on later writes"""
+    info_path = os.path.join(path, DATASET_INFO_FILE_NAME)
+    if os.path.exists(info_path):
+        stored_partition_by = read_partition_by(path)
+        if stored_partition_by != partition_by:
+            raise ValueError(
+                f"Parquet dataset {path} is partitioned by {stored_partition_by},"
+                f" cannot append data partitioned by {partition_by}."
+            )
+        return
+
+    write_atomically(
+        info_path,
+        lambda tmp_path: write_json(tmp_path, {"partition_by": partition_by}),
+    )
+
+
+def partition_dir_name(partition_by: PartitionBy, value: str) -> str:
+    return partition_by + "=" + urllib.parse.quote(value, safe="")
+
+
+def partition_value(partition_dir: str) -> str:
+    return urllib.parse.unquote(partition_dir.split("=", 1)[1])
+
+
+def partitioned(
+    df: pd.DataFrame, partition_by: PartitionBy | None
+) -> list[tuple[str | None, pd.DataFrame]]:
+    """Split a DataFrame into the parts written to the partition directories"""
+    if partition_by is None:
+        return [(None, df)]
+    if partition_by == "date":
+        if TIMESTAMP_COLUMN not in df.columns:
+            raise ValueError(
+                f'Partitioning by date requires a "{TIMESTAMP_COLUMN}" column.'
+            )
+        timestamps = pd.to_datetime(df[TIMESTAMP_COLUMN], utc=True)
+        if timestamps.isna().any():
+            # would be dropped by groupby otherwise
+            raise ValueError(
+                f'Partitioning by date requires "{TIMESTAMP_COLUMN}" values in all'
+                f" rows, but {timestamps.isna().sum()} rows have none."
+            )
+        keys = timestamps.dt.strftime("%Y-%m-%d")
+    else:
+        if METRIC_COLUMN not in df.columns:
+            raise ValueError(
+                f'Partitioning by metric requires a "{METRIC_COLUMN}" column.'
+            )
+        keys = df[METRIC_COLUMN].astype(str)
+    return [
+        (partition_dir_name(partition_by, str(key)), part_df)
+        for key, part_df in df.groupby(keys, sort=True)
+    ]
+
+
+def partition_dirs(
+    path: str, partition_by: PartitionBy | None, read_filter: ReadFilter | None
+) -> list[str]:
+    """Partition directories of a dataset which may contain data matching the filter"""
+    if partition_by is None:
+        return [path]
+
+    with os.scandir(path) as dir_entries:
+        dir_names = sorted(
+            dir_entry.name
+            for dir_entry in dir_entries
+            if dir_entry.is_dir() and dir_entry.name.startswith(partition_by + "=")
+        )
+
+    if read_filter is not None and partition_by == "date":
+        if read_filter.timestamp_from is not None:
+            min_date = read_filter.timestamp_from.astimezone(
+                datetime.timezone.utc
+            ).strftime("%Y-%m-%d")
+            dir_names = [
+                name for name in dir_names if partition_value(name) >= min_date
+            ]
+        if read_filter.timestamp_to is not None:
+            max_date = read_filter.timestamp_to.astimezone(
+                datetime.timezone.utc
+            ).strftime("%Y-%m-%d")
+            dir_names = [
+                name for name in dir_names if partition_value(name) <= max_date
+            ]
+    if (
+        read_filter is not None
+        and partition_by == "metric"
+        and read_filter.metrics is not None
+    ):
+        dir_names = [
+            name for name in dir_names if partition_value(name) in read_filter.metrics
+        ]
+    return [os.path.join(path, dir_name) for dir_name in dir_names]
+
+
+def partition_file_names(dir_path: str) -> list[str]:
+    """Names of the fragment and compacted files in a partition directory"""
+    try:
+        with os.scandir(dir_path) as dir_entries:
+            return sorted(
+                dir_entry.name
+                for dir_entry in dir_entries
+                if dir_entry.is_file()
+                and dir_entry.name.endswith(FRAGMENT_SUFFIX)
+                and dir_entry.name.startswith((FRAGMENT_PREFIX, COMPACTED_PREFIX))
+            )
+    except FileNotFoundError:
+        return []
+
+
+def replaced_fragment_names(dir_path: str, file_names: list[str]) -> set[str]:
+    """Names of the fragments replaced by the compacted files among file_names"""
+    replaced_file_names: set[str] = set()
+    for file_name in file_names:
+        if file_name.startswith(COMPACTED_PREFIX):
+            metadata = pq.read_schema(os.path.join(dir_path, file_name)).metadata or {}
+            replaced_file_names.update(
+                json.loads(metadata.get(REPLACED_FRAGMENTS_METADATA_KEY, b"[]"))
+            )
+    return replaced_file_names
+
+
+def fragment_files(dir_path: str) -> list[str]:
+    """Current fragment files of a partition directory
+
+    Fragments replaced by a compacted file are excluded.
+    """
+    file_names = partition_file_names(dir_path)
+    replaced_file_names = replaced_fragment_names(dir_path, file_names)
+    return [
+        os.path.join(dir_path, file_name)
+        for file_name in file_names
+        if file_name not in replaced_file_names
+    ]
+
+
+def fragments_dataset(file_paths: list[str]) -> ds.Dataset:
+    """Dataset of fragment files with the unified schema of all fragments
+
+    Otherwise the schema would be inferred from the first fragment only, which
+    fails e.g. if a column contains only nulls in that fragment.
+    """
+    schema = pa.unify_schemas([pq.read_schema(file_path) for file_path in file_paths])
+    return ds.dataset(file_paths, schema=schema, format="parquet")
+
+
+def remove_replaced_fragments(dir_path: str) -> None:
+    """Remove fragments left over by a compaction which did not finish
+
+    These are only hidden as long as the compacted file replacing them exists,
+    hence they must be removed before that file is compacted again.
+    """
+    file_names = partition_file_names(dir_path)
+    for file_name in replaced_fragment_names(dir_path, file_names).intersection(
+        file_names
+    ):
+        logger.warning(
+            "Removing fragment %s of Parquet dataset partition %s replaced by a"
+            " compacted file",
+            file_name,
+            dir_path,
+        )
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(os.path.join(dir_path, file_name))
+
+
+def replaced_by_other_compacted_files(
+    dir_path: str, compacted_file_name: str, fragment_names: list[str]
+) -> bool:
+    """Whether other compacted files replace any of the fragments
+
+    This happens if a compaction took longer than COMPACTION_LOCK_TIMEOUT, so that
+    another writer removed its lock and compacted the same fragments.
+    """
+    other_file_names = [
+        file_name
+        for file_name in partition_file_names(dir_path)
+        if file_name != compacted_file_name
+    ]
+    return not replaced_fragment_names(dir_path, other_file_names).isdisjoint(
+        fragment_names
+    )
+
+
+def acquire_compaction_lock(dir_path: str) -> bool:
+    lock_path = os.path.join(dir_path, COMPACTION_LOCK_FILE_NAME)
+    with contextlib.suppress(FileNotFoundError):
+        if time.time() - os.path.getmtime(lock_path) > COMPACTION_LOCK_TIMEOUT:
+            logger.warning("Removing stale compaction lock %s", lock_path)
+            os.remove(lock_path)
+    try:
+        os.close(os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+    except FileExistsError:
+        return False
+    return True
+
+
+def compact_partition(dir_path: str) -> None:
+    """Compact the current fragments of a partition directory into one file
+
+    Skipped if the partition is compacted by another writer at the same time.
+    """
+    if not acquire_compaction_lock(dir_path):
+        return
+    try:
+        remove_replaced_fragments(dir_path)
+        file_paths = fragment_files(dir_path)
+        if len(file_paths) <= 1:
+            return
+        table = fragments_dataset(file_paths).to_table()
+        replaced_file_names = [os.path.basename(file_path) for file_path in file_paths]
+        table = table.replace_schema_metadata(
+            {
+                **(table.schema.metadata or {}),
+                REPLACED_FRAGMENTS_METADATA_KEY: json.dumps(replaced_file_names),
+            }
+        )
+        with contextlib.suppress(FileNotFoundError):
+            # reading may take long, keep the lock from being considered stale
+            os.utime(os.path.join(dir_path, COMPACTION_LOCK_FILE_NAME))
+        compacted_file_name = new_file_name(COMPACTED_PREFIX)
+        compacted_path = os.path.join(dir_path, compacted_file_name)
+        write_atomically(
+            compacted_path, lambda tmp_path: pq.write_table(table, tmp_path)
+        )
+        if replaced_by_other_compacted_files(
+            dir_path, compacted_file_name, replaced_file_names
+        ):
+            # readers would get the rows of these fragments twice otherwise
+            logger.warning(
+                "Fragments of Parquet dataset partition %s were compacted"
+                " concurrently, removing compacted file %s",
+                dir_path,
+                compacted_file_name,
+            )
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(compacted_path)
+            return
+        # from now on readers ignore the replaced fragments
+        for file_path in file_paths:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(file_path)
+        logger.debug(
+            "Compacted %d fragments of Parquet dataset partition %s",
+            len(file_paths),
+            dir_path,
+        )
+    finally:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(os.path.join(dir_path, COMPACTION_LOCK_FILE_NAME))
+
+
+def write_parquet_dataset(
+    df: pd.DataFrame,
+    path: str,
+    partition_by: PartitionBy | None = None,
+    compact_min_fragments: int | None = None,
+    **kwargs: Any,
+) -> None:
+    """Append a DataFrame to a Parquet dataset
+
+    The index of the DataFrame is not stored. If compact_min_fragments is set, the
+    fragments of each written partition are compacted into one file as soon as
+    there are at least this many. Further keyword arguments are passed to
+    pyarrow.parquet.write_table.
+    """
+    if partition_by not in (None, "date", "metric"):
+        raise ValueError(
+            f'partition_by must be one of "date", "metric" or null, got {partition_by}.'
+        )
+    ensure_partition_by(path, partition_by)
+    if len(df.index) == 0:
+        return
+
+    for partition_dir, part_df in partitioned(df, partition_by):
+        dir_path = path if partition_dir is None else os.path.join(path, partition_dir)
+        table = pa.Table.from_pandas(part_df, preserve_index=False)
+        write_atomically(
+            os.path.join(dir_path, new_file_name(FRAGMENT_PREFIX)),
+            lambda tmp_path, table=table: pq.write_table(table, tmp_path, **kwargs),
+        )
+        if (
+            compact_min_fragments is not None
+            and len(fragment_files(dir_path)) >= compact_min_fragments
+        ):
+            compact_partition(dir_path)
+
+
+def read_fragments(path: str, read_filter: ReadFilter | None) -> pd.DataFrame:
+    file_paths = [
+        file_path
+        for dir_path in partition_dirs(path, read_partition_by(path), read_filter)
+        for file_path in fragment_files(dir_path)
+    ]
+    if len(file_paths) == 0:
+        return pd.DataFrame()
+
+    dataset = fragments_dataset(file_paths)
+    if read_filter is None or read_filter.is_empty():
+        return dataset.to_table().to_pandas()
+
+    expression, remaining_filter = parquet_filter_expression(
+        read_filter, dataset.schema
+    )
+    columns = None
+    if read_filter.columns is not None:
+        columns = read_filter.columns + [
+            column
+            for column in remaining_filter.filtered_columns()
+            if column not in read_filter.columns
+        ]
+    df = dataset.to_table(columns=columns, filter=expression).to_pandas()
+    if remaining_filter.is_empty():
+        return df
+    return apply_read_filter(df, remaining_filter)
+
+
+def load_parquet_dataset(
+    path: str, read_filter: ReadFilter | None = None, **kwargs: Any  # noqa: ARG001
+) -> pd.DataFrame:
+    """Load a Parquet dataset
+
+    Only the fragments of partitions matching the timestamp or metrics filter are
+    read. Within these, filters are pushed down to pyarrow as for Parquet files.
+    """
+    for _ in range(READ_ATTEMPTS - 1):
+        try:
+            return read_fragments(path, read_filter)
+        except FileNotFoundError:
+            # fragments were removed by a concurrent compaction, list them again
+            logger.debug("Fragments of Parquet dataset %s changed while reading", path)
+    return read_fragments(path, read_filter)
+
+
+def parquet_dataset_filterable_columns(
+    path: str, **kwargs: Any  # noqa: ARG001
+) -> list[str]:
+    file_paths = [
+        file_path
+        for dir_path in partition_dirs(path, read_partition_by(path), None)
+        for file_path in fragment_files(dir_path)
+    ]
+    if len(file_paths) == 0:
+        return []
+    return list(fragments_dataset(file_paths).schema.names)
@@ -0,0 +1,300 @@
+"""In-memory index of the files in the configured local directories
+
+Walking all configured directories and parsing the settings file of every data file
+on every structure request is slow for large directory trees, e.g. on network mounts.
+Instead the local files are kept in an index, which is refreshed incrementally:
+
+A directory is only listed again if its modification time changed, i.e. if entries
+were added, removed or renamed. Settings files of unchanged directories are only
+parsed again if their own modification time changed. So a refresh of unchanged
+directories requires one stat call per directory and settings file.
+
+Modification times which are very recent when a directory is listed are not trusted,
+since further changes may happen within the timestamp resolution of the file system.
+Such directories are listed again on the next refresh.
+
+If an index refresh interval is configured, the index is refreshed by a background
+thread and requests are answered from the index without refreshing it first.
+"""
+
+import logging
+import os
+import threading
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+
+from hetdesrun.adapters.local_file.config import local_file_adapter_config
+from hetdesrun.adapters.local_file.detect import LocalFile, local_file_from_path
+from hetdesrun.adapters.local_file.extensions import is_data_directory
+
+logger = logging.getLogger(__name__)
+
+SETTINGS_FILE_SUFFIX = ".settings.json"
+
+# modification times younger than this are not trusted
+RECENT_MTIME_NS = 2_000_000_000
+
+UNTRUSTED_MTIME_NS = -1
+
+
+def trusted_mtime_ns(mtime_ns: int, listed_at_ns: int) -> int:
+    if listed_at_ns - mtime_ns < RECENT_MTIME_NS:
+        return UNTRUSTED_MTIME_NS
+    return mtime_ns
+
+
+@dataclass
+class IndexedDirectory:
+    top_dir: str
+    mtime_ns: int
+    # local files in the order of the directory listing
+    local_files: list[LocalFile] = field(default_factory=list)
+    sub_dirs: list[str] = field(default_factory=list)
+    # symlinked sub directories are listed but not walked into, as with os.walk
+    linked_sub_dirs: set[str] = field(default_factory=set)
+    settings_file_mtimes_ns: dict[str, int] = field(default_factory=dict)
+
+    def walkable_sub_dirs(self) -> list[str]:
+        return [
+            sub_dir for sub_dir in self.sub_dirs if sub_dir not in self.linked_sub_dirs
+        ]
+
+
+class LocalFileIndex:
+    def __init__(self) -> None:
+        # guards the index data, only held while reading or updating it
+        self._lock = threading.RLock()
+        # serializes refreshes, held while listing directories
+        self._refresh_lock = threading.Lock()
+        self._dirs: dict[str, IndexedDirectory] = {}
+        # local files of existing data files by path
+        self._files_by_path: dict[str, LocalFile] = {}
+
+    def _list_dir(
+        self, dir_path: str, top_dir: str, mtime_ns: int
+    ) -> tuple[IndexedDirectory, list[LocalFile]]:
+        """List a directory and return it together with the local files of data files"""
+        listed_at_ns = time.time_ns()
+        indexed_dir = IndexedDirectory(
+            top_dir=top_dir, mtime_ns=trusted_mtime_ns(mtime_ns, listed_at_ns)
+        )
+        data_files: list[LocalFile] = []
+
+        with os.scandir(dir_path) as dir_entries:
+            for dir_entry in dir_entries:
+                if dir_entry.is_dir() and not is_data_directory(dir_entry.path):
+                    indexed_dir.sub_dirs.append(dir_entry.path)
+                    if dir_entry.is_symlink():
+                        indexed_dir.linked_sub_dirs.add(dir_entry.path)
+                    continue
+                is_settings_file = dir_entry.name.endswith(SETTINGS_FILE_SUFFIX)
+                if is_settings_file:
+                    indexed_dir.settings_file_mtimes_ns[
+                        dir_entry.path
+                    ] = trusted_mtime_ns(dir_entry.stat().st_mtime_ns, listed_at_ns)
+                local_file = local_file_from_path(dir_entry.path, top_dir)
+                if local_file is not None:
+                    indexed_dir.local_files.append(local_file)
+                    if not is_settings_file:
+                        data_files.append(local_file)
+        return indexed_dir, data_files
+
+    def _store_dir(
+        self,
+        dir_path: str,
+        indexed_dir: IndexedDirectory,
+        data_files: list[LocalFile],
+    ) -> None:
+        previously_indexed_dir = self._dirs.get(dir_path)
+        if previously_indexed_dir is not None:
+            self._forget_files(previously_indexed_dir)
+            for removed_sub_dir in set(previously_indexed_dir.sub_dirs) - set(
+                indexed_dir.sub_dirs
+            ):
+                self._remove_dir(removed_sub_dir)
+
+        self._dirs[dir_path] = indexed_dir
+        for local_file in data_files:
+            self._files_by_path[local_file.path] = local_file
+
+    def _forget_files(self, indexed_dir: IndexedDirectory) -> None:
+        for local_file in indexed_dir.local_files:
+            if self._files_by_path.get(local_file.path) is local_file:
+                del self._files_by_path[local_file.path]
+
+    def _remove_dir(self, dir_path: str) -> None:
+        indexed_dir = self._dirs.pop(dir_path, None)
+        if indexed_dir is None:
+            return
+        self._forget_files(indexed_dir)
+        for sub_dir in indexed_dir.sub_dirs:
+            self._remove_dir(sub_dir)
+
+    def _settings_files_changed(self, indexed_dir: IndexedDirectory) -> bool:
+        for settings_file_path, mtime_ns in indexed_dir.settings_file_mtimes_ns.items():
+            if mtime_ns == UNTRUSTED_MTIME_NS:
+                return True
+            try:
+                if os.stat(settings_file_path).st_mtime_ns != mtime_ns:
+                    return True
+            except OSError:
+                return True
+        return False
+
+    def _refresh_dir(
+        self, dir_path: str, top_dir: str, recursive: bool, visited: set[str]
+    ) -> None:
+        """Refresh the index for a directory
+
+        The file system is accessed without holding the lock of the index data, so
+        that requests answered from the index do not wait for slow file systems.
+        Indexed directories are replaced as a whole and never modified.
+        """
+        visited.add(dir_path)
+        try:
+            mtime_ns = os.stat(dir_path).st_mtime_ns
+        except OSError:
+            with self._lock:
+                self._remove_dir(dir_path)
+            return
+
+        with self._lock:
+            indexed_dir = self._dirs.get(dir_path)
+        if (
+            indexed_dir is None
+            or indexed_dir.top_dir != top_dir
+            # never equal for untrusted modification times
+            or indexed_dir.mtime_ns != mtime_ns
+            or self._settings_files_changed(indexed_dir)
+        ):
+            logger.debug("Listing local file directory %s", dir_path)
+            try:
+                indexed_dir, data_files = self._list_dir(dir_path, top_dir, mtime_ns)
+            except OSError as e:
+                logger.warning(
+                    "Could not list local file directory %s: %s", dir_path, e
+                )
+                with self._lock:
+                    self._remove_dir(dir_path)
+                return
+            with self._lock:
+                self._store_dir(dir_path, indexed_dir, data_files)
+
+        if recursive:
+            for sub_dir in indexed_dir.walkable_sub_dirs():
+                self._refresh_dir(sub_dir, top_dir, recursive, visited)
+
+    def refresh(self) -> None:
+        """Refresh the index for all configured directories
+
+        Directories which are not contained in the configured directories anymore
+        are removed from the index.
+        """
+        visited: set[str] = set()
+        with self._refresh_lock:
+            for top_dir in local_file_adapter_config.local_dirs:
+                self._refresh_dir(top_dir, top_dir, recursive=True, visited=visited)
+            with self._lock:
+                for dir_path in set(self._dirs) - visited:
+                    self._remove_dir(dir_path)
+
+    def refresh_dir(self, dir_path: str, top_dir: str) -> None:
+        """Refresh the index for the direct content of one directory"""
+        with self._refresh_lock:
+            self._refresh_dir(dir_path, top_dir, recursive=False, visited=set())
+
+    def local_files_and_dirs(self, dir_path: str) -> tuple[list[LocalFile], list[str]]:
+        """Local files and sub directories directly contained in a directory"""
+        with self._lock:
+            indexed_dir = self._dirs.get(dir_path)
+            if indexed_dir is None:
+                return [], []
+            return list(indexed_dir.local_files), list(indexed_dir.sub_dirs)
+
+    def _walk_local_files(self, dir_path: str) -> Iterator[LocalFile]:
+        indexed_dir = self._dirs.get(dir_path)
+        if indexed_dir is None:
+            return
+        yield from indexed_dir.local_files
+        for sub_dir in indexed_dir.walkable_sub_dirs():
+            yield from self._walk_local_files(sub_dir)
+
+    def all_local_files(self) -> list[LocalFile]:
+        """Local files of all configured directories in top-down walking order"""
+        with self._lock:
+            return [
+                local_file
+                for top_dir in local_file_adapter_config.local_dirs
+                for local_file in self._walk_local_files(top_dir)
+            ]
+
+    def local_file(self, path: str) -> LocalFile | None:
+        """Local file of an existing data file"""
+        with self._lock:
+            return self._files_by_path.get(path)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._dirs.clear()
+            self._files_by_path.clear()
+
+
+class BackgroundIndexRefresh:
+    """Thread refreshing the local file index periodically"""
+
+    def __init__(self, local_file_index: LocalFileIndex, interval: float) -> None:
+        self.local_file_index = local_file_index
+        self.interval = interval
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="hd-local-file-index", daemon=True
+        )
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            try:
+                self.local_file_index.refresh()
+            except Exception:  # noqa: BLE001
+                logger.exception("Refreshing the local file index failed")
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self._thread.join()
+
+
+local_file_index = LocalFileIndex()
+
+background_index_refresh_lock = threading.Lock()
+background_index_refresh: list[BackgroundIndexRefresh] = []
+
+
+def get_local_file_index() -> LocalFileIndex:
+    return local_file_index
+
+
+def refreshed_in_background() -> bool:
+    """Whether the index is refreshed by a background thread
+
+    Starts the background thread on first call if an index refresh interval is
+    configured. The first refresh is awaited, so that the index is complete.
+    """
+    interval = local_file_adapter_config.index_refresh_interval
+    if interval is None:
+        return False
+    with background_index_refresh_lock:
+        if len(background_index_refresh) == 0:
+            get_local_file_index().refresh()
+            index_refresh = BackgroundIndexRefresh(get_local_file_index(), interval)
+            index_refresh.start()
+            background_index_refresh.append(index_refresh)
+    return True
+
+
+def stop_background_index_refresh() -> None:
+    with background_index_refresh_lock:
+        while len(background_index_refresh) > 0:
+            background_index_refresh.pop().stop()
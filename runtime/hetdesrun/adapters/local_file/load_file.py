@@ -4,13 +4,59 @@ from typing import Any
 import pandas as pd
 
 from hetdesrun.adapters.exceptions import AdapterHandlingException
+from hetdesrun.adapters.local_file.detect import LocalFile
+from hetdesrun.adapters.local_file.filters import ReadFilter
+from hetdesrun.adapters.local_file.sidecar_cache import get_sidecar_cache
 from hetdesrun.adapters.local_file.structure import get_local_file_by_id
 from hetdesrun.adapters.local_file.utils import from_url_representation
 
 logger = logging.getLogger(__name__)
 
 
-def load_file_from_id(source_id: str) -> Any:
+def get_read_kwargs(local_file: LocalFile) -> dict[str, Any]:
+    read_kwargs = {}
+    if local_file.parsed_settings_file is not None:
+        if local_file.parsed_settings_file.loadable:
+            if local_file.parsed_settings_file.load_settings is not None:
+                read_kwargs = dict(local_file.parsed_settings_file.load_settings)
+        else:
+            raise AdapterHandlingException(
+                f"Local file {local_file.path} settings file does not allow loading!"
+            )
+    return read_kwargs
+
+
+def get_filterable_columns(source_id: str) -> list[str] | None:
+    """Columns of a local file which can be filtered while reading
+
+    Returns None if the file support handler does not support filtering.
+    """
+    possible_local_file = get_local_file_by_id(source_id)
+    if possible_local_file is None:
+        return None
+
+    file_support_handler = possible_local_file.file_support_handler()
+    if (
+        file_support_handler is None
+        or file_support_handler.filterable_columns_func is None
+    ):
+        return None
+
+    try:
+        filterable_columns: list[str] = file_support_handler.filterable_columns_func(
+            possible_local_file.path, **get_read_kwargs(possible_local_file)
+        )
+    except Exception as e:  # noqa: BLE001
+        msg = (
+            f"Failed to determine filterable columns of local file {possible_local_file.path}"
+            f"\nException was:\n{str(e)}."
+        )
+        logger.info(msg)
+        raise AdapterHandlingException(msg) from e
+    return filterable_columns
+
+
+def load_file_from_id(source_id: str, filters: dict[str, Any] | None = None) -> Any:
     possible_local_file = get_local_file_by_id(source_id)
 
     if possible_local_file is None:
@@ -19,15 +65,7 @@ def load_file_from_id(source_id: str) -> Any:
             "does not lie in a configured local dir or does not exist"
         )
 
-    read_kwargs = {}
-    if possible_local_file.parsed_settings_file is not None:
-        if possible_local_file.parsed_settings_file.loadable:
-            if possible_local_file.parsed_settings_file.load_settings is not None:
-                read_kwargs = possible_local_file.parsed_settings_file.load_settings
-        else:
-            raise AdapterHandlingException(
-                f"Local file {possible_local_file.path} settings file does not allow loading!"
-            )
+    read_kwargs = get_read_kwargs(possible_local_file)
 
     file_support_handler = possible_local_file.file_support_handler()
 
@@ -42,11 +80,24 @@ def load_file_from_id(source_id: str) -> Any:
             "read_handler_func."
         )
 
+    if file_support_handler.filterable_columns_func is not None and filters:
+        # pushed down to the read handler, e.g. to only read the required row groups
+        read_filter = ReadFilter.from_filters(filters)
+        if not read_filter.is_empty():
+            read_kwargs["read_filter"] = read_filter
+
     # Actual loading
     try:
-        loaded_df = file_support_handler.read_handler_func(
-            possible_local_file.path, **read_kwargs
-        )
+        if file_support_handler.sidecar_cacheable:
+            loaded_df = get_sidecar_cache().load(
+                file_support_handler.read_handler_func,
+                possible_local_file.path,
+                read_kwargs,
+            )
+        else:
+            loaded_df = file_support_handler.read_handler_func(
+                possible_local_file.path, **read_kwargs
+            )
     except Exception as e:  # noqa: BLE001
         msg = (
             f"Failed to retrieve local file \n{str(possible_local_file)}\n with "
@@ -0,0 +1,178 @@
+"""Cache of parsed local files as Feather sidecar files
+
+Parsing large CSV or Excel files takes much longer than reading the same data from
+a columnar binary format. If a sidecar cache directory is configured, the DataFrames
+loaded from files whose file support handler allows it are additionally stored as
+uncompressed Feather (Arrow IPC) files in that directory. Later loads of the same
+file read the sidecar file via memory mapping instead of parsing the file again.
+
+Sidecar files are keyed by the resolved path, size and modification time of the
+loaded file and by the load settings, so changed files or settings are never served
+from stale sidecar files. The total size of the cache directory is limited: The
+least recently used sidecar files are removed when the limit is exceeded.
+
+DataFrames which would not be loaded unchanged from a Feather file, e.g. because of
+non string column labels, are not cached.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from collections.abc import Callable
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+from pyarrow import feather
+
+from hetdesrun.adapters.file_cache import (
+    cache_file_path,
+    enforce_size_limit,
+    use_cache_file,
+)
+from hetdesrun.adapters.local_file.config import local_file_adapter_config
+from hetdesrun.atomic_files import write_atomically
+
+logger = logging.getLogger(__name__)
+
+SIDECAR_SUFFIX = ".feather"
+
+
+# object columns whose missing values are NaN instead of None
+NAN_NULL_COLUMNS_METADATA_KEY = b"hd_nan_null_columns"
+
+
+def roundtrip_nan_null_columns(df: pd.DataFrame) -> list[str] | None:
+    """Object columns with NaN as missing value if df survives a Feather roundtrip
+
+    Returns None if the DataFrame would be changed by storing it as Feather file:
+    Non string labels are converted to strings and missing values of object
+    columns are read as None. Columns with missing values all NaN or all None are
+    restored when reading, columns with both representations are not.
+    """
+    if not (
+        df.columns.is_unique
+        and all(isinstance(label, str) for label in df.columns)
+        and all(
+            name is None or isinstance(name, str)
+            for name in (*df.index.names, df.columns.name)
+        )
+    ):
+        return None
+    if df.index.dtype == object and df.index.hasnans:
+        return None
+
+    nan_null_columns = []
+    for column_name, column in df.items():
+        if column.dtype != object:
+            continue
+        missing_values = column[column.isna()]
+        if all(value is None for value in missing_values):
+            continue
+        if all(isinstance(value, float) for value in missing_values):
+            nan_null_columns.append(str(column_name))
+            continue
+        return None
+    return nan_null_columns
+
+
+def sidecar_key(path: str, stat_result: os.stat_result, read_kwargs: dict) -> str:
+    key_data = {
+        "path": os.path.realpath(path),
+        "size": stat_result.st_size,
+        "mtime_ns": stat_result.st_mtime_ns,
+        "read_kwargs": read_kwargs,
+    }
+    return hashlib.sha256(
+        json.dumps(key_data, sort_keys=True, default=str).encode("utf8")
+    ).hexdigest()
+
+
+class SidecarCache:
+    def _read_sidecar(self, sidecar_path: str) -> pd.DataFrame | None:
+        try:
+            table = feather.read_table(sidecar_path, memory_map=True)
+            df = table.to_pandas()
+        except (OSError, pa.ArrowException) as e:
+            logger.warning("Could not read sidecar file %s: %s", sidecar_path, e)
+            return None
+        for column_name in json.loads(
+            (table.schema.metadata or {}).get(NAN_NULL_COLUMNS_METADATA_KEY, b"[]")
+        ):
+            df[column_name] = df[column_name].where(df[column_name].notna(), np.nan)
+        return df
+
+    def _write_sidecar(self, df: pd.DataFrame, sidecar_path: str) -> None:
+        nan_null_columns = roundtrip_nan_null_columns(df)
+        if nan_null_columns is None:
+            logger.debug("DataFrame would be changed by storing it as sidecar file")
+            return
+        try:
+            table = pa.Table.from_pandas(df)
+        except (pa.ArrowException, ValueError, TypeError) as e:
+            logger.debug("Cannot store DataFrame as sidecar file: %s", e)
+            return
+        table = table.replace_schema_metadata(
+            {
+                **(table.schema.metadata or {}),
+                NAN_NULL_COLUMNS_METADATA_KEY: json.dumps(nan_null_columns),
+            }
+        )
+
+        write_atomically(
+            sidecar_path,
+            # uncompressed, so that the sidecar file can be memory mapped
+            lambda tmp_path: feather.write_feather(
+                table, tmp_path, compression="uncompressed"
+            ),
+        )
+
+    def load(
+        self,
+        read_func: Callable[..., Any],
+        path: str,
+        read_kwargs: dict[str, Any],
+    ) -> Any:
+        """Load a file via its sidecar file or load it with read_func and cache it
+
+        Loads without cache if no sidecar cache directory is configured.
+        """
+        cache_dir = local_file_adapter_config.sidecar_cache_dir
+        if cache_dir is None:
+            return read_func(path, **read_kwargs)
+
+        stat_result = os.stat(path)
+        sidecar_path = cache_file_path(
+            cache_dir, sidecar_key(path, stat_result, read_kwargs), SIDECAR_SUFFIX
+        )
+
+        if use_cache_file(sidecar_path):
+            cached_df = self._read_sidecar(sidecar_path)
+            if cached_df is not None:
+                logger.debug("Loaded local file %s from sidecar file", path)
+                return cached_df
+
+        loaded_obj = read_func(path, **read_kwargs)
+
+        max_size = local_file_adapter_config.sidecar_cache_max_size
+        if (
+            isinstance(loaded_obj, pd.DataFrame)
+            # files changed while loading are not cached
+            and os.stat(path).st_mtime_ns == stat_result.st_mtime_ns
+        ):
+            try:
+                self._write_sidecar(loaded_obj, sidecar_path)
+            except OSError as e:
+                logger.warning("Could not write sidecar file for %s: %s", path, e)
+            else:
+                enforce_size_limit(cache_dir, SIDECAR_SUFFIX, max_size)
+        return loaded_obj
+
+
+sidecar_cache = SidecarCache()
+
+
+def get_sidecar_cache() -> SidecarCache:
+    return sidecar_cache
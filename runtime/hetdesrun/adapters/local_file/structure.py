@@ -7,10 +7,14 @@ from hetdesrun.adapters.generic_rest.external_types import ExternalType
 from hetdesrun.adapters.local_file.config import local_file_adapter_config
 from hetdesrun.adapters.local_file.detect import (
     LocalFile,
-    get_local_files_and_dirs,
     local_file_from_path,
 )
 from hetdesrun.adapters.local_file.extensions import handlers_by_extension
+from hetdesrun.adapters.local_file.filters import READ_FILTERS
+from hetdesrun.adapters.local_file.index import (
+    get_local_file_index,
+    refreshed_in_background,
+)
 from hetdesrun.adapters.local_file.models import (
     FilterType,
     LocalFileStructureSink,
@@ -42,7 +46,9 @@ def source_from_local_file(local_file: LocalFile) -> LocalFileStructureSource:
         if external_type is ExternalType.METADATA_ANY
         else None,
         path=local_file.path,
-        filters={},
+        filters=dict(READ_FILTERS)
+        if file_support_handler.filterable_columns_func is not None
+        else {},
     )
 
 
@@ -196,7 +202,12 @@ def get_structure(parent_id: str | None = None) -> StructureResponse:
             f"root directories {str(local_root_dirs)}"
         )
 
-    local_files, dirs = get_local_files_and_dirs(current_dir, walk_sub_dirs=False)
+    local_file_index = get_local_file_index()
+    if not refreshed_in_background():
+        top_dir = get_valid_top_dir(current_dir)
+        if top_dir is not None:
+            local_file_index.refresh_dir(current_dir, top_dir)
+    local_files, dirs = local_file_index.local_files_and_dirs(current_dir)
 
     return StructureResponse(
         id="local-file-adapter",
@@ -238,28 +249,16 @@ def get_filtered_local_files(
     filter_str: str | None,
     selection_criterion_func: Callable[[LocalFile], bool] = local_file_loadable,
 ) -> list[LocalFile]:
-    local_root_dirs = local_file_adapter_config.local_dirs
-
-    gathered_local_files = []
-
-    for local_root_dir in local_root_dirs:
-        local_files, _ = get_local_files_and_dirs(local_root_dir, walk_sub_dirs=True)
-        gathered_local_files.extend(
-            [
-                local_file
-                for local_file in local_files
-                if selection_criterion_func(local_file)
-            ]
-        )
-
-    if filter_str is not None:
-        gathered_local_files = [
-            local_file
-            for local_file in gathered_local_files
-            if filter_str in local_file.path
-        ]
+    local_file_index = get_local_file_index()
+    if not refreshed_in_background():
+        local_file_index.refresh()
 
-    return gathered_local_files
+    return [
+        local_file
+        for local_file in local_file_index.all_local_files()
+        if (filter_str is None or filter_str in local_file.path)
+        and selection_criterion_func(local_file)
+    ]
 
 
 def get_sources(filter_str: str | None) -> list[LocalFileStructureSource]:
@@ -309,7 +308,18 @@ def get_local_file_by_id(
     if top_dir is None:
         return None
 
-    local_file = local_file_from_path(local_file_path, top_dir=top_dir)
+    local_file_index = get_local_file_index()
+    if not refreshed_in_background():
+        local_file_index.refresh_dir(os.path.dirname(local_file_path), top_dir)
+    indexed_local_file = local_file_index.local_file(local_file_path)
+
+    # files which do not exist (yet) or were created after the last refresh
+    local_file = (
+        local_file_from_path(local_file_path, top_dir=top_dir)
+        if indexed_local_file is None
+        # a copy, since callers may adapt the settings
+        else indexed_local_file.copy(deep=True)
+    )
 
     if local_file is None:
         return None
@@ -10,7 +10,9 @@ Actual data ingestion/egestion happens in the corresponding Runtime-Python-Plugi
 
 from fastapi import HTTPException, Query
 
+from hetdesrun.adapters.exceptions import AdapterHandlingException
 from hetdesrun.adapters.local_file import VERSION
+from hetdesrun.adapters.local_file.load_file import get_filterable_columns
 from hetdesrun.adapters.local_file.models import (
     InfoResponse,
     LocalFileStructureSink,
@@ -94,14 +96,25 @@ async def get_sinks_endpoint(
     dependencies=get_auth_deps(),
 )
 async def get_sources_metadata(
-    sourceId: str,  # noqa: ARG001
+    sourceId: str,
 ) -> list:
     """Get metadata attached to sources
 
-    This adapter does not implement metadata. Therefore this will always result
-    in an empty list!
+    For sources of files which can be filtered while reading (e.g. Parquet files)
+    the filterable columns are provided as metadatum "filterable_columns". Otherwise,
+    also if the filterable columns cannot be determined from the file, this results
+    in an empty list.
     """
-    return []
+    try:
+        filterable_columns = get_filterable_columns(sourceId)
+    except AdapterHandlingException:
+        # already logged, e.g. for HDF5 files with multiple keys but no key setting
+        return []
+    if filterable_columns is None:
+        return []
+    return [
+        {"key": "filterable_columns", "value": filterable_columns, "dataType": "any"}
+    ]
 
 
 @local_file_adapter_router.get(
@@ -2,27 +2,47 @@
 
 This adapter is used when data is provided directly during workflow
 execution, i.e. when it is provided as part of the execution request.
+
+Data is either provided as json in the "value" filter or uploaded as a part
+of a multipart execution request and referenced via the "upload" filter (see
+the uploads module).
 """
 
 from typing import Any
 
 from hetdesrun.adapters.exceptions import AdapterClientWiringInvalidError
+from hetdesrun.adapters.source.uploads import load_uploaded_input
 from hetdesrun.models.data_selection import FilteredSource
 
 
-def load_directly_provisioned_data(
-    wf_input_name_to_filtered_source_mapping_dict: dict[str, FilteredSource],
-    adapter_key: str,  # noqa: ARG001
-) -> dict[str, Any]:
+def load_single_directly_provisioned_value(
+    direct_provisioning_filtered_source: FilteredSource,
+) -> Any:
+    filters = direct_provisioning_filtered_source.filters
+    if "upload" in filters:
+        return load_uploaded_input(
+            filters["upload"],
+            filters.get("format", None),
+            direct_provisioning_filtered_source.type,
+        )
     try:
-        return {
-            wf_inp_name: direct_provisioning_filtered_source.filters["value"]
-            for (
-                wf_inp_name,
-                direct_provisioning_filtered_source,
-            ) in wf_input_name_to_filtered_source_mapping_dict.items()
-        }
+        return filters["value"]
     except KeyError as e:
         raise AdapterClientWiringInvalidError(
             "Direct Input Provisioning without 'value' field in filters"
         ) from e
+
+
+def load_directly_provisioned_data(
+    wf_input_name_to_filtered_source_mapping_dict: dict[str, FilteredSource],
+    adapter_key: str,  # noqa: ARG001
+) -> dict[str, Any]:
+    return {
+        wf_inp_name: load_single_directly_provisioned_value(
+            direct_provisioning_filtered_source
+        )
+        for (
+            wf_inp_name,
+            direct_provisioning_filtered_source,
+        ) in wf_input_name_to_filtered_source_mapping_dict.items()
+    }
@@ -0,0 +1,192 @@
+"""Uploaded input data for direct provisioning
+
+Instead of embedding whole datasets as json strings in the "value" filter of
+a direct provisioning input wiring, clients may upload them as parts of a
+multipart execution request in a binary or tabular format. The wiring then
+references the part by name via the "upload" filter:
+
+    {
+        "workflow_input_name": "x",
+        "adapter_id": "direct_provisioning",
+        "filters": {"upload": "x_data", "format": "parquet"}
+    }
+
+The parts are spooled to temporary files by the webservice and bound to the
+current execution context, from where the direct provisioning source adapter
+reads them.
+"""
+
+import logging
+from contextvars import ContextVar
+from enum import StrEnum
+from typing import IO, Any
+
+import pandas as pd
+import pyarrow as pa
+from pydantic import BaseModel
+
+from hetdesrun.adapters.exceptions import AdapterClientWiringInvalidError
+from hetdesrun.adapters.generic_rest.external_types import ExternalType, GeneralType
+
+logger = logging.getLogger(__name__)
+
+
+class UploadFormat(StrEnum):
+    PARQUET = "parquet"
+    ARROW = "arrow"
+    CSV = "csv"
+
+
+UPLOAD_FORMAT_BY_CONTENT_TYPE: dict[str, UploadFormat] = {
+    "application/vnd.apache.parquet": UploadFormat.PARQUET,
+    "application/x-parquet": UploadFormat.PARQUET,
+    "application/vnd.apache.arrow.stream": UploadFormat.ARROW,
+    "application/vnd.apache.arrow.file": UploadFormat.ARROW,
+    "text/csv": UploadFormat.CSV,
+}
+
+UPLOAD_FORMAT_BY_FILE_EXTENSION: dict[str, UploadFormat] = {
+    ".parquet": UploadFormat.PARQUET,
+    ".arrow": UploadFormat.ARROW,
+    ".arrows": UploadFormat.ARROW,
+    ".feather": UploadFormat.ARROW,
+    ".ipc": UploadFormat.ARROW,
+    ".csv": UploadFormat.CSV,
+}
+
+
+class UploadedInput(BaseModel):
+    """An uploaded multipart part spooled to a (temporary) file"""
+
+    name: str
+    file: Any  # binary file-like object, e.g. a SpooledTemporaryFile
+    filename: str | None = None
+    content_type: str | None = None
+
+    def detect_format(self) -> UploadFormat | None:
+        if self.content_type is not None:
+            media_type = self.content_type.split(";", 1)[0].strip().lower()
+            if media_type in UPLOAD_FORMAT_BY_CONTENT_TYPE:
+                return UPLOAD_FORMAT_BY_CONTENT_TYPE[media_type]
+        if self.filename is not None:
+            for extension, upload_format in UPLOAD_FORMAT_BY_FILE_EXTENSION.items():
+                if self.filename.lower().endswith(extension):
+                    return upload_format
+        return None
+
+
+uploaded_inputs: ContextVar[dict[str, UploadedInput]] = ContextVar("uploaded_inputs")
+
+
+def get_uploaded_inputs() -> dict[str, UploadedInput]:
+    try:
+        return uploaded_inputs.get()
+    except LookupError:
+        return {}
+
+
+def bind_uploaded_inputs(uploaded_input_by_name: dict[str, UploadedInput]) -> None:
+    # Always set a new dict, so that concurrently handled requests never share
+    # their uploaded inputs via a dict bound in a parent context.
+    uploaded_inputs.set(get_uploaded_inputs() | uploaded_input_by_name)
+
+
+def clear_uploaded_inputs_context() -> None:
+    uploaded_inputs.set({})
+
+
+def read_arrow_ipc(file: IO[bytes]) -> pd.DataFrame:
+    """Read Arrow IPC data in streaming or file (Feather v2) format"""
+    try:
+        return pa.ipc.open_stream(file).read_pandas()
+    except pa.ArrowInvalid:
+        file.seek(0)
+        return pa.ipc.open_file(file).read_pandas()
+
+
+def read_csv_upload(file: IO[bytes]) -> pd.DataFrame:
+    df = pd.read_csv(file)
+    if "timestamp" in df.columns:
+        df["timestamp"] = pd.to_datetime(df["timestamp"], utc=True)
+    return df
+
+
+def read_uploaded_frame(
+    uploaded_input: UploadedInput, upload_format: UploadFormat
+) -> pd.DataFrame:
+    uploaded_input.file.seek(0)
+    try:
+        if upload_format is UploadFormat.PARQUET:
+            return pd.read_parquet(uploaded_input.file)
+        if upload_format is UploadFormat.ARROW:
+            return read_arrow_ipc(uploaded_input.file)
+        return read_csv_upload(uploaded_input.file)
+    except (pa.ArrowException, ValueError, OSError) as e:
+        msg = (
+            f"Could not read uploaded input {uploaded_input.name} "
+            f"as {upload_format.value}:\n{str(e)}"
+        )
+        logger.info(msg)
+        raise AdapterClientWiringInvalidError(msg) from e
+
+
+def frame_to_series(df: pd.DataFrame, upload_name: str) -> pd.Series:
+    """Obtain a Series from an uploaded frame
+
+    Uploaded timeseries are expected in the layout of the generic rest adapter,
+    i.e. with a "timestamp" and a "value" column. Frames with exactly one column
+    are interpreted as Series directly.
+    """
+    if {"timestamp", "value"}.issubset(set(df.columns)):
+        series = df.set_index("timestamp")["value"]
+        series.index = pd.to_datetime(series.index, utc=True)
+        series.index.name = None
+        return series
+    if len(df.columns) == 1:
+        return df.iloc[:, 0]
+    raise AdapterClientWiringInvalidError(
+        f"Uploaded input {upload_name} can not be interpreted as series: It must either"
+        f" have exactly one column or the columns 'timestamp' and 'value'."
+        f" Got columns {list(df.columns)}."
+    )
+
+
+def load_uploaded_input(
+    upload_name: str, upload_format_str: str | None, type_str: str | None
+) -> pd.DataFrame | pd.Series:
+    """Load uploaded input data bound to the current context
+
+    The type of the input wiring determines whether a Series or a DataFrame is
+    returned.
+    """
+    try:
+        uploaded_input = get_uploaded_inputs()[upload_name]
+    except KeyError as e:
+        raise AdapterClientWiringInvalidError(
+            f"Wiring references uploaded input {upload_name} which was not uploaded."
+        ) from e
+
+    if upload_format_str is None or upload_format_str == "":
+        upload_format = uploaded_input.detect_format()
+        if upload_format is None:
+            raise AdapterClientWiringInvalidError(
+                f"Could not detect format of uploaded input {upload_name}. Please provide"
+                f" one of {[fmt.value for fmt in UploadFormat]} via the 'format' filter."
+            )
+    else:
+        try:
+            upload_format = UploadFormat(upload_format_str)
+        except ValueError as e:
+            raise AdapterClientWiringInvalidError(
+                f"Unknown format {upload_format_str} for uploaded input {upload_name}."
+                f" Must be one of {[fmt.value for fmt in UploadFormat]}."
+            ) from e
+
+    df = read_uploaded_frame(uploaded_input, upload_format)
+
+    if type_str is not None and ExternalType(type_str).general_type in (
+        GeneralType.TIMESERIES,
+        GeneralType.SERIES,
+    ):
+        return frame_to_series(df, upload_name)
+    return df
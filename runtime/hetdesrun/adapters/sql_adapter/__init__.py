@@ -1,5 +1,6 @@
 from typing import Any
 
+from hetdesrun.adapters.execution import run_blocking_adapter_func
 from hetdesrun.adapters.sql_adapter.load_table import load_table_from_provided_source_id
 from hetdesrun.adapters.sql_adapter.write_table import write_table_to_provided_sink_id
 from hetdesrun.models.data_selection import FilteredSink, FilteredSource
@@ -13,10 +14,13 @@ except FileNotFoundError:
 
 async def load_data(
     wf_input_name_to_filtered_source_mapping_dict: dict[str, FilteredSource],
-    adapter_key: str,  # noqa: ARG001
+    adapter_key: str,
 ) -> dict[str, Any]:
+    # database reads are blocking and must not block the event loop
     return {
-        wf_input_name: load_table_from_provided_source_id(
+        wf_input_name: await run_blocking_adapter_func(
+            adapter_key,
+            load_table_from_provided_source_id,
             str(
                 filtered_source.ref_key
                 if filtered_source.ref_key is not None
@@ -31,7 +35,7 @@ async def load_data(
 async def send_data(
     wf_output_name_to_filtered_sink_mapping_dict: dict[str, FilteredSink],
     wf_output_name_to_value_mapping_dict: dict[str, Any],
-    adapter_key: str,  # noqa: ARG001
+    adapter_key: str,
 ) -> dict[str, Any]:
     for (
         wf_output_name,
@@ -49,5 +53,7 @@ async def send_data(
             else filtered_sink.ref_id
         )
 
-        write_table_to_provided_sink_id(data, str(id_to_use))
+        await run_blocking_adapter_func(
+            adapter_key, write_table_to_provided_sink_id, data, str(id_to_use)
+        )
     return {}
@@ -1,14 +1,34 @@
 import os
+from datetime import timedelta
 from functools import cached_property
 from typing import Any
 
 from pydantic import BaseModel, BaseSettings, Field, validator
-from sqlalchemy import create_engine
-from sqlalchemy.engine import Engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Connection, Engine
 
 from hetdesrun.models.util import valid_python_identifier
 
 
+def enable_sqlite_transactional_ddl(engine: Engine) -> None:
+    """Let sqlalchemy instead of the pysqlite driver begin transactions
+
+    The pysqlite driver does not begin transactions before DDL statements like
+    DROP TABLE, so that replacing a table could not be rolled back. See the
+    sqlalchemy documentation on pysqlite transactions.
+    """
+
+    @event.listens_for(engine, "connect")
+    def disable_driver_transaction_handling(
+        dbapi_connection: Any, connection_record: Any  # noqa: ARG001
+    ) -> None:
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def begin_transaction(connection: Connection) -> None:
+        connection.exec_driver_sql("BEGIN")
+
+
 class TimeseriesTableConfig(BaseModel):
     appendable: bool = Field(
         True,
@@ -37,6 +57,15 @@ class TimeseriesTableConfig(BaseModel):
         ),
     )
 
+    max_rows: int | None = Field(
+        None,
+        description=(
+            "Maximum number of rows loaded from this table at once."
+            " Overrides max_rows of the database config."
+        ),
+        gt=0,
+    )
+
     @validator("column_mapping_hd_to_db")
     def column_mapping_invertible(cls, v: dict[str, str]) -> dict[str, str]:
         if len(v.values()) != len(set(v.values())):
@@ -107,9 +136,31 @@ class SQLAdapterDBConfig(BaseModel):
         ),
     )
 
+    chunk_size: int = Field(
+        10_000,
+        description=(
+            "Number of rows fetched from the database at once when loading data."
+            " Server side cursors are used if the database dialect supports them,"
+            " so that only one chunk of raw rows is held in memory at a time."
+        ),
+        gt=0,
+    )
+
+    max_rows: int | None = Field(
+        None,
+        description=(
+            "Maximum number of rows loaded from one source. Loading a source fails"
+            " once more rows are fetched. If None, the number of rows is not limited."
+        ),
+        gt=0,
+    )
+
     @cached_property
     def engine(self) -> Engine:
-        return create_engine(self.connection_url, **self.create_engine_kwargs)  # type: ignore
+        engine = create_engine(self.connection_url, **self.create_engine_kwargs)  # type: ignore
+        if engine.dialect.name == "sqlite" and engine.dialect.driver == "pysqlite":
+            enable_sqlite_transactional_ddl(engine)
+        return engine
 
     class Config:
         arbitrary_types_allowed = True
@@ -136,6 +187,16 @@ class SQLAdapterConfig(BaseSettings):
 
     sql_databases: list[SQLAdapterDBConfig] = Field([], env="SQL_ADAPTER_SQL_DATABASES")
 
+    structure_cache_ttl: timedelta | None = Field(
+        timedelta(seconds=60),
+        description=(
+            "How long the introspected tables of each database are cached for"
+            " answering structure and source requests. Set to null to introspect"
+            " the database on every request. Can be provided in seconds."
+        ),
+        env="SQL_ADAPTER_STRUCTURE_CACHE_TTL",
+    )
+
     @validator("sql_databases")
     def unique_db_keys(cls, v: list[SQLAdapterDBConfig]) -> list[SQLAdapterDBConfig]:
         if len({configured_db.key for configured_db in v}) != len(v):
@@ -1,11 +1,25 @@
 import datetime
 import logging
+from collections.abc import Iterable
+from enum import Enum
 
 import pandas as pd
 from pydantic import BaseModel, ValidationError
+from sqlalchemy.engine import Connection
 from sqlalchemy.exc import OperationalError as SQLOpsError
-from sqlalchemy.sql import and_, column, select, table
-from sqlalchemy.sql.selectable import Select
+from sqlalchemy.sql import (
+    and_,
+    cast,
+    column,
+    extract,
+    func,
+    literal_column,
+    select,
+    table,
+)
+from sqlalchemy.sql.elements import ColumnElement
+from sqlalchemy.sql.selectable import Select, TableClause
+from sqlalchemy.types import BigInteger
 
 from hetdesrun.adapters.exceptions import AdapterHandlingException
 from hetdesrun.adapters.sql_adapter.config import (
@@ -61,22 +75,89 @@ def extract_time_range(
     return from_datetime, to_datetime
 
 
-def prepare_sql_statement(
-    ts_table_name: str,
-    ts_table_config: TimeseriesTableConfig,
-    from_datetime: datetime.datetime,
-    to_datetime: datetime.datetime,
-    metrics_list: list[str] | None,
-) -> Select:
-    """Prepare the statement for fetching metrics
+class Aggregation(str, Enum):
+    MIN = "min"
+    MAX = "max"
+    MEAN = "mean"
+    FIRST = "first"
+    LAST = "last"
 
-    If metrics_list is None all metrics will be fetched.
+
+def extract_aggregation(
+    source_filters: dict[str, str]
+) -> tuple[Aggregation, int] | None:
+    """Parse the aggregation and bucket filters of timeseries table sources
+
+    Returns the aggregation and the bucket width in seconds or None if no
+    aggregation is requested. The aggregation defaults to mean if only a bucket
+    width is provided.
     """
+    aggregation_str = source_filters.get("aggregation", "").strip().lower()
+    bucket_str = source_filters.get("bucket", "").strip()
 
+    if bucket_str == "":
+        if aggregation_str != "":
+            msg = f"Aggregation {aggregation_str} requested without bucket filter."
+            logger.info(msg)
+            raise AdapterHandlingException(msg)
+        return None
+
+    try:
+        aggregation = Aggregation(aggregation_str if aggregation_str != "" else "mean")
+    except ValueError as e:
+        msg = (
+            f"Unknown aggregation {aggregation_str}. Must be one of"
+            f" {', '.join(aggregation.value for aggregation in Aggregation)}."
+        )
+        logger.info(msg)
+        raise AdapterHandlingException(msg) from e
+
+    try:
+        bucket = pd.to_timedelta(bucket_str)
+    except ValueError as e:
+        msg = (
+            f"Could not parse bucket filter {bucket_str}."
+            " Provide a duration like 15min, 1h or PT1H."
+        )
+        logger.info(msg)
+        raise AdapterHandlingException(msg) from e
+
+    if bucket < pd.Timedelta(seconds=1) or bucket % pd.Timedelta(
+        seconds=1
+    ) != pd.Timedelta(0):
+        msg = f"Bucket filter {bucket_str} must be a positive number of whole seconds."
+        logger.info(msg)
+        raise AdapterHandlingException(msg)
+
+    return aggregation, int(bucket.total_seconds())
+
+
+def epoch_seconds(dialect_name: str, timestamp_col: ColumnElement) -> ColumnElement:
+    """Expression for the seconds since the unix epoch of a timestamp column"""
+    if dialect_name == "postgresql":
+        return cast(func.floor(extract("epoch", timestamp_col)), BigInteger)
+    if dialect_name == "sqlite":
+        # timestamps are stored as text, strftime handles timezone suffixes
+        return cast(func.strftime("%s", timestamp_col), BigInteger)
+    if dialect_name in ("mysql", "mariadb"):
+        return cast(func.unix_timestamp(timestamp_col), BigInteger)
+    if dialect_name == "mssql":
+        return func.datediff_big(literal_column("second"), "1970-01-01", timestamp_col)
+
+    msg = (
+        f"Aggregating timeseries is not supported for database dialect {dialect_name}."
+    )
+    logger.info(msg)
+    raise AdapterHandlingException(msg)
+
+
+def ad_hoc_ts_table(
+    ts_table_name: str, ts_table_config: TimeseriesTableConfig
+) -> TableClause:
     # ad hoc table object without data type specifications since
     # corresponding to the fact that we want to employ pandas read_sql automatic
     # flexible dtype inference.
-    ts_table = table(
+    return table(
         ts_table_name,
         column(
             ts_table_config.timestamp_col_name,
@@ -88,7 +169,15 @@ def prepare_sql_statement(
         ),
     )
 
-    clauses = (
+
+def ts_table_clauses(
+    ts_table: TableClause,
+    ts_table_config: TimeseriesTableConfig,
+    from_datetime: datetime.datetime,
+    to_datetime: datetime.datetime,
+    metrics_list: list[str] | None,
+) -> tuple[ColumnElement, ...]:
+    return (
         ts_table.c[ts_table_config.timestamp_col_name] >= from_datetime,
         ts_table.c[ts_table_config.timestamp_col_name] <= to_datetime,
     ) + (
@@ -97,12 +186,117 @@ def prepare_sql_statement(
         else (ts_table.c[ts_table_config.metric_col_name].in_(metrics_list),)
     )
 
+
+def prepare_sql_statement(
+    ts_table_name: str,
+    ts_table_config: TimeseriesTableConfig,
+    from_datetime: datetime.datetime,
+    to_datetime: datetime.datetime,
+    metrics_list: list[str] | None,
+) -> Select:
+    """Prepare the statement for fetching metrics
+
+    If metrics_list is None all metrics will be fetched.
+    """
+
+    ts_table = ad_hoc_ts_table(ts_table_name, ts_table_config)
+
+    clauses = ts_table_clauses(
+        ts_table, ts_table_config, from_datetime, to_datetime, metrics_list
+    )
+
     # ad hoc sqlalchemy expression construction
     statement = select(ts_table).where(and_(*clauses))
 
     return statement
 
 
+def prepare_aggregating_sql_statement(  # noqa: PLR0913
+    ts_table_name: str,
+    ts_table_config: TimeseriesTableConfig,
+    from_datetime: datetime.datetime,
+    to_datetime: datetime.datetime,
+    metrics_list: list[str] | None,
+    aggregation: Aggregation,
+    bucket_seconds: int,
+    dialect_name: str,
+) -> Select:
+    """Prepare the statement for fetching metrics aggregated in time buckets
+
+    The timestamp column of the result contains the start of each bucket as seconds
+    since the unix epoch. Buckets are aligned to the unix epoch.
+    """
+    ts_table = ad_hoc_ts_table(ts_table_name, ts_table_config)
+    timestamp_col = ts_table.c[ts_table_config.timestamp_col_name]
+    metric_col = ts_table.c[ts_table_config.metric_col_name]
+
+    clauses = ts_table_clauses(
+        ts_table, ts_table_config, from_datetime, to_datetime, metrics_list
+    )
+
+    epoch = epoch_seconds(dialect_name, timestamp_col)
+    bucket = epoch - epoch % bucket_seconds
+
+    if aggregation in (Aggregation.FIRST, Aggregation.LAST):
+        # value of the first / last row of each bucket via a window function
+        row_number = func.row_number().over(
+            partition_by=(metric_col, bucket),
+            order_by=(
+                timestamp_col
+                if aggregation is Aggregation.FIRST
+                else timestamp_col.desc()
+            ),
+        )
+        numbered_rows = (
+            select(
+                bucket.label(ts_table_config.timestamp_col_name),
+                metric_col,
+                *(
+                    ts_table.c[val_col_name]
+                    for val_col_name in ts_table_config.fetchable_value_cols
+                ),
+                row_number.label("row_number_in_bucket"),
+            )
+            .where(and_(*clauses))
+            .subquery()
+        )
+        return (
+            select(
+                numbered_rows.c[ts_table_config.timestamp_col_name],
+                numbered_rows.c[ts_table_config.metric_col_name],
+                *(
+                    numbered_rows.c[val_col_name]
+                    for val_col_name in ts_table_config.fetchable_value_cols
+                ),
+            )
+            .where(numbered_rows.c.row_number_in_bucket == 1)
+            .order_by(
+                numbered_rows.c[ts_table_config.timestamp_col_name],
+                numbered_rows.c[ts_table_config.metric_col_name],
+            )
+        )
+
+    aggregate_func = {
+        Aggregation.MIN: func.min,
+        Aggregation.MAX: func.max,
+        Aggregation.MEAN: func.avg,
+    }[aggregation]
+
+    return (
+        select(
+            bucket.label(ts_table_config.timestamp_col_name),
+            metric_col,
+            *(
+                aggregate_func(ts_table.c[val_col_name]).label(val_col_name)
+                for val_col_name in ts_table_config.fetchable_value_cols
+            ),
+        )
+        .where(and_(*clauses))
+        .group_by(bucket, metric_col)
+        .order_by(bucket, metric_col)
+    )
+
+
 def prepare_validate_loaded_raw_multitsframe(
     multits_frame: pd.DataFrame,
     ts_table_config: TimeseriesTableConfig,
@@ -199,11 +393,32 @@ def load_table_from_provided_source_id(
 
         ts_table_config = db_config.timeseries_tables[ts_table_name]
 
-        statement = prepare_sql_statement(
-            ts_table_name, ts_table_config, from_datetime, to_datetime, metrics_list
+        aggregation = extract_aggregation(source_filters)
+
+        if aggregation is None:
+            statement = prepare_sql_statement(
+                ts_table_name, ts_table_config, from_datetime, to_datetime, metrics_list
+            )
+        else:
+            statement = prepare_aggregating_sql_statement(
+                ts_table_name,
+                ts_table_config,
+                from_datetime,
+                to_datetime,
+                metrics_list,
+                *aggregation,
+                dialect_name=db_config.engine.dialect.name,
+            )
+
+        multits_frame = load_sql_query(
+            db_config, statement, max_rows=ts_table_config.max_rows
         )
 
-        multits_frame = load_sql_query(db_config, statement)
+        if aggregation is not None:
+            # bucket starts are loaded as seconds since the unix epoch
+            multits_frame[ts_table_config.timestamp_col_name] = pd.to_datetime(
+                multits_frame[ts_table_config.timestamp_col_name], unit="s", utc=True
+            )
 
         validated_multi_ts_frame = prepare_validate_loaded_raw_multitsframe(
             multits_frame,
@@ -214,6 +429,10 @@ def load_table_from_provided_source_id(
             to_datetime,
         )
 
+        if aggregation is not None:
+            validated_multi_ts_frame.attrs["ref_aggregation"] = aggregation[0].value
+            validated_multi_ts_frame.attrs["ref_bucket_seconds"] = aggregation[1]
+
         return validated_multi_ts_frame
 
     msg = (
@@ -224,11 +443,54 @@ def load_table_from_provided_source_id(
     raise AdapterHandlingException(msg)
 
 
-def load_sql_table(db_config: SQLAdapterDBConfig, table_name: str) -> pd.DataFrame:
+def concat_chunks(
+    chunks: Iterable[pd.DataFrame], max_rows: int | None, source_description: str
+) -> pd.DataFrame:
+    """Concatenate dataframe chunks, failing once more than max_rows are loaded"""
+    loaded_chunks: list[pd.DataFrame] = []
+    n_loaded_rows = 0
+    for chunk in chunks:
+        n_loaded_rows += len(chunk)
+        if max_rows is not None and n_loaded_rows > max_rows:
+            msg = (
+                f"Sql adapter loading {source_description} exceeded the maximum"
+                f" number of {max_rows} rows."
+            )
+            logger.info(msg)
+            raise AdapterHandlingException(msg)
+        loaded_chunks.append(chunk)
+
+    if len(loaded_chunks) == 1:
+        return loaded_chunks[0]
+    # chunks may have been inferred with different dtypes, e.g. object for a chunk
+    # only containing None values
+    return pd.concat(loaded_chunks, ignore_index=True).infer_objects()
+
+
+def streaming_connection(
+    db_config: SQLAdapterDBConfig, connection: Connection
+) -> Connection:
+    """Use server side cursors where the dialect supports them"""
+    return connection.execution_options(
+        stream_results=True, max_row_buffer=db_config.chunk_size
+    )
+
+
+def load_sql_table(
+    db_config: SQLAdapterDBConfig, table_name: str, max_rows: int | None = None
+) -> pd.DataFrame:
     engine = db_config.engine
     try:
-        with engine.begin():
-            result = pd.read_sql_table(table_name, engine)
+        with engine.connect() as connection:
+            result = concat_chunks(
+                pd.read_sql_table(
+                    table_name,
+                    streaming_connection(db_config, connection),
+                    chunksize=db_config.chunk_size,
+                ),
+                max_rows if max_rows is not None else db_config.max_rows,
+                f"table {table_name}",
+            )
     except SQLOpsError as e:
         msg = f"Sql adapter pandas sql reading error: {str(e)}"
         logger.info(msg)
@@ -236,11 +498,21 @@ def load_sql_table(db_config: SQLAdapterDBConfig, table_name: str) -> pd.DataFra
     return result
 
 
-def load_sql_query(db_config: SQLAdapterDBConfig, query: Select) -> pd.DataFrame:
+def load_sql_query(
+    db_config: SQLAdapterDBConfig, query: Select | str, max_rows: int | None = None
+) -> pd.DataFrame:
     engine = db_config.engine
     try:
-        with engine.begin():
-            result = pd.read_sql_query(query, engine)
+        with engine.connect() as connection:
+            result = concat_chunks(
+                pd.read_sql_query(
+                    query,
+                    streaming_connection(db_config, connection),
+                    chunksize=db_config.chunk_size,
+                ),
+                max_rows if max_rows is not None else db_config.max_rows,
+                "query result",
+            )
     except SQLOpsError as e:
         msg = f"Sql adapter pandas sql query error: {str(e)}"
         logger.info(msg)
@@ -2,12 +2,13 @@ import logging
 from collections.abc import Iterable
 
 from pydantic import ValidationError
-from sqlalchemy import create_engine, inspect
+from sqlalchemy import inspect
 
 from hetdesrun.adapters.exceptions import AdapterHandlingException
 from hetdesrun.adapters.generic_rest.external_types import ExternalType
 from hetdesrun.adapters.sql_adapter.config import (
     SQLAdapterDBConfig,
+    get_sql_adapter_config,
 )
 from hetdesrun.adapters.sql_adapter.models import (
     SQLAdapterStructureSink,
@@ -18,14 +19,36 @@ from hetdesrun.adapters.sql_adapter.models import (
     WriteTableMode,
     to_table_type_str,
 )
+from hetdesrun.adapters.sql_adapter.structure_cache import (
+    IndexedSource,
+    get_structure_cache,
+    structure_cache_key,
+)
 from hetdesrun.adapters.sql_adapter.utils import get_configured_dbs_by_key
 
 logger = logging.getLogger(__name__)
 
-
-def get_table_names(uri: str) -> list[str]:
-    engine = create_engine(uri)
-    inspection = inspect(engine)
+TS_TABLE_SOURCE_FILTERS = {
+    "metrics": {  # metric ids as comma separated string
+        "name": "Metrics (json array or just comma separated or ALL)",
+        "type": "free_text",
+        "required": True,
+    },
+    "bucket": {  # aggregation is computed by the database
+        "name": "Aggregation bucket width (e.g. 15min, 1h)",
+        "type": "free_text",
+        "required": False,
+    },
+    "aggregation": {
+        "name": "Aggregation (min, max, mean, first or last)",
+        "type": "free_text",
+        "required": False,
+    },
+}
+
+
+def get_table_names(db_config: SQLAdapterDBConfig) -> list[str]:
+    inspection = inspect(db_config.engine)
     return inspection.get_table_names()
 
 
@@ -45,12 +68,14 @@ def is_allowed_dataframe_source_table(
 def get_allowed_dataframe_source_tables(db_config: SQLAdapterDBConfig) -> list[str]:
     return [
         table_name
-        for table_name in get_table_names(db_config.connection_url)
+        for table_name in get_table_names(db_config)
         if is_allowed_dataframe_source_table(table_name, db_config)
     ]
 
 
-def get_sources_of_db(db_config: SQLAdapterDBConfig) -> list[SQLAdapterStructureSource]:
+def introspect_sources_of_db(
+    db_config: SQLAdapterDBConfig,
+) -> list[SQLAdapterStructureSource]:
     return (
         [
             # query source
@@ -89,41 +114,62 @@ def get_sources_of_db(db_config: SQLAdapterDBConfig) -> list[SQLAdapterStructure
                 + db_config.name
                 + "/ts_table/"
                 + ts_table_name,
-                filters={
-                    "metrics": {  # metric ids as comma separated string
-                        "name": "Metrics (json array or just comma separated or ALL)",
-                        "type": "free_text",
-                        "required": True,
-                    }
-                },
+                filters=TS_TABLE_SOURCE_FILTERS,
             )
             for ts_table_name in db_config.timeseries_tables
         ]
     )
 
 
+def get_indexed_sources_of_db(db_config: SQLAdapterDBConfig) -> list[IndexedSource]:
+    """Get the sources of a database from the structure cache
+
+    The database is only introspected if its sources are not cached or the cached
+    sources are older than the configured structure_cache_ttl.
+    """
+    structure_cache_ttl = get_sql_adapter_config().structure_cache_ttl
+    structure_cache = get_structure_cache()
+
+    if structure_cache_ttl is not None:
+        indexed_sources = structure_cache.get(structure_cache_key(db_config))
+        if indexed_sources is not None:
+            return indexed_sources
+
+    indexed_sources = [
+        IndexedSource.from_source(source)
+        for source in introspect_sources_of_db(db_config)
+    ]
+    if structure_cache_ttl is not None:
+        structure_cache.store(
+            structure_cache_key(db_config),
+            indexed_sources,
+            structure_cache_ttl.total_seconds(),
+        )
+    return indexed_sources
+
+
+def get_sources_of_db(db_config: SQLAdapterDBConfig) -> list[SQLAdapterStructureSource]:
+    return [
+        indexed_source.source for indexed_source in get_indexed_sources_of_db(db_config)
+    ]
+
+
 def get_all_db_sources(
     db_configs: Iterable[SQLAdapterDBConfig],
+    filter_str: str | None = None,
 ) -> list[SQLAdapterStructureSource]:
+    filter_lower = None if filter_str is None else filter_str.lower()
+
     sources = []
     for db_config in db_configs:
-        sources.extend(get_sources_of_db(db_config))
+        sources.extend(
+            indexed_source.source
+            for indexed_source in get_indexed_sources_of_db(db_config)
+            if filter_lower is None or indexed_source.matches(filter_lower)
+        )
     return sources
 
 
-def filter_sql_sources(
-    sql_sources: Iterable[SQLAdapterStructureSource],
-    filter_str: str,  # noqa: A002
-) -> list[SQLAdapterStructureSource]:
-    filter_lower = filter_str.lower()
-
-    return [
-        x
-        for x in sql_sources
-        if filter_lower in x.name.lower() or filter_lower in x.path.lower()
-    ]
-
-
 def get_sinks_of_db(db_config: SQLAdapterDBConfig) -> list[SQLAdapterStructureSink]:
     return (
         [
@@ -276,13 +322,7 @@ def get_source_by_id(source_id: str) -> SQLAdapterStructureSource | None:
             type=ExternalType.MULTITSFRAME,
             name="Timeseries Table " + ts_table_name,
             path=db_config.key + "|" + db_config.name + "/ts_table/" + ts_table_name,
-            filters={
-                "metrics": {  # metric ids as comma separated string
-                    "name": "Metrics (json array or just comma separated or ALL)",
-                    "type": "free_text",
-                    "required": True,
-                }
-            },
+            filters=TS_TABLE_SOURCE_FILTERS,
         )
     return None
 
@@ -359,12 +399,7 @@ def get_sink_by_id(sink_id: str) -> SQLAdapterStructureSink | None:
 def get_sources(filter_str: str | None = None) -> list[SQLAdapterStructureSource]:
     configured_dbs_by_key = get_configured_dbs_by_key()
 
-    all_sources = get_all_db_sources(configured_dbs_by_key.values())
-
-    if filter_str is None:
-        return all_sources
-
-    return filter_sql_sources(all_sources, filter_str)
+    return get_all_db_sources(configured_dbs_by_key.values(), filter_str)
 
 
 def get_sinks(filter_str: str | None = None) -> list[SQLAdapterStructureSink]:
@@ -0,0 +1,71 @@
+"""Cache for the introspected source structure of the configured databases
+
+Introspecting the tables of a database requires a roundtrip to the database, but
+the structure endpoints are requested frequently by the frontend. Therefore the
+sources of each database are cached for the configured structure_cache_ttl
+together with the lower case name and path of each source, which are used to
+answer filtered source searches.
+
+Writing to a sink may create a table and therefore invalidates the cached
+sources of the respective database.
+"""
+
+import logging
+from typing import NamedTuple
+
+from hetdesrun.adapters.sql_adapter.config import SQLAdapterDBConfig
+from hetdesrun.adapters.sql_adapter.models import SQLAdapterStructureSource
+from hetdesrun.adapters.ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+
+class IndexedSource(NamedTuple):
+    source: SQLAdapterStructureSource
+    name_lower: str
+    path_lower: str
+
+    @classmethod
+    def from_source(cls, source: SQLAdapterStructureSource) -> "IndexedSource":
+        return cls(
+            source=source,
+            name_lower=source.name.lower(),
+            path_lower=source.path.lower(),
+        )
+
+    def matches(self, filter_lower: str) -> bool:
+        return filter_lower in self.name_lower or filter_lower in self.path_lower
+
+
+# db key and connection url
+StructureCacheKey = tuple[str, str]
+
+
+def structure_cache_key(db_config: SQLAdapterDBConfig) -> StructureCacheKey:
+    return (db_config.key, db_config.connection_url)
+
+
+class StructureCache(TTLCache[StructureCacheKey, list[IndexedSource]]):
+    def invalidate(self, db_key: str | None = None) -> None:
+        """Remove the cached sources of one database or of all databases"""
+        if db_key is None:
+            self.clear()
+        else:
+            self.remove_where(lambda cached_key: cached_key[0] == db_key)
+        logger.debug("Invalidated cached sql adapter structure of db %s", db_key)
+
+
+structure_cache = StructureCache()
+
+
+def get_structure_cache() -> StructureCache:
+    return structure_cache
+
+
+def invalidate_structure_cache(db_key: str | None = None) -> None:
+    """Invalidate cached sources of the database with db_key or of all databases
+
+    Call this after creating or dropping tables outside of the sql adapter, if the
+    changes should be visible before the structure_cache_ttl has passed.
+    """
+    get_structure_cache().invalidate(db_key)
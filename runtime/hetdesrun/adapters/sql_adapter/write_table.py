@@ -1,12 +1,21 @@
+import io
 import logging
+import numbers
+from collections.abc import Callable, Iterable
+from typing import Any, Literal
 
 import pandas as pd
+from pandas.io.sql import SQLTable
 from pydantic import ValidationError
+from sqlalchemy.engine import Connection, Dialect, Engine
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.exc import OperationalError as SQLOpsError
+from sqlalchemy.types import BigInteger, Boolean, DateTime, Float, Text, TypeEngine
 
 from hetdesrun.adapters.exceptions import AdapterHandlingException
 from hetdesrun.adapters.sql_adapter.config import TimeseriesTableConfig
 from hetdesrun.adapters.sql_adapter.models import WriteTable, WriteTableMode
+from hetdesrun.adapters.sql_adapter.structure_cache import invalidate_structure_cache
 from hetdesrun.adapters.sql_adapter.utils import (
     get_configured_dbs_by_key,
     validate_multits_frame,
@@ -14,6 +23,16 @@ from hetdesrun.adapters.sql_adapter.utils import (
 
 logger = logging.getLogger(__name__)
 
+InsertMethod = (
+    Literal["multi"]
+    | Callable[[SQLTable, Connection, list[str], Iterable[tuple[Any, ...]]], int]
+    | None
+)
+
+# maximum number of bound parameters of multi row INSERT statements. Some databases
+# limit this number, e.g. to 2100 for MS SQL Server.
+MULTI_INSERT_MAX_PARAMETERS = 2000
+
 
 def prepare_validate_multitsframe(
     data_to_send: pd.DataFrame,
@@ -67,6 +86,122 @@ def prepare_validate_multitsframe(
     return data_to_send
 
 
+POSTGRES_COPY_NULL = r"\N"
+
+
+def postgres_copy_csv_field(value: Any) -> str:
+    """Csv field for COPY FROM STDIN with the NULL marker POSTGRES_COPY_NULL
+
+    Non numeric values are always quoted, so that neither empty strings nor strings
+    equal to the NULL marker are stored as NULL.
+    """
+    if value is None:
+        return POSTGRES_COPY_NULL
+    if isinstance(value, numbers.Number):
+        return str(value)
+    return '"' + str(value).replace('"', '""') + '"'
+
+
+def postgres_copy_insert(
+    table: SQLTable,
+    connection: Connection,
+    keys: list[str],
+    data_iter: Iterable[tuple[Any, ...]],
+) -> int:
+    """Insert method for DataFrame.to_sql using the postgres COPY FROM STDIN command
+
+    Much faster than INSERT statements for many rows. Requires the psycopg2 driver.
+    """
+    csv_buffer = io.StringIO()
+    n_rows = 0
+    for row in data_iter:
+        csv_buffer.write(",".join(map(postgres_copy_csv_field, row)) + "\n")
+        n_rows += 1
+    csv_buffer.seek(0)
+
+    table_name = (
+        quote_identifier(table.name)
+        if table.schema is None
+        else f"{quote_identifier(table.schema)}.{quote_identifier(table.name)}"
+    )
+    with connection.connection.cursor() as cursor:
+        cursor.copy_expert(
+            f"COPY {table_name}"
+            f" ({', '.join(quote_identifier(key) for key in keys)})"
+            f" FROM STDIN WITH (FORMAT csv, NULL '{POSTGRES_COPY_NULL}')",
+            csv_buffer,
+        )
+    return n_rows
+
+
+def quote_identifier(identifier: str) -> str:
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+def insert_method_and_chunksize(
+    dialect: Dialect, n_columns: int
+) -> tuple[InsertMethod, int | None]:
+    """Fastest available way for DataFrame.to_sql to insert rows with this dialect
+
+    * postgres via psycopg2: COPY FROM STDIN
+    * sqlite: executemany of a prepared INSERT statement in one transaction
+    * others: multi row INSERT statements, with chunks limited by the maximum number
+      of bound parameters per statement
+    """
+    if dialect.name == "postgresql" and dialect.driver == "psycopg2":
+        return postgres_copy_insert, None
+    if dialect.name == "sqlite":
+        return None, None
+    return "multi", max(1, MULTI_INSERT_MAX_PARAMETERS // max(1, n_columns))
+
+
+def sql_dtypes(df: pd.DataFrame) -> dict[str, TypeEngine]:
+    """Explicit sql types for creating tables from the dataframe columns
+
+    Columns with other dtypes are left to the pandas type inference.
+    """
+    dtypes: dict[str, TypeEngine] = {}
+    for col_name, dtype in df.dtypes.items():
+        if isinstance(dtype, pd.DatetimeTZDtype):
+            dtypes[str(col_name)] = DateTime(timezone=True)
+        elif pd.api.types.is_datetime64_dtype(dtype):
+            dtypes[str(col_name)] = DateTime(timezone=False)
+        elif pd.api.types.is_bool_dtype(dtype):
+            dtypes[str(col_name)] = Boolean()
+        elif pd.api.types.is_integer_dtype(dtype):
+            dtypes[str(col_name)] = BigInteger()
+        elif pd.api.types.is_float_dtype(dtype):
+            dtypes[str(col_name)] = Float(precision=53)
+        elif pd.api.types.is_string_dtype(dtype) and pd.api.types.infer_dtype(
+            df[col_name], skipna=True
+        ) in ("string", "empty"):
+            dtypes[str(col_name)] = Text()
+    return dtypes
+
+
+def write_dataframe(
+    engine: Engine, df: pd.DataFrame, table_name: str, if_exists: str
+) -> None:
+    """Write dataframe to table in one transaction
+
+    Replacing or creating the table and inserting the rows are rolled back together
+    if anything fails, so that no partially written data remains.
+    """
+    with engine.begin() as connection:
+        method, chunksize = insert_method_and_chunksize(
+            connection.dialect, len(df.columns)
+        )
+        df.to_sql(
+            table_name,
+            connection,
+            if_exists=if_exists,  # type: ignore[arg-type]
+            index=False,
+            method=method,
+            chunksize=chunksize,
+            dtype=sql_dtypes(df),  # type: ignore[arg-type]
+        )
+
+
 def write_table_to_provided_sink_id(data: pd.DataFrame, sink_id: str) -> None:
     try:
         write_table = WriteTable.from_sink_id(sink_id)
@@ -96,17 +231,17 @@ def write_table_to_provided_sink_id(data: pd.DataFrame, sink_id: str) -> None:
             data_to_send, ts_table_config, sink_id, write_table
         )
 
-    engine = db_config.engine
     try:
-        with engine.begin():  # transactional / roll back in case of exceptions
-            data_to_send.to_sql(
-                write_table.table_name,
-                engine,
-                if_exists=write_table.pandas_if_exists_mode,
-                index=False,
-                method="multi",
-            )
-    except SQLOpsError as e:
+        write_dataframe(
+            db_config.engine,
+            data_to_send,
+            write_table.table_name,
+            if_exists=write_table.pandas_if_exists_mode,
+        )
+    except (SQLOpsError, DBAPIError) as e:
         msg = f"Sql adapter pandas to_sql writing error: {str(e)}"
         logger.info(msg)
         raise AdapterHandlingException(msg) from e
+
+    # the table may have been created, which must be visible as source
+    invalidate_structure_cache(write_table.db_key)
@@ -0,0 +1,68 @@
+"""Thread-safe cache with expiring entries
+
+Adapters use it to cache e.g. structure information or metadata, which are requested
+frequently but change rarely, for a configured time to live. Adapter specific caches
+add invalidation for the entries affected by writes of the adapter.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """Cache whose entries expire after the time to live they are stored with
+
+    If max_entries is set and exceeded, expired entries are removed first and then
+    the least recently stored entries.
+    """
+
+    def __init__(self, max_entries: int | None = None) -> None:
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        # values are the expiry time and the cached value, in the order of storing
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+
+    def get(self, key: K) -> V | None:
+        with self._lock:
+            try:
+                expires_at, value = self._entries[key]
+            except KeyError:
+                return None
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            return value
+
+    def store(self, key: K, value: V, ttl: float) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (time.monotonic() + ttl, value)
+            if self.max_entries is None or len(self._entries) <= self.max_entries:
+                return
+            now = time.monotonic()
+            for expired_key in [
+                cached_key
+                for cached_key, (expires_at, _) in self._entries.items()
+                if expires_at <= now
+            ]:
+                del self._entries[expired_key]
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def remove_where(self, predicate: Callable[[K], bool]) -> None:
+        """Remove the entries whose keys match the predicate"""
+        with self._lock:
+            for cached_key in [
+                cached_key for cached_key in self._entries if predicate(cached_key)
+            ]:
+                del self._entries[cached_key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
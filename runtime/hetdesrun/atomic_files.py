@@ -0,0 +1,34 @@
+"""Atomic replacement of files
+
+Files which are read concurrently, e.g. cached files or stored objects, are written
+to a temporary file in the same directory first and then renamed to their path.
+Renaming within a file system is atomic, so readers see either the previous or the
+new file but never a partially written one.
+"""
+
+import contextlib
+import os
+import uuid
+from collections.abc import Callable
+from typing import Any
+
+
+def write_atomically(path: str, write_func: Callable[[str], Any]) -> None:
+    """Write a file to a temporary path with write_func and move it to path
+
+    The temporary file is hidden, i.e. its name starts with ".", and removed if
+    write_func fails. Missing parent directories are created.
+    """
+    dir_path = os.path.dirname(path)
+    if dir_path != "":
+        os.makedirs(dir_path, exist_ok=True)
+    tmp_path = os.path.join(
+        dir_path, "." + os.path.basename(path) + "." + uuid.uuid4().hex + ".tmp"
+    )
+    try:
+        write_func(tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(tmp_path)
+        raise
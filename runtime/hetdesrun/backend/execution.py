@@ -9,6 +9,7 @@ from uuid import UUID, uuid4
 import httpx
 from pydantic import ValidationError
 
+from hetdesrun.adapters.source.uploads import get_uploaded_inputs
 from hetdesrun.backend.models.info import ExecutionResponseFrontendDto
 from hetdesrun.models.component import ComponentNode
 from hetdesrun.models.execution import ExecByIdInput
@@ -32,6 +33,7 @@ from hetdesrun.utils import Type
 from hetdesrun.webservice.auth_dependency import get_auth_headers
 from hetdesrun.webservice.auth_outgoing import ServiceAuthenticationError
 from hetdesrun.webservice.config import get_config
+from hetdesrun.webservice.http_clients import get_shared_http_client
 
 logger = logging.getLogger(__name__)
 logger.addFilter(execution_context_filter)
@@ -221,12 +223,14 @@ async def run_execution_input(
             logger.info(msg)
             raise TrafoExecutionRuntimeConnectionError(msg) from e
 
-        async with httpx.AsyncClient(
+        client = get_shared_http_client(
+            get_config().hd_runtime_engine_url,
             verify=get_config().hd_runtime_verify_certs,
-            timeout=get_config().external_request_timeout,
-        ) as client:
-            url = posix_urljoin(get_config().hd_runtime_engine_url, "runtime")
-            try:
+        )
+        uploaded_inputs = get_uploaded_inputs()
+        try:
+            if len(uploaded_inputs) == 0:
+                url = posix_urljoin(get_config().hd_runtime_engine_url, "runtime")
                 response = await client.post(
                     url,
                     headers=headers,
@@ -237,22 +241,47 @@ async def run_execution_input(
                     # https://github.com/samuelcolvin/pydantic/issues/1409#issuecomment-877175194
                     timeout=None,
                 )
-            except httpx.HTTPError as e:
-                # handles both request errors (connection problems)
-                # and 4xx and 5xx errors. See https://www.python-httpx.org/exceptions/
-                msg = f"Failure connecting to hd runtime endpoint ({url}):\n{str(e)}"
-                logger.info(msg)
-                raise TrafoExecutionRuntimeConnectionError(msg) from e
-            try:
-                json_obj = response.json()
-                execution_result = WorkflowExecutionResult(**json_obj)
-            except ValidationError as e:
-                msg = (
-                    f"Could not validate hd runtime result object. Exception:\n{str(e)}"
-                    f"\nJson Object is:\n{str(json_obj)}"
+            else:
+                # forward uploaded input data as multipart parts, streamed from
+                # the spooled files
+                url = posix_urljoin(
+                    get_config().hd_runtime_engine_url, "runtime-multipart"
+                )
+                for uploaded_input in uploaded_inputs.values():
+                    uploaded_input.file.seek(0)
+                response = await client.post(
+                    url,
+                    headers=headers,
+                    data={"runtime_input": execution_input.json()},
+                    files=[
+                        (
+                            name,
+                            (
+                                uploaded_input.filename or name,
+                                uploaded_input.file,
+                                uploaded_input.content_type,
+                            ),
+                        )
+                        for name, uploaded_input in uploaded_inputs.items()
+                    ],
+                    timeout=None,
                 )
-                logger.info(msg)
-                raise TrafoExecutionResultValidationError(msg) from e
+        except httpx.HTTPError as e:
+            # handles both request errors (connection problems)
+            # and 4xx and 5xx errors. See https://www.python-httpx.org/exceptions/
+            msg = f"Failure connecting to hd runtime endpoint ({url}):\n{str(e)}"
+            logger.info(msg)
+            raise TrafoExecutionRuntimeConnectionError(msg) from e
+        try:
+            json_obj = response.json()
+            execution_result = WorkflowExecutionResult(**json_obj)
+        except ValidationError as e:
+            msg = (
+                f"Could not validate hd runtime result object. Exception:\n{str(e)}"
+                f"\nJson Object is:\n{str(json_obj)}"
+            )
+            logger.info(msg)
+            raise TrafoExecutionResultValidationError(msg) from e
 
     execution_response = ExecutionResponseFrontendDto(
         **execution_result.dict(),
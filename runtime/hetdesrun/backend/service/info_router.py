@@ -1,10 +1,12 @@
 import logging
+from typing import Any
 
 from fastapi import status
 
 from hetdesrun import VERSION
 from hetdesrun.backend.kafka.consumer import get_kafka_worker_context
 from hetdesrun.webservice.config import get_config
+from hetdesrun.webservice.http_clients import get_http_client_stats
 from hetdesrun.webservice.router import HandleTrailingSlashAPIRouter
 
 logger = logging.getLogger(__name__)
@@ -34,12 +36,15 @@ async def get_info() -> dict:
     If Kafka consumer execution is enabled this will also show
     some information of the consumer instance running in the web service worker
     instance which is selected to answer this http request.
+
+    Furthermore request statistics of the shared http clients of
+    this worker process are shown per target host.
     """
     logger.info("Get sign of life")
 
     # import current state of consumer globals
 
-    info_dict = {
+    info_dict: dict[str, Any] = {
         "msg": "Here I am",
         "version": VERSION,
     }
@@ -53,4 +58,9 @@ async def get_info() -> dict:
             "worker_process_kafka_consumer_partition_assignments"
         ] = kafka_ctx.consumer.assignment()
 
+    info_dict["worker_process_http_client_stats"] = {
+        origin: host_stats.dict()
+        for origin, host_stats in get_http_client_stats().items()
+    }
+
     return info_dict
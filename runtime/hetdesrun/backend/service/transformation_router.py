@@ -13,11 +13,12 @@ from fastapi import (
     HTTPException,
     Path,
     Query,
+    Request,
     Response,
     status,
 )
 from fastapi.responses import HTMLResponse
-from pydantic import HttpUrl, StrictInt, StrictStr
+from pydantic import HttpUrl, StrictInt, StrictStr, ValidationError
 
 from hetdesrun.backend.execution import (
     TrafoExecutionInputValidationError,
@@ -69,6 +70,7 @@ from hetdesrun.webservice.auth_dependency import (
 )
 from hetdesrun.webservice.auth_outgoing import ServiceAuthenticationError
 from hetdesrun.webservice.config import get_config
+from hetdesrun.webservice.multipart import bound_multipart_execution_request
 from hetdesrun.webservice.router import HandleTrailingSlashAPIRouter
 
 logger = logging.getLogger(__name__)
@@ -785,6 +787,45 @@ async def execute_transformation_revision_endpoint(
     return await handle_trafo_revision_execution_request(exec_by_id)
 
 
+@transformation_router.post(
+    "/execute-multipart",
+    response_model=ExecutionResponseFrontendDto,
+    summary="Executes a transformation revision with uploaded input data",
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_200_OK: {
+            "description": "Successfully executed the transformation revision"
+        }
+    },
+)
+async def execute_transformation_revision_multipart_endpoint(
+    request: Request,
+) -> ExecutionResponseFrontendDto:
+    """Execute a transformation revision with input data uploaded as multipart parts.
+
+    Expects a multipart/form-data body with a form field "exec_by_id" containing the
+    same json payload as the /execute endpoint. All other parts are file parts with
+    input data in Parquet, Arrow IPC or CSV format. They are referenced by part name
+    from direct provisioning input wirings via the "upload" filter, e.g.
+    {"upload": "my_part", "format": "parquet"}. If the "format" filter is omitted the
+    format is detected from the content type or file name of the part.
+
+    Uploaded parts are spooled to temporary files instead of being decoded from json.
+
+    The test wiring will not be updated.
+    """
+    async with bound_multipart_execution_request(request, "exec_by_id") as payload:
+        try:
+            exec_by_id = ExecByIdInput.parse_raw(payload)
+        except ValidationError as err:
+            msg = f"Could not validate multipart execution payload:\n{str(err)}"
+            logger.error(msg)
+            raise HTTPException(
+                status.HTTP_422_UNPROCESSABLE_ENTITY, detail=msg
+            ) from err
+        return await handle_trafo_revision_execution_request(exec_by_id)
+
+
 callback_router = APIRouter()
 
 
@@ -807,6 +848,8 @@ async def send_result_to_callback_url(
         )
         logger.error(msg)
 
+    # callback urls are provided by users, hence a shared client per callback
+    # origin would keep clients and connections open for arbitrarily many origins
     async with httpx.AsyncClient(
         verify=get_config().hd_backend_verify_certs,
         timeout=get_config().external_request_timeout,
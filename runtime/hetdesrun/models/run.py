@@ -71,6 +71,12 @@ class AllMeasuredSteps(BaseModel):
     pure_execution: PerformanceMeasuredStep | None = None
     load_data: PerformanceMeasuredStep | None = None
     send_data: PerformanceMeasuredStep | None = None
+    load_data_by_adapter: dict[str, PerformanceMeasuredStep] = Field(
+        {}, description="Loading time of each adapter, which are loaded concurrently"
+    )
+    send_data_by_adapter: dict[str, PerformanceMeasuredStep] = Field(
+        {}, description="Sending time of each adapter, which are sent to concurrently"
+    )
 
 
 class ConfigurationInput(BaseModel):
@@ -92,8 +92,9 @@ async def runtime_service(  # noqa: PLR0911, PLR0912, PLR0915
             currently_executed_process_stage.value
         )
 
+        load_data_by_adapter_measured_steps: dict[str, PerformanceMeasuredStep] = {}
         loaded_data = await resolve_and_load_data_from_wiring(
-            runtime_input.workflow_wiring
+            runtime_input.workflow_wiring, load_data_by_adapter_measured_steps
         )
 
         load_data_measured_step.stop()
@@ -213,8 +214,11 @@ async def runtime_service(  # noqa: PLR0911, PLR0912, PLR0915
             currently_executed_process_stage.value
         )
 
+        send_data_by_adapter_measured_steps: dict[str, PerformanceMeasuredStep] = {}
         direct_return_data: dict = await resolve_and_send_data_from_wiring(
-            runtime_input.workflow_wiring, workflow_result
+            runtime_input.workflow_wiring,
+            workflow_result,
+            send_data_by_adapter_measured_steps,
         )
 
         send_data_measured_step.stop()
@@ -242,6 +246,12 @@ async def runtime_service(  # noqa: PLR0911, PLR0912, PLR0915
     wf_exec_result.measured_steps.pure_execution = pure_execution_measured_step
     wf_exec_result.measured_steps.load_data = load_data_measured_step
     wf_exec_result.measured_steps.send_data = send_data_measured_step
+    wf_exec_result.measured_steps.load_data_by_adapter = (
+        load_data_by_adapter_measured_steps
+    )
+    wf_exec_result.measured_steps.send_data_by_adapter = (
+        send_data_by_adapter_measured_steps
+    )
 
     runtime_logger.info(
         "Workflow Execution Result Pydantic Object: \n%s",
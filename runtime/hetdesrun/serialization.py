@@ -13,41 +13,192 @@ framework in the future. In production deployments models should be stored and
 loaded through appropriate adapters (see hetida designer adapter system)
 and not via components.
 """
+import logging
+import mmap
 import os
-from typing import Any
+import pickle
+import sys
+import threading
+import types
+from collections import OrderedDict
+from typing import Any, Literal
 
 import joblib
+import numpy as np
 
+from hetdesrun.atomic_files import write_atomically
 from hetdesrun.webservice.config import get_config
 
+logger = logging.getLogger(__name__)
+
+
+class LoadedObjectCache:
+    """In-memory LRU cache of loaded objects within a memory budget
+
+    Objects are keyed by the resolved path and the modification time of their file,
+    so that overwritten files and the moved "latest" symlink are never served from
+    stale entries. The memory usage of an object is estimated with
+    estimated_memory_size. Cached objects are shared between loads and hence must not be modified.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        # values are the estimated size and the object, in the order of last usage
+        self._entries: OrderedDict[tuple, tuple[int, Any]] = OrderedDict()
+        self._total_size = 0
+
+    def get(self, key: tuple) -> tuple[bool, Any]:
+        """Whether the object is cached and the object itself"""
+        with self._lock:
+            try:
+                _, obj = self._entries[key]
+            except KeyError:
+                return False, None
+            self._entries.move_to_end(key)
+            return True, obj
+
+    def store(self, key: tuple, obj: Any, size: int, max_size: int) -> None:
+        if size > max_size:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._total_size -= self._entries.pop(key)[0]
+            self._entries[key] = (size, obj)
+            self._total_size += size
+            while self._total_size > max_size:
+                _, (removed_size, _) = self._entries.popitem(last=False)
+                self._total_size -= removed_size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._total_size = 0
+
+
+def estimated_memory_size(obj: Any) -> int:
+    """Estimate the memory in bytes used by an object and the objects it references
+
+    Follows containers, NumPy arrays of objects and instance attributes. Pandas
+    objects are measured with their deep memory usage. The data of memory mapped
+    NumPy arrays is not counted, since it is read from the file on demand and can be
+    evicted by the operating system. Classes, functions, modules and loggers are
+    shared and hence not counted either.
+    """
+    total_size = 0
+    seen_ids: set[int] = set()
+    to_visit = [obj]
+    while to_visit:
+        current = to_visit.pop()
+        if id(current) in seen_ids or isinstance(
+            current,
+            type
+            | types.ModuleType
+            | types.FunctionType
+            | types.BuiltinFunctionType
+            | types.MethodType
+            | logging.Logger
+            | mmap.mmap,
+        ):
+            continue
+        seen_ids.add(id(current))
+        # includes the data of arrays owning their data and of pandas objects
+        total_size += sys.getsizeof(current)
+
+        if isinstance(current, np.ndarray):
+            if current.base is not None:
+                to_visit.append(current.base)
+            if current.dtype == object:
+                to_visit.extend(current.ravel())
+        elif isinstance(current, dict):
+            to_visit.extend(current.keys())
+            to_visit.extend(current.values())
+        elif isinstance(current, list | tuple | set | frozenset):
+            to_visit.extend(current)
+        elif hasattr(current, "__dict__") and isinstance(current.__dict__, dict):
+            to_visit.append(current.__dict__)
+    return total_size
+
+
+loaded_object_cache = LoadedObjectCache()
+
+
+def get_loaded_object_cache() -> LoadedObjectCache:
+    return loaded_object_cache
+
 
 def get_object_path(name: str, tag: str) -> str:
     return os.path.join(get_config().model_repo_path, name + "_" + tag)
 
 
 def symlink_latest(name: str, tag: str) -> None:
-    latest_path = get_object_path(name, "latest")
+    # replaces a possibly existing symlink without a moment where it is missing
+    write_atomically(
+        get_object_path(name, "latest"),
+        lambda tmp_path: os.symlink(get_object_path(name, tag), tmp_path),
+    )
 
-    # remove possibly existing symlink
-    try:  # noqa: SIM105
-        os.remove(latest_path)
-    except FileNotFoundError:
-        pass
 
-    obj_path = get_object_path(name, tag)
+def dump_obj(obj: Any, name: str, tag: str, compress: int | None = None) -> None:
+    """Serialize an object with joblib
 
-    os.symlink(obj_path, latest_path)
-
-
-def dump_obj(obj: Any, name: str, tag: str) -> None:
+    The compression level compress defaults to the configured model repo
+    compression level.
+    """
     if tag.lower() == "latest":
         raise ValueError(
             '"latest" has a special meaning as a tag and cannot be used directly when'
             " dumping objects"
         )
-    joblib.dump(obj, get_object_path(name, tag))
+    if compress is None:
+        compress = get_config().model_repo_compression_level
+    write_atomically(
+        get_object_path(name, tag),
+        lambda tmp_path: joblib.dump(obj, tmp_path, compress=compress),
+    )
     symlink_latest(name, tag)
 
 
-def load_obj(name: str, tag: str) -> Any:
-    return joblib.load(get_object_path(name, tag))
+def dumped_with_compression(path: str) -> bool:
+    """Whether joblib dumped the object at path with compression
+
+    Uncompressed dumps start with the pickle protocol opcode, compressed ones with
+    the magic number of the compression format.
+    """
+    with open(path, "rb") as f:
+        return f.read(1) != pickle.PROTO
+
+
+def load_obj(
+    name: str, tag: str, mmap_mode: Literal["r", "config"] | None = "config"
+) -> Any:
+    """Load an object serialized with joblib
+
+    NumPy arrays are memory mapped read-only if mmap_mode is "r" and read into
+    memory if it is None. It defaults to the configured model repo mmap mode. Note
+    that mmap_mode has no effect for objects dumped with compression, e.g. due to a
+    configured model repo compression level, which are always read into memory.
+    If a model repo cache size is configured, loaded objects are kept in memory for
+    later loads of the unchanged file.
+    """
+    if mmap_mode == "config":
+        mmap_mode = get_config().model_repo_mmap_mode
+    # resolves the "latest" symlink
+    path = os.path.realpath(get_object_path(name, tag))
+    if mmap_mode is not None and dumped_with_compression(path):
+        # joblib ignores mmap_mode for compressed files, but fails for some arrays
+        mmap_mode = None
+
+    max_size = get_config().model_repo_cache_max_size
+    if max_size == 0:
+        return joblib.load(path, mmap_mode=mmap_mode)
+
+    stat_result = os.stat(path)
+    key = (path, stat_result.st_mtime_ns, stat_result.st_size, mmap_mode)
+    cached, obj = get_loaded_object_cache().get(key)
+    if cached:
+        logger.debug("Took object %s from loaded object cache", path)
+        return obj
+
+    obj = joblib.load(path, mmap_mode=mmap_mode)
+    get_loaded_object_cache().store(key, obj, estimated_memory_size(obj), max_size)
+    return obj
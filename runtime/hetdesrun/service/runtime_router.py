@@ -1,10 +1,14 @@
 import logging
 
+from fastapi import HTTPException, Request, status
+from pydantic import ValidationError
+
 from hetdesrun import VERSION
 from hetdesrun.models.base import VersionInfo
 from hetdesrun.models.run import WorkflowExecutionInput, WorkflowExecutionResult
 from hetdesrun.runtime.service import runtime_service
 from hetdesrun.webservice.auth_dependency import get_auth_deps
+from hetdesrun.webservice.multipart import bound_multipart_execution_request
 from hetdesrun.webservice.router import HandleTrailingSlashAPIRouter
 
 logger = logging.getLogger(__name__)
@@ -23,6 +27,32 @@ async def runtime_endpoint(
     return await runtime_service(runtime_input)
 
 
+@runtime_router.post(
+    "/runtime-multipart",
+    response_model=WorkflowExecutionResult,
+    dependencies=get_auth_deps(),
+)
+async def runtime_multipart_endpoint(request: Request) -> WorkflowExecutionResult:
+    """Run workflow with input data uploaded as multipart parts
+
+    Expects a multipart/form-data body with a form field "runtime_input" containing
+    the json workflow execution input. All other parts are file parts (Parquet,
+    Arrow IPC or CSV) which are referenced by their part name via the "upload" filter
+    of direct provisioning input wirings.
+    """
+    async with bound_multipart_execution_request(
+        request, "runtime_input"
+    ) as runtime_input_json:
+        try:
+            runtime_input = WorkflowExecutionInput.parse_raw(runtime_input_json)
+        except ValidationError as e:
+            logger.info("Could not validate multipart runtime input:\n%s", str(e))
+            raise HTTPException(
+                status.HTTP_422_UNPROCESSABLE_ENTITY, detail=e.errors()
+            ) from e
+        return await runtime_service(runtime_input)
+
+
 @runtime_router.get("/info", response_model=VersionInfo)
 async def info_service() -> dict:
     """Version Info Endpoint
@@ -13,6 +13,7 @@ from starlette.requests import Request
 from starlette.responses import JSONResponse, Response
 
 from hetdesrun import VERSION
+from hetdesrun.adapters.execution import get_adapter_thread_pool
 from hetdesrun.adapters.kafka.config import get_kafka_adapter_config
 from hetdesrun.adapters.sql_adapter.config import get_sql_adapter_config
 from hetdesrun.backend.service.adapter_router import adapter_router
@@ -29,6 +30,8 @@ from hetdesrun.backend.service.wiring_router import wiring_router
 from hetdesrun.backend.service.workflow_router import workflow_router
 from hetdesrun.webservice.auth_dependency import get_auth_deps
 from hetdesrun.webservice.config import get_config
+from hetdesrun.webservice.http_clients import close_shared_http_clients
+from hetdesrun.webservice.multipart import is_multipart_request
 
 if get_config().hd_kafka_consumer_enabled:
     from hetdesrun.backend.kafka.consumer import get_kafka_worker_context
@@ -47,6 +50,11 @@ class AdditionalLoggingRoute(APIRoute):
         original_route_handler = super().get_route_handler()
 
         async def custom_route_handler(request: Request) -> Response:
+            if is_multipart_request(request):
+                # Do not read multipart bodies into memory. They may contain large
+                # binary uploads which are streamed to spool files during form parsing.
+                logger.info("RECEIVED MULTIPART BODY (not logged)")
+                return await original_route_handler(request)  # type: ignore
             try:
                 json_data = await request.json()
             except json.decoder.JSONDecodeError:
@@ -94,6 +102,10 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:  # noqa: ARG001
         logger.info("Shutting down Kafka consumer...")
         kakfa_worker_context = get_kafka_worker_context()
         await kakfa_worker_context.stop()
+    logger.info("Closing shared http clients...")
+    await close_shared_http_clients()
+    logger.info("Shutting down adapter thread pool...")
+    get_adapter_thread_pool().shutdown(wait=False)
 
 
 def app_desc_part() -> str:
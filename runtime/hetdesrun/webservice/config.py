@@ -2,6 +2,7 @@ import datetime
 import os
 import re
 from enum import Enum
+from typing import Literal
 from uuid import UUID
 
 from pydantic import BaseSettings, Field, Json, SecretStr, validator
@@ -86,6 +87,36 @@ class RuntimeConfig(BaseSettings):
             " (e.g. trained models) will be stored."
         ),
     )
+    model_repo_cache_max_size: int = Field(
+        0,
+        env="MODEL_REPO_CACHE_MAX_SIZE",
+        description=(
+            "Memory budget in bytes for objects loaded from the simple built-in object"
+            " store which are kept in memory for later loads. The memory usage of the"
+            " objects is estimated without the data of memory mapped NumPy arrays."
+            " Set to 0 to load objects from disk on every load."
+        ),
+        ge=0,
+    )
+    model_repo_mmap_mode: Literal["r"] | None = Field(
+        None,
+        env="MODEL_REPO_MMAP_MODE",
+        description=(
+            'Set to "r" to memory map NumPy arrays of objects loaded from the simple'
+            " built-in object store read-only instead of reading them into memory."
+            " Not possible for compressed objects."
+        ),
+    )
+    model_repo_compression_level: int = Field(
+        0,
+        env="MODEL_REPO_COMPRESSION_LEVEL",
+        description=(
+            "Compression level (0 to 9) with which objects are stored in the simple"
+            " built-in object store. 0 disables compression."
+        ),
+        ge=0,
+        le=9,
+    )
 
     is_backend_service: bool = Field(
         True,
@@ -379,6 +410,74 @@ class RuntimeConfig(BaseSettings):
     hd_adapters_verify_certs: bool = Field(
         True, env="HETIDA_DESIGNER_ADAPTERS_VERIFY_CERTS"
     )
+    hd_adapters_concurrency_limit: int = Field(
+        8,
+        env="HETIDA_DESIGNER_ADAPTERS_CONCURRENCY_LIMIT",
+        description=(
+            "Maximum number of adapters which are loaded from / sent to concurrently"
+            " during a single execution."
+        ),
+        gt=0,
+    )
+    hd_adapters_thread_pool_max_workers: int = Field(
+        16,
+        env="HETIDA_DESIGNER_ADAPTERS_THREAD_POOL_MAX_WORKERS",
+        description=(
+            "Number of threads per worker process in which blocking adapter"
+            " functions (e.g. synchronous adapter load and send functions, file,"
+            " database and blob storage access of the built-in adapters) are run"
+            " outside of the event loop."
+        ),
+        gt=0,
+    )
+    hd_adapters_thread_limits: dict[str, int] = Field(
+        {},
+        env="HETIDA_DESIGNER_ADAPTERS_THREAD_LIMITS",
+        description=(
+            "Maximum number of threads of the adapter thread pool which may be used"
+            " concurrently by an adapter, by adapter key. Adapters which are not"
+            " listed may use all threads. Example:"
+            ' {"local-file-adapter": 4, "sql-adapter": 8}'
+        ),
+    )
+
+    hd_http_clients_max_connections: int = Field(
+        100,
+        env="HETIDA_DESIGNER_HTTP_CLIENTS_MAX_CONNECTIONS",
+        description=(
+            "Maximum number of concurrent connections of the shared http client"
+            " for each host requests are sent to (adapters, runtime, backend)."
+        ),
+        gt=0,
+    )
+    hd_http_clients_max_keepalive_connections: int = Field(
+        20,
+        env="HETIDA_DESIGNER_HTTP_CLIENTS_MAX_KEEPALIVE_CONNECTIONS",
+        description=(
+            "Maximum number of idle connections kept alive by the shared http client"
+            " for each host."
+        ),
+        ge=0,
+    )
+    hd_http_clients_http2: bool = Field(
+        False,
+        env="HETIDA_DESIGNER_HTTP_CLIENTS_HTTP2",
+        description=(
+            "Whether the shared http clients use HTTP/2 for https connections to hosts"
+            " supporting it. Requires the h2 package to be installed."
+        ),
+    )
+    hd_generic_rest_sink_max_rows_per_request: int | None = Field(
+        None,
+        env="HETIDA_DESIGNER_GENERIC_REST_SINK_MAX_ROWS_PER_REQUEST",
+        description=(
+            "If set, framelike data sent to generic rest adapter sinks is split into"
+            " several POST requests of at most this number of rows each. The adapter"
+            " web service must then handle subsequent POSTs for the same id appending."
+            " Each request body is streamed in row batches regardless of this setting."
+        ),
+        gt=0,
+    )
 
     hd_kafka_consumption_mode: None | ExecByIdBase = Field(
         None,
@@ -447,6 +546,12 @@ class RuntimeConfig(BaseSettings):
         env="HETIDA_DESIGNER_KAFKA_RESPONSE_TOPIC",
     )
 
+    @validator("hd_adapters_thread_limits")
+    def adapters_thread_limits_positive(cls, v: dict[str, int]) -> dict[str, int]:
+        if any(limit <= 0 for limit in v.values()):
+            raise ValueError("Adapter thread limits must be positive.")
+        return v
+
     @validator("internal_auth_client_credentials")
     def internal_auth_client_credentials_set_if_internal_auth_mode_is_client(
         cls,
@@ -0,0 +1,158 @@
+"""Shared pooled http clients for outgoing requests
+
+Creating an AsyncClient per job means a new TCP connection and TLS handshake for
+every request. Instead, outgoing requests to adapters, the runtime and the backend
+use clients which are shared process-wide per target origin (scheme, host and port)
+and TLS verification setting. They keep connections alive between requests. Only
+origins from the configuration are requested this way; requests to user provided
+urls like callback urls use short-lived clients, so that the number of shared
+clients stays bounded.
+
+httpx clients must only be used in the event loop in which their connections were
+opened. Hence clients are registered per event loop. The clients of the
+application's event loop are closed in the FastAPI lifespan.
+
+Since clients are shared, request specific settings like auth headers must be
+passed per request and not to the client.
+"""
+
+import asyncio
+import logging
+import threading
+import weakref
+from urllib.parse import urlsplit
+
+import httpx
+from pydantic import BaseModel
+
+from hetdesrun.webservice.config import get_config
+
+logger = logging.getLogger(__name__)
+
+# origin and whether certificates are verified
+HttpClientKey = tuple[str, bool]
+
+
+class HostConnectionStats(BaseModel):
+    requests: int = 0
+    error_responses: int = 0
+
+
+def origin_of_url(url: str) -> str:
+    split_url = urlsplit(str(url))
+    return f"{split_url.scheme}://{split_url.netloc}"
+
+
+def http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class HttpClientRegistry:
+    """Shared clients of one event loop"""
+
+    def __init__(self) -> None:
+        self._clients: dict[HttpClientKey, httpx.AsyncClient] = {}
+        self._request_stats: dict[str, HostConnectionStats] = {}
+
+    def get_client(self, url: str, verify: bool) -> httpx.AsyncClient:
+        origin = origin_of_url(url)
+        try:
+            return self._clients[(origin, verify)]
+        except KeyError:
+            pass
+
+        request_stats = self._request_stats.setdefault(origin, HostConnectionStats())
+
+        async def count_request(request: httpx.Request) -> None:  # noqa: ARG001
+            request_stats.requests += 1
+
+        async def count_error_response(response: httpx.Response) -> None:
+            if response.status_code >= 400:
+                request_stats.error_responses += 1
+
+        use_http2 = get_config().hd_http_clients_http2
+        if use_http2 and not http2_available():
+            logger.warning(
+                "HTTP/2 is activated for outgoing requests but the h2 package is not"
+                " installed. Falling back to HTTP/1.1."
+            )
+            use_http2 = False
+
+        logger.debug("Creating shared http client for %s", origin)
+        client = httpx.AsyncClient(
+            verify=verify,
+            timeout=get_config().external_request_timeout,
+            http2=use_http2,
+            limits=httpx.Limits(
+                max_connections=get_config().hd_http_clients_max_connections,
+                max_keepalive_connections=(
+                    get_config().hd_http_clients_max_keepalive_connections
+                ),
+            ),
+            event_hooks={
+                "request": [count_request],
+                "response": [count_error_response],
+            },
+        )
+        self._clients[(origin, verify)] = client
+        return client
+
+    def stats(self) -> dict[str, HostConnectionStats]:
+        return {
+            origin: request_stats.copy()
+            for origin, request_stats in self._request_stats.items()
+        }
+
+    async def aclose(self) -> None:
+        clients = list(self._clients.values())
+        self._clients.clear()
+        await asyncio.gather(*(client.aclose() for client in clients))
+
+
+http_client_registries_lock = threading.Lock()
+http_client_registries: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, HttpClientRegistry
+] = weakref.WeakKeyDictionary()
+
+
+def get_http_client_registry() -> HttpClientRegistry:
+    """Registry of the running event loop"""
+    loop = asyncio.get_running_loop()
+    with http_client_registries_lock:
+        try:
+            return http_client_registries[loop]
+        except KeyError:
+            registry = HttpClientRegistry()
+            http_client_registries[loop] = registry
+            return registry
+
+
+def get_shared_http_client(url: str, verify: bool) -> httpx.AsyncClient:
+    """Shared client for requests to the origin of url
+
+    Must be called from within a running event loop. The client must not be closed
+    by the caller.
+    """
+    return get_http_client_registry().get_client(url, verify)
+
+
+async def close_shared_http_clients() -> None:
+    """Close the shared clients of the running event loop"""
+    await get_http_client_registry().aclose()
+
+
+def get_http_client_stats() -> dict[str, HostConnectionStats]:
+    """Per host statistics of the shared clients of all event loops"""
+    with http_client_registries_lock:
+        registries = list(http_client_registries.values())
+    stats_by_origin: dict[str, HostConnectionStats] = {}
+    for registry in registries:
+        for origin, host_stats in registry.stats().items():
+            aggregated_stats = stats_by_origin.setdefault(origin, HostConnectionStats())
+            aggregated_stats.requests += host_stats.requests
+            aggregated_stats.error_responses += host_stats.error_responses
+    return stats_by_origin
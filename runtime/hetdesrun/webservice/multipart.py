@@ -0,0 +1,75 @@
+"""Handling of multipart execution requests
+
+Multipart execution requests consist of one form field containing the usual
+json execution payload and an arbitrary number of file parts with input data,
+which are referenced by their part name from direct provisioning input wirings.
+
+File parts are streamed to spooled temporary files during form parsing, so that
+large inputs are neither held in memory as a whole nor decoded from json.
+"""
+
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from fastapi import HTTPException, status
+from starlette.datastructures import UploadFile
+from starlette.requests import Request
+
+from hetdesrun.adapters.source.uploads import (
+    UploadedInput,
+    bind_uploaded_inputs,
+    clear_uploaded_inputs_context,
+)
+
+logger = logging.getLogger(__name__)
+
+MAX_UPLOADED_INPUT_PARTS = 1000
+
+
+def is_multipart_request(request: Request) -> bool:
+    return request.headers.get("content-type", "").startswith("multipart/form-data")
+
+
+@asynccontextmanager
+async def bound_multipart_execution_request(
+    request: Request, payload_field_name: str
+) -> AsyncIterator[str]:
+    """Parse multipart execution request and bind uploaded inputs to context
+
+    Yields the json payload string of the field with name payload_field_name.
+    All file parts are bound as uploaded inputs to the current context until
+    leaving the context manager, after which the spooled files are closed.
+    """
+    async with request.form(
+        max_files=MAX_UPLOADED_INPUT_PARTS, max_fields=MAX_UPLOADED_INPUT_PARTS
+    ) as form:
+        payload = form.get(payload_field_name, None)
+        if not isinstance(payload, str):
+            msg = (
+                f"Multipart execution request requires a form field {payload_field_name}"
+                " containing the json execution payload."
+            )
+            logger.info(msg)
+            raise HTTPException(status.HTTP_422_UNPROCESSABLE_ENTITY, detail=msg)
+
+        uploaded_input_by_name = {
+            name: UploadedInput(
+                name=name,
+                file=part.file,
+                filename=part.filename,
+                content_type=part.content_type,
+            )
+            for name, part in form.multi_items()
+            if isinstance(part, UploadFile)
+        }
+        logger.info(
+            "Received multipart execution request with uploaded inputs %s",
+            str(list(uploaded_input_by_name.keys())),
+        )
+
+        bind_uploaded_inputs(uploaded_input_by_name)
+        try:
+            yield payload
+        finally:
+            clear_uploaded_inputs_context()
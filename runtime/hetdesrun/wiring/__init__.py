@@ -1,17 +1,97 @@
+import asyncio
 from collections import defaultdict
-from typing import Any
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
 
 from hetdesrun.adapters import load_data_from_adapter, send_data_with_adapter
+from hetdesrun.adapters.exceptions import (
+    AdapterHandlingException,
+    MultipleAdaptersHandlingError,
+)
 from hetdesrun.models.data_selection import FilteredSink, FilteredSource
+from hetdesrun.models.run import PerformanceMeasuredStep
 from hetdesrun.models.wiring import WorkflowWiring
+from hetdesrun.webservice.config import get_config
+
+T = TypeVar("T")
+
+
+async def run_per_adapter_concurrently(
+    handle_funcs_by_adapter_key: dict[str | int, Callable[[], Awaitable[T]]],
+    measured_steps_by_adapter: dict[str, PerformanceMeasuredStep] | None = None,
+) -> dict[str | int, T]:
+    """Run the handling coroutines of several adapters concurrently
+
+    At most hd_adapters_concurrency_limit adapters are handled at the same time.
+    The handling of every adapter, also of failing ones, is measured and the
+    measured steps are written to measured_steps_by_adapter if provided.
+
+    All adapters are handled to completion, even if some of them fail, since
+    stopping e.g. half-way through sending data is not desirable. Afterwards
+    an exception of a single failing adapter is reraised as is, while exceptions
+    of more than one failing adapter are collected in a
+    MultipleAdaptersHandlingError attributing them to their adapter keys.
+    """
+    semaphore = asyncio.Semaphore(get_config().hd_adapters_concurrency_limit)
+
+    async def limited(
+        adapter_key: str | int, handle_func: Callable[[], Awaitable[T]]
+    ) -> T:
+        async with semaphore:
+            measured_step = PerformanceMeasuredStep.create_and_begin(str(adapter_key))
+            try:
+                return await handle_func()
+            finally:
+                # failing adapters are measured as well
+                measured_step.stop()
+                if measured_steps_by_adapter is not None:
+                    measured_steps_by_adapter[str(adapter_key)] = measured_step
+
+    results = await asyncio.gather(
+        *(
+            limited(adapter_key, handle_func)
+            for adapter_key, handle_func in handle_funcs_by_adapter_key.items()
+        ),
+        return_exceptions=True,
+    )
+
+    results_by_adapter_key = dict(
+        zip(handle_funcs_by_adapter_key.keys(), results, strict=True)
+    )
+
+    exceptions_by_adapter_key = {
+        adapter_key: result
+        for adapter_key, result in results_by_adapter_key.items()
+        if isinstance(result, BaseException)
+    }
+
+    for exc in exceptions_by_adapter_key.values():
+        if not isinstance(exc, AdapterHandlingException):
+            # unexpected exceptions are propagated like before
+            raise exc
+
+    if len(exceptions_by_adapter_key) == 1:
+        raise next(iter(exceptions_by_adapter_key.values()))
+
+    if len(exceptions_by_adapter_key) > 1:
+        raise MultipleAdaptersHandlingError(
+            {
+                str(adapter_key): exc
+                for adapter_key, exc in exceptions_by_adapter_key.items()
+            }
+        )
+
+    return results_by_adapter_key  # type: ignore[return-value]
 
 
 async def resolve_and_load_data_from_wiring(
     workflow_wiring: WorkflowWiring,
+    measured_steps_by_adapter: dict[str, PerformanceMeasuredStep] | None = None,
 ) -> dict[str, Any]:
     """Loads data from sources and provides it as a dict with the workflow input names as keys
 
-    Data is loaded in batches per adapter.
+    Data is loaded in batches per adapter. Different adapters are loaded from
+    concurrently.
     """
 
     wirings_by_adapter = defaultdict(list)
@@ -20,12 +100,11 @@ async def resolve_and_load_data_from_wiring(
         if input_wiring.use_default_value is False:
             wirings_by_adapter[input_wiring.adapter_id].append(input_wiring)
 
-    loaded_data = {}
-
-    # data is loaded adapter-wise:
-    for adapter_key, input_wirings_of_adapter in wirings_by_adapter.items():
+    def load_func(
+        adapter_key: str | int, input_wirings_of_adapter: list
+    ) -> Callable[[], Awaitable[dict]]:
         # call adapter with these wirings / sources
-        loaded_data_from_adapter: dict = await load_data_from_adapter(
+        return lambda: load_data_from_adapter(
             adapter_key,
             {
                 input_wiring.workflow_input_name: FilteredSource(
@@ -39,15 +118,31 @@ async def resolve_and_load_data_from_wiring(
             },
         )
 
+    # data is loaded adapter-wise:
+    loaded_data_by_adapter = await run_per_adapter_concurrently(
+        {
+            adapter_key: load_func(adapter_key, input_wirings_of_adapter)
+            for adapter_key, input_wirings_of_adapter in wirings_by_adapter.items()
+        },
+        measured_steps_by_adapter,
+    )
+
+    loaded_data = {}
+    for loaded_data_from_adapter in loaded_data_by_adapter.values():
         loaded_data.update(loaded_data_from_adapter)
     return loaded_data
 
 
 async def resolve_and_send_data_from_wiring(
-    workflow_wiring: WorkflowWiring, result_data: dict[str, Any]
+    workflow_wiring: WorkflowWiring,
+    result_data: dict[str, Any],
+    measured_steps_by_adapter: dict[str, PerformanceMeasuredStep] | None = None,
 ) -> dict[str, Any]:
     """Sends data to sinks
 
+    Data is sent in batches per adapter. Different adapters are sent to
+    concurrently.
+
     Data that is not send to a sink by the workflow wiring is returned.
     """
 
@@ -56,11 +151,11 @@ async def resolve_and_send_data_from_wiring(
     for output_wiring in workflow_wiring.output_wirings:
         wirings_by_adapter[output_wiring.adapter_id].append(output_wiring)
 
-    all_data_not_send_by_adapter = {}
-    # data is loaded adapter-wise:
-    for adapter_key, output_wirings_of_adapter in wirings_by_adapter.items():
-        # call adapter with these wirings / sources
-        data_not_send_by_adapter: dict[str, Any] | None = await send_data_with_adapter(
+    def send_func(
+        adapter_key: str | int, output_wirings_of_adapter: list
+    ) -> Callable[[], Awaitable[dict[str, Any] | None]]:
+        # call adapter with these wirings / sinks
+        return lambda: send_data_with_adapter(
             adapter_key,
             {
                 output_wiring.workflow_output_name: FilteredSink(
@@ -75,6 +170,17 @@ async def resolve_and_send_data_from_wiring(
             result_data,
         )
 
+    # data is sent adapter-wise:
+    data_not_send_by_adapter_key = await run_per_adapter_concurrently(
+        {
+            adapter_key: send_func(adapter_key, output_wirings_of_adapter)
+            for adapter_key, output_wirings_of_adapter in wirings_by_adapter.items()
+        },
+        measured_steps_by_adapter,
+    )
+
+    all_data_not_send_by_adapter = {}
+    for data_not_send_by_adapter in data_not_send_by_adapter_key.values():
         if data_not_send_by_adapter is not None:
             all_data_not_send_by_adapter.update(data_not_send_by_adapter)
     return all_data_not_send_by_adapter
@@ -20,7 +20,9 @@ async def send_data(
 ) -> Dict[str, Any]
 
 Notes:
-* You can provide both functions or coroutine functions (Awaitables)
+* You can provide both functions or coroutine functions (Awaitables). Functions are run in
+  a thread pool, so blocking IO in them does not block other executions. Coroutine functions
+  should use hetdesrun.adapters.execution.run_blocking_adapter_func for blocking IO.
 * The types returned by a loading function must comply with the the hetida designer data types.
   For example the adapter may return pandas Series objects (which can be used in SERIES inputs)
 * A send data function should return an empty dictionary. The option to return an actual data
@@ -106,6 +108,8 @@ csv_file_support_handler = FileSupportHandler(
     ],
     read_handler_func=load_csv,
     write_handler_func=write_csv,
+    # parsing is slow, so loaded DataFrames may be cached as Feather sidecar files
+    sidecar_cacheable=True,
 )
 
 register_file_support(csv_file_support_handler)
@@ -128,11 +132,17 @@ excel_file_support_handler = FileSupportHandler(
     ],
     read_handler_func=load_excel,
     write_handler_func=write_excel,
+    # parsing is slow, so loaded DataFrames may be cached as Feather sidecar files
+    sidecar_cacheable=True,
 )
 
 register_file_support(excel_file_support_handler)
 
-from hetdesrun.adapters.local_file.handlers.hdf import load_hdf, write_hdf  # noqa: E402
+from hetdesrun.adapters.local_file.handlers.hdf import (  # noqa: E402
+    hdf_filterable_columns,
+    load_hdf,
+    write_hdf,
+)
 
 hdf_file_support_handler = FileSupportHandler(
     associated_extensions=[
@@ -141,12 +151,14 @@ hdf_file_support_handler = FileSupportHandler(
     ],
     read_handler_func=load_hdf,
     write_handler_func=write_hdf,
+    filterable_columns_func=hdf_filterable_columns,
 )
 
 register_file_support(hdf_file_support_handler)
 
 from hetdesrun.adapters.local_file.handlers.parquet import (  # noqa: E402
     load_parquet,
+    parquet_filterable_columns,
     write_parquet,
 )
 
@@ -157,10 +169,30 @@ parquet_file_support_handler = FileSupportHandler(
     ],
     read_handler_func=load_parquet,
     write_handler_func=write_parquet,
+    filterable_columns_func=parquet_filterable_columns,
 )
 
 register_file_support(parquet_file_support_handler)
 
+from hetdesrun.adapters.local_file.handlers.parquet_dataset import (  # noqa: E402
+    load_parquet_dataset,
+    parquet_dataset_filterable_columns,
+    write_parquet_dataset,
+)
+
+parquet_dataset_file_support_handler = FileSupportHandler(
+    associated_extensions=[
+        # directories with this extension are appendable, partitioned Parquet datasets
+        ".parquet_dataset"
+    ],
+    read_handler_func=load_parquet_dataset,
+    write_handler_func=write_parquet_dataset,
+    filterable_columns_func=parquet_dataset_filterable_columns,
+    is_directory=True,
+)
+
+register_file_support(parquet_dataset_file_support_handler)
+
 
 from hetdesrun.adapters.generic_rest.external_types import ExternalType  # noqa: E402
 from hetdesrun.adapters.local_file.handlers.pickle import (  # noqa: E402
@@ -5,6 +5,7 @@ import pytest
 from fastapi import FastAPI
 from httpx import AsyncClient
 
+from hetdesrun.adapters.blob_storage.listing_cache import invalidate_listing_cache
 from hetdesrun.adapters.blob_storage.models import (
     AdapterHierarchy,
     BlobStorageStructureSource,
@@ -13,6 +14,13 @@ from hetdesrun.adapters.blob_storage.models import (
 from hetdesrun.webservice.application import init_app
 
 
+@pytest.fixture(autouse=True)
+def _clean_listing_cache() -> Generator:
+    invalidate_listing_cache()
+    yield
+    invalidate_listing_cache()
+
+
 @pytest.fixture(scope="session")
 def mock_adapter_hierarchy_location_in_config() -> Generator:
     with mock.patch(
@@ -1,3 +1,4 @@
+import asyncio
 import pickle
 import struct
 from io import BytesIO
@@ -210,3 +211,42 @@ async def test_blob_storage_load_data_with_error() -> None:
             },
             adapter_key="blob-storage-adapter",
         )
+
+
+@pytest.mark.asyncio
+async def test_blob_storage_load_data_loads_sources_concurrently() -> None:
+    currently_loading = 0
+    max_loading = 0
+
+    async def load_blob_from_storage_mock(
+        thing_node_id: str, metadata_key: str, adapter_key: str
+    ) -> str:
+        nonlocal currently_loading, max_loading
+        currently_loading += 1
+        max_loading = max(max_loading, currently_loading)
+        await asyncio.sleep(0.05)
+        currently_loading -= 1
+        return metadata_key
+
+    with mock.patch(
+        "hetdesrun.adapters.blob_storage.load_blob.load_blob_from_storage",
+        new=load_blob_from_storage_mock,
+    ):
+        loaded_data = await load_data(
+            wf_input_name_to_filtered_source_mapping_dict={
+                input_name: FilteredSource(
+                    ref_id="i-ii/A",
+                    ref_id_type="SOURCE",
+                    ref_key=input_name + " - 2022-01-02 14:23:18+00:00",
+                    type="Any",
+                )
+                for input_name in ["a", "b", "c"]
+            },
+            adapter_key="blob-storage-adapter",
+        )
+
+    assert max_loading == 3
+    assert loaded_data == {
+        input_name: input_name + " - 2022-01-02 14:23:18+00:00"
+        for input_name in ["a", "b", "c"]
+    }
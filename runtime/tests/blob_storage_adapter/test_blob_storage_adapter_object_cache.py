@@ -0,0 +1,140 @@
+import os
+import pickle
+from collections.abc import Generator
+from unittest import mock
+
+import boto3
+import pytest
+from moto import mock_s3
+
+from hetdesrun.adapters.blob_storage.config import get_blob_adapter_config
+from hetdesrun.adapters.blob_storage.exceptions import AdapterConnectionError
+from hetdesrun.adapters.blob_storage.load_blob import (
+    get_object,
+    load_object_from_storage,
+    opened_object,
+)
+from hetdesrun.adapters.blob_storage.models import ObjectKey
+from hetdesrun.adapters.blob_storage.object_cache import (
+    CACHE_FILE_SUFFIX,
+    get_object_cache,
+)
+
+OBJECT_KEY_STRING = (
+    "A_2022-01-02T14:23:18+00:00_4ec1c6fd-03cc-4c21-8a74-23f3dd841a1f.pkl"
+)
+
+
+@pytest.fixture()
+def s3_client_with_object() -> Generator:
+    with mock_s3():
+        client_mock = boto3.client("s3", region_name="us-east-1")
+        client_mock.create_bucket(Bucket="i-ii")
+        client_mock.put_object(
+            Bucket="i-ii", Key=OBJECT_KEY_STRING, Body=pickle.dumps({"a": [1, 2]})
+        )
+        yield client_mock
+    get_object_cache().clear_objects()
+
+
+def cached_file_names(cache_dir: str) -> list[str]:
+    return [
+        file_name
+        for file_name in os.listdir(cache_dir)
+        if file_name.endswith(CACHE_FILE_SUFFIX)
+    ]
+
+
+def test_blob_storage_object_cache_on_disk(s3_client_with_object, tmp_path) -> None:
+    cache_dir = str(tmp_path / "object_cache")
+    with mock.patch.object(
+        get_blob_adapter_config(), "object_cache_dir", cache_dir
+    ), mock.patch(
+        "hetdesrun.adapters.blob_storage.load_blob.get_object",
+        wraps=get_object,
+    ) as mocked_get_object:
+        for _ in range(2):
+            assert load_object_from_storage(
+                s3_client=s3_client_with_object,
+                bucket_name="i-ii",
+                object_key=ObjectKey.from_string(OBJECT_KEY_STRING),
+            ) == {"a": [1, 2]}
+        assert len(cached_file_names(cache_dir)) == 1
+        assert mocked_get_object.call_count == 1
+
+        # changed objects have another ETag, hence they are downloaded again
+        s3_client_with_object.put_object(
+            Bucket="i-ii", Key=OBJECT_KEY_STRING, Body=pickle.dumps({"a": [3]})
+        )
+        assert load_object_from_storage(
+            s3_client=s3_client_with_object,
+            bucket_name="i-ii",
+            object_key=ObjectKey.from_string(OBJECT_KEY_STRING),
+        ) == {"a": [3]}
+        assert len(cached_file_names(cache_dir)) == 2
+        assert mocked_get_object.call_count == 2
+
+
+def test_blob_storage_object_cache_in_memory(s3_client_with_object) -> None:
+    with mock.patch.object(
+        get_blob_adapter_config(), "object_cache_max_objects", 1
+    ), mock.patch(
+        "hetdesrun.adapters.blob_storage.load_blob.pickle.load",
+        wraps=pickle.load,
+    ) as mocked_pickle_load:
+        loaded_objects = [
+            load_object_from_storage(
+                s3_client=s3_client_with_object,
+                bucket_name="i-ii",
+                object_key=ObjectKey.from_string(OBJECT_KEY_STRING),
+            )
+            for _ in range(2)
+        ]
+        assert loaded_objects[0] == {"a": [1, 2]}
+        assert loaded_objects[1] is loaded_objects[0]
+        assert mocked_pickle_load.call_count == 1
+
+        with pytest.raises(AdapterConnectionError, match="contains no object"):
+            load_object_from_storage(
+                s3_client=s3_client_with_object,
+                bucket_name="i-ii",
+                object_key=ObjectKey.from_string(
+                    OBJECT_KEY_STRING.replace("4ec1c6fd", "5ec1c6fd")
+                ),
+            )
+
+
+def test_blob_storage_object_cache_object_changed_while_loading(
+    s3_client_with_object, tmp_path
+) -> None:
+    cache_dir = str(tmp_path / "object_cache")
+    outdated_etag = s3_client_with_object.head_object(
+        Bucket="i-ii", Key=OBJECT_KEY_STRING
+    )["ETag"]
+    s3_client_with_object.put_object(
+        Bucket="i-ii", Key=OBJECT_KEY_STRING, Body=pickle.dumps({"a": [3]})
+    )
+    with mock.patch.object(
+        get_blob_adapter_config(), "object_cache_dir", cache_dir
+    ), pytest.raises(
+        AdapterConnectionError, match="changed while loading"
+    ), opened_object(
+        s3_client=s3_client_with_object,
+        bucket_name="i-ii",
+        object_key_string=OBJECT_KEY_STRING,
+        etag=outdated_etag,
+    ):
+        pass
+    assert not os.path.exists(cache_dir)
+
+
+def test_blob_storage_streamed_object_closed_on_errors() -> None:
+    body = mock.Mock()
+    with mock.patch(
+        "hetdesrun.adapters.blob_storage.load_blob.get_object",
+        return_value={"Body": body},
+    ), pytest.raises(ValueError, match="unpickling failed"), opened_object(
+        s3_client=mock.Mock(), bucket_name="i-ii", object_key_string="key"
+    ):
+        raise ValueError("unpickling failed")
+    body.close.assert_called_once()
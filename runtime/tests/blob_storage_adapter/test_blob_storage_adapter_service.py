@@ -119,3 +119,26 @@ async def test_blob_storage_service_get_object_key_strings_in_bucket() -> None:
                 BucketName("bucket-with-objects-name")
             )
             assert object_key_string_list == ["key"]
+
+
+@pytest.mark.asyncio
+async def test_blob_storage_service_get_object_key_strings_in_bucket_paginated() -> None:
+    with mock_s3():
+        client_mock = boto3.client("s3", region_name="eu-central-1")
+        client_mock.create_bucket(
+            Bucket="bucket-with-many-objects-name",
+            CreateBucketConfiguration={"LocationConstraint": "eu-central-1"},
+        )
+        for i in range(1005):
+            client_mock.put_object(
+                Bucket="bucket-with-many-objects-name", Key=f"key{i:04d}"
+            )
+        with mock.patch(
+            "hetdesrun.adapters.blob_storage.service.get_s3_client",
+            return_value=client_mock,
+        ):
+            object_key_string_list = await get_object_key_strings_in_bucket(
+                BucketName("bucket-with-many-objects-name")
+            )
+        # a single list_objects_v2 response contains at most 1000 keys
+        assert object_key_string_list == [f"key{i:04d}" for i in range(1005)]
@@ -5,9 +5,11 @@ import pytest
 from hetdesrun.adapters.blob_storage.exceptions import (
     StructureObjectNotFound,
 )
+from hetdesrun.adapters.blob_storage.listing_cache import invalidate_listing_cache
 from hetdesrun.adapters.blob_storage.models import (
     AdapterHierarchy,
     BlobStorageStructureSource,
+    BucketName,
     HierarchyNode,
     IdString,
     StructureBucket,
@@ -420,3 +422,41 @@ def test_blob_storage_get_sink_by_thing_node_id_and_metadata_key() -> None:
             get_sink_by_thing_node_id_and_metadata_key(
                 thing_node_id=IdString("i-i/B"), metadata_key="A - Next Object"
             )
+
+
+@pytest.mark.asyncio
+async def test_blob_storage_source_lookups_use_cached_listing() -> None:
+    with mock.patch(
+        "hetdesrun.adapters.blob_storage.structure.get_adapter_structure",
+        return_value=AdapterHierarchy.from_file(
+            "tests/data/blob_storage/blob_storage_adapter_hierarchy.json"
+        ),
+    ), mock.patch(
+        "hetdesrun.adapters.blob_storage.structure.get_object_key_strings_in_bucket",
+        new=mock.AsyncMock(wraps=mocked_get_oks_in_bucket),
+    ) as mocked_get_oks:
+        assert len(await get_sources_by_parent_id(IdString("i-i/A"))) == 2
+        assert len(await get_sources_by_parent_id(IdString("i-i/B"))) == 0
+        await get_source_by_id(
+            IdString(
+                "i-i/A_2022-01-02T14:23:18+00:00_4ec1c6fd-03cc-4c21-8a74-23f3dd841a1f.pkl"
+            )
+        )
+        await get_source_by_thing_node_id_and_metadata_key(
+            IdString("i-i/A"),
+            "A - 2022-01-02 14:57:31+00:00 - 0788f303-61ce-47a9-b5f9-ec7b0de3be43 (pkl)",
+        )
+        assert mocked_get_oks.await_count == 1
+
+        invalidate_listing_cache(BucketName("i-i"))
+        assert len(await get_sources_by_parent_id(IdString("i-i/A"))) == 2
+        assert mocked_get_oks.await_count == 2
+
+        with mock.patch(
+            "hetdesrun.adapters.blob_storage.structure.get_blob_adapter_config",
+            return_value=mock.Mock(listing_cache_ttl=None),
+        ):
+            invalidate_listing_cache()
+            await get_sources_by_parent_id(IdString("i-i/A"))
+            await get_sources_by_parent_id(IdString("i-i/A"))
+        assert mocked_get_oks.await_count == 4
@@ -5,14 +5,21 @@ from uuid import UUID
 
 import boto3
 import joblib
+import numpy as np
 import pytest
 from botocore.exceptions import ClientError
 from moto import mock_s3
 
+from hetdesrun.adapters.blob_storage.config import get_blob_adapter_config
 from hetdesrun.adapters.blob_storage.exceptions import (
     AdapterConnectionError,
     StructureObjectNotFound,
 )
+from hetdesrun.adapters.blob_storage.listing_cache import (
+    BucketListing,
+    get_listing_cache,
+)
+from hetdesrun.adapters.blob_storage.load_blob import load_object_from_storage
 from hetdesrun.adapters.blob_storage.models import (
     AdapterHierarchy,
     BlobStorageStructureSink,
@@ -188,12 +195,15 @@ async def test_blob_storage_write_blob_to_storage_works() -> None:
                 )
             },
         ):
+            get_listing_cache().store(BucketName(bucket_name), BucketListing([]), 60)
             await write_blob_to_storage(
                 data=struct.pack(">i", 42),
                 thing_node_id="i-ii/E",
                 metadata_key="E - Next Object",
                 filters={},
             )
+            # the cached listing without the new object is invalidated
+            assert get_listing_cache().get(BucketName(bucket_name)) is None
 
             object_summaries_response = client_mock.list_objects_v2(Bucket=bucket_name)
             assert object_summaries_response["KeyCount"] == 1
@@ -557,3 +567,110 @@ async def test_blob_storage_send_data_with_invalid_wiring_error() -> None:
             wf_output_name_to_value_mapping_dict={"output_name": data},
             adapter_key="blob-storage-adapter",
         )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("checksum_algorithm", ["SHA1", "SHA256", "CRC32", ""])
+async def test_blob_storage_write_blob_to_storage_with_multipart_upload(
+    checksum_algorithm: str,
+) -> None:
+    data = np.arange(1_400_000, dtype=np.float64)  # more than two parts of 5 MiB
+    with mock_s3():
+        client_mock = boto3.client("s3", region_name="us-east-1")
+        bucket_name = "i-ii"
+        client_mock.create_bucket(Bucket=bucket_name)
+        with mock.patch(
+            "hetdesrun.adapters.blob_storage.write_blob.get_s3_client",
+            return_value=client_mock,
+        ), mock.patch(
+            "hetdesrun.adapters.blob_storage.write_blob.get_sink_by_thing_node_id_and_metadata_key",
+            return_value=BlobStorageStructureSink(
+                id="i-ii/E_generic_sink",
+                thingNodeId="i-ii/E",
+                name="E - Next Object",
+                path="i-ii/E",
+                metadataKey="E - Next Object",
+            ),
+        ), mock.patch(
+            "hetdesrun.adapters.blob_storage.write_blob._get_job_id_context",
+            return_value={
+                "currently_executed_job_id": UUID(
+                    "8c71d5e1-dbf7-4a18-9c94-930a51f0bdf4"
+                )
+            },
+        ), mock.patch.object(
+            get_blob_adapter_config(), "multipart_part_size", 5 * 1024 * 1024
+        ), mock.patch.object(
+            get_blob_adapter_config(), "checksum_algorithm", checksum_algorithm
+        ):
+            await write_blob_to_storage(
+                data=data,
+                thing_node_id="i-ii/E",
+                metadata_key="E - Next Object",
+                filters={},
+            )
+
+            object_summaries_response = client_mock.list_objects_v2(Bucket=bucket_name)
+            assert object_summaries_response["KeyCount"] == 1
+            object_key_string = object_summaries_response["Contents"][0]["Key"]
+            # ETags of objects written with multipart uploads end with the part count
+            assert client_mock.head_object(Bucket=bucket_name, Key=object_key_string)[
+                "ETag"
+            ].endswith('-3"')
+
+            loaded_data = load_object_from_storage(
+                s3_client=client_mock,
+                bucket_name=bucket_name,
+                object_key=ObjectKey.from_string(object_key_string),
+            )
+            assert np.array_equal(loaded_data, data)
+
+
+@pytest.mark.asyncio
+async def test_blob_storage_write_blob_to_storage_aborts_failed_multipart_upload() -> (
+    None
+):
+    with mock_s3():
+        client_mock = boto3.client("s3", region_name="us-east-1")
+        bucket_name = "i-ii"
+        client_mock.create_bucket(Bucket=bucket_name)
+        with mock.patch(
+            "hetdesrun.adapters.blob_storage.write_blob.get_s3_client",
+            return_value=client_mock,
+        ), mock.patch(
+            "hetdesrun.adapters.blob_storage.write_blob.get_sink_by_thing_node_id_and_metadata_key",
+            return_value=BlobStorageStructureSink(
+                id="i-ii/E_generic_sink",
+                thingNodeId="i-ii/E",
+                name="E - Next Object",
+                path="i-ii/E",
+                metadataKey="E - Next Object",
+            ),
+        ), mock.patch(
+            "hetdesrun.adapters.blob_storage.write_blob._get_job_id_context",
+            return_value={
+                "currently_executed_job_id": UUID(
+                    "8c71d5e1-dbf7-4a18-9c94-930a51f0bdf4"
+                )
+            },
+        ), mock.patch.object(
+            get_blob_adapter_config(), "multipart_part_size", 5 * 1024 * 1024
+        ), mock.patch.object(
+            client_mock,
+            "complete_multipart_upload",
+            side_effect=ClientError(
+                error_response={"Error": {"Code": "InvalidPart"}},
+                operation_name="CompleteMultipartUpload",
+            ),
+        ), pytest.raises(
+            AdapterConnectionError, match="ClientError occured for multipart upload"
+        ):
+            await write_blob_to_storage(
+                data=np.zeros(1_000_000),
+                thing_node_id="i-ii/E",
+                metadata_key="E - Next Object",
+                filters={},
+            )
+
+        assert client_mock.list_objects_v2(Bucket=bucket_name)["KeyCount"] == 0
+        assert "Uploads" not in client_mock.list_multipart_uploads(Bucket=bucket_name)
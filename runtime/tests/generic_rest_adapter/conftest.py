@@ -0,0 +1,37 @@
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from unittest import mock
+
+import httpx
+import pytest
+
+
+@pytest.fixture
+def framelike_stream_mock() -> Callable[..., mock.MagicMock]:
+    """Factory for mocks of httpx.AsyncClient.stream used for loading framelike data
+
+    The returned mock can be used to patch
+    hetdesrun.adapters.generic_rest.load_framelike.httpx.AsyncClient.stream
+    and records the calls. Each call yields a response with the provided status
+    code, body text and headers, or raises the provided exception.
+    """
+
+    def create_stream_mock(
+        status_code: int = 200,
+        text: str = "",
+        headers: dict[str, str] | None = None,
+        exception: Exception | None = None,
+    ) -> mock.MagicMock:
+        @asynccontextmanager
+        async def stream(
+            *args, **kwargs
+        ) -> AsyncIterator[httpx.Response]:  # noqa: ARG001
+            if exception is not None:
+                raise exception
+            yield httpx.Response(
+                status_code, headers=headers or {}, content=text.encode("utf8")
+            )
+
+        return mock.MagicMock(side_effect=stream)
+
+    return create_stream_mock
@@ -1,4 +1,3 @@
-import io
 from unittest import mock
 
 import pandas as pd
@@ -107,24 +106,23 @@ async def mock_load_generic_rest_dataframe_with_timestamp_col(*args, **kwargs):
 
 
 @pytest.mark.asyncio
-async def test_end_to_end_load_dataframe_data_with_timestamp_column():
-    resp_mock = mock.Mock()
-    resp_mock.status_code = 200
-    resp_mock.raw = io.StringIO(
-        """\n
+async def test_end_to_end_load_dataframe_data_with_timestamp_column(
+    framelike_stream_mock,
+):
+    stream_mock = framelike_stream_mock(
+        text="""\n
         {"timestamp": "2020-03-11T13:45:18.194000000Z", "a": 42.3}
         {"timestamp": "2020-03-11T14:45:18.194000000Z", "a": 41.7}
         {"timestamp": "2020-03-11T15:45:18.194000000Z", "a": 15.89922333}
         """
     )
-    resp_mock.headers = {}
     with mock.patch(  # noqa: SIM117
         "hetdesrun.adapters.generic_rest.load_framelike.get_generic_rest_adapter_base_url",
         return_value="https://hetida.de",
     ):
         with mock.patch(
-            "hetdesrun.adapters.generic_rest.load_framelike.requests.Session.get",
-            return_value=resp_mock,
+            "hetdesrun.adapters.generic_rest.load_framelike.httpx.AsyncClient.stream",
+            new=stream_mock,
         ):
             loaded_data = await load_data(
                 {
@@ -140,25 +138,23 @@ async def test_end_to_end_load_dataframe_data_with_timestamp_column():
 
 
 @pytest.mark.asyncio
-async def test_end_to_end_load_dataframe_data_with_attrs():
-    resp_mock = mock.Mock()
-    resp_mock.status_code = 200
+async def test_end_to_end_load_dataframe_data_with_attrs(framelike_stream_mock):
     attributes = {"b": 2}
-    resp_mock.headers = {"Data-Attributes": encode_attributes(attributes)}
-    resp_mock.raw = io.StringIO(
-        """\n
+    stream_mock = framelike_stream_mock(
+        headers={"Data-Attributes": encode_attributes(attributes)},
+        text="""\n
         {"timestamp": "2020-03-11T13:45:18.194000000Z", "a": 42.3}
         {"timestamp": "2020-03-11T14:45:18.194000000Z", "a": 41.7}
         {"timestamp": "2020-03-11T15:45:18.194000000Z", "a": 15.89922333}
-        """
+        """,
     )
     with mock.patch(  # noqa: SIM117
         "hetdesrun.adapters.generic_rest.load_framelike.get_generic_rest_adapter_base_url",
         return_value="https://hetida.de",
     ):
         with mock.patch(
-            "hetdesrun.adapters.generic_rest.load_framelike.requests.Session.get",
-            return_value=resp_mock,
+            "hetdesrun.adapters.generic_rest.load_framelike.httpx.AsyncClient.stream",
+            new=stream_mock,
         ):
             loaded_data = await load_data(
                 {
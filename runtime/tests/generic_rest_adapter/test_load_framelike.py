@@ -0,0 +1,196 @@
+import asyncio
+import gzip
+from contextlib import asynccontextmanager
+from functools import partial
+from unittest import mock
+
+import httpx
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from hetdesrun.adapters.generic_rest.arrow_format import ARROW_STREAM_MEDIA_TYPE
+from hetdesrun.adapters.generic_rest.config import (
+    GenericRestAdapterOptions,
+    generic_rest_adapter_config,
+)
+from hetdesrun.adapters.generic_rest.load_framelike import (
+    load_framelike_data,
+    read_ndjson_stream,
+)
+from hetdesrun.models.data_selection import FilteredSource
+
+ndjson_lines = [
+    '{"timestamp": "2020-03-11T13:45:18.194000000Z", "a": 1, "b": "x"}\n',
+    '{"timestamp": "2020-03-11T14:45:18.194000000Z", "a": 2, "b": "y"}\n',
+    '{"timestamp": "2020-03-11T15:45:18.194000000Z", "a": 3.5, "b": "z"}\n',
+]
+
+
+async def chunks_of(data: bytes, chunk_size: int):
+    for pos in range(0, len(data), chunk_size):
+        yield data[pos : pos + chunk_size]
+
+
+@pytest.mark.asyncio
+async def test_read_ndjson_stream_in_batches():
+    data = "".join(ndjson_lines).encode("utf8")
+
+    df_single_batch = await read_ndjson_stream(chunks_of(data, 7))
+    # tiny batch size: every line is parsed on its own
+    df_multiple_batches = await read_ndjson_stream(chunks_of(data, 7), batch_size=10)
+
+    pd.testing.assert_frame_equal(df_single_batch, df_multiple_batches)
+    assert df_multiple_batches.shape == (3, 3)
+    assert df_multiple_batches["a"].to_list() == [1.0, 2.0, 3.5]
+    assert isinstance(df_multiple_batches["timestamp"].dtype, pd.DatetimeTZDtype)
+
+    # last line without line break
+    df = await read_ndjson_stream(chunks_of(data.rstrip(), 5), batch_size=10)
+    assert df.shape == (3, 3)
+
+    empty_df = await read_ndjson_stream(chunks_of(b"\n  \n", 1), batch_size=1)
+    assert empty_df.shape == (0, 0)
+
+
+@pytest.mark.asyncio
+async def test_load_framelike_data_concurrent_downloads_overlap():
+    both_streams_started = asyncio.Barrier(2)
+
+    @asynccontextmanager
+    async def stream(*args, **kwargs):  # noqa: ARG001
+        async def body():
+            yield ndjson_lines[0].encode("utf8")
+            # only passes if the other download is in progress at the same time
+            await asyncio.wait_for(both_streams_started.wait(), timeout=5)
+            yield ndjson_lines[1].encode("utf8")
+
+        yield httpx.Response(200, content=body())
+
+    with mock.patch(
+        "hetdesrun.adapters.generic_rest.load_framelike.get_generic_rest_adapter_base_url",
+        return_value="https://hetida.de",
+    ), mock.patch(
+        "hetdesrun.adapters.generic_rest.load_framelike.httpx.AsyncClient.stream",
+        new=mock.MagicMock(side_effect=stream),
+    ):
+        dfs = await asyncio.gather(
+            *(
+                load_framelike_data(
+                    [FilteredSource(ref_id=ref_id, type="dataframe")],
+                    additional_params=[],
+                    adapter_key="test_concurrent_framelike_loading",
+                    endpoint="dataframe",
+                )
+                for ref_id in ("id_1", "id_2")
+            )
+        )
+
+    assert all(df.shape == (2, 3) for df in dfs)
+
+
+@pytest.mark.asyncio
+async def test_load_framelike_data_decodes_gzip_responses():
+    received_requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        received_requests.append(request)
+        return httpx.Response(
+            200,
+            content=gzip.compress("".join(ndjson_lines).encode("utf8")),
+            headers={"Content-Encoding": "gzip"},
+        )
+
+    transport = httpx.MockTransport(handler)
+
+    with mock.patch(
+        "hetdesrun.adapters.generic_rest.load_framelike.get_generic_rest_adapter_base_url",
+        return_value="https://hetida.de",
+    ), mock.patch(
+        "hetdesrun.adapters.generic_rest.load_framelike.httpx.AsyncClient",
+        new=partial(httpx.AsyncClient, transport=transport),
+    ):
+        df = await load_framelike_data(
+            [FilteredSource(ref_id="id_1", type="dataframe")],
+            additional_params=[],
+            adapter_key="test_gzip_framelike_loading",
+            endpoint="dataframe",
+        )
+
+    assert "gzip" in received_requests[0].headers["Accept-Encoding"]
+    assert df.shape == (3, 3)
+    assert df["b"].to_list() == ["x", "y", "z"]
+
+
+@pytest.mark.asyncio
+async def test_load_framelike_data_negotiates_arrow_stream_format():
+    arrow_df = pd.DataFrame(
+        {
+            "timestamp": pd.to_datetime(
+                ["2020-03-11T13:45:18.194Z", "2020-03-11T14:45:18.194Z"], utc=True
+            ),
+            "a": [1, 2],
+            "b": ["x", "y"],
+        }
+    )
+    sink = pa.BufferOutputStream()
+    table = pa.Table.from_pandas(arrow_df, preserve_index=False)
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    arrow_stream_bytes = sink.getvalue().to_pybytes()
+
+    adapter_answers_arrow = True
+    received_requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        received_requests.append(request)
+        if adapter_answers_arrow:
+            return httpx.Response(
+                200,
+                content=arrow_stream_bytes,
+                headers={"Content-Type": ARROW_STREAM_MEDIA_TYPE},
+            )
+        return httpx.Response(
+            200,
+            content="".join(ndjson_lines).encode("utf8"),
+            headers={"Content-Type": "application/x-ndjson"},
+        )
+
+    transport = httpx.MockTransport(handler)
+    adapter_key = "test_arrow_framelike_loading"
+
+    with mock.patch(
+        "hetdesrun.adapters.generic_rest.load_framelike.get_generic_rest_adapter_base_url",
+        return_value="https://hetida.de",
+    ), mock.patch(
+        "hetdesrun.adapters.generic_rest.load_framelike.httpx.AsyncClient",
+        new=partial(httpx.AsyncClient, transport=transport),
+    ), mock.patch.object(
+        generic_rest_adapter_config,
+        "adapter_options",
+        {adapter_key: GenericRestAdapterOptions(arrow_format=True)},
+    ):
+        df = await load_framelike_data(
+            [FilteredSource(ref_id="id_1", type="dataframe")],
+            additional_params=[],
+            adapter_key=adapter_key,
+            endpoint="dataframe",
+        )
+        assert (
+            received_requests[0].headers["Accept"].startswith(ARROW_STREAM_MEDIA_TYPE)
+        )
+        assert df["a"].to_list() == [1, 2]
+        assert df["b"].to_list() == ["x", "y"]
+        pd.testing.assert_index_equal(
+            df.index, pd.DatetimeIndex(arrow_df["timestamp"], name="timestamp")
+        )
+
+        # fallback for adapters which do not support the arrow format
+        adapter_answers_arrow = False
+        df = await load_framelike_data(
+            [FilteredSource(ref_id="id_1", type="dataframe")],
+            additional_params=[],
+            adapter_key=adapter_key,
+            endpoint="dataframe",
+        )
+        assert df["b"].to_list() == ["x", "y", "z"]
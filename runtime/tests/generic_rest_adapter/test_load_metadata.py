@@ -1,3 +1,4 @@
+from functools import partial
 from typing import Any
 from unittest import mock
 
@@ -9,8 +10,15 @@ from hetdesrun.adapters.exceptions import (
     AdapterHandlingException,
 )
 from hetdesrun.adapters.generic_rest import load_data
+from hetdesrun.adapters.generic_rest.config import (
+    GenericRestAdapterOptions,
+    generic_rest_adapter_config,
+)
 from hetdesrun.adapters.generic_rest.load_metadata import load_multiple_metadata
-from hetdesrun.models.data_selection import FilteredSource
+from hetdesrun.adapters.generic_rest.send_metadata import (
+    send_multiple_metadata_to_adapter,
+)
+from hetdesrun.models.data_selection import FilteredSink, FilteredSource
 from hetdesrun.webservice.auth_outgoing import ServiceAuthenticationError
 
 
@@ -302,3 +310,189 @@ async def test_end_to_end_load_metadata_with_exception():
             },
             adapter_key="end_to_end_only_dataframe_data",
         )
+
+
+def metadata_transport(
+    requested_urls: list[httpx.URL], batch_status_code: int = 200
+) -> httpx.MockTransport:
+    metadata = {
+        "Max Value": {"key": "Max Value", "value": 300.0, "dataType": "float"},
+        "Min Value": {"key": "Min Value", "value": -100.0, "dataType": "float"},
+        "Serial": {"key": "Serial", "value": 24567, "dataType": "int"},
+    }
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested_urls.append(request.url)
+        if request.url.path == "/sources/id_1/metadataBatch":
+            if batch_status_code != 200:
+                return httpx.Response(batch_status_code)
+            # Serial is only available via the single metadatum endpoint
+            return httpx.Response(
+                200,
+                json=[
+                    metadata[key]
+                    for key in request.url.params.get_list("key")
+                    if key != "Serial"
+                ],
+            )
+        key = request.url.path.rsplit("/", 1)[-1]
+        return httpx.Response(200, json=metadata[key])
+
+    return httpx.MockTransport(handler)
+
+
+def source_metadata(*keys_and_types: tuple[str, str]) -> dict[str, FilteredSource]:
+    return {
+        f"wf_input_{key}": FilteredSource(
+            ref_id="id_1",
+            ref_id_type="SOURCE",
+            ref_key=key,
+            type=f"metadata({data_type})",
+            filters={"unit": "C"},
+        )
+        for key, data_type in keys_and_types
+    }
+
+
+@pytest.mark.asyncio
+async def test_load_metadata_batch():
+    requested_urls: list[httpx.URL] = []
+    with mock.patch(
+        "hetdesrun.adapters.generic_rest.load_metadata.get_generic_rest_adapter_base_url",
+        return_value="https://hetida.de",
+    ), mock.patch(
+        "hetdesrun.webservice.http_clients.httpx.AsyncClient",
+        new=partial(httpx.AsyncClient, transport=metadata_transport(requested_urls)),
+    ):
+        loaded_metadata = await load_multiple_metadata(
+            source_metadata(("Max Value", "float"), ("Min Value", "float")),
+            adapter_key="test_load_metadata_batch_adapter_key",
+        )
+        assert loaded_metadata == {
+            "wf_input_Max Value": 300.0,
+            "wf_input_Min Value": -100.0,
+        }
+        assert len(requested_urls) == 1
+        assert requested_urls[0].path == "/sources/id_1/metadataBatch"
+        assert requested_urls[0].params.get_list("key") == ["Max Value", "Min Value"]
+        assert requested_urls[0].params["unit"] == "C"
+
+        # metadata missing in the batch response are requested individually
+        requested_urls.clear()
+        loaded_metadata = await load_multiple_metadata(
+            source_metadata(("Max Value", "float"), ("Serial", "int")),
+            adapter_key="test_load_metadata_batch_adapter_key",
+        )
+        assert loaded_metadata == {
+            "wf_input_Max Value": 300.0,
+            "wf_input_Serial": 24567,
+        }
+        assert [url.path for url in requested_urls] == [
+            "/sources/id_1/metadataBatch",
+            "/sources/id_1/metadata/Serial",
+        ]
+
+
+@pytest.mark.parametrize("batch_status_code", [404, 405, 501])
+@pytest.mark.asyncio
+async def test_load_metadata_batch_fallback_to_single_requests(batch_status_code):
+    requested_urls: list[httpx.URL] = []
+    with mock.patch(
+        "hetdesrun.adapters.generic_rest.load_metadata.get_generic_rest_adapter_base_url",
+        return_value="https://hetida.de",
+    ), mock.patch(
+        "hetdesrun.webservice.http_clients.httpx.AsyncClient",
+        new=partial(
+            httpx.AsyncClient,
+            transport=metadata_transport(
+                requested_urls, batch_status_code=batch_status_code
+            ),
+        ),
+    ):
+        for _ in range(2):
+            requested_urls.clear()
+            loaded_metadata = await load_multiple_metadata(
+                source_metadata(("Max Value", "float"), ("Min Value", "float")),
+                adapter_key=(
+                    "test_load_metadata_batch_fallback_adapter_key_"
+                    + str(batch_status_code)
+                ),
+            )
+            assert loaded_metadata == {
+                "wf_input_Max Value": 300.0,
+                "wf_input_Min Value": -100.0,
+            }
+
+        single_paths = [
+            "/sources/id_1/metadata/Max Value",
+            "/sources/id_1/metadata/Min Value",
+        ]
+        if batch_status_code == 404:
+            # may be an unknown ref id, so the batch endpoint is tried again
+            assert sorted(url.path for url in requested_urls) == [
+                *single_paths,
+                "/sources/id_1/metadataBatch",
+            ]
+        else:
+            # the batch endpoint is only tried once
+            assert sorted(url.path for url in requested_urls) == single_paths
+
+
+@pytest.mark.asyncio
+async def test_load_metadata_cache():
+    adapter_key = "test_load_metadata_cache_adapter_key"
+    requested_urls: list[httpx.URL] = []
+    with mock.patch(
+        "hetdesrun.adapters.generic_rest.load_metadata.get_generic_rest_adapter_base_url",
+        return_value="https://hetida.de",
+    ), mock.patch(
+        "hetdesrun.adapters.generic_rest.send_metadata.get_generic_rest_adapter_base_url",
+        return_value="https://hetida.de",
+    ), mock.patch(
+        "hetdesrun.webservice.http_clients.httpx.AsyncClient",
+        new=partial(httpx.AsyncClient, transport=metadata_transport(requested_urls)),
+    ), mock.patch.object(
+        generic_rest_adapter_config,
+        "adapter_options",
+        {adapter_key: GenericRestAdapterOptions(metadata_cache_ttl=60)},
+    ):
+        for _ in range(2):
+            loaded_metadata = await load_multiple_metadata(
+                source_metadata(("Serial", "int")), adapter_key=adapter_key
+            )
+            assert loaded_metadata == {"wf_input_Serial": 24567}
+        assert len(requested_urls) == 1
+
+        # other filters are cached separately
+        loaded_metadata = await load_multiple_metadata(
+            {
+                "wf_input": FilteredSource(
+                    ref_id="id_1",
+                    ref_id_type="SOURCE",
+                    ref_key="Serial",
+                    type="metadata(int)",
+                    filters={"unit": "F"},
+                )
+            },
+            adapter_key=adapter_key,
+        )
+        assert len(requested_urls) == 2
+
+        # sending the metadatum removes it from the cache
+        await send_multiple_metadata_to_adapter(
+            {
+                "wf_output": FilteredSink(
+                    ref_id="id_1",
+                    ref_id_type="SOURCE",
+                    ref_key="Serial",
+                    type="metadata(int)",
+                )
+            },
+            {"wf_output": 24567},
+            adapter_key=adapter_key,
+        )
+        requested_urls.clear()
+        loaded_metadata = await load_multiple_metadata(
+            source_metadata(("Serial", "int")), adapter_key=adapter_key
+        )
+        assert [url.path for url in requested_urls] == ["/sources/id_1/metadata/Serial"]
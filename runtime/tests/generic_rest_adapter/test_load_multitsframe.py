@@ -1,4 +1,3 @@
-import io
 from unittest import mock
 
 import pandas as pd
@@ -16,9 +15,10 @@ from hetdesrun.models.data_selection import FilteredSource
 
 
 @pytest.mark.asyncio
-async def test_load_single_multitsframe_from_adapter_end_to_end() -> None:
-    resp_mock = mock.Mock(
-        status_code=200,
+async def test_load_single_multitsframe_from_adapter_end_to_end(
+    framelike_stream_mock,
+) -> None:
+    stream_mock = framelike_stream_mock(
         headers={
             "Data-Attributes": encode_attributes(
                 {
@@ -27,8 +27,7 @@ async def test_load_single_multitsframe_from_adapter_end_to_end() -> None:
                 }
             )
         },
-        raw=io.StringIO(
-            """
+        text="""
         {"timestamp": "2019-08-01T15:45:36.000Z", "metric": "a", "value": 1.0}
         {"timestamp": "2019-08-01T15:45:37.000Z", "metric": "b", "value": 1.2}
         {"timestamp": "2019-08-01T15:45:37.000Z", "metric": "c", "value": 0.5}
@@ -38,16 +37,15 @@ async def test_load_single_multitsframe_from_adapter_end_to_end() -> None:
         {"timestamp": "2019-08-01T15:45:56.000Z", "metric": "a", "value": 1.5}
         {"timestamp": "2019-08-01T15:45:57.000Z", "metric": "b", "value": 1.7}
         {"timestamp": "2019-08-01T15:45:56.000Z", "metric": "c", "value": 0.1}
-        """
-        ),
+        """,
     )
     with mock.patch(  # noqa: SIM117
         "hetdesrun.adapters.generic_rest.load_framelike.get_generic_rest_adapter_base_url",
         return_value="https://hetida.de",
     ):
         with mock.patch(
-            "hetdesrun.adapters.generic_rest.load_framelike.requests.Session.get",
-            return_value=resp_mock,
+            "hetdesrun.adapters.generic_rest.load_framelike.httpx.AsyncClient.stream",
+            new=stream_mock,
         ):
             mtsf = await load_single_multitsframe_from_adapter(
                 FilteredSource(
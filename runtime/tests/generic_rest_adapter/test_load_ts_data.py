@@ -1,39 +1,43 @@
-import io
+import asyncio
 from unittest import mock
 
+import httpx
+import numpy as np
 import pandas as pd
 import pytest
-import requests
 
 from hetdesrun.adapters.exceptions import (
     AdapterClientWiringInvalidError,
     AdapterConnectionError,
+    AdapterHandlingException,
 )
 from hetdesrun.adapters.generic_rest import (
     load_data,
     load_grouped_timeseries_data_together,
 )
+from hetdesrun.adapters.generic_rest.config import (
+    GenericRestAdapterOptions,
+    generic_rest_adapter_config,
+)
 from hetdesrun.adapters.generic_rest.external_types import ExternalType
-from hetdesrun.adapters.generic_rest.load_ts_data import load_ts_data_from_adapter
+from hetdesrun.adapters.generic_rest.load_ts_data import (
+    load_ts_data_from_adapter,
+    split_channels_from_loaded_data,
+)
 from hetdesrun.models.data_selection import FilteredSource
 
 
 @pytest.mark.asyncio
-async def test_load_ts_adapter_request():
+async def test_load_ts_adapter_request(framelike_stream_mock):
     with mock.patch(
         "hetdesrun.adapters.generic_rest.load_framelike.get_generic_rest_adapter_base_url",
         return_value="https://hetida.de",
     ):
-        resp_mock = mock.Mock()
-        resp_mock.status_code = 200
-        resp_mock.raw = io.StringIO(
-            """\n
+        resp_text = """\n
             {"timeseriesId": "1", "timestamp": "2020-03-11T13:45:18.194000000Z", "value": 42.3}
             {"timeseriesId": "1", "timestamp": "2020-03-11T14:45:18.194000000Z", "value": 41.7}
             {"timeseriesId": "1", "timestamp": "2020-03-11T15:45:18.194000000Z", "value": 15.89922333}
             """
-        )
-        resp_mock.headers = {}
 
         filtered_sources = [
             FilteredSource(
@@ -54,8 +58,8 @@ async def test_load_ts_adapter_request():
             }
         )
         with mock.patch(
-            "hetdesrun.adapters.generic_rest.load_framelike.requests.Session.get",
-            return_value=resp_mock,
+            "hetdesrun.adapters.generic_rest.load_framelike.httpx.AsyncClient.stream",
+            new=framelike_stream_mock(text=resp_text),
         ) as get_request_mock:
             df = await load_ts_data_from_adapter(
                 filtered_sources,
@@ -74,19 +78,22 @@ async def test_load_ts_adapter_request():
             assert ("from", "2018-09-01T00:00:00Z") in kwargs["params"]
             assert ("to", "2020-01-01T00:00:00Z") in kwargs["params"]
 
-            resp_mock.status_code = 400
-            resp_mock.text = "my adapter error"
-            with pytest.raises(AdapterConnectionError, match="my adapter error"):
-                await load_ts_data_from_adapter(
-                    filtered_sources,
-                    filter_params=filter_params,
-                    adapter_key="test_load_ts_generic_adapter_key",
-                )
-
-            resp_mock.status_code = 404
-            resp_mock.text = "errorCode"
-            resp_mock.json = mock.Mock(return_value={"errorCode": "RESULT_EMPTY"})
+        with mock.patch(
+            "hetdesrun.adapters.generic_rest.load_framelike.httpx.AsyncClient.stream",
+            new=framelike_stream_mock(status_code=400, text="my adapter error"),
+        ), pytest.raises(AdapterConnectionError, match="my adapter error"):
+            await load_ts_data_from_adapter(
+                filtered_sources,
+                filter_params=filter_params,
+                adapter_key="test_load_ts_generic_adapter_key",
+            )
 
+        with mock.patch(
+            "hetdesrun.adapters.generic_rest.load_framelike.httpx.AsyncClient.stream",
+            new=framelike_stream_mock(
+                status_code=404, text='{"errorCode": "RESULT_EMPTY"}'
+            ),
+        ):
             df = await load_ts_data_from_adapter(
                 filtered_sources,
                 filter_params=filter_params,
@@ -95,8 +102,10 @@ async def test_load_ts_adapter_request():
 
             assert df.shape == (0, 3)
 
-            resp_mock.status_code = 200
-            resp_mock.raw = io.StringIO("")
+        with mock.patch(
+            "hetdesrun.adapters.generic_rest.load_framelike.httpx.AsyncClient.stream",
+            new=framelike_stream_mock(text=""),
+        ):
             df = await load_ts_data_from_adapter(
                 filtered_sources,
                 filter_params=filter_params,
@@ -368,14 +377,14 @@ async def test_end_to_end_load_empty_ts_data_with_attrs():
 
 
 @pytest.mark.asyncio
-async def test_end_to_end_load_ts_with_exception():
+async def test_end_to_end_load_ts_with_exception(framelike_stream_mock):
     with mock.patch(
         "hetdesrun.adapters.generic_rest.load_framelike.get_generic_rest_adapter_base_url",
         return_value="https://hetida.de",
     ):
         with mock.patch(
-            "hetdesrun.adapters.generic_rest.load_framelike.requests.Session.get",
-            return_value=mock.Mock(status_code=422, text="my adapter error"),
+            "hetdesrun.adapters.generic_rest.load_framelike.httpx.AsyncClient.stream",
+            new=framelike_stream_mock(status_code=422, text="my adapter error"),
         ), pytest.raises(AdapterConnectionError, match="my adapter error"):
             await load_data(
                 {
@@ -392,8 +401,8 @@ async def test_end_to_end_load_ts_with_exception():
             )
 
         with mock.patch(
-            "hetdesrun.adapters.generic_rest.load_framelike.requests.Session.get",
-            side_effect=requests.HTTPError("my http error"),
+            "hetdesrun.adapters.generic_rest.load_framelike.httpx.AsyncClient.stream",
+            new=framelike_stream_mock(exception=httpx.ConnectError("my http error")),
         ), pytest.raises(AdapterConnectionError, match="my http error"):
             await load_data(
                 {
@@ -408,3 +417,117 @@ async def test_end_to_end_load_ts_with_exception():
                 },
                 adapter_key="end_to_end_only_ts_data",
             )
+
+
+def test_split_channels_from_loaded_data_matches_masking_per_id():
+    rng = np.random.default_rng(42)
+    n_records = 1000
+    df = pd.DataFrame(
+        {
+            "timeseriesId": pd.Series(
+                rng.choice(["a", "b", "c", "d"], size=n_records), dtype="string"
+            ),
+            "timestamp": pd.Timestamp("2020-01-01T00:00:00Z")
+            + pd.to_timedelta(rng.permutation(n_records), unit="s"),
+            "value": rng.normal(size=n_records),
+        }
+    )
+    # channel "a" is sorted already, the others are not
+    df = pd.concat(
+        [
+            df[df["timeseriesId"] != "a"],
+            df[df["timeseriesId"] == "a"].sort_values("timestamp"),
+        ]
+    )
+    df.attrs = {"a": {"unit": "m"}, "b": {"unit": "s"}}
+
+    extracted = split_channels_from_loaded_data(
+        df, {"inp_a": "a", "inp_b": "b", "inp_b_2": "b", "inp_x": "x"}
+    )
+
+    assert set(extracted.keys()) == {"inp_a", "inp_b", "inp_b_2", "inp_x"}
+    for key, ts_id in [
+        ("inp_a", "a"),
+        ("inp_b", "b"),
+        ("inp_b_2", "b"),
+        ("inp_x", "x"),
+    ]:
+        masked_df = df[df["timeseriesId"] == ts_id].copy()
+        masked_df.index = masked_df["timestamp"]
+        expected = masked_df["value"].sort_index()
+        expected.name = ts_id
+        pd.testing.assert_series_equal(extracted[key], expected)
+        assert extracted[key].attrs == df.attrs.get(ts_id, {})
+
+    # Series of an id requested twice do not share data
+    assert not np.shares_memory(
+        extracted["inp_b"].to_numpy(), extracted["inp_b_2"].to_numpy()
+    )
+
+    with pytest.raises(AdapterHandlingException, match="Missing keys"):
+        split_channels_from_loaded_data(df.drop(columns="timeseriesId"), {"inp": "a"})
+
+
+@pytest.mark.asyncio
+async def test_load_ts_data_in_concurrent_time_windows():
+    requested_windows = []
+    currently_loading = 0
+    max_loading = 0
+
+    async def mocked_load_framelike_data(
+        filtered_sources, additional_params, adapter_key, endpoint
+    ):
+        nonlocal currently_loading, max_loading
+        currently_loading += 1
+        max_loading = max(max_loading, currently_loading)
+        params = dict(additional_params)
+        requested_windows.append((params["from"], params["to"]))
+        assert params["free"] == "text"
+        start = pd.Timestamp(params["from"])
+        # later windows finish first
+        await asyncio.sleep(0.01 * (10 - len(requested_windows)))
+        currently_loading -= 1
+        df = pd.DataFrame(
+            {
+                "timeseriesId": ["a", "a"],
+                "timestamp": [start, start + pd.Timedelta(hours=1)],
+                "value": [start.day, start.day + 0.5],
+            }
+        )
+        df.attrs = {"a": {"window": start.day}}
+        return df
+
+    with mock.patch(
+        "hetdesrun.adapters.generic_rest.load_ts_data.load_framelike_data",
+        new=mocked_load_framelike_data,
+    ), mock.patch.object(
+        generic_rest_adapter_config,
+        "adapter_options",
+        {
+            "windowed_adapter": GenericRestAdapterOptions(
+                timeseries_window_size="P1D", timeseries_window_concurrency=2
+            )
+        },
+    ):
+        df = await load_ts_data_from_adapter(
+            [FilteredSource(ref_id="a", type="timeseries(float)")],
+            [
+                ("free", "text"),
+                ("from", "2020-01-01T00:00:00Z"),
+                ("to", "2020-01-04T12:00:00Z"),
+            ],
+            adapter_key="windowed_adapter",
+        )
+
+    assert sorted(requested_windows) == [
+        ("2020-01-01T00:00:00Z", "2020-01-01T23:59:59.999999999Z"),
+        ("2020-01-02T00:00:00.000000000Z", "2020-01-02T23:59:59.999999999Z"),
+        ("2020-01-03T00:00:00.000000000Z", "2020-01-03T23:59:59.999999999Z"),
+        ("2020-01-04T00:00:00.000000000Z", "2020-01-04T12:00:00Z"),
+    ]
+    assert max_loading == 2
+    # concatenated in window order
+    assert list(df["value"]) == [1, 1.5, 2, 2.5, 3, 3.5, 4, 4.5]
+    assert df["timestamp"].is_monotonic_increasing
+    assert df["timeseriesId"].dtype == "string"
+    assert df.attrs == {"a": {"window": 4}}
@@ -1,3 +1,4 @@
+import json
 from unittest import mock
 
 import numpy as np
@@ -21,7 +22,7 @@ async def test_end_to_end_send_only_dataframe_data():
         return_value="https://hetida.de",
     ):
         with mock.patch(
-            "hetdesrun.adapters.generic_rest.send_dataframe.AsyncClient.post",
+            "hetdesrun.webservice.http_clients.httpx.AsyncClient.post",
             new=post_mock,
         ):
             # one frame
@@ -43,7 +44,7 @@ async def test_end_to_end_send_only_dataframe_data():
                 ("id", "sink_id_1"),
                 ("filter_key", "filter_value"),
             ]
-            assert kwargs["json"] == [
+            assert json.loads(b"".join(kwargs["content"].chunks())) == [
                 {"a": 1.2, "b": 2.9},
                 {"a": 3.4, "b": 8.7},
                 {"a": 5.9, "b": 2.2},
@@ -68,7 +69,7 @@ async def test_end_to_end_send_only_dataframe_data():
                 ("id", "sink_id_1"),
                 ("filter_key", "filter_value"),
             ]
-            assert kwargs["json"] == []
+            assert json.loads(b"".join(kwargs["content"].chunks())) == []
 
             # more than one frame
             await send_data(
@@ -92,8 +93,12 @@ async def test_end_to_end_send_only_dataframe_data():
             # note: can be async!
             func_name_1, args_1, kwargs_1 = post_mock.mock_calls[2]
             func_name_2, args_2, kwargs_2 = post_mock.mock_calls[3]
-            assert (len(kwargs_1["json"]) == 3) or (len(kwargs_2["json"]) == 3)
-            assert (len(kwargs_1["json"]) == 2) or (len(kwargs_2["json"]) == 2)
+            assert (len(json.loads(b"".join(kwargs_1["content"].chunks()))) == 3) or (
+                len(json.loads(b"".join(kwargs_2["content"].chunks()))) == 3
+            )
+            assert (len(json.loads(b"".join(kwargs_1["content"].chunks()))) == 2) or (
+                len(json.loads(b"".join(kwargs_2["content"].chunks()))) == 2
+            )
 
             # one dataframe frame with timestamps and attributes
             df = pd.DataFrame(
@@ -122,7 +127,7 @@ async def test_end_to_end_send_only_dataframe_data():
 
             func_name, args, kwargs = post_mock.mock_calls[4]
             assert kwargs["params"] == [("id", "sink_id_1")]
-            assert kwargs["json"] == [
+            assert json.loads(b"".join(kwargs["content"].chunks())) == [
                 {"a": 1.2, "b": 2.9, "timestamp": "2020-08-03T15:30:00+00:00"},
                 {"a": 3.4, "b": 8.7, "timestamp": "2020-12-01T07:15:00+00:00"},
                 {"a": 5.9, "b": 2.2, "timestamp": "2021-01-05T09:20:00+00:00"},
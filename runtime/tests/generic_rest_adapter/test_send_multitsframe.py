@@ -1,3 +1,4 @@
+import json
 from unittest import mock
 
 import numpy as np
@@ -8,6 +9,10 @@ from hetdesrun.adapters.exceptions import AdapterOutputDataError
 from hetdesrun.adapters.generic_rest import send_data
 from hetdesrun.adapters.generic_rest.external_types import ExternalType
 from hetdesrun.adapters.generic_rest.load_framelike import decode_attributes
+from hetdesrun.adapters.generic_rest.send_framelike import JsonRecordsStream
+from hetdesrun.adapters.generic_rest.send_multitsframe import (
+    multitsframe_to_json_rows_encoder,
+)
 from hetdesrun.models.data_selection import FilteredSink
 
 
@@ -19,7 +24,7 @@ async def test_end_to_end_send_only_multitsframe_data() -> None:
         "hetdesrun.adapters.generic_rest.send_framelike.get_generic_rest_adapter_base_url",
         return_value="https://hetida.de",
     ), mock.patch(
-        "hetdesrun.adapters.generic_rest.send_multitsframe.AsyncClient.post",
+        "hetdesrun.webservice.http_clients.httpx.AsyncClient.post",
         new=post_mock,
     ):
         mtsf_1 = pd.DataFrame(
@@ -84,7 +89,7 @@ async def test_end_to_end_send_only_multitsframe_data() -> None:
             ("id", "sink_id_1"),
             ("filter_key_1", "filter_value_1"),
         ]
-        assert kwargs_1["json"] == [
+        assert json.loads(b"".join(kwargs_1["content"].chunks())) == [
             {
                 "timestamp": "2019-08-01T15:45:36.000000000Z",
                 "metric": "a",
@@ -141,7 +146,7 @@ async def test_end_to_end_send_only_multitsframe_data() -> None:
             ("id", "sink_id_2"),
             ("filter_key_2", "filter_value_2"),
         ]
-        assert kwargs_2["json"] == [
+        assert json.loads(b"".join(kwargs_2["content"].chunks())) == [
             {
                 "timestamp": "2019-08-01T15:45:36.000000000Z",
                 "metric": "a",
@@ -180,7 +185,7 @@ async def test_end_to_end_send_only_multitsframe_data() -> None:
             ("id", "sink_id_3"),
             ("filter_key_3", "filter_value_3"),
         ]
-        assert kwargs_3["json"] == []
+        assert json.loads(b"".join(kwargs_3["content"].chunks())) == []
 
         no_mtsf = pd.Series([1.0], index=pd.to_datetime(["2019-08-01T15:45:36Z"]))
         with pytest.raises(
@@ -259,3 +264,59 @@ async def test_end_to_end_send_only_multitsframe_data() -> None:
                 {"outp_9": mtsf_9},
                 adapter_key="test_end_to_end_send_only_multitsframe_data",
             )
+
+
+def test_multitsframe_to_json_records_is_byte_compatible() -> None:
+    mtsf = pd.DataFrame(
+        {
+            "value": [1.0, np.nan, 0.5, 1e-7],
+            "metric": ["a", "b", 'c "quoted"', "ä"],
+            "timestamp": pd.to_datetime(
+                [
+                    "2019-08-01T15:45:36.000Z",
+                    "2019-08-01T15:45:37.000001Z",
+                    "2019-08-01T15:45:37.123456789Z",
+                    "2019-08-01T15:45:46Z",
+                ],
+                format="ISO8601",
+            ),
+        }
+    )
+
+    legacy_df = mtsf.replace({np.nan: None})
+    legacy_df["timestamp"] = legacy_df["timestamp"].apply(
+        lambda x: x.strftime("%Y-%m-%dT%H:%M:%S.%f") + f"{x.nanosecond:03d}" + "Z"
+    )
+
+    assert b"".join(
+        JsonRecordsStream(
+            multitsframe_to_json_rows_encoder(mtsf), 0, len(mtsf), batch_size=3
+        ).chunks()
+    ) == json.dumps(legacy_df.to_dict(orient="records")).encode("utf-8")
+
+
+def test_multitsframe_with_numpy_scalar_values_is_byte_compatible() -> None:
+    mtsf = pd.DataFrame(
+        {
+            "value": pd.Series(
+                [np.int64(1), np.float64(2.5), np.bool_(True), "text", None],
+                dtype=object,
+            ),
+            "metric": ["a", "b", "c", "d", "e"],
+            "timestamp": pd.to_datetime(
+                ["2019-08-01T15:45:36.000Z"] * 5,
+                format="ISO8601",
+            ),
+        }
+    )
+
+    legacy_df = mtsf.replace({np.nan: None})
+    legacy_df["timestamp"] = legacy_df["timestamp"].apply(
+        lambda x: x.strftime("%Y-%m-%dT%H:%M:%S.%f") + f"{x.nanosecond:03d}" + "Z"
+    )
+
+    assert b"".join(
+        JsonRecordsStream(
+            multitsframe_to_json_rows_encoder(mtsf), 0, len(mtsf), batch_size=2
+        ).chunks()
+    ) == json.dumps(legacy_df.to_dict(orient="records")).encode("utf-8")
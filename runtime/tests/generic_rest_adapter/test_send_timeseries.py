@@ -1,13 +1,25 @@
+import gzip
+import json
+from functools import partial
 from unittest import mock
 
+import httpx
 import numpy as np
 import pandas as pd
+import pyarrow as pa
 import pytest
 
 from hetdesrun.adapters.exceptions import AdapterOutputDataError
 from hetdesrun.adapters.generic_rest import send_data
+from hetdesrun.adapters.generic_rest.arrow_format import ARROW_STREAM_MEDIA_TYPE
+from hetdesrun.adapters.generic_rest.config import (
+    GenericRestAdapterOptions,
+    generic_rest_adapter_config,
+)
 from hetdesrun.adapters.generic_rest.external_types import ExternalType
 from hetdesrun.adapters.generic_rest.load_framelike import decode_attributes
+from hetdesrun.adapters.generic_rest.send_framelike import JsonRecordsStream
+from hetdesrun.adapters.generic_rest.send_ts_data import ts_to_json_rows_encoder
 from hetdesrun.models.data_selection import FilteredSink
 
 
@@ -21,7 +33,7 @@ async def test_end_to_end_send_only_timeseries_data_works():
         "hetdesrun.adapters.generic_rest.send_framelike.get_generic_rest_adapter_base_url",
         return_value="https://hetida.de",
     ), mock.patch(
-        "hetdesrun.adapters.generic_rest.send_ts_data.AsyncClient.post",
+        "hetdesrun.webservice.http_clients.httpx.AsyncClient.post",
         new=post_mock,
     ):
         ts_1 = pd.Series(
@@ -54,7 +66,7 @@ async def test_end_to_end_send_only_timeseries_data_works():
             ("timeseriesId", "sink_id_1"),
             ("filter_key", "filter_value"),
         ]
-        assert kwargs["json"] == [
+        assert json.loads(b"".join(kwargs["content"].chunks())) == [
             {"timestamp": "2020-01-15T00:00:00.000000000Z", "value": 1.2},
             {"timestamp": "2020-01-15T01:00:00.000000000Z", "value": 3.4},
             {"timestamp": "2020-01-15T02:00:00.000000000Z", "value": 5.9},
@@ -94,8 +106,12 @@ async def test_end_to_end_send_only_timeseries_data_works():
         # note: can be async!
         _, _, kwargs_1 = post_mock.mock_calls[1]
         _, _, kwargs_2 = post_mock.mock_calls[2]
-        assert (len(kwargs_1["json"]) == 3) or (len(kwargs_2["json"]) == 3)
-        assert (len(kwargs_1["json"]) == 2) or (len(kwargs_2["json"]) == 2)
+        assert (len(json.loads(b"".join(kwargs_1["content"].chunks()))) == 3) or (
+            len(json.loads(b"".join(kwargs_2["content"].chunks()))) == 3
+        )
+        assert (len(json.loads(b"".join(kwargs_1["content"].chunks()))) == 2) or (
+            len(json.loads(b"".join(kwargs_2["content"].chunks()))) == 2
+        )
         assert kwargs_1["params"] == [
             ("timeseriesId", "sink_id_1"),
             ("filter_key_1", "filter_value_1"),
@@ -136,7 +152,9 @@ async def test_end_to_end_send_only_timeseries_data_works():
         # note: can be async!
         _, _, kwargs_3 = post_mock.mock_calls[3]
 
-        assert kwargs_3["json"][2]["value"] is None  # np.nan comes through as null
+        assert (
+            json.loads(b"".join(kwargs_3["content"].chunks()))[2]["value"] is None
+        )  # np.nan comes through as null
         assert "Data-Attributes" in kwargs_3["headers"]
         received_attrs = decode_attributes(kwargs_3["headers"]["Data-Attributes"])
         for key, value in ts_3_attrs.items():
@@ -151,7 +169,7 @@ async def test_end_to_end_send_only_timeseries_data_works():
         )
         _, _, kwargs_4 = post_mock.mock_calls[4]
 
-        assert kwargs_4["json"] == []
+        assert json.loads(b"".join(kwargs_4["content"].chunks())) == []
 
 
 @pytest.mark.asyncio
@@ -219,3 +237,271 @@ async def test_end_to_end_send_only_timeseries_data_exception_handling():
             {"outp_11": no_ts},
             adapter_key="test_end_to_end_send_only_timeseries_data_adapter_key",
         )
+
+
+def legacy_ts_records(series: pd.Series) -> list[dict]:
+    """Per-row reference encoding the vectorized encoding must match"""
+    return (
+        pd.DataFrame(
+            {
+                "value": series.to_numpy(),
+                "timestamp": pd.Series(series.index, index=series.index).apply(
+                    lambda x: x.strftime("%Y-%m-%dT%H:%M:%S.%f")
+                    + f"{x.nanosecond:03d}"
+                    + "Z"
+                ),
+            }
+        )
+        .replace({np.nan: None})
+        .to_dict(orient="records")
+    )
+
+
+@pytest.mark.parametrize(
+    ("values", "sink_type"),
+    [
+        ([1.2, np.nan, -3e-17, 1e22, np.inf, -np.inf, 0.1 + 0.2], "timeseries(float)"),
+        ([1, -2, 3, 2**40, 0, 5, 7], "timeseries(int)"),
+        ([True, False, True, True, False, False, True], "timeseries(bool)"),
+        (
+            ["first", 'with "quotes"', "äöü €", "%s", "", "a\nb", "\\"],
+            "timeseries(string)",
+        ),
+        (["a", 1, 2.5, None, True, np.nan, {"b": [1]}], "timeseries(any)"),
+    ],
+)
+def test_ts_to_json_records_is_byte_compatible(values, sink_type):
+    series = pd.Series(
+        values,
+        index=pd.to_datetime(
+            [
+                "2020-01-15T00:00:00.000Z",
+                "2020-01-15T01:00:00.000001Z",
+                "2020-01-15T02:00:00.123456789Z",
+                "1970-01-01T00:00:00Z",
+                "1800-03-01T23:59:59.999999999Z",
+                "2200-12-31T12:00:00.5Z",
+                "2020-01-15T02:00:00.000000007Z",
+            ],
+            format="ISO8601",
+        ),
+    )
+
+    expected = json.dumps(legacy_ts_records(series)).encode("utf-8")
+    encode_rows = ts_to_json_rows_encoder(series, ExternalType(sink_type))
+    for batch_size in (1, 3, 7, 100):
+        assert (
+            b"".join(
+                JsonRecordsStream(
+                    encode_rows, 0, len(series), batch_size=batch_size
+                ).chunks()
+            )
+            == expected
+        )
+
+
+@pytest.mark.asyncio
+async def test_send_timeseries_streams_bodies_split_into_several_requests():
+    received_requests: list[httpx.Request] = []
+    received_bodies: list[bytes] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        received_requests.append(request)
+        received_bodies.append(await request.aread())
+        return httpx.Response(200)
+
+    transport = httpx.MockTransport(handler)
+
+    series = pd.Series(
+        np.arange(10, dtype=float),
+        index=pd.date_range("2020-01-15T00:00:00Z", periods=10, freq="1h"),
+    )
+
+    with mock.patch(  # noqa: SIM117
+        "hetdesrun.adapters.generic_rest.send_framelike.get_generic_rest_adapter_base_url",
+        return_value="https://hetida.de",
+    ), mock.patch(
+        "hetdesrun.webservice.http_clients.httpx.AsyncClient",
+        new=partial(httpx.AsyncClient, transport=transport),
+    ), mock.patch(
+        "hetdesrun.adapters.generic_rest.send_framelike.JSON_RECORDS_BATCH_SIZE",
+        new=3,
+    ), mock.patch(
+        "hetdesrun.webservice.config.runtime_config."
+        "hd_generic_rest_sink_max_rows_per_request",
+        new=4,
+    ):
+        await send_data(
+            {"outp": FilteredSink(ref_id="sink_id", type="timeseries(float)")},
+            {"outp": series},
+            adapter_key="test_send_timeseries_streaming_adapter_key",
+        )
+
+    assert len(received_requests) == 3
+    for request in received_requests:
+        assert request.headers["Transfer-Encoding"] == "chunked"
+        assert request.headers["Content-Type"] == "application/json"
+        assert request.url.params["timeseriesId"] == "sink_id"
+
+    posted_records = [json.loads(body) for body in received_bodies]
+    assert [len(records) for records in posted_records] == [4, 4, 2]
+    assert [
+        record["value"] for records in posted_records for record in records
+    ] == list(series.to_numpy())
+    assert posted_records[2][-1]["timestamp"] == "2020-01-15T09:00:00.000000000Z"
+
+
+@pytest.mark.asyncio
+async def test_send_timeseries_compresses_bodies_if_accepted_by_adapter():
+    received_requests: list[httpx.Request] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/info":
+            return httpx.Response(
+                200,
+                json={
+                    "id": "gzip-adapter",
+                    "name": "Gzip Adapter",
+                    "version": "1.0.0",
+                    "acceptedRequestEncodings": ["gzip"],
+                },
+            )
+        await request.aread()
+        received_requests.append(request)
+        return httpx.Response(200)
+
+    transport = httpx.MockTransport(handler)
+
+    series = pd.Series(
+        np.arange(10, dtype=float),
+        index=pd.date_range("2020-01-15T00:00:00Z", periods=10, freq="1h"),
+    )
+
+    adapter_key = "test_send_timeseries_gzip_adapter_key"
+    with mock.patch(  # noqa: SIM117
+        "hetdesrun.adapters.generic_rest.send_framelike.get_generic_rest_adapter_base_url",
+        return_value="https://hetida.de",
+    ), mock.patch(
+        "hetdesrun.adapters.generic_rest.info.get_generic_rest_adapter_base_url",
+        return_value="https://hetida.de",
+    ), mock.patch(
+        "hetdesrun.webservice.http_clients.httpx.AsyncClient",
+        new=partial(httpx.AsyncClient, transport=transport),
+    ), mock.patch(
+        "hetdesrun.adapters.generic_rest.send_framelike.JSON_RECORDS_BATCH_SIZE",
+        new=3,
+    ), mock.patch.object(
+        generic_rest_adapter_config,
+        "adapter_options",
+        {adapter_key: GenericRestAdapterOptions(compress_requests=True)},
+    ):
+        await send_data(
+            {"outp": FilteredSink(ref_id="sink_id", type="timeseries(float)")},
+            {"outp": series},
+            adapter_key=adapter_key,
+        )
+
+    assert len(received_requests) == 1
+    assert received_requests[0].headers["Content-Encoding"] == "gzip"
+    posted_records = json.loads(gzip.decompress(received_requests[0].content))
+    assert [record["value"] for record in posted_records] == list(series.to_numpy())
+
+
+def test_json_records_stream_gzip_chunks():
+    series = pd.Series(
+        np.arange(10, dtype=float),
+        index=pd.date_range("2020-01-15T00:00:00Z", periods=10, freq="1h"),
+    )
+    encode_rows = ts_to_json_rows_encoder(series, ExternalType("timeseries(float)"))
+
+    plain_stream = JsonRecordsStream(encode_rows, 0, 10, batch_size=3)
+    gzip_stream = JsonRecordsStream(encode_rows, 0, 10, batch_size=3, gzip=True)
+
+    assert gzip.decompress(b"".join(gzip_stream.chunks())) == b"".join(
+        plain_stream.chunks()
+    )
+
+
+@pytest.mark.asyncio
+async def test_send_timeseries_in_arrow_format_if_accepted_by_adapter():
+    received_requests: list[httpx.Request] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/info":
+            return httpx.Response(
+                200,
+                json={
+                    "id": "arrow-adapter",
+                    "name": "Arrow Adapter",
+                    "version": "1.0.0",
+                    "acceptedRequestContentTypes": [ARROW_STREAM_MEDIA_TYPE],
+                },
+            )
+        await request.aread()
+        received_requests.append(request)
+        return httpx.Response(200)
+
+    transport = httpx.MockTransport(handler)
+
+    series = pd.Series(
+        np.arange(10, dtype=float),
+        index=pd.date_range("2020-01-15T00:00:00Z", periods=10, freq="1h"),
+    )
+
+    adapter_key = "test_send_timeseries_arrow_adapter_key"
+    with mock.patch(  # noqa: SIM117
+        "hetdesrun.adapters.generic_rest.send_framelike.get_generic_rest_adapter_base_url",
+        return_value="https://hetida.de",
+    ), mock.patch(
+        "hetdesrun.adapters.generic_rest.info.get_generic_rest_adapter_base_url",
+        return_value="https://hetida.de",
+    ), mock.patch(
+        "hetdesrun.webservice.http_clients.httpx.AsyncClient",
+        new=partial(httpx.AsyncClient, transport=transport),
+    ), mock.patch(
+        "hetdesrun.adapters.generic_rest.send_framelike.ARROW_RECORD_BATCH_SIZE",
+        new=3,
+    ), mock.patch(
+        "hetdesrun.webservice.config.runtime_config."
+        "hd_generic_rest_sink_max_rows_per_request",
+        new=8,
+    ), mock.patch.object(
+        generic_rest_adapter_config,
+        "adapter_options",
+        {adapter_key: GenericRestAdapterOptions(arrow_format=True)},
+    ):
+        await send_data(
+            {
+                "outp_1": FilteredSink(ref_id="sink_id", type="timeseries(float)"),
+                # mixed values cannot be converted to Arrow and are sent as json
+                "outp_2": FilteredSink(ref_id="mixed_id", type="timeseries(any)"),
+            },
+            {"outp_1": series, "outp_2": series.astype(object).replace(1.0, "one")},
+            adapter_key=adapter_key,
+        )
+
+    arrow_requests = [
+        request
+        for request in received_requests
+        if request.url.params["timeseriesId"] == "sink_id"
+    ]
+    assert len(arrow_requests) == 2
+    posted_dfs = []
+    for request in arrow_requests:
+        assert request.headers["Content-Type"] == ARROW_STREAM_MEDIA_TYPE
+        with pa.ipc.open_stream(request.content) as reader:
+            posted_dfs.append(reader.read_pandas())
+    posted_df = pd.concat(posted_dfs, ignore_index=True)
+    assert posted_df["value"].to_list() == series.to_list()
+    pd.testing.assert_index_equal(
+        pd.DatetimeIndex(posted_df["timestamp"]), series.index, check_names=False
+    )
+
+    json_requests = [
+        request
+        for request in received_requests
+        if request.url.params["timeseriesId"] == "mixed_id"
+    ]
+    assert len(json_requests) == 2
+    assert json_requests[0].headers["Content-Type"] == "application/json"
+    assert json.loads(json_requests[0].content)[1]["value"] == "one"
@@ -0,0 +1,163 @@
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from hetdesrun.adapters.generic_rest import load_grouped_timeseries_data_together
+from hetdesrun.adapters.generic_rest.config import (
+    GenericRestAdapterOptions,
+    generic_rest_adapter_config,
+)
+from hetdesrun.adapters.generic_rest.external_types import ExternalType
+from hetdesrun.adapters.generic_rest.ts_cache import (
+    CachedTimeseries,
+    TimeseriesCache,
+    get_timeseries_cache,
+)
+from hetdesrun.models.data_selection import FilteredSource
+
+ALL_TIMESTAMPS = pd.date_range("2020-01-01T00:00:00Z", periods=48, freq="1h")
+
+
+def ts(hour: int) -> pd.Timestamp:
+    return ALL_TIMESTAMPS[0] + pd.Timedelta(hours=hour)
+
+
+def series_between(start: pd.Timestamp, end: pd.Timestamp, offset: float = 0.0):
+    timestamps = ALL_TIMESTAMPS.copy()
+    timestamps = timestamps[(timestamps >= start) & (timestamps <= end)]
+    return pd.Series(
+        np.arange(len(timestamps), dtype=float) + offset,
+        index=pd.Index(timestamps, name="timestamp"),
+        name="value",
+    )
+
+
+def test_cached_timeseries_missing_intervals_and_merge():
+    cached = CachedTimeseries()
+    assert cached.missing_intervals(ts(2), ts(5)) == [(ts(2), ts(5))]
+    assert cached.missing_intervals(ts(2), ts(2)) == [(ts(2), ts(2))]
+
+    cached.merge(series_between(ts(2), ts(5)), ts(2), ts(5))
+    cached.merge(series_between(ts(10), ts(12)), ts(10), ts(12))
+    assert cached.intervals == [(ts(2), ts(5)), (ts(10), ts(12))]
+
+    assert cached.missing_intervals(ts(3), ts(4)) == []
+    assert cached.missing_intervals(ts(5), ts(5)) == []
+    assert cached.missing_intervals(ts(0), ts(15)) == [
+        (ts(0), ts(2)),
+        (ts(5), ts(10)),
+        (ts(12), ts(15)),
+    ]
+
+    # merged data replaces cached data in its interval
+    cached.merge(series_between(ts(4), ts(11), offset=100.0), ts(4), ts(11))
+    assert cached.intervals == [(ts(2), ts(12))]
+    extracted = cached.extract(ts(2), ts(12))
+    assert list(extracted.index) == list(ALL_TIMESTAMPS[2:13])
+    assert list(extracted.to_numpy()) == [0.0, 1.0, *np.arange(8) + 100.0, 2.0]
+
+
+def test_timeseries_cache_evicts_least_recently_used():
+    entry_nbytes = CachedTimeseries()
+    entry_nbytes.merge(series_between(ts(0), ts(9)), ts(0), ts(9))
+    cache = TimeseriesCache(max_bytes=2 * entry_nbytes.nbytes)
+
+    keys = [
+        ("adapter", ts_id, ExternalType.TIMESERIES_FLOAT, frozenset())
+        for ts_id in ("a", "b", "c")
+    ]
+    for key in keys[:2]:
+        entry = cache.get(key)
+        entry.merge(series_between(ts(0), ts(9)), ts(0), ts(9))
+        cache.store(key, entry)
+
+    cache.get(keys[0])  # now b is least recently used
+    entry = cache.get(keys[2])
+    entry.merge(series_between(ts(0), ts(9)), ts(0), ts(9))
+    cache.store(keys[2], entry)
+
+    assert cache.nbytes <= cache.max_bytes
+    assert cache.get(keys[0]).series is not None
+    assert cache.get(keys[1]).series is None
+    assert cache.get(keys[2]).series is not None
+
+
+@pytest.mark.asyncio
+async def test_load_grouped_timeseries_only_loads_missing_intervals():
+    requested_intervals = []
+
+    async def mocked_load_ts_data_from_adapter(
+        filtered_sources, filter_params, adapter_key
+    ):
+        params = dict(filter_params)
+        requested_intervals.append(
+            (
+                sorted(fs.ref_id for fs in filtered_sources),
+                params["from"],
+                params["to"],
+            )
+        )
+        start = pd.Timestamp(params["from"])
+        end = pd.Timestamp(params["to"])
+        return pd.concat(
+            [
+                series_between(start, end, offset=100.0 * i)
+                .reset_index()
+                .assign(timeseriesId=fs.ref_id)
+                for i, fs in enumerate(
+                    sorted(filtered_sources, key=lambda fs: fs.ref_id)
+                )
+            ],
+            ignore_index=True,
+        ).astype({"timeseriesId": "string"})
+
+    def data_to_load(from_hour: int, to_hour: int) -> dict[str, FilteredSource]:
+        return {
+            ts_id
+            + "_inp": FilteredSource(
+                ref_id=ts_id,
+                type="timeseries(float)",
+                filters={
+                    "timestampFrom": ts(from_hour).strftime("%Y-%m-%dT%H:%M:%SZ"),
+                    "timestampTo": ts(to_hour).strftime("%Y-%m-%dT%H:%M:%SZ"),
+                    "free": "text",
+                },
+            )
+            for ts_id in ("a", "b")
+        }
+
+    get_timeseries_cache().clear()
+    with mock.patch(
+        "hetdesrun.adapters.generic_rest.load_ts_data.load_ts_data_from_adapter",
+        new=mocked_load_ts_data_from_adapter,
+    ), mock.patch.object(
+        generic_rest_adapter_config,
+        "adapter_options",
+        {"cached_adapter": GenericRestAdapterOptions(cache_timeseries=True)},
+    ):
+        first = await load_grouped_timeseries_data_together(
+            data_to_load(0, 10), adapter_key="cached_adapter"
+        )
+        second = await load_grouped_timeseries_data_together(
+            data_to_load(5, 20), adapter_key="cached_adapter"
+        )
+        third = await load_grouped_timeseries_data_together(
+            data_to_load(6, 8), adapter_key="cached_adapter"
+        )
+    get_timeseries_cache().clear()
+
+    assert requested_intervals == [
+        (["a", "b"], "2020-01-01T00:00:00Z", "2020-01-01T10:00:00Z"),
+        (["a", "b"], "2020-01-01T10:00:00.000000000Z", "2020-01-01T20:00:00Z"),
+    ]
+
+    assert list(first["a_inp"].index) == list(ALL_TIMESTAMPS[0:11])
+    assert list(second["a_inp"].index) == list(ALL_TIMESTAMPS[5:21])
+    assert list(third["b_inp"].index) == list(ALL_TIMESTAMPS[6:9])
+    assert first["b_inp"].name == "b"
+    assert list(second["b_inp"].to_numpy()) == [
+        *np.arange(5.0, 10.0) + 100.0,
+        *np.arange(11.0) + 100.0,
+    ]
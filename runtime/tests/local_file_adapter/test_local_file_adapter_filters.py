@@ -0,0 +1,178 @@
+import os
+from unittest import mock
+
+import pandas as pd
+import pytest
+
+from hetdesrun.adapters.exceptions import AdapterHandlingException
+from hetdesrun.adapters.local_file.config import local_file_adapter_config
+from hetdesrun.adapters.local_file.filters import ReadFilter
+from hetdesrun.adapters.local_file.index import get_local_file_index
+from hetdesrun.adapters.local_file.load_file import load_file_from_id
+from hetdesrun.adapters.local_file.structure import get_source_by_id
+from hetdesrun.adapters.local_file.utils import to_url_representation
+
+FILTERS = {
+    "columns": "timestamp, value",
+    "timestampFrom": "2023-01-02T00:00:00Z",
+    "timestampTo": "2023-01-02T23:59:59Z",
+    "metrics": '["a", "b b"]',
+}
+
+
+@pytest.fixture()
+def multitsframe():
+    return pd.DataFrame(
+        {
+            "timestamp": pd.date_range(
+                "2023-01-01", periods=96, freq="h", tz="UTC"
+            ).repeat(3),
+            "metric": ["a", "b b", "c"] * 96,
+            "value": range(288),
+        }
+    )
+
+
+@pytest.fixture()
+def local_files_root(tmp_path, multitsframe):
+    root = str(tmp_path)
+    multitsframe.to_parquet(os.path.join(root, "data.parquet"), row_group_size=72)
+    multitsframe.to_hdf(
+        os.path.join(root, "table.h5"),
+        key="default",
+        format="table",
+        data_columns=["timestamp", "metric"],
+    )
+    multitsframe.to_hdf(os.path.join(root, "fixed.h5"), key="default")
+    multitsframe.to_csv(os.path.join(root, "data.csv"), index=False)
+    with mock.patch.object(local_file_adapter_config, "local_dirs", {root}):
+        yield root
+    get_local_file_index().clear()
+
+
+def expected_filtered(multitsframe):
+    return multitsframe[
+        (multitsframe["timestamp"] >= pd.Timestamp("2023-01-02", tz="UTC"))
+        & (multitsframe["timestamp"] < pd.Timestamp("2023-01-03", tz="UTC"))
+        & multitsframe["metric"].isin(["a", "b b"])
+    ][["timestamp", "value"]]
+
+
+def test_read_filter_from_filters():
+    read_filter = ReadFilter.from_filters(
+        {"columns": "", "timestampFrom": "2023-01-02", "metrics": "a, b b"}
+    )
+    assert read_filter.columns is None
+    assert read_filter.timestamp_from == pd.Timestamp("2023-01-02", tz="UTC")
+    assert read_filter.timestamp_to is None
+    assert read_filter.metrics == ["a", "b b"]
+
+    assert ReadFilter.from_filters({"file_name": "some.csv"}).is_empty()
+
+    with pytest.raises(AdapterHandlingException, match="Could not parse"):
+        ReadFilter.from_filters({"timestampTo": "not a timestamp"})
+
+
+@pytest.mark.parametrize("file_name", ["data.parquet", "table.h5", "fixed.h5"])
+def test_load_file_from_id_with_filters(local_files_root, multitsframe, file_name):
+    source_id = to_url_representation(os.path.join(local_files_root, file_name))
+
+    loaded_df = load_file_from_id(source_id, FILTERS)
+    pd.testing.assert_frame_equal(
+        loaded_df.reset_index(drop=True),
+        expected_filtered(multitsframe).reset_index(drop=True),
+    )
+
+    pd.testing.assert_frame_equal(
+        load_file_from_id(source_id, {}).reset_index(drop=True),
+        multitsframe,
+    )
+
+
+def test_parquet_filters_are_pushed_down(local_files_root):
+    source_id = to_url_representation(os.path.join(local_files_root, "data.parquet"))
+    with mock.patch(
+        "hetdesrun.adapters.local_file.handlers.parquet.pd.read_parquet",
+        wraps=pd.read_parquet,
+    ) as mocked_read_parquet:
+        load_file_from_id(source_id, FILTERS)
+
+    assert mocked_read_parquet.call_args.kwargs["columns"] == ["timestamp", "value"]
+    assert "timestamp" in str(mocked_read_parquet.call_args.kwargs["filters"])
+    assert "metric" in str(mocked_read_parquet.call_args.kwargs["filters"])
+
+
+def test_table_hdf_filters_are_pushed_down(local_files_root):
+    source_id = to_url_representation(os.path.join(local_files_root, "table.h5"))
+    with mock.patch(
+        "hetdesrun.adapters.local_file.handlers.hdf.pd.read_hdf",
+        wraps=pd.read_hdf,
+    ) as mocked_read_hdf:
+        load_file_from_id(source_id, FILTERS)
+
+    assert len(mocked_read_hdf.call_args.kwargs["where"]) == 3
+
+
+def test_filters_and_metadata_offered_for_filterable_sources(local_files_root):
+    parquet_source = get_source_by_id(
+        to_url_representation(os.path.join(local_files_root, "data.parquet"))
+    )
+    assert set(parquet_source.filters) == set(FILTERS)
+    assert all(not fltr.required for fltr in parquet_source.filters.values())
+
+    csv_source = get_source_by_id(
+        to_url_representation(os.path.join(local_files_root, "data.csv"))
+    )
+    assert csv_source.filters == {}
+
+    # filters are ignored for files not supporting them
+    assert len(load_file_from_id(csv_source.id, FILTERS)) == 288
+
+
+@pytest.mark.asyncio
+async def test_sources_metadata_contains_filterable_columns(
+    local_files_root, async_test_client
+):
+    async with async_test_client as client:
+        metadata = {
+            file_name: (
+                await client.get(
+                    "/adapters/localfile/sources/"
+                    + to_url_representation(os.path.join(local_files_root, file_name))
+                    + "/metadata/"
+                )
+            ).json()
+            for file_name in ["data.parquet", "table.h5", "fixed.h5", "data.csv"]
+        }
+
+    assert metadata["data.parquet"] == [
+        {
+            "key": "filterable_columns",
+            "value": ["timestamp", "metric", "value"],
+            "dataType": "any",
+        }
+    ]
+    assert metadata["table.h5"][0]["value"] == ["timestamp", "metric"]
+    assert metadata["fixed.h5"][0]["value"] == []
+    assert metadata["data.csv"] == []
+
+
+@pytest.mark.asyncio
+async def test_sources_metadata_empty_if_columns_cannot_be_determined(
+    local_files_root, multitsframe, async_test_client
+):
+    multi_key_path = os.path.join(local_files_root, "multi_key.h5")
+    multitsframe.to_hdf(multi_key_path, key="first", format="table")
+    multitsframe.to_hdf(multi_key_path, key="second", format="table")
+    with open(os.path.join(local_files_root, "broken.parquet"), "wb") as f:
+        f.write(b"no parquet")
+
+    async with async_test_client as client:
+        for file_name in ["multi_key.h5", "broken.parquet"]:
+            response = await client.get(
+                "/adapters/localfile/sources/"
+                + to_url_representation(os.path.join(local_files_root, file_name))
+                + "/metadata/"
+            )
+            assert response.status_code == 200
+            assert response.json() == []
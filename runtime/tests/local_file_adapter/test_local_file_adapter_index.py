@@ -0,0 +1,171 @@
+import json
+import os
+import shutil
+import threading
+import time
+from unittest import mock
+
+import pytest
+
+from hetdesrun.adapters.local_file.config import local_file_adapter_config
+from hetdesrun.adapters.local_file.detect import get_local_files_and_dirs
+from hetdesrun.adapters.local_file.index import (
+    LocalFileIndex,
+    get_local_file_index,
+    refreshed_in_background,
+    stop_background_index_refresh,
+)
+from hetdesrun.adapters.local_file.structure import (
+    get_local_file_by_id,
+    get_sinks,
+    get_sources,
+)
+from hetdesrun.adapters.local_file.utils import to_url_representation
+
+# modification time old enough to be trusted by the index
+OLD_MTIME = time.time() - 3600
+
+
+def set_old_mtimes(top_dir: str) -> None:
+    for root, dirs, files in os.walk(top_dir):
+        for name in dirs + files:
+            os.utime(os.path.join(root, name), (OLD_MTIME, OLD_MTIME))
+    os.utime(top_dir, (OLD_MTIME, OLD_MTIME))
+
+
+@pytest.fixture()
+def local_files_root(tmp_path):
+    root = str(tmp_path / "local_files")
+    shutil.copytree(os.path.join("tests", "data", "local_files"), root)
+    set_old_mtimes(root)
+    with mock.patch.object(local_file_adapter_config, "local_dirs", {root}):
+        yield root
+    get_local_file_index().clear()
+
+
+def test_local_file_index_is_equivalent_to_walking_dirs():
+    top_dir = os.path.join("tests", "data", "local_files")
+    local_file_index = LocalFileIndex()
+    with mock.patch.object(local_file_adapter_config, "local_dirs", {top_dir}):
+        local_file_index.refresh()
+        indexed_local_files = local_file_index.all_local_files()
+
+    walked_local_files, walked_dirs = get_local_files_and_dirs(top_dir)
+    assert indexed_local_files == walked_local_files
+
+    indexed_local_files, indexed_dirs = local_file_index.local_files_and_dirs(top_dir)
+    walked_local_files, walked_dirs = get_local_files_and_dirs(
+        top_dir, walk_sub_dirs=False
+    )
+    assert indexed_local_files == walked_local_files
+    assert indexed_dirs == walked_dirs
+
+
+def test_local_file_index_refreshes_incrementally(local_files_root):
+    local_file_index = LocalFileIndex()
+    local_file_index.refresh()
+    assert len(local_file_index.all_local_files()) == 10
+
+    with mock.patch(
+        "hetdesrun.adapters.local_file.index.local_file_from_path"
+    ) as mocked_local_file_from_path:
+        local_file_index.refresh()
+    assert mocked_local_file_from_path.call_count == 0
+
+    dir3 = os.path.join(local_files_root, "dir1", "dir2", "dir3")
+    with open(os.path.join(dir3, "new.csv"), "w", encoding="utf8") as f:
+        f.write("a,b\n1,2\n")
+    local_file_index.refresh()
+    assert len(local_file_index.all_local_files()) == 11
+    assert local_file_index.local_file(os.path.join(dir3, "new.csv")) is not None
+
+    # settings files are parsed again if changed, without directory changes
+    settings_file_path = os.path.join(dir3, "hd_df_csv123b.csv.settings.json")
+    with open(settings_file_path, "w", encoding="utf8") as f:
+        json.dump({"loadable": False, "writable": True}, f)
+    os.utime(dir3, (OLD_MTIME, OLD_MTIME))
+    local_file_index.refresh()
+    local_file = local_file_index.local_file(os.path.join(dir3, "hd_df_csv123b.csv"))
+    assert local_file is not None
+    assert local_file.parsed_settings_file.loadable is False
+
+    shutil.rmtree(os.path.join(local_files_root, "dir1", "dir2"))
+    local_file_index.refresh()
+    assert len(local_file_index.all_local_files()) == 6
+    assert local_file_index.local_file(os.path.join(dir3, "new.csv")) is None
+
+
+def test_local_file_structure_served_from_index(local_files_root):
+    assert len(get_sources(None)) == 8
+    assert len(get_sources("dir3")) == 2
+    assert len(get_sinks(None)) == 3
+
+    local_file_id = to_url_representation(
+        os.path.join(local_files_root, "dir_any", "overwritable_picklable.pkl")
+    )
+    local_file = get_local_file_by_id(local_file_id)
+    assert local_file is not None
+    assert local_file == get_local_file_index().local_file(local_file.path)
+
+    # callers may adapt the returned local file
+    local_file.parsed_settings_file.writable = False
+    assert get_local_file_by_id(local_file_id).parsed_settings_file.writable is True
+
+    assert (
+        get_local_file_by_id(
+            to_url_representation(os.path.join(local_files_root, "not_present.csv")),
+            verify_existence=False,
+        )
+        is not None
+    )
+
+
+def test_local_file_index_background_refresh(local_files_root):
+    assert refreshed_in_background() is False
+
+    with mock.patch.object(local_file_adapter_config, "index_refresh_interval", 0.05):
+        try:
+            assert refreshed_in_background() is True
+            assert len(get_sources(None)) == 8
+
+            with open(
+                os.path.join(local_files_root, "new.csv"), "w", encoding="utf8"
+            ) as f:
+                f.write("a,b\n1,2\n")
+            time.sleep(0.2)
+            assert len(get_sources(None)) == 9
+        finally:
+            stop_background_index_refresh()
+
+
+def test_local_file_index_answers_requests_while_listing(local_files_root):
+    local_file_index = LocalFileIndex()
+    local_file_index.refresh()
+    new_file_path = os.path.join(local_files_root, "new.csv")
+    with open(new_file_path, "w", encoding="utf8") as f:
+        f.write("a,b\n1,2\n")
+
+    listing_started = threading.Event()
+    listing_released = threading.Event()
+    scandir = os.scandir
+
+    def slow_scandir(path):
+        listing_started.set()
+        listing_released.wait(5)
+        return scandir(path)
+
+    with mock.patch(
+        "hetdesrun.adapters.local_file.index.os.scandir", side_effect=slow_scandir
+    ):
+        refresh_thread = threading.Thread(target=local_file_index.refresh)
+        refresh_thread.start()
+        assert listing_started.wait(5)
+        try:
+            # the index can be read while a directory is listed
+            assert len(local_file_index.all_local_files()) == 10
+            assert local_file_index.local_file(new_file_path) is None
+        finally:
+            listing_released.set()
+            refresh_thread.join()
+
+    assert local_file_index.local_file(new_file_path) is not None
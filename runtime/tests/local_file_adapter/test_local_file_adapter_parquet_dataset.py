@@ -0,0 +1,254 @@
+import json
+import os
+import shutil
+from unittest import mock
+
+import pandas as pd
+import pytest
+
+from hetdesrun.adapters.exceptions import AdapterHandlingException
+from hetdesrun.adapters.local_file.config import local_file_adapter_config
+from hetdesrun.adapters.local_file.handlers import parquet_dataset
+from hetdesrun.adapters.local_file.handlers.parquet_dataset import (
+    COMPACTION_LOCK_FILE_NAME,
+    fragment_files,
+    parquet_dataset_filterable_columns,
+    write_parquet_dataset,
+)
+from hetdesrun.adapters.local_file.index import get_local_file_index
+from hetdesrun.adapters.local_file.load_file import load_file_from_id
+from hetdesrun.adapters.local_file.structure import get_structure
+from hetdesrun.adapters.local_file.utils import to_url_representation
+from hetdesrun.adapters.local_file.write_file import write_to_file
+from hetdesrun.atomic_files import write_atomically
+
+
+def day_of_data(day: str, offset: int = 0) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "timestamp": pd.date_range(day, periods=24, freq="h", tz="UTC").repeat(2),
+            "metric": ["a", "b"] * 24,
+            "value": [float(offset + i) for i in range(48)],
+        }
+    )
+
+
+@pytest.fixture()
+def dataset_path(tmp_path):
+    root = str(tmp_path)
+    path = os.path.join(root, "results.parquet_dataset")
+    with open(path + ".settings.json", "w", encoding="utf8") as f:
+        json.dump(
+            {
+                "loadable": True,
+                "writable": True,
+                "write_settings": {"partition_by": "date", "compact_min_fragments": 3},
+            },
+            f,
+        )
+    with mock.patch.object(local_file_adapter_config, "local_dirs", {root}):
+        yield path
+    get_local_file_index().clear()
+
+
+def test_parquet_dataset_appended_and_loaded(dataset_path):
+    dataset_id = to_url_representation(dataset_path)
+    days = ["2023-01-01", "2023-01-02", "2023-01-02", "2023-01-03"]
+    for i, day in enumerate(days):
+        write_to_file(day_of_data(day, offset=100 * i), dataset_id, {})
+
+    structure = get_structure(to_url_representation(os.path.dirname(dataset_path)))
+    assert structure.thingNodes == []
+    assert [source.id for source in structure.sources] == [dataset_id]
+    assert [sink.id for sink in structure.sinks if sink.id == dataset_id] == [
+        dataset_id
+    ]
+
+    assert sorted(os.listdir(dataset_path)) == [
+        "_hd_dataset.json",
+        "date=2023-01-01",
+        "date=2023-01-02",
+        "date=2023-01-03",
+    ]
+    assert len(os.listdir(os.path.join(dataset_path, "date=2023-01-02"))) == 2
+
+    expected_df = pd.concat(
+        [day_of_data(day, offset=100 * i) for i, day in enumerate(days)],
+        ignore_index=True,
+    )
+    pd.testing.assert_frame_equal(load_file_from_id(dataset_id), expected_df)
+
+    with mock.patch(
+        "hetdesrun.adapters.local_file.handlers.parquet_dataset.fragment_files",
+        wraps=fragment_files,
+    ) as mocked_fragment_files:
+        loaded_df = load_file_from_id(
+            dataset_id,
+            {
+                "timestampFrom": "2023-01-02T05:00:00Z",
+                "timestampTo": "2023-01-02T06:00:00Z",
+                "metrics": "b",
+            },
+        )
+    # only the partition of the requested day is read
+    assert [
+        os.path.basename(call.args[0]) for call in mocked_fragment_files.call_args_list
+    ] == ["date=2023-01-02"]
+    assert loaded_df["value"].tolist() == [111.0, 113.0, 211.0, 213.0]
+
+
+def test_parquet_dataset_compaction(dataset_path):
+    for i in range(3):
+        write_parquet_dataset(
+            day_of_data("2023-01-01", offset=100 * i),
+            dataset_path,
+            partition_by="date",
+            compact_min_fragments=3,
+        )
+    partition_path = os.path.join(dataset_path, "date=2023-01-01")
+    file_names = os.listdir(partition_path)
+    assert len(file_names) == 1
+    assert file_names[0].startswith("compacted-")
+    assert len(load_file_from_id(to_url_representation(dataset_path))) == 3 * 48
+
+    write_parquet_dataset(
+        day_of_data("2023-01-01", offset=300), dataset_path, partition_by="date"
+    )
+    assert len(fragment_files(partition_path)) == 2
+
+
+def test_parquet_dataset_ignores_fragments_replaced_by_compaction(dataset_path):
+    for i in range(2):
+        write_parquet_dataset(
+            day_of_data("2023-01-01", offset=100 * i), dataset_path, partition_by="date"
+        )
+    partition_path = os.path.join(dataset_path, "date=2023-01-01")
+    backup_path = dataset_path + ".backup"
+    shutil.copytree(partition_path, backup_path)
+
+    write_parquet_dataset(
+        day_of_data("2023-01-01", offset=200),
+        dataset_path,
+        partition_by="date",
+        compact_min_fragments=3,
+    )
+    # as if compaction was interrupted before removing the replaced fragments
+    for file_name in os.listdir(backup_path):
+        shutil.copy(os.path.join(backup_path, file_name), partition_path)
+
+    assert len(os.listdir(partition_path)) == 3
+    assert len(fragment_files(partition_path)) == 1
+    assert len(load_file_from_id(to_url_representation(dataset_path))) == 3 * 48
+
+    # the left over fragments are removed before compacting again
+    write_parquet_dataset(
+        day_of_data("2023-01-01", offset=300),
+        dataset_path,
+        partition_by="date",
+        compact_min_fragments=2,
+    )
+    assert len(os.listdir(partition_path)) == 1
+    assert len(load_file_from_id(to_url_representation(dataset_path))) == 4 * 48
+
+
+def test_parquet_dataset_with_all_null_column_in_fragment(dataset_path):
+    df = day_of_data("2023-01-01")
+    df["comment"] = None
+    write_parquet_dataset(df, dataset_path, partition_by="date")
+    df_with_comments = day_of_data("2023-01-01", offset=100)
+    df_with_comments["comment"] = "checked"
+    write_parquet_dataset(
+        df_with_comments, dataset_path, partition_by="date", compact_min_fragments=3
+    )
+
+    expected_df = pd.concat([df, df_with_comments], ignore_index=True)
+    pd.testing.assert_frame_equal(
+        load_file_from_id(to_url_representation(dataset_path)), expected_df
+    )
+
+    write_parquet_dataset(
+        day_of_data("2023-01-01", offset=200),
+        dataset_path,
+        partition_by="date",
+        compact_min_fragments=3,
+    )
+    assert len(fragment_files(os.path.join(dataset_path, "date=2023-01-01"))) == 1
+    assert (
+        load_file_from_id(to_url_representation(dataset_path))["comment"].tolist()
+        == [None] * 48 + ["checked"] * 48 + [None] * 48
+    )
+
+
+def test_parquet_dataset_date_partitioning_requires_timestamps(dataset_path):
+    df = day_of_data("2023-01-01")
+    df.loc[3, "timestamp"] = pd.NaT
+    with pytest.raises(ValueError, match="1 rows have none"):
+        write_parquet_dataset(df, dataset_path, partition_by="date")
+    assert fragment_files(dataset_path) == []
+
+
+def test_parquet_dataset_partitioning_cannot_change(dataset_path):
+    write_parquet_dataset(
+        day_of_data("2023-01-01"), dataset_path, partition_by="metric"
+    )
+    assert sorted(os.listdir(dataset_path)) == [
+        "_hd_dataset.json",
+        "metric=a",
+        "metric=b",
+    ]
+
+    with pytest.raises(AdapterHandlingException, match="partitioned by metric"):
+        write_to_file(
+            day_of_data("2023-01-02"), to_url_representation(dataset_path), {}
+        )
+
+
+def test_parquet_dataset_compaction_after_lock_timeout(dataset_path):
+    for i in range(2):
+        write_parquet_dataset(
+            day_of_data("2023-01-01", offset=100 * i), dataset_path, partition_by="date"
+        )
+    partition_path = os.path.join(dataset_path, "date=2023-01-01")
+
+    def write_after_concurrent_compaction(path, write_func):
+        if os.path.basename(path).startswith("compacted-"):
+            mocked_write_atomically.side_effect = write_atomically
+            # the lock is considered stale by another writer, which compacts the
+            # same fragments
+            os.remove(os.path.join(partition_path, COMPACTION_LOCK_FILE_NAME))
+            parquet_dataset.compact_partition(partition_path)
+        write_atomically(path, write_func)
+
+    with mock.patch(
+        "hetdesrun.adapters.local_file.handlers.parquet_dataset.write_atomically",
+        side_effect=write_after_concurrent_compaction,
+    ) as mocked_write_atomically:
+        parquet_dataset.compact_partition(partition_path)
+
+    file_names = os.listdir(partition_path)
+    assert len(file_names) == 1
+    assert file_names[0].startswith("compacted-")
+    assert len(load_file_from_id(to_url_representation(dataset_path))) == 2 * 48
+
+
+def test_parquet_dataset_filterable_columns_of_all_fragments(dataset_path):
+    write_parquet_dataset(day_of_data("2023-01-01"), dataset_path)
+    df_with_comments = day_of_data("2023-01-01", offset=100)
+    df_with_comments["comment"] = "checked"
+    write_parquet_dataset(df_with_comments, dataset_path)
+
+    assert parquet_dataset_filterable_columns(dataset_path) == [
+        "timestamp",
+        "metric",
+        "value",
+        "comment",
+    ]
+
+
+def test_parquet_dataset_failed_writes_leave_no_temporary_files(dataset_path):
+    with mock.patch(
+        "hetdesrun.adapters.local_file.handlers.parquet_dataset.json.dump",
+        side_effect=OSError("disk full"),
+    ), pytest.raises(OSError, match="disk full"):
+        write_parquet_dataset(day_of_data("2023-01-01"), dataset_path)
+    assert os.listdir(dataset_path) == []
@@ -0,0 +1,161 @@
+import os
+import time
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from hetdesrun.adapters.local_file.config import local_file_adapter_config
+from hetdesrun.adapters.local_file.index import get_local_file_index
+from hetdesrun.adapters.local_file.load_file import load_file_from_id
+from hetdesrun.adapters.local_file.sidecar_cache import (
+    SIDECAR_SUFFIX,
+    roundtrip_nan_null_columns,
+)
+from hetdesrun.adapters.local_file.utils import to_url_representation
+
+
+@pytest.fixture()
+def local_files_root(tmp_path):
+    root = str(tmp_path / "local_files")
+    os.makedirs(root)
+    cache_dir = str(tmp_path / "sidecar_cache")
+    with mock.patch.object(
+        local_file_adapter_config, "local_dirs", {root}
+    ), mock.patch.object(local_file_adapter_config, "sidecar_cache_dir", cache_dir):
+        yield root, cache_dir
+    get_local_file_index().clear()
+
+
+def write_csv_file(path: str, offset: int = 0) -> pd.DataFrame:
+    df = pd.DataFrame(
+        {
+            "timestamp": pd.date_range("2023-01-01", periods=50, freq="h").astype(str),
+            "value": [float(offset + i) for i in range(50)],
+            "name": ["a"] * 50,
+        }
+    )
+    df.to_csv(path, index=False)
+    return df
+
+
+def sidecar_files(cache_dir: str) -> list[str]:
+    return [name for name in os.listdir(cache_dir) if name.endswith(SIDECAR_SUFFIX)]
+
+
+def test_csv_loaded_from_sidecar_file(local_files_root):
+    root, cache_dir = local_files_root
+    path = os.path.join(root, "data.csv")
+    expected_df = write_csv_file(path)
+    source_id = to_url_representation(path)
+
+    pd.testing.assert_frame_equal(load_file_from_id(source_id), expected_df)
+    assert len(sidecar_files(cache_dir)) == 1
+
+    with mock.patch(
+        "hetdesrun.adapters.local_file.handlers.csv.pd.read_csv"
+    ) as mocked_read_csv:
+        pd.testing.assert_frame_equal(load_file_from_id(source_id), expected_df)
+    assert mocked_read_csv.call_count == 0
+
+    # changed load settings and changed files are parsed again
+    with mock.patch(
+        "hetdesrun.adapters.local_file.load_file.get_read_kwargs",
+        return_value={"usecols": ["value"]},
+    ):
+        assert list(load_file_from_id(source_id).columns) == ["value"]
+    assert len(sidecar_files(cache_dir)) == 2
+
+    expected_df = write_csv_file(path, offset=100)
+    os.utime(path, ns=(time.time_ns(), time.time_ns() + 1_000_000_000))
+    pd.testing.assert_frame_equal(load_file_from_id(source_id), expected_df)
+    assert len(sidecar_files(cache_dir)) == 3
+
+
+def test_sidecar_cache_removes_least_recently_used_files(local_files_root):
+    root, cache_dir = local_files_root
+    source_ids = []
+    for i in range(3):
+        path = os.path.join(root, f"data{i}.csv")
+        write_csv_file(path, offset=i)
+        source_ids.append(to_url_representation(path))
+
+    load_file_from_id(source_ids[0])
+    sidecar_size = os.path.getsize(os.path.join(cache_dir, sidecar_files(cache_dir)[0]))
+
+    with mock.patch.object(
+        local_file_adapter_config, "sidecar_cache_max_size", 2 * sidecar_size
+    ):
+        load_file_from_id(source_ids[1])
+        time.sleep(0.01)
+        # use first file again, so that the second one is least recently used
+        sidecar_of_first_file = sidecar_files(cache_dir)
+        load_file_from_id(source_ids[0])
+        time.sleep(0.01)
+        load_file_from_id(source_ids[2])
+
+    assert len(sidecar_files(cache_dir)) == 2
+    with mock.patch(
+        "hetdesrun.adapters.local_file.handlers.csv.pd.read_csv"
+    ) as mocked_read_csv:
+        load_file_from_id(source_ids[0])
+        load_file_from_id(source_ids[2])
+    assert mocked_read_csv.call_count == 0
+    assert set(sidecar_of_first_file) & set(sidecar_files(cache_dir))
+
+
+def test_no_sidecar_files_without_cache_dir(local_files_root):
+    root, cache_dir = local_files_root
+    path = os.path.join(root, "data.csv")
+    write_csv_file(path)
+    with mock.patch.object(local_file_adapter_config, "sidecar_cache_dir", None):
+        load_file_from_id(to_url_representation(path))
+    assert not os.path.exists(cache_dir)
+
+
+def test_sidecar_cache_does_not_change_loaded_data(local_files_root):
+    root, cache_dir = local_files_root
+    path = os.path.join(root, "data.csv")
+    with open(path, "w", encoding="utf8") as f:
+        f.write("1,a,x\n2,,y\n3,c,\n")
+    source_id = to_url_representation(path)
+
+    with mock.patch.object(local_file_adapter_config, "sidecar_cache_dir", None):
+        uncached_df = load_file_from_id(source_id)
+    pd.testing.assert_frame_equal(load_file_from_id(source_id), uncached_df)
+    assert len(sidecar_files(cache_dir)) == 1
+    cached_df = load_file_from_id(source_id)
+    pd.testing.assert_frame_equal(cached_df, uncached_df)
+    # missing values of object columns are NaN also when loaded from sidecar file
+    assert cached_df["a"].dtype == object
+    assert np.isnan(cached_df["a"].iloc[0])
+
+    # integer labels would be loaded as strings from sidecar files
+    with mock.patch(
+        "hetdesrun.adapters.local_file.load_file.get_read_kwargs",
+        return_value={"header": None, "index_col": 0},
+    ):
+        with mock.patch.object(local_file_adapter_config, "sidecar_cache_dir", None):
+            uncached_df = load_file_from_id(source_id)
+        for _ in range(2):
+            pd.testing.assert_frame_equal(load_file_from_id(source_id), uncached_df)
+    assert len(sidecar_files(cache_dir)) == 1
+
+
+def test_roundtrip_nan_null_columns():
+    df = pd.DataFrame(
+        {"nan": ["a", np.nan], "none": ["a", None], "complete": ["a", "b"]}
+    )
+    assert roundtrip_nan_null_columns(df) == ["nan"]
+    assert (
+        roundtrip_nan_null_columns(pd.DataFrame({"mixed": ["a", np.nan, None]})) is None
+    )
+    assert roundtrip_nan_null_columns(pd.DataFrame({0: [1.0]})) is None
+    assert roundtrip_nan_null_columns(pd.DataFrame({"a": [1.0]}, index=["x"])) == []
+    assert (
+        roundtrip_nan_null_columns(
+            pd.DataFrame({"a": [1.0]}, index=pd.Index(["x"], name=0))
+        )
+        is None
+    )
@@ -11,6 +11,7 @@ from hetdesrun.adapters.sql_adapter.config import (
     SQLAdapterDBConfig,
     TimeseriesTableConfig,
 )
+from hetdesrun.adapters.sql_adapter.structure_cache import invalidate_structure_cache
 from hetdesrun.adapters.sql_adapter.utils import get_configured_dbs_by_key
 from hetdesrun.webservice.application import init_app
 
@@ -89,6 +90,7 @@ def temporary_prefilled_sqlite_ts_db(temporary_sqlite_file_path_ts_db):
 @pytest.fixture(scope="function")  # noqa: PT003
 def _clean_configured_dbs_by_key():
     get_configured_dbs_by_key.cache_clear()
+    invalidate_structure_cache()
 
 
 @pytest.fixture(scope="function")  # noqa: PT003
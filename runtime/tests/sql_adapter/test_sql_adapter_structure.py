@@ -1,4 +1,12 @@
-from hetdesrun.adapters.sql_adapter.config import get_sql_adapter_config
+from unittest import mock
+
+import pandas as pd
+from sqlalchemy import inspect
+
+from hetdesrun.adapters.sql_adapter.config import (
+    get_sql_adapter_config,
+    sql_adapter_config,
+)
 from hetdesrun.adapters.sql_adapter.structure import (
     get_sink_by_id,
     get_sinks,
@@ -6,6 +14,8 @@ from hetdesrun.adapters.sql_adapter.structure import (
     get_sources,
     get_structure,
 )
+from hetdesrun.adapters.sql_adapter.structure_cache import invalidate_structure_cache
+from hetdesrun.adapters.sql_adapter.write_table import write_table_to_provided_sink_id
 
 
 def test_config_works(two_sqlite_dbs_configured):
@@ -56,3 +66,57 @@ def test_sql_adapter_structure(two_sqlite_dbs_configured):
     assert len(all_sinks) == 3
     for snk in all_sinks:
         assert snk == get_sink_by_id(snk.id)
+
+
+def test_sql_adapter_structure_is_cached(two_sqlite_dbs_configured):
+    with mock.patch(
+        "hetdesrun.adapters.sql_adapter.structure.inspect",
+        wraps=inspect,
+    ) as mocked_inspect:
+        assert len(get_sources()) == 4
+        assert mocked_inspect.call_count == 2  # once per db
+
+        assert len(get_sources()) == 4
+        assert len(get_structure("test_example_sqlite_read_db").sources) == 3
+        assert mocked_inspect.call_count == 2
+
+        invalidate_structure_cache("test_example_sqlite_read_db")
+        assert len(get_sources()) == 4
+        assert mocked_inspect.call_count == 3
+
+        invalidate_structure_cache()
+        assert len(get_sources()) == 4
+        assert mocked_inspect.call_count == 5
+
+        with mock.patch.object(sql_adapter_config, "structure_cache_ttl", None):
+            assert len(get_sources()) == 4
+            assert len(get_sources()) == 4
+        assert mocked_inspect.call_count == 9
+
+
+def test_sql_adapter_structure_cache_invalidated_by_writes(two_sqlite_dbs_configured):
+    assert len(get_sources("model_config_params")) == 0
+
+    write_table_to_provided_sink_id(
+        pd.DataFrame({"a": [1.0, 2.0]}),
+        "test_writable_temp_sqlite_db/replace_table/model_config_params",
+    )
+
+    filtered_sources = get_sources("MODEL_config")
+    assert len(filtered_sources) == 1
+    assert (
+        filtered_sources[0].id
+        == "test_writable_temp_sqlite_db/table/model_config_params"
+    )
+
+
+def test_sql_adapter_filtered_sources(two_sqlite_dbs_configured):
+    all_sources = get_sources()
+
+    for filter_str in ("", "query", "TABLE", "example_sqlite_read_db|", "not present"):
+        assert get_sources(filter_str) == [
+            src
+            for src in all_sources
+            if filter_str.lower() in src.name.lower()
+            or filter_str.lower() in src.path.lower()
+        ]
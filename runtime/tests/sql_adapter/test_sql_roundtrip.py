@@ -1,7 +1,24 @@
+from unittest import mock
+
+import numpy as np
 import pandas as pd
 import pytest
+from sqlalchemy.dialects.mssql import pymssql
+from sqlalchemy.dialects.postgresql import psycopg2
+from sqlalchemy.dialects.sqlite import pysqlite
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.types import BigInteger, Boolean, DateTime, Float, Text
 
+from hetdesrun.adapters.exceptions import AdapterHandlingException
 from hetdesrun.adapters.sql_adapter import load_data, send_data
+from hetdesrun.adapters.sql_adapter.config import SQLAdapterDBConfig
+from hetdesrun.adapters.sql_adapter.load_table import load_sql_query, load_sql_table
+from hetdesrun.adapters.sql_adapter.write_table import (
+    insert_method_and_chunksize,
+    postgres_copy_insert,
+    sql_dtypes,
+    write_dataframe,
+)
 from hetdesrun.models.data_selection import FilteredSink, FilteredSource
 
 
@@ -167,3 +184,145 @@ async def test_roundtrip_replace_table(two_sqlite_dbs_configured):
     )
 
     assert len(replace_table_after_second_write["inp"]) == 3
+
+
+def test_chunked_loading_with_row_limit(temporary_sqlite_file_path):
+    db_config = SQLAdapterDBConfig(
+        connection_url="sqlite+pysqlite:///" + temporary_sqlite_file_path,
+        name="chunked loading sqlite db",
+        key="chunked_loading_sqlite_db",
+        chunk_size=3,
+    )
+    df = pd.DataFrame(
+        {
+            "a": list(range(10)),
+            # first chunk only contains missing values
+            "b": [None, None, None] + [float(i) for i in range(7)],
+            "c": [f"text {i}" for i in range(10)],
+        }
+    )
+    df.to_sql("chunked_table", db_config.engine, index=False)
+
+    loaded_df = load_sql_table(db_config, "chunked_table")
+    pd.testing.assert_frame_equal(loaded_df, df)
+
+    loaded_df = load_sql_query(db_config, "SELECT a, c FROM chunked_table WHERE a > 4")
+    assert loaded_df["a"].to_list() == [5, 6, 7, 8, 9]
+    assert loaded_df.index.to_list() == [0, 1, 2, 3, 4]
+
+    assert len(load_sql_table(db_config, "chunked_table", max_rows=10)) == 10
+    with pytest.raises(AdapterHandlingException, match="maximum number of 9 rows"):
+        load_sql_table(db_config, "chunked_table", max_rows=9)
+
+    db_config.max_rows = 5
+    with pytest.raises(AdapterHandlingException, match="maximum number of 5 rows"):
+        load_sql_query(db_config, "SELECT * FROM chunked_table")
+
+
+def test_insert_method_per_dialect():
+    method, chunksize = insert_method_and_chunksize(psycopg2.dialect(), 3)
+    assert method is postgres_copy_insert
+    assert chunksize is None
+
+    assert insert_method_and_chunksize(pysqlite.dialect(), 3) == (None, None)
+
+    assert insert_method_and_chunksize(pymssql.dialect(), 3) == ("multi", 666)
+
+
+def test_postgres_copy_insert():
+    cursor = mock.MagicMock()
+    connection = mock.MagicMock()
+    connection.connection.cursor.return_value.__enter__.return_value = cursor
+    table = mock.Mock()
+    table.name = "ts_table"
+    table.schema = "timeseries"
+
+    n_rows = postgres_copy_insert(
+        table,
+        connection,
+        ["timestamp", "metric", "value"],
+        iter(
+            [
+                ("2023-07-01 00:00:00+00:00", "a", 4.2),
+                ("2023-07-02", 'b "2"', None),
+                ("2023-07-03", "", np.int64(3)),
+                ("2023-07-04", r"\N", True),
+            ]
+        ),
+    )
+
+    assert n_rows == 4
+    statement, csv_buffer = cursor.copy_expert.call_args.args
+    assert statement == (
+        'COPY "timeseries"."ts_table" ("timestamp", "metric", "value")'
+        " FROM STDIN WITH (FORMAT csv, NULL '\\N')"
+    )
+    # empty strings and strings equal to the NULL marker are quoted, NULLs are not
+    assert csv_buffer.read().splitlines() == [
+        '"2023-07-01 00:00:00+00:00","a",4.2',
+        '"2023-07-02","b ""2""",\\N',
+        '"2023-07-03","",3',
+        '"2023-07-04","\\N",True',
+    ]
+
+
+def test_sql_dtypes():
+    assert {
+        col_name: type(sql_type)
+        for col_name, sql_type in sql_dtypes(
+            pd.DataFrame(
+                {
+                    "timestamp": pd.to_datetime(["2023-07-01T00:00:00+00:00"]),
+                    "naive_timestamp": pd.to_datetime(["2023-07-01T00:00:00"]),
+                    "flag": [True],
+                    "count": [1],
+                    "value": [4.2],
+                    "text": ["a"],
+                    "mixed": [{"a": 1}],
+                }
+            )
+        ).items()
+    } == {
+        "timestamp": DateTime,
+        "naive_timestamp": DateTime,
+        "flag": Boolean,
+        "count": BigInteger,
+        "value": Float,
+        "text": Text,
+    }
+
+
+def test_write_dataframe_is_transactional(temporary_sqlite_file_path):
+    engine = SQLAdapterDBConfig(
+        connection_url="sqlite+pysqlite:///" + temporary_sqlite_file_path,
+        name="transactional writing sqlite db",
+        key="transactional_writing_sqlite_db",
+    ).engine
+    with engine.begin() as connection:
+        connection.exec_driver_sql(
+            "CREATE TABLE constrained_table (a INTEGER NOT NULL, b TEXT)"
+        )
+
+    write_dataframe(
+        engine,
+        pd.DataFrame({"a": [1, 2], "b": ["x", "y"]}),
+        "constrained_table",
+        "append",
+    )
+    with pytest.raises(DBAPIError):
+        write_dataframe(
+            engine,
+            pd.DataFrame({"a": [3, None], "b": ["z", "w"]}),
+            "constrained_table",
+            "append",
+        )
+    with pytest.raises(DBAPIError):
+        write_dataframe(
+            engine,
+            # dicts cannot be bound as parameters
+            pd.DataFrame({"b": ["w", {"not": "writable"}]}),
+            "constrained_table",
+            "replace",
+        )
+
+    assert pd.read_sql_table("constrained_table", engine)["a"].to_list() == [1, 2]
@@ -1,8 +1,20 @@
+import datetime
+
 import pandas as pd
 import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.dialects import mssql, mysql, postgresql
 
+from hetdesrun.adapters.exceptions import AdapterHandlingException
 from hetdesrun.adapters.sql_adapter import load_data, send_data
-from hetdesrun.adapters.sql_adapter.config import get_sql_adapter_config
+from hetdesrun.adapters.sql_adapter.config import (
+    TimeseriesTableConfig,
+    get_sql_adapter_config,
+)
+from hetdesrun.adapters.sql_adapter.load_table import (
+    Aggregation,
+    prepare_aggregating_sql_statement,
+)
 from hetdesrun.adapters.sql_adapter.structure import (
     get_sink_by_id,
     get_sinks,
@@ -238,3 +250,130 @@ async def test_column_mapping(three_sqlite_dbs_configured):
     )
     assert len(received_data["inp"]) == 2
     assert {"timestamp", "metric", "value"} == set(received_data["inp"].columns)
+
+
+async def load_aggregated_ts_table(
+    ts_table_name: str, aggregation: str, bucket: str = "1h", metrics: str = "a,c"
+) -> pd.DataFrame:
+    received_data = await load_data(
+        {
+            "inp": FilteredSource(
+                ref_id="read_only_timeseries_sqlite_database/ts_table/" + ts_table_name,
+                ref_id_type="SOURCE",
+                filters={
+                    "metrics": metrics,
+                    "timestampFrom": "2023-08-29T00:00:00+00:00",
+                    "timestampTo": "2023-08-29T23:59:59+00:00",
+                    "bucket": bucket,
+                    "aggregation": aggregation,
+                },
+            )
+        },
+        adapter_key="sql-adapter",
+    )
+    return received_data["inp"]
+
+
+@pytest.mark.asyncio
+async def test_load_aggregated_ts_table(
+    three_sqlite_dbs_configured, temporary_prefilled_sqlite_ts_db
+):
+    pd.DataFrame(
+        {
+            "value": [0.5, 3.0, 4.0],
+            "timestamp": pd.to_datetime(
+                [
+                    "2023-08-29T11:10:00+00:00",
+                    "2023-08-29T11:40:00+00:00",
+                    "2023-08-29T13:30:00+00:00",
+                ]
+            ),
+            "metric": ["a", "a", "c"],
+        }
+    ).to_sql(
+        "ro_ts_table",
+        create_engine("sqlite+pysqlite:///" + temporary_prefilled_sqlite_ts_db),
+        if_exists="append",
+        index=False,
+    )
+    # raw rows: a at 11:10 (0.5), 11:40 (3.0), 11:58:02 (1.2), 13:07:46 (2.0)
+    # and c at 13:07:46 (2.2), 13:30 (4.0)
+
+    expected_timestamps = pd.to_datetime(
+        [
+            "2023-08-29T11:00:00+00:00",
+            "2023-08-29T13:00:00+00:00",
+            "2023-08-29T13:00:00+00:00",
+        ]
+    )
+    for aggregation, expected_values in {
+        "min": [0.5, 2.0, 2.2],
+        "max": [3.0, 2.0, 4.0],
+        "mean": [(0.5 + 3.0 + 1.2) / 3, 2.0, 3.1],
+        "first": [0.5, 2.0, 2.2],
+        "last": [1.2, 2.0, 4.0],
+    }.items():
+        multits_frame = await load_aggregated_ts_table("ro_ts_table", aggregation)
+        assert multits_frame["timestamp"].to_list() == expected_timestamps.to_list()
+        assert multits_frame["metric"].to_list() == ["a", "a", "c"]
+        assert multits_frame["value"].to_list() == pytest.approx(expected_values)
+        assert multits_frame.attrs["ref_aggregation"] == aggregation
+        assert multits_frame.attrs["ref_bucket_seconds"] == 3600
+
+    # mean by default, other bucket width
+    multits_frame = await load_aggregated_ts_table(
+        "ro_ts_table", "", bucket="PT1D", metrics="c"
+    )
+    assert multits_frame["timestamp"].to_list() == [
+        pd.Timestamp("2023-08-29T00:00:00+00:00")
+    ]
+    assert multits_frame["value"].to_list() == pytest.approx([3.1])
+
+    # column mapping applies to aggregated data as well
+    multits_frame = await load_aggregated_ts_table("table3", "max")
+    assert list(multits_frame.columns) == ["timestamp", "metric", "value"]
+    assert multits_frame["value"].to_list() == pytest.approx([1.2, 2.0, 2.2])
+
+
+@pytest.mark.asyncio
+async def test_load_aggregated_ts_table_invalid_filters(three_sqlite_dbs_configured):
+    with pytest.raises(AdapterHandlingException, match="without bucket"):
+        await load_aggregated_ts_table("ro_ts_table", "max", bucket="")
+    with pytest.raises(AdapterHandlingException, match="Unknown aggregation"):
+        await load_aggregated_ts_table("ro_ts_table", "median")
+    with pytest.raises(AdapterHandlingException, match="Could not parse bucket"):
+        await load_aggregated_ts_table("ro_ts_table", "max", bucket="hourly")
+    with pytest.raises(AdapterHandlingException, match="whole seconds"):
+        await load_aggregated_ts_table("ro_ts_table", "max", bucket="500ms")
+
+
+def test_aggregating_statement_compiles_for_other_dialects():
+    for dialect, expected_epoch_sql in (
+        (postgresql.dialect(), "EXTRACT(epoch FROM ts_table.timestamp)"),
+        (mysql.dialect(), "unix_timestamp(ts_table.timestamp)"),
+        (mssql.dialect(), "datediff_big(second,"),
+    ):
+        for aggregation in Aggregation:
+            statement = prepare_aggregating_sql_statement(
+                "ts_table",
+                TimeseriesTableConfig(),
+                datetime.datetime(2023, 8, 1, tzinfo=datetime.timezone.utc),
+                datetime.datetime(2023, 9, 1, tzinfo=datetime.timezone.utc),
+                ["a", "b"],
+                aggregation,
+                900,
+                dialect.name,
+            )
+            assert expected_epoch_sql in str(statement.compile(dialect=dialect))
+
+    with pytest.raises(AdapterHandlingException, match="not supported"):
+        prepare_aggregating_sql_statement(
+            "ts_table",
+            TimeseriesTableConfig(),
+            datetime.datetime(2023, 8, 1, tzinfo=datetime.timezone.utc),
+            datetime.datetime(2023, 9, 1, tzinfo=datetime.timezone.utc),
+            None,
+            Aggregation.MEAN,
+            900,
+            "oracle",
+        )
@@ -0,0 +1,110 @@
+import asyncio
+import contextvars
+import threading
+import time
+from unittest import mock
+
+import pytest
+
+from hetdesrun.adapters import (
+    load_data_from_adapter,
+    register_sink_adapter,
+    register_source_adapter,
+    send_data_with_adapter,
+)
+from hetdesrun.adapters.base import SINK_ADAPTERS, SOURCE_ADAPTERS
+from hetdesrun.adapters.exceptions import AdapterConnectionError
+from hetdesrun.adapters.execution import run_blocking_adapter_func
+
+
+class SyncAdapterError(Exception):
+    pass
+
+
+@pytest.fixture()
+def _sync_test_adapter_registered():
+    def load_func(filtered_sources, adapter_key):
+        if "fail" in filtered_sources:
+            raise SyncAdapterError("connection lost")
+        time.sleep(0.1)
+        return {name: threading.current_thread().name for name in filtered_sources}
+
+    def send_func(filtered_sinks, data, adapter_key):
+        time.sleep(0.1)
+        return {}
+
+    register_source_adapter(
+        "sync-test-adapter", load_func, connection_error_class=SyncAdapterError
+    )
+    register_sink_adapter("sync-test-adapter", send_func)
+    yield
+    del SOURCE_ADAPTERS["sync-test-adapter"]
+    del SINK_ADAPTERS["sync-test-adapter"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("_sync_test_adapter_registered")
+async def test_sync_adapter_functions_do_not_block_event_loop():
+    ticks = 0
+
+    async def tick():
+        nonlocal ticks
+        for _ in range(5):
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    loaded_data, not_sent_data, _ = await asyncio.gather(
+        load_data_from_adapter("sync-test-adapter", {"inp": None}),
+        send_data_with_adapter("sync-test-adapter", {"outp": None}, {"outp": 1.0}),
+        tick(),
+    )
+    assert loaded_data["inp"].startswith("hd-adapter")
+    assert not_sent_data == {}
+    assert ticks == 5
+
+    with pytest.raises(AdapterConnectionError, match="connection lost"):
+        await load_data_from_adapter("sync-test-adapter", {"fail": None})
+
+
+@pytest.mark.asyncio
+async def test_run_blocking_adapter_func_respects_adapter_thread_limits():
+    lock = threading.Lock()
+    currently_running = {"limited": 0, "unlimited": 0}
+    max_running = {"limited": 0, "unlimited": 0}
+
+    def blocking_func(adapter_key: str) -> str:
+        with lock:
+            currently_running[adapter_key] += 1
+            max_running[adapter_key] = max(
+                max_running[adapter_key], currently_running[adapter_key]
+            )
+        time.sleep(0.05)
+        with lock:
+            currently_running[adapter_key] -= 1
+        return adapter_key
+
+    with mock.patch(
+        "hetdesrun.webservice.config.runtime_config.hd_adapters_thread_limits",
+        new={"limited": 2},
+    ):
+        results = await asyncio.gather(
+            *(
+                run_blocking_adapter_func(adapter_key, blocking_func, adapter_key)
+                for adapter_key in ["limited"] * 6 + ["unlimited"] * 4
+            )
+        )
+
+    assert results == ["limited"] * 6 + ["unlimited"] * 4
+    assert max_running["limited"] == 2
+    assert max_running["unlimited"] == 4
+
+
+@pytest.mark.asyncio
+async def test_run_blocking_adapter_func_propagates_context_variables():
+    job_id: contextvars.ContextVar[str] = contextvars.ContextVar("job_id")
+    job_id.set("a4e9b2b5-3b63-4ea0-8b42-3c2f4bbb1a4d")
+
+    assert (
+        await run_blocking_adapter_func("some-adapter", job_id.get)
+        == "a4e9b2b5-3b63-4ea0-8b42-3c2f4bbb1a4d"
+    )
@@ -0,0 +1,29 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from hetdesrun.atomic_files import write_atomically
+
+
+def test_write_atomically_replaces_files(tmp_path):
+    file_path = str(tmp_path / "sub_dir" / "file.txt")
+    write_atomically(file_path, lambda tmp_path: Path(tmp_path).write_text("first"))
+    write_atomically(file_path, lambda tmp_path: Path(tmp_path).write_text("second"))
+
+    assert Path(file_path).read_text() == "second"
+    assert os.listdir(tmp_path / "sub_dir") == ["file.txt"]
+
+
+def test_write_atomically_does_not_leave_partial_files(tmp_path):
+    file_path = str(tmp_path / "file.txt")
+    Path(file_path).write_text("previous")
+
+    def failing_write(tmp_path):
+        Path(tmp_path).write_text("partial")
+        raise OSError("disk full")
+
+    with pytest.raises(OSError, match="disk full"):
+        write_atomically(file_path, failing_write)
+    assert Path(file_path).read_text() == "previous"
+    assert os.listdir(tmp_path) == ["file.txt"]
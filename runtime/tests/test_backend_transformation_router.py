@@ -1,3 +1,4 @@
+import io
 import json
 import logging
 from copy import deepcopy
@@ -5,9 +6,16 @@ from posixpath import join as posix_urljoin
 from unittest import mock
 from uuid import UUID
 
+import pandas as pd
 import pytest
 from fastapi import HTTPException
 
+from hetdesrun.adapters.source.uploads import (
+    UploadedInput,
+    bind_uploaded_inputs,
+    clear_uploaded_inputs_context,
+)
+from hetdesrun.backend.execution import prepare_execution_input, run_execution_input
 from hetdesrun.component.code import expand_code, update_code
 from hetdesrun.models.execution import ExecByIdInput, ExecLatestByGroupIdInput
 from hetdesrun.models.wiring import InputWiring, WorkflowWiring
@@ -2348,3 +2356,161 @@ async def test_put_releasing_drafts(async_test_client, mocked_clean_test_db_sess
         trafo_from_resp = TransformationRevision(**response.json())
 
         assert trafo_from_resp.state is State.RELEASED
+
+
+multipart_component_code = """
+COMPONENT_INFO = {
+    "inputs": {
+        "frame": {"data_type": "DATAFRAME"},
+        "series": {"data_type": "SERIES"},
+    },
+    "outputs": {
+        "frame_sum": {"data_type": "FLOAT"},
+        "series_sum": {"data_type": "FLOAT"},
+    },
+    "name": "Sum uploaded inputs",
+    "category": "Test",
+    "version_tag": "1.0.0",
+    "id": "c3b1b7c4-4c1d-4bd1-9a06-0e4e3bb1f7d1",
+    "revision_group_id": "c3b1b7c4-4c1d-4bd1-9a06-0e4e3bb1f7d1",
+    "state": "RELEASED",
+}
+
+
+def main(*, frame, series):
+    return {"frame_sum": float(frame["a"].sum()), "series_sum": float(series.sum())}
+"""
+
+
+@pytest.mark.asyncio
+async def test_execute_multipart_for_transformation_revision(
+    async_test_client, mocked_clean_test_db_session
+):
+    tr_component = transformation_revision_from_python_code(multipart_component_code)
+    store_single_transformation_revision(tr_component)
+
+    exec_by_id_input = ExecByIdInput(
+        id=tr_component.id,
+        wiring=WorkflowWiring(
+            input_wirings=[
+                InputWiring(
+                    workflow_input_name="frame",
+                    adapter_id="direct_provisioning",
+                    filters={"upload": "frame_part", "format": "parquet"},
+                ),
+                InputWiring(
+                    workflow_input_name="series",
+                    adapter_id="direct_provisioning",
+                    type="timeseries(float)",
+                    filters={"upload": "series_part"},
+                ),
+            ]
+        ),
+    )
+
+    parquet_bytes = io.BytesIO()
+    pd.DataFrame({"a": [1.0, 2.0, 3.0], "b": ["x", "y", "z"]}).to_parquet(parquet_bytes)
+    csv_str = "timestamp,value\n2020-01-01T00:00:00Z,1.5\n2020-01-02T00:00:00Z,2.5\n"
+
+    async with async_test_client as ac:
+        response = await ac.post(
+            "/api/transformations/execute-multipart",
+            data={"exec_by_id": exec_by_id_input.json()},
+            files={
+                "frame_part": ("frame.parquet", parquet_bytes.getvalue()),
+                "series_part": ("series.csv", csv_str.encode(), "text/csv"),
+            },
+        )
+
+        assert response.status_code == 200
+        resp_data = response.json()
+        assert resp_data["result"] == "ok"
+        assert resp_data["output_results_by_output_name"]["frame_sum"] == 6.0
+        assert resp_data["output_results_by_output_name"]["series_sum"] == 4.0
+
+        # referenced part missing
+        response = await ac.post(
+            "/api/transformations/execute-multipart",
+            data={"exec_by_id": exec_by_id_input.json()},
+            files={"frame_part": ("frame.parquet", parquet_bytes.getvalue())},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["result"] == "failure"
+        assert "series_part" in response.json()["error"]["message"]
+
+        # execution payload missing
+        response = await ac.post(
+            "/api/transformations/execute-multipart",
+            files={"frame_part": ("frame.parquet", parquet_bytes.getvalue())},
+        )
+
+        assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_execute_multipart_for_separate_runtime_container(
+    mocked_clean_test_db_session,
+):
+    tr_component = transformation_revision_from_python_code(multipart_component_code)
+    store_single_transformation_revision(tr_component)
+
+    exec_by_id_input = ExecByIdInput(
+        id=tr_component.id,
+        wiring=WorkflowWiring(
+            input_wirings=[
+                InputWiring(
+                    workflow_input_name="frame",
+                    adapter_id="direct_provisioning",
+                    filters={"upload": "frame_part"},
+                ),
+                InputWiring(
+                    workflow_input_name="series",
+                    adapter_id="direct_provisioning",
+                    filters={"value": "[1.0, 2.0]"},
+                ),
+            ]
+        ),
+    )
+
+    bind_uploaded_inputs(
+        {
+            "frame_part": UploadedInput(
+                name="frame_part",
+                file=io.BytesIO(b"not read by backend"),
+                filename="frame.parquet",
+            )
+        }
+    )
+
+    with mock.patch(
+        "hetdesrun.webservice.config.runtime_config.is_runtime_service", new=False
+    ):
+        resp_mock = mock.Mock()
+        resp_mock.status_code = 200
+        resp_mock.json = mock.Mock(
+            return_value={
+                "output_results_by_output_name": {"frame_sum": 6.0, "series_sum": 3.0},
+                "result": "ok",
+                "job_id": str(exec_by_id_input.job_id),
+            }
+        )
+        with mock.patch(
+            "hetdesrun.backend.execution.get_auth_headers",
+            return_value={},
+        ), mock.patch(
+            "hetdesrun.backend.execution.httpx.AsyncClient.post",
+            return_value=resp_mock,
+        ) as mocked_post:
+            exec_response = await run_execution_input(
+                prepare_execution_input(exec_by_id_input)
+            )
+
+    clear_uploaded_inputs_context()
+
+    assert exec_response.output_results_by_output_name["frame_sum"] == 6.0
+    mocked_post.assert_called_once()
+    args, kwargs = mocked_post.call_args
+    assert args[0].endswith("runtime-multipart")
+    assert kwargs["files"][0][0] == "frame_part"
+    assert "runtime_input" in kwargs["data"]
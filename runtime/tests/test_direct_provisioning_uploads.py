@@ -0,0 +1,105 @@
+import io
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from hetdesrun.adapters.exceptions import AdapterClientWiringInvalidError
+from hetdesrun.adapters.source.direct_provisioning import (
+    load_directly_provisioned_data,
+)
+from hetdesrun.adapters.source.uploads import (
+    UploadedInput,
+    UploadFormat,
+    bind_uploaded_inputs,
+    clear_uploaded_inputs_context,
+)
+from hetdesrun.models.data_selection import FilteredSource
+
+
+@pytest.fixture
+def _uploaded_arrow_inputs():
+    table = pa.Table.from_pandas(pd.DataFrame({"a": [1, 2, 3]}), preserve_index=False)
+
+    stream_bytes = io.BytesIO()
+    with pa.ipc.new_stream(stream_bytes, table.schema) as writer:
+        writer.write_table(table)
+
+    file_bytes = io.BytesIO()
+    with pa.ipc.new_file(file_bytes, table.schema) as writer:
+        writer.write_table(table)
+
+    bind_uploaded_inputs(
+        {
+            "stream": UploadedInput(
+                name="stream",
+                file=stream_bytes,
+                content_type="application/vnd.apache.arrow.stream",
+            ),
+            "file": UploadedInput(name="file", file=file_bytes, filename="x.feather"),
+            "unknown": UploadedInput(name="unknown", file=io.BytesIO(b"abc")),
+        }
+    )
+    yield
+    clear_uploaded_inputs_context()
+
+
+def test_uploaded_input_format_detection():
+    assert (
+        UploadedInput(
+            name="x", file=None, content_type="text/csv; charset=utf-8"
+        ).detect_format()
+        is UploadFormat.CSV
+    )
+    assert (
+        UploadedInput(name="x", file=None, filename="X.PARQUET").detect_format()
+        is UploadFormat.PARQUET
+    )
+    assert UploadedInput(name="x", file=None, filename="x.bin").detect_format() is None
+
+
+@pytest.mark.usefixtures("_uploaded_arrow_inputs")
+def test_load_uploaded_arrow_inputs():
+    loaded = load_directly_provisioned_data(
+        {
+            "frame_from_stream": FilteredSource(filters={"upload": "stream"}),
+            "series_from_file": FilteredSource(
+                type="series(int)", filters={"upload": "file"}
+            ),
+            "json_value": FilteredSource(filters={"value": "42"}),
+        },
+        adapter_key="direct_provisioning",
+    )
+
+    assert isinstance(loaded["frame_from_stream"], pd.DataFrame)
+    assert loaded["frame_from_stream"]["a"].to_list() == [1, 2, 3]
+    assert isinstance(loaded["series_from_file"], pd.Series)
+    assert loaded["series_from_file"].to_list() == [1, 2, 3]
+    assert loaded["json_value"] == "42"
+
+
+@pytest.mark.usefixtures("_uploaded_arrow_inputs")
+def test_load_uploaded_inputs_errors():
+    with pytest.raises(AdapterClientWiringInvalidError, match="not uploaded"):
+        load_directly_provisioned_data(
+            {"x": FilteredSource(filters={"upload": "missing"})},
+            adapter_key="direct_provisioning",
+        )
+
+    with pytest.raises(AdapterClientWiringInvalidError, match="detect format"):
+        load_directly_provisioned_data(
+            {"x": FilteredSource(filters={"upload": "unknown"})},
+            adapter_key="direct_provisioning",
+        )
+
+    with pytest.raises(AdapterClientWiringInvalidError, match="Could not read"):
+        load_directly_provisioned_data(
+            {"x": FilteredSource(filters={"upload": "unknown", "format": "parquet"})},
+            adapter_key="direct_provisioning",
+        )
+
+    with pytest.raises(AdapterClientWiringInvalidError, match="'value' field"):
+        load_directly_provisioned_data(
+            {"x": FilteredSource(filters={})},
+            adapter_key="direct_provisioning",
+        )
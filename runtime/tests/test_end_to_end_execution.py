@@ -760,7 +760,7 @@ class TestSctructuredErrors:
         assert result.error.location.file.endswith(
             "/hetdesrun/adapters/generic_rest/send_ts_data.py"
         )
-        assert result.error.location.function_name == "ts_to_list_of_dicts"
+        assert result.error.location.function_name == "ts_to_json_rows_encoder"
 
     async def test_raise_json_encoding_exception(
         self,
@@ -0,0 +1,44 @@
+import os
+import time
+from pathlib import Path
+
+from hetdesrun.adapters.file_cache import (
+    cache_file_path,
+    enforce_size_limit,
+    open_cache_file,
+    use_cache_file,
+)
+
+
+def test_file_cache_removes_least_recently_used_files(tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    os.makedirs(cache_dir)
+    for i, cache_key in enumerate(["first", "second", "third"]):
+        file_path = cache_file_path(cache_dir, cache_key, ".cached")
+        Path(file_path).write_bytes(b"x" * 100)
+        os.utime(file_path, (time.time() - 100 + i, time.time() - 100 + i))
+    (tmp_path / "cache" / "other.txt").write_bytes(b"x" * 1000)
+    # using a cached file marks it as recently used
+    assert use_cache_file(cache_file_path(cache_dir, "first", ".cached"))
+
+    enforce_size_limit(cache_dir, ".cached", 250)
+    assert sorted(os.listdir(cache_dir)) == [
+        "first.cached",
+        "other.txt",
+        "third.cached",
+    ]
+    assert not use_cache_file(cache_file_path(cache_dir, "second", ".cached"))
+
+
+def test_opened_cache_file_stays_readable_after_removal(tmp_path):
+    cache_dir = str(tmp_path)
+    file_path = cache_file_path(cache_dir, "key", ".cached")
+    assert open_cache_file(file_path) is None
+
+    Path(file_path).write_bytes(b"content")
+    cache_file = open_cache_file(file_path)
+    assert cache_file is not None
+    with cache_file:
+        enforce_size_limit(cache_dir, ".cached", 0)
+        assert not os.path.exists(file_path)
+        assert cache_file.read() == b"content"
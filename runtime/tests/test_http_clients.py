@@ -0,0 +1,101 @@
+from functools import partial
+from unittest import mock
+
+import httpx
+import pytest
+
+from hetdesrun.backend.service.transformation_router import (
+    send_result_to_callback_url,
+)
+from hetdesrun.webservice.http_clients import (
+    close_shared_http_clients,
+    get_http_client_stats,
+    get_shared_http_client,
+    origin_of_url,
+)
+
+
+def test_origin_of_url():
+    assert origin_of_url("https://hetida.de:8090/adapter/info") == (
+        "https://hetida.de:8090"
+    )
+    assert origin_of_url("http://localhost/api?id=1") == "http://localhost"
+
+
+@pytest.mark.asyncio
+async def test_shared_http_clients_are_reused_per_origin_and_verify_setting():
+    client = get_shared_http_client("https://hetida.de/adapter/sources", verify=True)
+
+    assert (
+        get_shared_http_client("https://hetida.de/adapter/timeseries", verify=True)
+        is client
+    )
+    assert (
+        get_shared_http_client("https://hetida.de/adapter/sources", verify=False)
+        is not client
+    )
+    assert (
+        get_shared_http_client("https://hetida.de:8443/adapter/sources", verify=True)
+        is not client
+    )
+
+    await close_shared_http_clients()
+    assert client.is_closed
+    assert (
+        get_shared_http_client("https://hetida.de/adapter/sources", verify=True)
+        is not client
+    )
+    await close_shared_http_clients()
+
+
+@pytest.mark.asyncio
+async def test_shared_http_client_stats_count_requests_per_host():
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/missing":
+            return httpx.Response(404)
+        return httpx.Response(200, json={})
+
+    transport = httpx.MockTransport(handler)
+
+    with mock.patch(
+        "hetdesrun.webservice.http_clients.httpx.AsyncClient",
+        new=partial(httpx.AsyncClient, transport=transport),
+    ):
+        client = get_shared_http_client("https://stats-test-host.de/info", verify=True)
+        await client.get("https://stats-test-host.de/info")
+        await client.get("https://stats-test-host.de/missing")
+        other_client = get_shared_http_client(
+            "https://other-stats-test-host.de/info", verify=True
+        )
+        await other_client.get("https://other-stats-test-host.de/info")
+
+    stats = get_http_client_stats()
+    assert stats["https://stats-test-host.de"].requests == 2
+    assert stats["https://stats-test-host.de"].error_responses == 1
+    assert stats["https://other-stats-test-host.de"].requests == 1
+    assert stats["https://other-stats-test-host.de"].error_responses == 0
+
+    await close_shared_http_clients()
+
+
+@pytest.mark.asyncio
+async def test_callback_urls_do_not_get_shared_http_clients():
+    received_callbacks = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        received_callbacks.append(str(request.url))
+        return httpx.Response(200)
+
+    result = mock.MagicMock()
+    result.json.return_value = "{}"
+    with mock.patch(
+        "hetdesrun.webservice.http_clients.httpx.AsyncClient",
+        new=partial(httpx.AsyncClient, transport=httpx.MockTransport(handler)),
+    ), mock.patch(
+        "hetdesrun.backend.service.transformation_router.get_auth_headers",
+        return_value={},
+    ):
+        await send_result_to_callback_url("https://callback-host.de/result", result)
+
+    assert received_callbacks == ["https://callback-host.de/result"]
+    assert "https://callback-host.de" not in get_http_client_stats()
@@ -1,11 +1,22 @@
 import json
+import os
 from typing import Any
+from unittest import mock
 
 import numpy as np
 import pandas as pd
+import pytest
 from pydantic import BaseModel
 
 from hetdesrun.datatypes import AdvancedTypesOutputSerializationConfig
+from hetdesrun.serialization import (
+    LoadedObjectCache,
+    dump_obj,
+    estimated_memory_size,
+    get_loaded_object_cache,
+    load_obj,
+)
+from hetdesrun.webservice.config import get_config
 
 
 def test_serialization():
@@ -22,3 +33,89 @@ def test_serialization():
     loaded_json = json.loads(om.json())
     assert loaded_json["s"]["__data__"]["data"][2] is None
     assert isinstance(loaded_json["s"]["__data__"]["data"][1], float)
+
+
+@pytest.fixture()
+def model_repo_path(tmp_path):
+    with mock.patch.object(get_config(), "model_repo_path", str(tmp_path)):
+        yield str(tmp_path)
+    get_loaded_object_cache().clear()
+
+
+def test_dump_and_load_obj(model_repo_path):
+    dump_obj({"a": np.arange(1000)}, "model", "1", compress=3)
+    dump_obj({"a": np.arange(10)}, "model", "2")
+
+    assert np.array_equal(load_obj("model", "1")["a"], np.arange(1000))
+    assert np.array_equal(load_obj("model", "latest")["a"], np.arange(10))
+    # no temporary files are left
+    assert sorted(os.listdir(model_repo_path)) == [
+        "model_1",
+        "model_2",
+        "model_latest",
+    ]
+
+    with pytest.raises(ValueError, match="special meaning"):
+        dump_obj(42, "model", "latest")
+
+
+def test_load_obj_with_cache_and_mmap_mode(model_repo_path):
+    dump_obj(np.arange(1000), "model", "1")
+    with mock.patch.object(get_config(), "model_repo_cache_max_size", 10**6):
+        loaded_obj = load_obj("model", "latest")
+        assert load_obj("model", "1") is loaded_obj
+        assert load_obj("model", "latest") is loaded_obj
+
+        # the latest symlink is resolved, so the new object is loaded
+        dump_obj(np.arange(10), "model", "2")
+        assert np.array_equal(load_obj("model", "latest"), np.arange(10))
+
+        memory_mapped_obj = load_obj("model", "1", mmap_mode="r")
+        assert isinstance(memory_mapped_obj, np.memmap)
+        assert memory_mapped_obj is not loaded_obj
+        assert np.array_equal(memory_mapped_obj, loaded_obj)
+
+
+def test_loaded_object_cache_keeps_memory_budget():
+    loaded_object_cache = LoadedObjectCache()
+    for i in range(3):
+        loaded_object_cache.store(("obj", i), i, size=40, max_size=100)
+    assert loaded_object_cache.get(("obj", 0)) == (False, None)
+    assert loaded_object_cache.get(("obj", 1)) == (True, 1)
+
+    # the least recently used object is removed
+    loaded_object_cache.store(("obj", 3), 3, size=40, max_size=100)
+    assert loaded_object_cache.get(("obj", 2)) == (False, None)
+    assert loaded_object_cache.get(("obj", 1)) == (True, 1)
+
+    # objects exceeding the budget are not cached
+    loaded_object_cache.store(("obj", 4), 4, size=101, max_size=100)
+    assert loaded_object_cache.get(("obj", 4)) == (False, None)
+
+
+def test_load_obj_mmap_mode_overrides_config(model_repo_path):
+    dump_obj(np.arange(1000), "model", "1")
+    with mock.patch.object(get_config(), "model_repo_mmap_mode", "r"):
+        assert isinstance(load_obj("model", "1"), np.memmap)
+        assert not isinstance(load_obj("model", "1", mmap_mode=None), np.memmap)
+
+        # compressed objects are always read into memory
+        dump_obj(np.arange(1000), "model", "2", compress=3)
+        assert not isinstance(load_obj("model", "2"), np.memmap)
+
+
+def test_estimated_memory_size(model_repo_path):
+    array = np.arange(10**5, dtype=np.int64)
+    assert estimated_memory_size(array) >= array.nbytes
+    # shared and viewed arrays are counted once
+    obj = {"a": array, "b": [array, array[10:]]}
+    assert array.nbytes <= estimated_memory_size(obj) < 2 * array.nbytes
+    assert estimated_memory_size(pd.Series(["x" * 1000] * 100)) >= 100 * 1000
+
+    # the data of compressed objects is counted in full
+    dump_obj(array, "model", "1", compress=3)
+    assert estimated_memory_size(load_obj("model", "1")) >= array.nbytes
+    assert os.path.getsize(os.path.join(model_repo_path, "model_1")) < array.nbytes
+    # but not the data of memory mapped arrays
+    dump_obj(array, "model", "2")
+    assert estimated_memory_size(load_obj("model", "2", mmap_mode="r")) < 10**4
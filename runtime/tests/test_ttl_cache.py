@@ -0,0 +1,44 @@
+from unittest import mock
+
+from hetdesrun.adapters.ttl_cache import TTLCache
+
+
+def test_ttl_cache_expires_entries():
+    cache: TTLCache[str, int] = TTLCache()
+    with mock.patch("hetdesrun.adapters.ttl_cache.time.monotonic", return_value=100.0):
+        cache.store("a", 1, 10)
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+
+    with mock.patch("hetdesrun.adapters.ttl_cache.time.monotonic", return_value=110.0):
+        assert cache.get("a") is None
+
+
+def test_ttl_cache_removes_expired_before_oldest_entries():
+    cache: TTLCache[str, int] = TTLCache(max_entries=2)
+    with mock.patch("hetdesrun.adapters.ttl_cache.time.monotonic", return_value=100.0):
+        cache.store("a", 1, 60)
+        cache.store("b", 2, 1)
+    with mock.patch("hetdesrun.adapters.ttl_cache.time.monotonic", return_value=105.0):
+        cache.store("c", 3, 60)
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        cache.store("d", 4, 60)
+        assert cache.get("a") is None
+        assert cache.get("c") == 3
+        assert cache.get("d") == 4
+
+
+def test_ttl_cache_remove_where():
+    cache: TTLCache[tuple[str, str], int] = TTLCache()
+    cache.store(("x", "a"), 1, 60)
+    cache.store(("x", "b"), 2, 60)
+    cache.store(("y", "a"), 3, 60)
+
+    cache.remove_where(lambda key: key[0] == "x")
+    assert cache.get(("x", "a")) is None
+    assert cache.get(("x", "b")) is None
+    assert cache.get(("y", "a")) == 3
+
+    cache.clear()
+    assert cache.get(("y", "a")) is None
@@ -1,5 +1,19 @@
+import asyncio
+from unittest import mock
+
 import pytest
 
+from hetdesrun.adapters.exceptions import (
+    AdapterClientWiringInvalidError,
+    AdapterConnectionError,
+    MultipleAdaptersHandlingError,
+)
+from hetdesrun.models.wiring import InputWiring, OutputWiring, WorkflowWiring
+from hetdesrun.wiring import (
+    resolve_and_load_data_from_wiring,
+    resolve_and_send_data_from_wiring,
+)
+
 
 async def run_workflow_with_client(workflow_json, open_async_test_client):
     response = await open_async_test_client.post("engine/runtime", json=workflow_json)
@@ -63,3 +77,122 @@ async def test_wiring_direct_input_provisioning(
 
         assert "32.0" in node_results  # intermediate result
         assert "64.0" in node_results
+
+
+def wiring_with_adapters(adapter_ids: list[str]) -> WorkflowWiring:
+    return WorkflowWiring(
+        input_wirings=[
+            InputWiring(
+                workflow_input_name="inp_" + adapter_id,
+                adapter_id=adapter_id,
+                ref_id="some_ref_id",
+                type="series(float)",
+            )
+            for adapter_id in adapter_ids
+        ],
+        output_wirings=[
+            OutputWiring(
+                workflow_output_name="out_" + adapter_id,
+                adapter_id=adapter_id,
+                ref_id="some_ref_id",
+                type="series(float)",
+            )
+            for adapter_id in adapter_ids
+        ],
+    )
+
+
+@pytest.mark.asyncio
+async def test_wiring_loads_and_sends_adapters_concurrently():
+    barrier = asyncio.Barrier(2)
+
+    async def mocked_load(adapter_key, filtered_sources):
+        await barrier.wait()  # only passes if both adapters are loaded concurrently
+        return {name: 42.0 for name in filtered_sources}
+
+    async def mocked_send(adapter_key, filtered_sinks, data):
+        await barrier.wait()
+        return {name: data[name] for name in filtered_sinks}
+
+    wiring = wiring_with_adapters(["adapter_a", "adapter_b"])
+    measured_steps: dict = {}
+    with mock.patch(
+        "hetdesrun.wiring.load_data_from_adapter", side_effect=mocked_load
+    ), mock.patch("hetdesrun.wiring.send_data_with_adapter", side_effect=mocked_send):
+        loaded_data = await asyncio.wait_for(
+            resolve_and_load_data_from_wiring(wiring, measured_steps), timeout=5
+        )
+        not_sent_data = await asyncio.wait_for(
+            resolve_and_send_data_from_wiring(
+                wiring, {"out_adapter_a": 1.0, "out_adapter_b": 2.0}
+            ),
+            timeout=5,
+        )
+
+    assert loaded_data == {"inp_adapter_a": 42.0, "inp_adapter_b": 42.0}
+    assert not_sent_data == {"out_adapter_a": 1.0, "out_adapter_b": 2.0}
+    assert set(measured_steps.keys()) == {"adapter_a", "adapter_b"}
+    assert all(step.end is not None for step in measured_steps.values())
+
+
+@pytest.mark.asyncio
+async def test_wiring_respects_adapter_concurrency_limit():
+    currently_running = 0
+    max_running = 0
+
+    async def mocked_load(adapter_key, filtered_sources):
+        nonlocal currently_running, max_running
+        currently_running += 1
+        max_running = max(max_running, currently_running)
+        await asyncio.sleep(0.01)
+        currently_running -= 1
+        return {name: 42.0 for name in filtered_sources}
+
+    with mock.patch(
+        "hetdesrun.wiring.load_data_from_adapter", side_effect=mocked_load
+    ), mock.patch(
+        "hetdesrun.webservice.config.runtime_config.hd_adapters_concurrency_limit",
+        new=2,
+    ):
+        loaded_data = await resolve_and_load_data_from_wiring(
+            wiring_with_adapters(["a", "b", "c", "d", "e"])
+        )
+    assert len(loaded_data) == 5
+    assert max_running == 2
+
+
+@pytest.mark.asyncio
+async def test_wiring_attributes_errors_of_several_failing_adapters():
+    async def mocked_load(adapter_key, filtered_sources):
+        if adapter_key == "adapter_a":
+            raise AdapterConnectionError("a is down")
+        if adapter_key == "adapter_b":
+            raise AdapterClientWiringInvalidError("b is misconfigured")
+        return {name: 42.0 for name in filtered_sources}
+
+    with mock.patch("hetdesrun.wiring.load_data_from_adapter", side_effect=mocked_load):
+        with pytest.raises(AdapterConnectionError, match="a is down"):
+            await resolve_and_load_data_from_wiring(
+                wiring_with_adapters(["adapter_a", "adapter_c"])
+            )
+
+        measured_steps: dict = {}
+        with pytest.raises(MultipleAdaptersHandlingError) as exc_info:
+            await resolve_and_load_data_from_wiring(
+                wiring_with_adapters(["adapter_a", "adapter_b", "adapter_c"]),
+                measured_steps,
+            )
+
+    # failing adapters are measured as well
+    assert set(measured_steps.keys()) == {"adapter_a", "adapter_b", "adapter_c"}
+    assert all(step.end is not None for step in measured_steps.values())
+
+    assert set(exc_info.value.exceptions_by_adapter_key.keys()) == {
+        "adapter_a",
+        "adapter_b",
+    }
+    assert "Adapter adapter_a: AdapterConnectionError: a is down" in str(exc_info.value)
+    assert (
+        "Adapter adapter_b: AdapterClientWiringInvalidError: b is misconfigured"
+        in str(exc_info.value)
+    )